@@ -0,0 +1,37 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 常用接口的异步版本, 用于 FastAPI 等基于 asyncio 的服务
+接口名称和参数与同步接口一致, 返回协程:
+
+    import akshare.aio as ak_aio
+    stock_zh_a_hist_df = await ak_aio.stock_zh_a_hist(symbol="000001")
+
+请求通过 curl_cffi 的 AsyncSession 发送, 解析代码与同步接口共用
+"""
+
+from akshare.aio.datacenter import (
+    fetch_datacenter,
+    stock_fhps_em,
+    stock_lhb_detail_em,
+    stock_margin_account_info,
+    stock_yjbb_em,
+)
+from akshare.aio.em import fund_etf_hist_em, stock_zh_a_hist, stock_zh_a_spot_em
+from akshare.aio.request import close_async_session, set_async_session_config
+from akshare.aio.sina import fetch_hq, futures_zh_spot
+
+__all__ = [
+    "close_async_session",
+    "fetch_datacenter",
+    "fetch_hq",
+    "fund_etf_hist_em",
+    "futures_zh_spot",
+    "set_async_session_config",
+    "stock_fhps_em",
+    "stock_lhb_detail_em",
+    "stock_margin_account_info",
+    "stock_yjbb_em",
+    "stock_zh_a_hist",
+    "stock_zh_a_spot_em",
+]
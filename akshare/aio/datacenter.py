@@ -0,0 +1,171 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 东方财富-数据中心报表的异步版本
+https://datacenter-web.eastmoney.com/api/data/v1/get
+请求参数和字段定义(ReportSchema)与同步接口共用, 剩余页面同时请求
+"""
+
+import asyncio
+from typing import Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from akshare.aio.request import request_get
+from akshare.stock_feature.stock_fhps_em import _FHPS_SCHEMA, _fhps_params
+from akshare.stock_feature.stock_lhb_em import _LHB_DETAIL_SCHEMA, _lhb_detail_params
+from akshare.stock_feature.stock_margin_em import (
+    _MARGIN_ACCOUNT_INFO_SCHEMA,
+    _MARGIN_PAGE_KEYS,
+    _margin_account_info_params,
+)
+from akshare.stock_feature.stock_yjbb_em import _YJBB_SCHEMA, _yjbb_params
+from akshare.utils.datacenter import (
+    DATACENTER_URL,
+    ReportSchema,
+    apply_report_schema,
+    page_params,
+)
+
+
+async def _fetch_page(url: str, params: Dict, timeout: Optional[float]) -> Dict:
+    """
+    东方财富-数据中心-获取单页数据
+    :param url: 请求地址
+    :type url: str
+    :param params: 请求参数
+    :type params: dict
+    :param timeout: 请求超时时间
+    :type timeout: float
+    :return: 接口返回的 result 字段
+    :rtype: dict
+    """
+    r = await request_get(url, params=params, timeout=timeout)
+    return r.json()["result"]
+
+
+async def fetch_datacenter_pages(
+    params: Dict,
+    url: str = DATACENTER_URL,
+    page_keys: Sequence[str] = ("pageNumber",),
+    timeout: Optional[float] = None,
+) -> List[Dict]:
+    """
+    东方财富-数据中心-获取全部页面的原始数据
+    :param params: 请求参数, 包括 reportName, columns, filter 等
+    :type params: dict
+    :param url: 请求地址
+    :type url: str
+    :param page_keys: 表示页码的参数名
+    :type page_keys: tuple
+    :param timeout: 请求超时时间
+    :type timeout: float
+    :return: 按页码顺序合并的数据
+    :rtype: list
+    """
+    result = await _fetch_page(url, page_params(params, page_keys, 1), timeout)
+    if not result:
+        return []
+    total_page = int(result.get("pages") or 1)
+    page_results = await asyncio.gather(
+        *[
+            _fetch_page(url, page_params(params, page_keys, page), timeout)
+            for page in range(2, total_page + 1)
+        ]
+    )
+    page_list = [result["data"]] + [
+        page_result["data"] if page_result else [] for page_result in page_results
+    ]
+    return [item for page in page_list for item in page or []]
+
+
+async def fetch_datacenter(
+    params: Dict,
+    schema: Optional[ReportSchema] = None,
+    url: str = DATACENTER_URL,
+    page_keys: Sequence[str] = ("pageNumber",),
+    timeout: Optional[float] = None,
+) -> pd.DataFrame:
+    """
+    东方财富-数据中心-获取报表的全部数据
+    https://data.eastmoney.com/center/
+    :param params: 请求参数, 包括 reportName, columns, filter 等
+    :type params: dict
+    :param schema: 字段定义, 为 None 时返回原始字段
+    :type schema: ReportSchema
+    :param url: 请求地址
+    :type url: str
+    :param page_keys: 表示页码的参数名
+    :type page_keys: tuple
+    :param timeout: 请求超时时间
+    :type timeout: float
+    :return: 报表数据
+    :rtype: pandas.DataFrame
+    """
+    temp_df = pd.DataFrame(
+        await fetch_datacenter_pages(
+            params=params, url=url, page_keys=page_keys, timeout=timeout
+        )
+    )
+    if schema is None:
+        return temp_df
+    return apply_report_schema(temp_df, schema)
+
+
+async def stock_lhb_detail_em(
+    start_date: str = "20230403", end_date: str = "20230417"
+) -> pd.DataFrame:
+    """
+    东方财富网-数据中心-龙虎榜单-龙虎榜详情
+    https://data.eastmoney.com/stock/tradedetail.html
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :return: 龙虎榜详情
+    :rtype: pandas.DataFrame
+    """
+    params = _lhb_detail_params(start_date, end_date)
+    return await fetch_datacenter(params, schema=_LHB_DETAIL_SCHEMA)
+
+
+async def stock_yjbb_em(date: str = "20200331") -> pd.DataFrame:
+    """
+    东方财富-数据中心-年报季报-业绩快报-业绩报表
+    https://data.eastmoney.com/bbsj/202003/yjbb.html
+    :param date: "20200331", "20200630", "20200930", "20201231"; 从 20100331 开始
+    :type date: str
+    :return: 业绩报表
+    :rtype: pandas.DataFrame
+    """
+    return await fetch_datacenter(_yjbb_params(date), schema=_YJBB_SCHEMA)
+
+
+async def stock_fhps_em(date: str = "20231231") -> pd.DataFrame:
+    """
+    东方财富网-数据中心-年报季报-分红送配
+    https://data.eastmoney.com/yjfp/
+    :param date: 分红送配报告期
+    :type date: str
+    :return: 分红送配
+    :rtype: pandas.DataFrame
+    """
+    big_df = await fetch_datacenter(_fhps_params(date), schema=_FHPS_SCHEMA)
+    big_df.sort_values(["最新公告日期"], inplace=True, ignore_index=True)
+    return big_df
+
+
+async def stock_margin_account_info() -> pd.DataFrame:
+    """
+    东方财富网-数据中心-融资融券-融资融券账户统计-两融账户信息
+    https://data.eastmoney.com/rzrq/zhtjday.html
+    :return: 融资融券账户统计
+    :rtype: pandas.DataFrame
+    """
+    big_df = await fetch_datacenter(
+        _margin_account_info_params(),
+        schema=_MARGIN_ACCOUNT_INFO_SCHEMA,
+        page_keys=_MARGIN_PAGE_KEYS,
+    )
+    big_df.sort_values(["日期"], ignore_index=True, inplace=True)
+    return big_df
@@ -0,0 +1,138 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 东方财富-行情接口的异步版本
+请求参数和解析与同步接口共用, 只有网络请求改为协程
+"""
+
+import asyncio
+import math
+from typing import Dict
+
+import pandas as pd
+
+from akshare.aio.request import request_get, request_with_retry
+from akshare.fund.fund_etf_em import _fund_etf_hist_frame, _fund_etf_hist_params
+from akshare.stock_feature.stock_hist_em import (
+    _A_SPOT_PARAMS,
+    _A_SPOT_URL,
+    _KLINE_URL,
+    _zh_a_hist_frame,
+    _zh_a_hist_params,
+    _zh_a_spot_frame,
+)
+from akshare.utils.func import paginated_frame
+
+
+async def _fetch_page(url: str, params: Dict, timeout: int) -> list:
+    """
+    东方财富-获取单页数据
+    :param url: 请求地址
+    :type url: str
+    :param params: 请求参数
+    :type params: dict
+    :param timeout: 请求超时时间
+    :type timeout: int
+    :return: 单页数据
+    :rtype: list
+    """
+    r = await request_with_retry(url, params=params, timeout=timeout)
+    return r.json()["data"]["diff"]
+
+
+async def fetch_paginated_data(
+    url: str, base_params: Dict, timeout: int = 15
+) -> pd.DataFrame:
+    """
+    东方财富-分页获取数据并合并结果, 剩余页面同时请求
+    :param url: 请求地址
+    :type url: str
+    :param base_params: 基础请求参数
+    :type base_params: dict
+    :param timeout: 请求超时时间
+    :type timeout: int
+    :return: 合并后的数据
+    :rtype: pandas.DataFrame
+    """
+    params = base_params.copy()
+    r = await request_with_retry(url, params=params, timeout=timeout)
+    data_json = r.json()
+    per_page_num = len(data_json["data"]["diff"])
+    total_page = math.ceil(data_json["data"]["total"] / per_page_num)
+    page_list = await asyncio.gather(
+        *[
+            _fetch_page(url, {**params, "pn": page}, timeout)
+            for page in range(2, total_page + 1)
+        ]
+    )
+    return paginated_frame([data_json["data"]["diff"]] + list(page_list))
+
+
+async def stock_zh_a_spot_em() -> pd.DataFrame:
+    """
+    东方财富网-沪深京 A 股-实时行情
+    https://quote.eastmoney.com/center/gridlist.html#hs_a_board
+    :return: 实时行情
+    :rtype: pandas.DataFrame
+    """
+    temp_df = await fetch_paginated_data(_A_SPOT_URL, _A_SPOT_PARAMS)
+    return _zh_a_spot_frame(temp_df)
+
+
+async def stock_zh_a_hist(
+    symbol: str = "000001",
+    period: str = "daily",
+    start_date: str = "19700101",
+    end_date: str = "20500101",
+    adjust: str = "",
+    timeout: float = None,
+) -> pd.DataFrame:
+    """
+    东方财富网-行情首页-沪深京 A 股-每日行情
+    https://quote.eastmoney.com/concept/sh603777.html?from=classic
+    :param symbol: 股票代码
+    :type symbol: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}
+    :type period: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param timeout: choice of None or a positive float number
+    :type timeout: float
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
+    params = _zh_a_hist_params(symbol, period, start_date, end_date, adjust)
+    r = await request_get(_KLINE_URL, params=params, timeout=timeout)
+    return _zh_a_hist_frame(r.json(), symbol)
+
+
+async def fund_etf_hist_em(
+    symbol: str = "159707",
+    period: str = "daily",
+    start_date: str = "19700101",
+    end_date: str = "20500101",
+    adjust: str = "",
+) -> pd.DataFrame:
+    """
+    东方财富-ETF行情
+    https://quote.eastmoney.com/sz159707.html
+    :param symbol: ETF 代码
+    :type symbol: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}
+    :type period: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
+    params = _fund_etf_hist_params(symbol, period, start_date, end_date, adjust)
+    r = await request_get(_KLINE_URL, params=params, timeout=15)
+    return _fund_etf_hist_frame(r.json())
@@ -0,0 +1,166 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 异步 HTTP 请求工具函数
+基于 curl_cffi 的 AsyncSession, 每个事件循环共用一个会话, 按主机复用连接;
+同一主机的请求频率, 并发数和熔断器与同步请求层共用(akshare.utils.rate_limit), 请求同样记录到 akshare.utils.trace
+"""
+
+import asyncio
+import random
+import weakref
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+from curl_cffi.requests import AsyncSession, RequestsError, Response
+from curl_cffi.requests.exceptions import ConnectionError as CurlConnectionError
+
+from akshare.utils import trace
+from akshare.utils.context import config
+from akshare.utils.rate_limit import (
+    _get_host,
+    get_circuit_breaker,
+    get_host_concurrency,
+    get_rate_limiter,
+)
+from akshare.utils.request import _session_config
+
+_async_session_config = {"max_clients": 256}
+_sessions = weakref.WeakKeyDictionary()
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def set_async_session_config(max_clients: int = None) -> None:
+    """
+    设置异步会话的参数, 对之后创建的会话生效
+    :param max_clients: 每个事件循环同时打开的最大连接数
+    :type max_clients: int
+    :return: None
+    :rtype: None
+    """
+    if max_clients is not None:
+        _async_session_config["max_clients"] = max_clients
+
+
+def get_async_session() -> AsyncSession:
+    """
+    获取当前事件循环共用的异步会话
+    :return: 会话对象
+    :rtype: curl_cffi.requests.AsyncSession
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None:
+        session = AsyncSession(max_clients=_async_session_config["max_clients"])
+        _sessions[loop] = session
+    return session
+
+
+async def close_async_session() -> None:
+    """
+    关闭当前事件循环的异步会话, 一般在服务关闭时调用
+    :return: None
+    :rtype: None
+    """
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+def _get_host_semaphore(url: str) -> asyncio.Semaphore:
+    semaphores = _semaphores.setdefault(asyncio.get_running_loop(), {})
+    host = urlsplit(url).hostname or url
+    semaphore = semaphores.get(host)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(get_host_concurrency(host))
+        semaphores[host] = semaphore
+    return semaphore
+
+
+async def request(method: str, url: str, **kwargs) -> Response:
+    """
+    通过当前事件循环的会话发送 HTTP 请求, 参数与 akshare.utils.request.request 一致
+    :param method: 请求方法
+    :type method: str
+    :param url: 请求 URL
+    :type url: str
+    :return: Response 对象
+    :rtype: curl_cffi.requests.Response
+    :raises: akshare.exceptions.CircuitOpenError 主机熔断中, 请求未发出
+    """
+    if kwargs.get("proxies") is None and config.proxies is not None:
+        kwargs["proxies"] = config.proxies
+    if "timeout" not in kwargs:
+        kwargs["timeout"] = _session_config["timeout"]
+    breaker = get_circuit_breaker(url)
+    with trace.request_span(method, url, stream=kwargs.get("stream")) as span:
+        # 熔断拒绝的请求同样记录为出错的请求
+        breaker.before_request(_get_host(url))
+        try:
+            await get_rate_limiter(url).acquire_async()
+            async with _get_host_semaphore(url):
+                span.mark_sent()
+                response = await get_async_session().request(method, url, **kwargs)
+        except CurlConnectionError:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_response(response.status_code, response.headers)
+        span.set_response(response)
+    return response
+
+
+async def request_get(url: str, params: Dict = None, **kwargs) -> Response:
+    """
+    发送异步 HTTP GET 请求
+    :param url: 请求 URL
+    :type url: str
+    :param params: 请求参数
+    :type params: dict
+    :return: Response 对象
+    :rtype: curl_cffi.requests.Response
+    """
+    return await request("GET", url, params=params, **kwargs)
+
+
+async def request_with_retry(
+    url: str,
+    params: Dict = None,
+    timeout: int = 15,
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    random_delay_range: Tuple[float, float] = (0.5, 1.5),
+) -> Response:
+    """
+    带重试机制的异步 HTTP GET 请求, 重试策略与 akshare.utils.request.request_with_retry 一致
+    :param url: 请求 URL
+    :type url: str
+    :param params: 请求参数
+    :type params: dict
+    :param timeout: 超时时间（秒）
+    :type timeout: int
+    :param max_retries: 最大重试次数
+    :type max_retries: int
+    :param base_delay: 基础延迟时间（秒），用于指数退避
+    :type base_delay: float
+    :param random_delay_range: 随机延迟范围（秒）
+    :type random_delay_range: tuple
+    :return: Response 对象
+    :rtype: curl_cffi.requests.Response
+    :raises: 最后一次请求的异常; 主机熔断时立即抛出 CircuitOpenError, 不再重试
+    """
+    last_exception = None
+    for attempt in range(max_retries):
+        try:
+            with trace.attempt(attempt):
+                response = await request_get(url, params=params, timeout=timeout)
+            response.raise_for_status()
+            return response
+        except (RequestsError, ValueError) as e:
+            last_exception = e
+            if attempt < max_retries - 1:
+                delay = base_delay * (2**attempt) + random.uniform(*random_delay_range)
+                await asyncio.sleep(delay)
+    raise last_exception
@@ -0,0 +1,108 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 新浪财经-实时行情接口的异步版本
+请求分批和解析与 akshare.utils.sina_hq 共用, 各批同时请求
+"""
+
+import asyncio
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from akshare.aio.request import request_get
+from akshare.futures.futures_zh_sina import (
+    _futures_contract_exchange_min,
+    _futures_zh_spot_frame,
+)
+from akshare.utils.sina_hq import (
+    HQ_HEADERS,
+    HQ_URL,
+    MAX_URL_LENGTH,
+    batch_symbols,
+    parse_hq_text,
+    random_rn,
+)
+
+
+async def _fetch_batch(
+    batch: List[str], timeout: Optional[float]
+) -> Dict[str, List[str]]:
+    """
+    获取一批代码的行情
+    :param batch: 代码
+    :type batch: list
+    :param timeout: 请求超时时间
+    :type timeout: float
+    :return: {代码: 字段列表}
+    :rtype: dict
+    """
+    url = f"{HQ_URL}rn={random_rn()}&list={','.join(batch)}"
+    r = await request_get(url, headers=HQ_HEADERS, timeout=timeout)
+    r.encoding = "gbk"
+    return parse_hq_text(r.text)
+
+
+async def fetch_hq(
+    symbols: Iterable[str],
+    max_url_length: int = MAX_URL_LENGTH,
+    timeout: Optional[float] = 10,
+) -> Dict[str, List[str]]:
+    """
+    新浪财经-获取多个代码的实时行情原始字段
+    :param symbols: 带市场前缀的代码
+    :type symbols: iterable
+    :param max_url_length: 单个请求 URL 的最大长度
+    :type max_url_length: int
+    :param timeout: 请求超时时间
+    :type timeout: float
+    :return: {代码: 字段列表}, 按请求的代码顺序
+    :rtype: dict
+    """
+    results = await asyncio.gather(
+        *[
+            _fetch_batch(batch, timeout)
+            for batch in batch_symbols(symbols, max_url_length=max_url_length)
+        ]
+    )
+    quotes = {}
+    for result in results:
+        quotes.update(result)
+    return quotes
+
+
+async def futures_zh_spot(
+    symbol: str = "V2309",
+    market: str = "CF",
+    adjust: str = "0",
+) -> pd.DataFrame:
+    """
+    期货的实时行情数据
+    https://vip.stock.finance.sina.com.cn/quotes_service/view/qihuohangqing.html#titlePos_1
+    :param symbol: 合约名称的字符串组合
+    :type symbol: str
+    :param market: CF 为商品期货
+    :type market: str
+    :param adjust: '1' or '0'；'1' 时合约详情仍由同步接口获取, 在线程池中运行
+    :type adjust: str
+    :return: 期货的实时行情数据
+    :rtype: pandas.DataFrame
+    """
+    subscribe_list = ",".join(["nf_" + item.strip() for item in symbol.split(",")])
+    quotes = await fetch_hq(subscribe_list.split(","))
+    # 按请求的合约顺序取行, 重复或缺失的合约也与 contract_name_list 一一对应
+    data_df = pd.DataFrame([quotes.get(item, []) for item in subscribe_list.split(",")])
+    contract_details = None
+    if adjust == "1":
+        loop = asyncio.get_running_loop()
+        contract_details = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    None, _futures_contract_exchange_min, item.split("_")[1]
+                )
+                for item in subscribe_list.split(",")
+            ]
+        )
+    return _futures_zh_spot_frame(
+        data_df, subscribe_list, market, adjust, contract_details
+    )
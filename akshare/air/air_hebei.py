@@ -16,9 +16,10 @@ https://110.249.223.67/publish
 """
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
+from akshare.utils.request import request_get
+
 
 def air_quality_hebei() -> pd.DataFrame:
     """
@@ -28,7 +29,7 @@ def air_quality_hebei() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "http://218.11.10.130:8080/api/hour/130000.xml"
-    r = requests.get(url)
+    r = request_get(url)
     soup = BeautifulSoup(r.content, features="xml")
     data = []
     cities = soup.find_all("City")
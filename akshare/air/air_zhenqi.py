@@ -14,10 +14,10 @@ import re
 from io import StringIO
 
 import pandas as pd
-import requests
 from py_mini_racer import MiniRacer
 
 from akshare.utils import demjson
+from akshare.utils.request import request_get, request_post
 
 
 def _get_js_path(name: str = None, module_file: str = None) -> str:
@@ -78,7 +78,7 @@ def air_city_table() -> pd.DataFrame:
             "order": "DESC",
             "type": "DAY",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         temp_df = pd.read_html(StringIO(r.text))[1].iloc[1:, :]
         del temp_df["降序"]
         temp_df.reset_index(inplace=True)
@@ -132,7 +132,7 @@ def air_quality_watch_point(
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/81.0.4044.122 Safari/537.36"
     }
-    r = requests.post(url, data=payload, headers=headers)
+    r = request_post(url, data=payload, headers=headers)
     data_text = r.text
     data_json = demjson.decode(ctx.call("decode_result", data_text))
     temp_df = pd.DataFrame(data_json["rows"])
@@ -206,7 +206,7 @@ def air_quality_hist(
         "X-Requested-With": "XMLHttpRequest",
     }
     params = {"param": ctx.call("encode_param", need)}
-    r = requests.post(url, data=params, headers=headers)
+    r = request_post(url, data=params, headers=headers)
     temp_text = ctx.call("decryptData", r.text)
     data_json = demjson.decode(ctx.call("b.decode", temp_text))
     temp_df = pd.DataFrame(data_json["result"]["data"]["rows"])
@@ -243,7 +243,7 @@ def air_quality_rank(date: str = "") -> pd.DataFrame:
             "order": "DESC",
             "type": "DAY",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         return pd.read_html(StringIO(r.text))[1].iloc[1:, :]
     elif len(date.split("-")) == 2:
         params = {
@@ -252,7 +252,7 @@ def air_quality_rank(date: str = "") -> pd.DataFrame:
             "order": "DESC",
             "type": "MONTH",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         return pd.read_html(StringIO(r.text))[2].iloc[1:, :]
     elif len(date.split("-")) == 1 and date != "实时":
         params = {
@@ -261,7 +261,7 @@ def air_quality_rank(date: str = "") -> pd.DataFrame:
             "order": "DESC",
             "type": "YEAR",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         return pd.read_html(StringIO(r.text))[3].iloc[1:, :]
     if date == "实时":
         params = {
@@ -269,7 +269,7 @@ def air_quality_rank(date: str = "") -> pd.DataFrame:
             "order": "DESC",
             "type": "MONTH",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         return pd.read_html(StringIO(r.text))[0].iloc[1:, :]
 
 
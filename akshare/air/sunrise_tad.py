@@ -9,7 +9,8 @@ https://www.timeanddate.com
 from io import StringIO
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def sunrise_city_list() -> list:
@@ -20,7 +21,7 @@ def sunrise_city_list() -> list:
     :rtype: list
     """
     url = "https://www.timeanddate.com/astronomy/china"
-    r = requests.get(url)
+    r = request_get(url)
     city_list = []
     china_city_one_df = pd.read_html(StringIO(r.text))[1]
     china_city_two_df = pd.read_html(StringIO(r.text))[2]
@@ -55,7 +56,7 @@ def sunrise_daily(date: str = "20240428", city: str = "beijing") -> pd.DataFrame
         year = date[:4]
         month = date[4:6]
         url = f"https://www.timeanddate.com/sun/china/{city}?month={month}&year={year}"
-        r = requests.get(url, verify=False)
+        r = request_get(url, verify=False)
         table = pd.read_html(StringIO(r.text), header=2)[1]
         month_df = table.iloc[:-1,]
         day_df = month_df[
@@ -88,7 +89,7 @@ def sunrise_monthly(date: str = "20240428", city: str = "beijing") -> pd.DataFra
         year = date[:4]
         month = date[4:6]
         url = f"https://www.timeanddate.com/sun/china/{city}?month={month}&year={year}"
-        r = requests.get(url)
+        r = request_get(url)
         table = pd.read_html(StringIO(r.text), header=2)[1]
         month_df = table.iloc[:-1,].copy()
         month_df.index = [date[:-2]] * len(month_df)
@@ -9,9 +9,9 @@ https://mba.tuck.dartmouth.edu/pages/faculty/ken.french/data_library.html
 from io import StringIO
 
 import pandas as pd
-import requests
 
 from akshare.article.cons import ff_home_url
+from akshare.utils.request import request_get
 
 
 def article_ff_crr() -> pd.DataFrame:
@@ -21,7 +21,7 @@ def article_ff_crr() -> pd.DataFrame:
     :return: FF多因子模型单一表格
     :rtype: pandas.DataFrame
     """
-    res = requests.get(ff_home_url)
+    res = request_get(ff_home_url)
     # first table
     list_index = (
         pd.read_html(StringIO(res.text), header=0, index_col=0)[4]
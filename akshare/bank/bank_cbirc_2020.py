@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/2/4 23:00
+Date: 2026/10/18 15:00
 Desc: 中国银行保险监督管理委员会-首页-政务信息-行政处罚-银保监分局本级-XXXX行政处罚信息公开表
 https://www.nfra.gov.cn/cn/view/pages/ItemList.html?itemPId=923&itemId=4115&itemUrl=ItemListRightList.html&itemName=%E9%93%B6%E4%BF%9D%E7%9B%91%E5%88%86%E5%B1%80%E6%9C%AC%E7%BA%A7&itemsubPId=931&itemsubPName=%E8%A1%8C%E6%94%BF%E5%A4%84%E7%BD%9A#2
 提取 具体页面 html 页面的 json 接口
@@ -13,10 +13,11 @@ import warnings
 from io import StringIO
 
 import pandas as pd
-import requests
 from tqdm import tqdm
 
 from akshare.bank.cons import cbirc_headers_without_cookie_2020
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
 
 
 def bank_fjcf_total_num(item: str = "分局本级") -> int:
@@ -40,7 +41,7 @@ def bank_fjcf_total_num(item: str = "分局本级") -> int:
         "pageSize": "18",
         "pageIndex": "1",
     }
-    res = requests.get(main_url, params=params, headers=cbirc_headers)
+    res = request_get(main_url, params=params, headers=cbirc_headers)
     return int(res.json()["data"]["total"])
 
 
@@ -67,7 +68,7 @@ def bank_fjcf_total_page(item: str = "分局本级", begin: int = 1) -> int:
         "pageSize": "18",
         "pageIndex": str(begin),
     }
-    res = requests.get(main_url, params=params, headers=cbirc_headers)
+    res = request_get(main_url, params=params, headers=cbirc_headers)
     if res.json()["data"]["total"] / 18 > int(res.json()["data"]["total"] / 18):
         total_page = int(res.json()["data"]["total"] / 18) + 1
         return total_page
@@ -94,15 +95,16 @@ def bank_fjcf_page_url(
     }
     cbirc_headers = cbirc_headers_without_cookie_2020.copy()
     main_url = "https://www.nfra.gov.cn/cbircweb/DocInfo/SelectDocByItemIdAndChild"
-    temp_df = pd.DataFrame()
+    temp_chunks = ChunkAccumulator()
     for i_page in tqdm(range(begin, page + begin), leave=False):
         params = {
             "itemId": item_id_list[item],
             "pageSize": "18",
             "pageIndex": str(i_page),
         }
-        res = requests.get(main_url, params=params, headers=cbirc_headers)
-        temp_df = pd.concat([temp_df, pd.DataFrame(res.json()["data"]["rows"])])
+        res = request_get(main_url, params=params, headers=cbirc_headers)
+        temp_chunks.append(pd.DataFrame(res.json()["data"]["rows"]))
+    temp_df = temp_chunks.to_frame(ignore_index=False)
     return temp_df[
         ["docId", "docSubtitle", "publishDate", "docFileUrl", "docTitle", "generaltype"]
     ]
@@ -123,10 +125,10 @@ def bank_fjcf_table_detail(
     :rtype: pandas.DataFrame
     """
     id_list = bank_fjcf_page_url(page=page, item=item, begin=begin)["docId"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for item in id_list:
         url = f"https://www.nfra.gov.cn/cn/static/data/DocInfo/SelectByDocId/data_docId={item}.json"
-        res = requests.get(url)
+        res = request_get(url)
         try:
             table_list = pd.read_html(StringIO(res.json()["data"]["docClob"]))[0]
             if table_list.shape[1] == 2:
@@ -160,11 +162,12 @@ def bank_fjcf_table_detail(
             table_list.append(res.json()["data"]["publishDate"])
             table_df = pd.DataFrame(table_list)
             table_df.columns = ["内容"]
-            big_df = pd.concat(objs=[big_df, table_df.T], ignore_index=True)
+            big_chunks.append(table_df.T)
             # 解决有些页面缺少字段的问题, 都放到 try 里面
         except:  # noqa: E722
             warnings.warn(f"{item} 不是表格型数据，将跳过采集")
             continue
+    big_df = big_chunks.to_frame()
     if big_df.empty:
         return pd.DataFrame()
     big_df.columns = [
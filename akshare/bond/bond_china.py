@@ -11,10 +11,10 @@ https://www.chinamoney.com.cn/chinese/mkdatabond/
 from io import StringIO
 
 import pandas as pd
-import requests
 
 from akshare.bond.bond_china_money import bond_china_close_return_map
 from akshare.utils.cons import headers
+from akshare.utils.request import request_get, request_post
 
 
 def bond_spot_quote() -> pd.DataFrame:
@@ -30,7 +30,7 @@ def bond_spot_quote() -> pd.DataFrame:
         "flag": "1",
         "lang": "cn",
     }
-    r = requests.post(url=url, data=payload, headers=headers)
+    r = request_post(url=url, data=payload, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     temp_df.columns = [
@@ -94,7 +94,7 @@ def bond_spot_deal() -> pd.DataFrame:
         "lang": "cn",
         "bondName": "",
     }
-    r = requests.post(url=url, data=payload, headers=headers)
+    r = request_post(url=url, data=payload, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     temp_df.columns = [
@@ -162,7 +162,7 @@ def bond_china_yield(
         "qxId": "ycqx",
         "locale": "cn_ZH",
     }
-    res = requests.get(url, params=params, headers=headers)
+    res = request_get(url, params=params, headers=headers)
     data_text = res.text.replace("&nbsp", "")
     data_df = pd.read_html(StringIO(data_text), header=0)[1]
     data_df["日期"] = pd.to_datetime(data_df["日期"], errors="coerce").dt.date
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/5/10 14:00
+Date: 2026/10/18 15:00
 Desc: 中国外汇交易中心暨全国银行间同业拆借中心
 https://www.chinamoney.com.cn/chinese/scsjzqxx/
 """
@@ -9,9 +9,10 @@ https://www.chinamoney.com.cn/chinese/scsjzqxx/
 import functools
 
 import pandas as pd
-import requests
 from akshare.utils.tqdm import get_tqdm
 from akshare.bond.bond_china import bond_china_close_return_map
+from akshare.utils.request import request_post
+from akshare.utils.func import ChunkAccumulator
 
 
 @functools.lru_cache()
@@ -31,7 +32,7 @@ def bond_info_cm_query(symbol: str = "评级等级") -> pd.DataFrame:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/109.0.0.0 Safari/537.36"
         }
-        r = requests.post(url, headers=headers)
+        r = request_post(url, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["enty"])
         temp_df.columns = ["code", "name"]
@@ -49,7 +50,7 @@ def bond_info_cm_query(symbol: str = "评级等级") -> pd.DataFrame:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/109.0.0.0 Safari/537.36"
         }
-        r = requests.post(url, headers=headers)
+        r = request_post(url, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"][f"{symbol_map[symbol]}"])
         if temp_df.shape[1] == 1:
@@ -136,17 +137,18 @@ def bond_info_cm(
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/109.0.0.0 Safari/537.36"
     }
-    r = requests.post(url, data=payload, headers=headers)
+    r = request_post(url, data=payload, headers=headers)
     data_json = r.json()
     total_page = data_json["data"]["pageTotal"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         payload.update({"pageNo": page})
-        r = requests.post(url, data=payload, headers=headers)
+        r = request_post(url, data=payload, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["resultList"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.rename(
         columns={
             "bondDefinedCode": "查询代码",
@@ -197,7 +199,7 @@ def bond_info_detail_cm(symbol: str = "淮安农商行CDSD2022021012") -> pd.Dat
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/109.0.0.0 Safari/537.36"
     }
-    r = requests.post(url, data=payload, headers=headers)
+    r = request_post(url, data=payload, headers=headers)
     data_json = r.json()
     data_dict = data_json["data"]["bondBaseInfo"]
     if data_dict["creditRateEntyList"]:
@@ -7,10 +7,10 @@ http://webapi.cninfo.com.cn/#/thematicStatistics
 """
 
 import pandas as pd
-import requests
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
+from akshare.utils.request import request_post
+from akshare.utils.js_pool import get_js_pool
 
 
 def _get_file_content_cninfo(file: str = "cninfo.js") -> str:
@@ -41,9 +41,8 @@ def bond_treasure_issue_cninfo(
     :rtype: pandas.DataFrame
     """
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1120"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -65,7 +64,7 @@ def bond_treasure_issue_cninfo(
         "sdate": "-".join([start_date[:4], start_date[4:6], start_date[6:]]),
         "edate": "-".join([end_date[:4], end_date[4:6], end_date[6:]]),
     }
-    r = requests.post(url, headers=headers, params=params)
+    r = request_post(url, headers=headers, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     temp_df.rename(
@@ -137,9 +136,8 @@ def bond_local_government_issue_cninfo(
     :rtype: pandas.DataFrame
     """
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1121"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -161,7 +159,7 @@ def bond_local_government_issue_cninfo(
         "sdate": "-".join([start_date[:4], start_date[4:6], start_date[6:]]),
         "edate": "-".join([end_date[:4], end_date[4:6], end_date[6:]]),
     }
-    r = requests.post(url, headers=headers, params=params)
+    r = request_post(url, headers=headers, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     temp_df.rename(
@@ -233,9 +231,8 @@ def bond_corporate_issue_cninfo(
     :rtype: pandas.DataFrame
     """
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1122"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -257,7 +254,7 @@ def bond_corporate_issue_cninfo(
         "sdate": "-".join([start_date[:4], start_date[4:6], start_date[6:]]),
         "edate": "-".join([end_date[:4], end_date[4:6], end_date[6:]]),
     }
-    r = requests.post(url, headers=headers, params=params)
+    r = request_post(url, headers=headers, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     temp_df.rename(
@@ -333,9 +330,8 @@ def bond_cov_issue_cninfo(
     :rtype: pandas.DataFrame
     """
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1123"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -357,7 +353,7 @@ def bond_cov_issue_cninfo(
         "sdate": "-".join([start_date[:4], start_date[4:6], start_date[6:]]),
         "edate": "-".join([end_date[:4], end_date[4:6], end_date[6:]]),
     }
-    r = requests.post(url, headers=headers, params=params)
+    r = request_post(url, headers=headers, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     temp_df.rename(
@@ -486,9 +482,8 @@ def bond_cov_stock_issue_cninfo() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "http://webapi.cninfo.com.cn/api/sysapi/p_sysapi1124"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -506,7 +501,7 @@ def bond_cov_stock_issue_cninfo() -> pd.DataFrame:
         "Chrome/93.0.4577.63 Safari/537.36",
         "X-Requested-With": "XMLHttpRequest",
     }
-    r = requests.post(url, headers=headers)
+    r = request_post(url, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     temp_df.rename(
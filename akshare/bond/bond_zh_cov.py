@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/7/4 15:00
+Date: 2026/10/18 15:00
 Desc: 新浪财经-债券-沪深可转债-实时行情数据和历史行情数据
 https://vip.stock.finance.sina.com.cn/mkt/#hskzz_z
 """
@@ -10,8 +10,6 @@ import datetime
 import re
 
 import pandas as pd
-import py_mini_racer
-import requests
 
 from akshare.bond.cons import (
     zh_sina_bond_hs_cov_count_url,
@@ -19,10 +17,11 @@ from akshare.bond.cons import (
     zh_sina_bond_hs_cov_url,
     zh_sina_bond_hs_cov_hist_url,
 )
-from akshare.stock.cons import hk_js_decode
 from akshare.utils import demjson
-from akshare.utils.func import fetch_paginated_data
+from akshare.utils.func import ChunkAccumulator, fetch_paginated_data
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.sina_decode import decode_sina
 
 
 def _get_zh_bond_hs_cov_page_count() -> int:
@@ -35,7 +34,7 @@ def _get_zh_bond_hs_cov_page_count() -> int:
     params = {
         "node": "hskzz_z",
     }
-    r = requests.get(zh_sina_bond_hs_cov_count_url, params=params)
+    r = request_get(zh_sina_bond_hs_cov_count_url, params=params)
     page_count = int(re.findall(re.compile(r"\d+"), r.text)[0]) / 80
     if isinstance(page_count, int):
         return page_count
@@ -50,15 +49,16 @@ def bond_zh_hs_cov_spot() -> pd.DataFrame:
     :return: 所有沪深可转债在当前时刻的实时行情数据
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     page_count = _get_zh_bond_hs_cov_page_count()
     zh_sina_bond_hs_payload_copy = zh_sina_bond_hs_cov_payload.copy()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_count + 1), leave=False):
         zh_sina_bond_hs_payload_copy.update({"page": page})
-        res = requests.get(zh_sina_bond_hs_cov_url, params=zh_sina_bond_hs_payload_copy)
+        res = request_get(zh_sina_bond_hs_cov_url, params=zh_sina_bond_hs_payload_copy)
         data_json = demjson.decode(res.text)
-        big_df = pd.concat(objs=[big_df, pd.DataFrame(data_json)], ignore_index=True)
+        big_chunks.append(pd.DataFrame(data_json))
+    big_df = big_chunks.to_frame()
     return big_df
 
 
@@ -71,17 +71,14 @@ def bond_zh_hs_cov_daily(symbol: str = "sh010107") -> pd.DataFrame:
     :return: 指定沪深可转债代码的日 K 线数据
     :rtype: pandas.DataFrame
     """
-    r = requests.get(
+    r = request_get(
         zh_sina_bond_hs_cov_hist_url.format(
             symbol, datetime.datetime.now().strftime("%Y_%m_%d")
         )
     )
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
-    data_df = pd.DataFrame(dict_list)
+    data_df = pd.DataFrame(
+        decode_sina(r.text.split("=")[1].split(";")[0].replace('"', ""))
+    )
     data_df["date"] = pd.to_datetime(data_df["date"]).dt.date
     return data_df
 
@@ -163,7 +160,7 @@ def bond_zh_hs_cov_min(
             "ut": "f057cbcbce2a86e2866ab8877db1d059",
             "ndays": "1",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             [item.split(",") for item in data_json["data"]["trends"]]
@@ -211,7 +208,7 @@ def bond_zh_hs_cov_min(
             "ut": "7eea3edcaed734bea9cbfc24409ed989",
             "forcect": "1",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             [item.split(",") for item in data_json["data"]["klines"]]
@@ -280,7 +277,7 @@ def bond_zh_hs_cov_pre_min(symbol: str = "sh113570") -> pd.DataFrame:
         "iscca": "0",
         "secid": f"{market_type[symbol[:2]]}.{symbol[2:]}",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["trends"]])
     temp_df.columns = [
@@ -329,17 +326,18 @@ def bond_zh_cov() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.columns = [
         "债券代码",
@@ -581,7 +579,7 @@ def bond_zh_cov_info(
                 "f240~10~SECURITY_CODE~REDEEM_TRIG_PRICE,f23~01~CONVERT_STOCK_CODE~PBV_RATIO",
             }
         )
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame.from_dict(data_json["result"]["data"])
         return temp_df
@@ -592,7 +590,7 @@ def bond_zh_cov_info(
                 "quoteColumns": "",
             }
         )
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame.from_dict(data_json["result"]["data"])
         return temp_df
@@ -605,7 +603,7 @@ def bond_zh_cov_info(
                 "sortTypes": "1",
             }
         )
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame.from_dict(data_json["result"]["data"])
         return temp_df
@@ -616,7 +614,7 @@ def bond_zh_cov_info(
                 "quoteColumns": "",
             }
         )
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame.from_dict(data_json["result"]["data"])
         return temp_df
@@ -645,7 +643,7 @@ def bond_zh_cov_value_analysis(symbol: str = "113527") -> pd.DataFrame:
         "p": "1",
         "ps": "8000",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
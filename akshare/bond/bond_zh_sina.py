@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/6/18 18:30
+Date: 2026/10/18 15:00
 Desc: 新浪财经-债券-沪深债券-实时行情数据和历史行情数据
 https://vip.stock.finance.sina.com.cn/mkt/#hs_z
 """
@@ -10,8 +10,6 @@ import datetime
 import re
 
 import pandas as pd
-import requests
-import py_mini_racer
 
 from akshare.bond.cons import (
     zh_sina_bond_hs_count_url,
@@ -19,9 +17,11 @@ from akshare.bond.cons import (
     zh_sina_bond_hs_url,
     zh_sina_bond_hs_hist_url,
 )
-from akshare.stock.cons import hk_js_decode
-from akshare.utils import demjson
+from akshare.utils import jsonp
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.sina_decode import decode_sina
+from akshare.utils.func import ChunkAccumulator
 
 
 def get_zh_bond_hs_page_count() -> int:
@@ -34,7 +34,7 @@ def get_zh_bond_hs_page_count() -> int:
     params = {
         "node": "hs_z",
     }
-    res = requests.get(zh_sina_bond_hs_count_url, params=params)
+    res = request_get(zh_sina_bond_hs_count_url, params=params)
     page_count = int(re.findall(re.compile(r"\d+"), res.text)[0]) / 80
     if isinstance(page_count, int):
         return page_count
@@ -57,15 +57,16 @@ def bond_zh_hs_spot(start_page: str = "1", end_page: str = "10") -> pd.DataFrame
     page_count = int(page_count)
     zh_sina_bond_hs_payload_copy = zh_sina_bond_hs_payload.copy()
     tqdm = get_tqdm()
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     start_page = int(start_page)
     end_page = int(end_page) + 1 if int(end_page) + 1 <= page_count else page_count
     for page in tqdm(range(start_page, end_page), leave=False):
         zh_sina_bond_hs_payload_copy.update({"page": page})
-        r = requests.get(zh_sina_bond_hs_url, params=zh_sina_bond_hs_payload_copy)
-        data_json = demjson.decode(r.text)
+        r = request_get(zh_sina_bond_hs_url, params=zh_sina_bond_hs_payload_copy)
+        data_json = jsonp.loads(r.text)
         temp_df = pd.DataFrame(data_json)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "代码",
         "-",
@@ -124,17 +125,14 @@ def bond_zh_hs_daily(symbol: str = "sh010107") -> pd.DataFrame:
     :return: 指定沪深债券代码的日 K 线数据
     :rtype: pandas.DataFrame
     """
-    r = requests.get(
+    r = request_get(
         zh_sina_bond_hs_hist_url.format(
             symbol, datetime.datetime.now().strftime("%Y_%m_%d")
         )
     )
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行 js 解密代码
-    data_df = pd.DataFrame(dict_list)
+    data_df = pd.DataFrame(
+        decode_sina(r.text.split("=")[1].split(";")[0].replace('"', ""))
+    )
     data_df["date"] = pd.to_datetime(data_df["date"], errors="coerce").dt.date
     data_df["open"] = pd.to_numeric(data_df["open"], errors="coerce")
     data_df["high"] = pd.to_numeric(data_df["high"], errors="coerce")
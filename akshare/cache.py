@@ -0,0 +1,333 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 接口结果的本地持久化缓存
+默认关闭, 调用 akshare.cache.enable() 后, 使用 @cached 装饰的接口会按
+"函数名称 + 规范化后的参数" 将结果保存到本地 SQLite 文件中;
+每个接口可以声明自己的有效期(TTL), 超过容量上限时按最近最少使用(LRU)淘汰
+"""
+
+import datetime
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Optional, Union
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".akshare", "cache.sqlite")
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+# 常用的有效期(秒), None 表示永不过期
+TTL_SPOT = 5
+TTL_INTRADAY = 60
+TTL_DAILY = 6 * 60 * 60
+TTL_FOREVER = None
+
+TTLPolicy = Union[None, float, Callable[[Dict], Optional[float]]]
+
+
+class _CacheStore:
+    """
+    基于 SQLite 的缓存存储, 多线程共享同一个连接
+    """
+
+    def __init__(self, path: str, max_size: int):
+        self.path = path
+        self.max_size = max_size
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, func TEXT, created REAL, expires REAL, "
+            "accessed REAL, size INTEGER, value BLOB)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_accessed ON cache (accessed)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires, value FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            expires, value = row
+            if expires is not None and expires <= now:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE cache SET accessed = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            return value
+
+    def set(self, key: str, func: str, value: bytes, ttl: Optional[float]) -> None:
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, func, now, expires, now, len(value), value),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """
+        删除过期数据, 超过容量上限时按最近访问时间淘汰
+        """
+        self._conn.execute(
+            "DELETE FROM cache WHERE expires IS NOT NULL AND expires <= ?",
+            (time.time(),),
+        )
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache"
+        ).fetchone()[0]
+        if total <= self.max_size:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM cache ORDER BY accessed"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_size:
+                break
+            evicted.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM cache WHERE key = ?", evicted)
+
+    def purge(self, func: str = None, expired_only: bool = False) -> int:
+        sql = "DELETE FROM cache WHERE 1 = 1"
+        args = []
+        if func is not None:
+            sql += " AND func = ?"
+            args.append(func)
+        if expired_only:
+            sql += " AND expires IS NOT NULL AND expires <= ?"
+            args.append(time.time())
+        with self._lock:
+            count = self._conn.execute(sql, args).rowcount
+            self._conn.commit()
+        if not expired_only:
+            with self._lock:
+                self._conn.execute("VACUUM")
+        return count
+
+    def entries(self) -> list:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT func, COUNT(*), SUM(size), MIN(created), MAX(accessed) "
+                "FROM cache GROUP BY func ORDER BY func"
+            ).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_store: Optional[_CacheStore] = None
+_ttl_overrides: Dict[str, TTLPolicy] = {}
+_stats: Dict[str, Dict[str, int]] = {}
+_stats_lock = threading.Lock()
+
+
+def enable(path: str = DEFAULT_CACHE_PATH, max_size: int = DEFAULT_MAX_SIZE) -> None:
+    """
+    开启本地缓存
+    :param path: SQLite 缓存文件路径
+    :type path: str
+    :param max_size: 缓存容量上限(字节), 超过后按 LRU 淘汰
+    :type max_size: int
+    :return: None
+    :rtype: None
+    """
+    global _store
+    disable()
+    _store = _CacheStore(path=path, max_size=max_size)
+
+
+def disable() -> None:
+    """
+    关闭本地缓存, 已缓存的数据保留在磁盘上
+    :return: None
+    :rtype: None
+    """
+    global _store
+    if _store is not None:
+        _store.close()
+    _store = None
+
+
+def is_enabled() -> bool:
+    """
+    本地缓存是否开启
+    :return: 是否开启
+    :rtype: bool
+    """
+    return _store is not None
+
+
+def set_ttl(func: Union[str, Callable], ttl: TTLPolicy) -> None:
+    """
+    覆盖指定接口的缓存有效期
+    :param func: 接口名称或接口函数
+    :type func: str or callable
+    :param ttl: 有效期(秒); None 表示永不过期, 0 表示不缓存, 也可以是接收参数字典返回有效期的函数
+    :type ttl: float or callable
+    :return: None
+    :rtype: None
+    """
+    name = func if isinstance(func, str) else func.__name__
+    _ttl_overrides[name] = ttl
+
+
+def purge(func: Union[str, Callable] = None, expired_only: bool = False) -> int:
+    """
+    清除缓存
+    :param func: 只清除指定接口的缓存, 默认清除全部
+    :type func: str or callable
+    :param expired_only: 只清除已过期的缓存
+    :type expired_only: bool
+    :return: 删除的条目数量
+    :rtype: int
+    """
+    if _store is None:
+        return 0
+    name = func if func is None or isinstance(func, str) else func.__name__
+    return _store.purge(func=name, expired_only=expired_only)
+
+
+def stats():
+    """
+    缓存命中统计以及各接口的缓存占用
+    :return: 缓存统计
+    :rtype: pandas.DataFrame
+    """
+    import pandas as pd
+
+    with _stats_lock:
+        temp_df = pd.DataFrame.from_dict(
+            _stats, orient="index", columns=["hits", "misses"]
+        )
+    temp_df.index.name = "func"
+    if _store is not None:
+        entry_df = pd.DataFrame(
+            _store.entries(),
+            columns=["func", "entries", "size", "oldest", "last_access"],
+        ).set_index("func")
+        entry_df["oldest"] = pd.to_datetime(entry_df["oldest"], unit="s")
+        entry_df["last_access"] = pd.to_datetime(entry_df["last_access"], unit="s")
+        temp_df = temp_df.join(entry_df, how="outer")
+    temp_df = temp_df.reset_index()
+    if temp_df.empty:
+        return temp_df
+    temp_df[["hits", "misses"]] = temp_df[["hits", "misses"]].fillna(0).astype(int)
+    temp_df["hit_rate"] = temp_df["hits"] / (temp_df["hits"] + temp_df["misses"]).where(
+        lambda x: x > 0
+    )
+    return temp_df
+
+
+def reset_stats() -> None:
+    """
+    清零缓存命中统计
+    :return: None
+    :rtype: None
+    """
+    with _stats_lock:
+        _stats.clear()
+
+
+def _record(name: str, hit: bool) -> None:
+    with _stats_lock:
+        item = _stats.setdefault(name, {"hits": 0, "misses": 0})
+        item["hits" if hit else "misses"] += 1
+
+
+def _make_key(name: str, arguments: Dict) -> str:
+    payload = json.dumps(arguments, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha1(f"{name}:{payload}".encode("utf-8")).hexdigest()
+
+
+def history_ttl(
+    end_param: str = "end_date", recent_ttl: Optional[float] = TTL_DAILY
+) -> Callable[[Dict], Optional[float]]:
+    """
+    历史行情的有效期策略: 结束日期早于今天时数据已收盘不再变化, 永不过期;
+    否则最后一根 K 线仍可能变化, 使用 recent_ttl; 不复权和后复权以外的 adjust(如前复权, 复权因子)
+    在除权除息后会整体改写或不受日期范围限制, 也使用 recent_ttl
+    :param end_param: 结束日期参数名称
+    :type end_param: str
+    :param recent_ttl: 包含当天数据或非 ""/"hfq" 复权方式时的有效期(秒)
+    :type recent_ttl: float
+    :return: 有效期策略函数
+    :rtype: callable
+    """
+
+    def policy(arguments: Dict) -> Optional[float]:
+        if (arguments.get("adjust") or "") not in ("", "hfq"):
+            return recent_ttl
+        end_date = "".join(
+            char for char in str(arguments.get(end_param, "")) if char.isdigit()
+        )[:8]
+        today = datetime.date.today().strftime("%Y%m%d")
+        if len(end_date) == 8 and end_date < today:
+            return TTL_FOREVER
+        return recent_ttl
+
+    return policy
+
+
+def cached(ttl: TTLPolicy = TTL_DAILY) -> Callable:
+    """
+    接口缓存装饰器, 缓存未开启时直接调用原函数; 空结果和异常不会被缓存
+    :param ttl: 有效期(秒); None 表示永不过期, 0 表示不缓存, 也可以是接收参数字典返回有效期的函数
+    :type ttl: float or callable
+    :return: 装饰器
+    :rtype: callable
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        name = func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            store = _store
+            if store is None:
+                return func(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            policy = _ttl_overrides.get(name, ttl)
+            expire = policy(arguments) if callable(policy) else policy
+            if expire is not None and expire <= 0:
+                return func(*args, **kwargs)
+            key = _make_key(f"{func.__module__}.{name}", arguments)
+            value = store.get(key)
+            if value is not None:
+                _record(name, hit=True)
+                return pickle.loads(value)
+            _record(name, hit=False)
+            result = func(*args, **kwargs)
+            if getattr(result, "empty", False) or result is None:
+                return result
+            store.set(key, name, pickle.dumps(result, pickle.HIGHEST_PROTOCOL), expire)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -7,7 +7,8 @@ https://datacenter.jin10.com/reportType/dc_cme_btc_report
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def crypto_bitcoin_cme(date: str = "20230830") -> pd.DataFrame:
@@ -43,7 +44,7 @@ def crypto_bitcoin_cme(date: str = "20230830") -> pd.DataFrame:
         "x-csrf-token": "",
         "x-version": "1.0.0",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(
         [item for item in data_json["data"]["values"]],
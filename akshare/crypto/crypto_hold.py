@@ -7,7 +7,8 @@ https://datacenter.jin10.com/dc_report?name=bitcoint
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def crypto_bitcoin_hold_report():
@@ -22,7 +23,7 @@ def crypto_bitcoin_hold_report():
         "X-App-Id": "lnFP5lxse24wPgtY",
         "X-Version": "1.0.0",
     }
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"]["values"])
     temp_df.columns = [
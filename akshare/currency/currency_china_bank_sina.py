@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/12/8 17:20
+Date: 2026/10/18 15:00
 Desc: 新浪财经-中行人民币牌价历史数据查询
 https://biz.finance.sina.com.cn/forex/forex.php?startdate=2012-01-01&enddate=2021-06-14&money_code=EUR&type=0
 """
@@ -10,10 +10,12 @@ from functools import lru_cache
 from io import StringIO
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
+
 
 @lru_cache()
 def _currency_boc_sina_map(
@@ -36,7 +38,7 @@ def _currency_boc_sina_map(
         "money_code": "EUR",
         "type": "0",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     r.encoding = "gbk"
     soup = BeautifulSoup(r.text, "lxml")
     data_dict = dict(
@@ -79,17 +81,18 @@ def currency_boc_sina(
         "page": "1",
         "call_type": "ajax",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     soup = BeautifulSoup(r.text, features="lxml")
     soup.find(attrs={"id": "money_code"})
     page_element_list = soup.find_all("a", attrs={"class": "page"})
     page_num = int(page_element_list[-2].text) if len(page_element_list) != 0 else 1
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in tqdm(range(1, page_num + 1), leave=False):
         params.update({"page": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         temp_df = pd.read_html(StringIO(r.text), header=0)[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "日期",
         "中行汇买价",
@@ -11,9 +11,10 @@ from datetime import datetime
 from io import StringIO
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
+from akshare.utils.request import request_get, request_post
+
 
 def currency_boc_safe() -> pd.DataFrame:
     """
@@ -23,7 +24,7 @@ def currency_boc_safe() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://www.safe.gov.cn/safe/2020/1218/17833.html"
-    r = requests.get(url)
+    r = request_get(url)
     r.encoding = "utf8"
     soup = BeautifulSoup(r.text, features="lxml")
     content = soup.find(name="a", string=re.compile("人民币汇率"))["href"]
@@ -43,7 +44,7 @@ def currency_boc_safe() -> pd.DataFrame:
         "endDate": end_date,
         "queryYN": "true",
     }
-    r = requests.post(url, data=payload)
+    r = request_post(url, data=payload)
     current_temp_df = pd.read_html(StringIO(r.text))[-1]
     current_temp_df.sort_values(by=["日期"], inplace=True)
     current_temp_df.reset_index(inplace=True, drop=True)
@@ -24,6 +24,8 @@ import time
 import pandas as pd
 import requests
 
+from akshare.utils.request import request_get
+
 
 def __get_interest_rate_data(attr_id: str, name: str = "利率") -> pd.DataFrame:
     """
@@ -57,7 +59,7 @@ def __get_interest_rate_data(attr_id: str, name: str = "利率") -> pd.DataFrame
     interest_rate_data = []
     try:
         while True:
-            response = requests.get(
+            response = request_get(
                 url=base_url, params=params, headers=headers, timeout=10
             )
             data = response.json()
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/11/12 15:20
+Date: 2026/10/18 15:00
 Desc: 宏观数据-中国
 """
 
@@ -21,6 +21,8 @@ from akshare.economic.cons import (
 )
 from akshare.utils import demjson
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 class TLSAdapter(HTTPAdapter):
@@ -60,14 +62,14 @@ def __macro_china_base_func(symbol: str, params: dict) -> pd.DataFrame:
     }
     url = "https://datacenter-api.jin10.com/reports/list_v2"
     params = params
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     while True:
-        r = requests.get(url, params=params, headers=headers)
+        r = request_get(url, params=params, headers=headers)
         data_json = r.json()
         if not data_json["data"]["values"]:
             break
         temp_df = pd.DataFrame(data_json["data"]["values"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
         last_date_str = temp_df.iat[-1, 0]
         last_date_str = (
             (
@@ -78,6 +80,7 @@ def __macro_china_base_func(symbol: str, params: dict) -> pd.DataFrame:
             .isoformat()
         )
         params.update({"max_date": f"{last_date_str}"})
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "日期",
         "今值",
@@ -127,7 +130,7 @@ def macro_china_qyspjg() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.rename(
@@ -221,7 +224,7 @@ def macro_china_fdi() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
 
@@ -332,7 +335,7 @@ def macro_china_urban_unemployment() -> pd.DataFrame:
         "k1": "1691326382042",
         "h": "1",
     }
-    r = requests.get(url, params=params, verify=False)
+    r = request_get(url, params=params, verify=False)
     r.encoding = "utf-8"
     data_json = r.json()
     value_list = [item["data"]["data"] for item in data_json["returndata"]["datanodes"]]
@@ -640,7 +643,7 @@ def macro_china_shibor_all() -> pd.DataFrame:
 
     t = time.time()
     params = {"_": t}
-    res = requests.get(
+    res = request_get(
         url="https://cdn.jin10.com/data_center/reports/il_1.json", params=params
     )
     json_data = res.json()
@@ -686,7 +689,7 @@ def macro_china_hk_market_info() -> pd.DataFrame:
 
     t = time.time()
     params = {"_": t}
-    res = requests.get(
+    res = request_get(
         url="https://cdn.jin10.com/data_center/reports/il_2.json", params=params
     )
     json_data = res.json()
@@ -727,7 +730,7 @@ def macro_china_daily_energy() -> pd.DataFrame:
     :return: pandas.DataFrame
     """
     t = time.time()
-    res = requests.get(
+    res = request_get(
         JS_CHINA_ENERGY_DAILY_URL.format(
             str(int(round(t * 1000))), str(int(round(t * 1000)) + 90)
         )
@@ -759,7 +762,7 @@ def macro_china_rmb() -> pd.DataFrame:
     """
     t = time.time()
     params = {"_": t}
-    res = requests.get(
+    res = request_get(
         "https://cdn.jin10.com/data_center/reports/exchange_rate.json",
         params=params,
     )
@@ -866,7 +869,7 @@ def macro_china_market_margin_sz() -> pd.DataFrame:
     """
     t = time.time()
     params = {"_": t}
-    res = requests.get(
+    res = request_get(
         url="https://cdn.jin10.com/data_center/reports/fs_2.json", params=params
     )
     json_data = res.json()
@@ -898,7 +901,7 @@ def macro_china_market_margin_sh() -> pd.DataFrame:
     url = "https://cdn.jin10.com/data_center/reports/fs_1.json"
     t = time.time()
     params = {"_": t}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     json_data = r.json()
     temp_df = pd.DataFrame(json_data["values"]).T
     temp_df.reset_index(inplace=True)
@@ -931,11 +934,11 @@ def macro_china_au_report() -> pd.DataFrame:
     """
     t = time.time()
     params = {"_": t}
-    res = requests.get(
+    res = request_get(
         url="https://cdn.jin10.com/data_center/reports/sge.json", params=params
     )
     json_data = res.json()
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for item in json_data["values"].keys():
         temp_df = pd.DataFrame(json_data["values"][item])
         temp_df["date"] = item
@@ -955,7 +958,8 @@ def macro_china_au_report() -> pd.DataFrame:
             "交收量",
             "日期",
         ]
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df = big_df[
         [
             "日期",
@@ -1006,17 +1010,18 @@ def macro_china_lpr() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df["TRADE_DATE"] = pd.to_datetime(big_df["TRADE_DATE"], errors="coerce").dt.date
     big_df["LPR1Y"] = pd.to_numeric(big_df["LPR1Y"], errors="coerce")
@@ -1058,7 +1063,7 @@ def macro_china_new_house_price(
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
@@ -1130,7 +1135,7 @@ def macro_china_enterprise_boom_index() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
@@ -1197,7 +1202,7 @@ def macro_china_national_tax_receipts() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
 
@@ -1231,7 +1236,7 @@ def macro_china_bank_financing() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
@@ -1277,7 +1282,7 @@ def macro_china_insurance_income() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
@@ -1323,7 +1328,7 @@ def macro_china_mobile_number() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.drop_duplicates(inplace=True)
@@ -1370,17 +1375,18 @@ def macro_china_vegetable_basket() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1425,17 +1431,18 @@ def macro_china_agricultural_product() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1480,17 +1487,18 @@ def macro_china_agricultural_index() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1535,17 +1543,18 @@ def macro_china_energy_index() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1590,17 +1599,18 @@ def macro_china_commodity_price_index() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1645,17 +1655,18 @@ def macro_global_sox_index() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1700,17 +1711,18 @@ def macro_china_yw_electronic_index() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1758,17 +1770,18 @@ def macro_china_construction_index() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1813,17 +1826,18 @@ def macro_china_construction_price_index() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1868,17 +1882,18 @@ def macro_china_lpi_index() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1923,17 +1938,18 @@ def macro_china_bdti_index() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1978,17 +1994,18 @@ def macro_china_bsi_index() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -2033,17 +2050,18 @@ def _em_macro_1(em_id) -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -2134,7 +2152,7 @@ def macro_china_new_financial_credit() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
 
@@ -2186,7 +2204,7 @@ def macro_china_fx_gold() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
@@ -2249,7 +2267,7 @@ def macro_china_stock_market_cap() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
@@ -2334,7 +2352,7 @@ def macro_china_money_supply() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
@@ -2418,7 +2436,7 @@ def macro_china_cpi() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
@@ -2492,7 +2510,7 @@ def macro_china_gdp() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
@@ -2568,7 +2586,7 @@ def macro_china_ppi() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
@@ -2613,7 +2631,7 @@ def macro_china_pmi() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
@@ -2665,7 +2683,7 @@ def macro_china_gdzctz() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
 
@@ -2716,7 +2734,7 @@ def macro_china_hgjck() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.rename(
@@ -2805,7 +2823,7 @@ def macro_china_czsr() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
 
@@ -2858,7 +2876,7 @@ def macro_china_whxd() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
 
@@ -2908,7 +2926,7 @@ def macro_china_wbck() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
 
@@ -2959,7 +2977,7 @@ def macro_china_xfzxx() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
 
@@ -3042,7 +3060,7 @@ def macro_china_gyzjz() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
@@ -3088,7 +3106,7 @@ def macro_china_reserve_requirement_ratio() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
@@ -3176,7 +3194,7 @@ def macro_china_consumer_goods_retail() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
@@ -3221,18 +3239,20 @@ def macro_china_society_electricity() -> pd.DataFrame:
         "num": "31",
         "condition": "",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"])
+    big_chunks = ChunkAccumulator()
+    big_chunks.append(pd.DataFrame(data_json["data"]))
     for i in range(1, page_num):
         params.update({"from": i * 31})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         data_json = demjson.decode(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.columns = [
         "统计时间",
@@ -3274,19 +3294,21 @@ def macro_china_society_traffic_volume() -> pd.DataFrame:
         "num": "31",
         "condition": "",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"]["非累计"])
+    big_chunks = ChunkAccumulator()
+    big_chunks.append(pd.DataFrame(data_json["data"]["非累计"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num), leave=False):
         params.update({"from": i * 31})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         data_json = demjson.decode(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"]["非累计"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     big_df["货运量"] = pd.to_numeric(big_df["货运量"], errors="coerce")
     big_df["货运量同比增长"] = pd.to_numeric(big_df["货运量同比增长"], errors="coerce")
@@ -3332,19 +3354,21 @@ def macro_china_postal_telecommunicational() -> pd.DataFrame:
         "num": "31",
         "condition": "",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"]["非累计"])
+    big_chunks = ChunkAccumulator()
+    big_chunks.append(pd.DataFrame(data_json["data"]["非累计"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num), leave=False):
         params.update({"from": i * 31})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         data_json = demjson.decode(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"]["非累计"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     for item in big_df.columns[1:]:
         big_df[item] = pd.to_numeric(big_df[item], errors="coerce")
@@ -3366,19 +3390,21 @@ def macro_china_international_tourism_fx() -> pd.DataFrame:
         "num": "31",
         "condition": "",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"])
+    big_chunks = ChunkAccumulator()
+    big_chunks.append(pd.DataFrame(data_json["data"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num)):
         params.update({"from": i * 31})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         data_json = demjson.decode(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     big_df["数量"] = pd.to_numeric(big_df["数量"], errors="coerce")
     big_df["比重"] = pd.to_numeric(big_df["比重"], errors="coerce")
@@ -3400,19 +3426,21 @@ def macro_china_passenger_load_factor() -> pd.DataFrame:
         "num": "31",
         "condition": "",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"])
+    big_chunks = ChunkAccumulator()
+    big_chunks.append(pd.DataFrame(data_json["data"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num)):
         params.update({"from": i * 31})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         data_json = demjson.decode(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     big_df["客座率"] = pd.to_numeric(big_df["客座率"], errors="coerce")
     big_df["载运率"] = pd.to_numeric(big_df["载运率"], errors="coerce")
@@ -3434,7 +3462,7 @@ def _macro_china_freight_index() -> pd.DataFrame:
         "num": "31",
         "condition": "",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
@@ -3442,7 +3470,7 @@ def _macro_china_freight_index() -> pd.DataFrame:
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num)):
         params.update({"from": i * 31})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         data_json = demjson.decode(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
@@ -3466,7 +3494,7 @@ def macro_china_freight_index() -> pd.DataFrame:
         "num": 5000,
         "condition": "",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     columns_list = r.content.decode("gbk").split("\n")[2].split(", ")
     columns_list = [item.strip() for item in columns_list]
     content_list = r.content.decode("gbk").split("\n")[3:]
@@ -3511,19 +3539,21 @@ def macro_china_central_bank_balance() -> pd.DataFrame:
         "num": "31",
         "condition": "",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"])
+    big_chunks = ChunkAccumulator()
+    big_chunks.append(pd.DataFrame(data_json["data"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num)):
         params.update({"from": i * 31})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         data_json = demjson.decode(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     for item in big_df.columns[1:]:
         big_df[item] = pd.to_numeric(big_df[item], errors="coerce")
@@ -3545,19 +3575,21 @@ def macro_china_insurance() -> pd.DataFrame:
         "num": "31",
         "condition": "",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"])
+    big_chunks = ChunkAccumulator()
+    big_chunks.append(pd.DataFrame(data_json["data"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num)):
         params.update({"from": i * 31})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         data_json = demjson.decode(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     for item in big_df.columns[2:]:
         big_df[item] = pd.to_numeric(big_df[item], errors="coerce")
@@ -3579,19 +3611,21 @@ def macro_china_supply_of_money() -> pd.DataFrame:
         "num": "31",
         "condition": "",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"])
+    big_chunks = ChunkAccumulator()
+    big_chunks.append(pd.DataFrame(data_json["data"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num)):
         params.update({"from": i * 31})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         data_json = demjson.decode(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     for item in big_df.columns[1:]:
         big_df[item] = pd.to_numeric(big_df[item], errors="coerce")
@@ -3613,19 +3647,21 @@ def macro_china_foreign_exchange_gold() -> pd.DataFrame:
         "num": "31",
         "condition": "",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"])
+    big_chunks = ChunkAccumulator()
+    big_chunks.append(pd.DataFrame(data_json["data"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num), leave=False):
         params.update({"from": i * 31})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         data_json = demjson.decode(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     big_df.sort_values(by=["统计时间"], ignore_index=True, inplace=True)
     big_df["黄金储备"] = pd.to_numeric(big_df["黄金储备"], errors="coerce")
@@ -3648,19 +3684,21 @@ def macro_china_retail_price_index() -> pd.DataFrame:
         "num": "31",
         "condition": "",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"])
+    big_chunks = ChunkAccumulator()
+    big_chunks.append(pd.DataFrame(data_json["data"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num), leave=False):
         params.update({"from": i * 31})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         data_json = demjson.decode(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     big_df.sort_values(by=["统计月份"], ignore_index=True, inplace=True)
     big_df["零售商品价格指数"] = pd.to_numeric(
@@ -3693,17 +3731,18 @@ def macro_china_real_estate() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params, headers=headers)
+        r = request_get(url, params=params, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "日期",
         "最新值",
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/4/3 16:08
+Date: 2026/10/18 15:00
 Desc: 金十数据-数据中心-主要机构-宏观经济
 https://datacenter.jin10.com/
 """
@@ -10,9 +10,11 @@ import datetime
 import time
 
 import pandas as pd
-import requests
 from tqdm import tqdm
 
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
+
 
 def macro_cons_gold() -> pd.DataFrame:
     """
@@ -36,14 +38,14 @@ def macro_cons_gold() -> pd.DataFrame:
         "max_date": "",
         "_": str(int(round(t * 1000))),
     }
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     while True:
-        r = requests.get(url, params=params, headers=headers)
+        r = request_get(url, params=params, headers=headers)
         data_json = r.json()
         if not data_json["data"]["values"]:
             break
         temp_df = pd.DataFrame(data_json["data"]["values"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
         last_date_str = temp_df.iat[-1, 0]
         last_date_str = (
             (
@@ -54,6 +56,7 @@ def macro_cons_gold() -> pd.DataFrame:
             .isoformat()
         )
         params.update({"max_date": f"{last_date_str}"})
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "日期",
         "总库存",
@@ -101,14 +104,14 @@ def macro_cons_silver() -> pd.DataFrame:
         "max_date": "",
         "_": str(int(round(t * 1000))),
     }
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     while True:
-        r = requests.get(url, params=params, headers=headers)
+        r = request_get(url, params=params, headers=headers)
         data_json = r.json()
         if not data_json["data"]["values"]:
             break
         temp_df = pd.DataFrame(data_json["data"]["values"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
         last_date_str = temp_df.iat[-1, 0]
         last_date_str = (
             (
@@ -119,6 +122,7 @@ def macro_cons_silver() -> pd.DataFrame:
             .isoformat()
         )
         params.update({"max_date": f"{last_date_str}"})
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "日期",
         "总库存",
@@ -172,7 +176,7 @@ def macro_cons_opec_month() -> pd.DataFrame:
         "x-csrf-token": "",
         "x-version": "1.0.0",
     }
-    res = requests.get(
+    res = request_get(
         url=f"https://datacenter-api.jin10.com/reports/dates?category=opec&_={str(int(round(t * 1000)))}",
         headers=headers,
     )  # 日期序列
@@ -180,7 +184,7 @@ def macro_cons_opec_month() -> pd.DataFrame:
     bar = tqdm(reversed(all_date_list))
     for item in bar:
         bar.set_description(f"Please wait for a moment, now downloading {item}'s data")
-        res = requests.get(
+        res = request_get(
             url=f"https://datacenter-api.jin10.com/reports/list?"
             f"category=opec&date={item}&_={str(int(round(t * 1000)))}",
             headers=headers,
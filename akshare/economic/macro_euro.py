@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/4/3 17:08
+Date: 2026/10/18 15:00
 Desc: 金十数据中心-经济指标-欧元区
 金十数据中心-经济指标-欧元区-国民经济运行状况-经济状况
 金十数据中心-经济指标-欧元区-国民经济运行状况-物价水平
@@ -14,9 +14,11 @@ Desc: 金十数据中心-经济指标-欧元区
 import time
 
 import pandas as pd
-import requests
 from tqdm import tqdm
 
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
+
 
 # 金十数据中心-经济指标-欧元区-国民经济运行状况
 # 金十数据中心-经济指标-欧元区-国民经济运行状况-经济状况
@@ -39,11 +41,11 @@ def macro_euro_gdp_yoy() -> pd.DataFrame:
         "x-version": "1.0.0",
     }
 
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -58,13 +60,14 @@ def macro_euro_gdp_yoy() -> pd.DataFrame:
             "x-csrf-token": "x-csrf-token",
             "x-version": "1.0.0",
         }
-        r = requests.get(url, headers=headers, params=params)
+        r = request_get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df["商品"] = "欧元区季度GDP年率"
 
@@ -97,11 +100,11 @@ def macro_euro_cpi_mom() -> pd.DataFrame:
         "x-version": "1.0.0",
     }
 
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -116,13 +119,14 @@ def macro_euro_cpi_mom() -> pd.DataFrame:
             "x-csrf-token": "x-csrf-token",
             "x-version": "1.0.0",
         }
-        r = requests.get(url, headers=headers, params=params)
+        r = request_get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["商品"] = "欧元区CPI月率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -156,11 +160,11 @@ def macro_euro_cpi_yoy() -> pd.DataFrame:
         "x-version": "1.0.0",
     }
 
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -175,13 +179,14 @@ def macro_euro_cpi_yoy() -> pd.DataFrame:
             "x-csrf-token": "x-csrf-token",
             "x-version": "1.0.0",
         }
-        r = requests.get(url, headers=headers, params=params)
+        r = request_get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["商品"] = "欧元区CPI年率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -214,11 +219,11 @@ def macro_euro_ppi_mom() -> pd.DataFrame:
         "x-csrf-token": "x-csrf-token",
         "x-version": "1.0.0",
     }
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -233,13 +238,14 @@ def macro_euro_ppi_mom() -> pd.DataFrame:
             "x-csrf-token": "x-csrf-token",
             "x-version": "1.0.0",
         }
-        r = requests.get(url, headers=headers, params=params)
+        r = request_get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["商品"] = "欧元区PPI月率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -273,11 +279,11 @@ def macro_euro_retail_sales_mom() -> pd.DataFrame:
         "x-version": "1.0.0",
     }
 
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -292,13 +298,14 @@ def macro_euro_retail_sales_mom() -> pd.DataFrame:
             "x-csrf-token": "x-csrf-token",
             "x-version": "1.0.0",
         }
-        r = requests.get(url, headers=headers, params=params)
+        r = request_get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["商品"] = "欧元区零售销售月率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -329,11 +336,11 @@ def macro_euro_employment_change_qoq() -> pd.DataFrame:
         "x-version": "1.0.0",
     }
 
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -348,13 +355,14 @@ def macro_euro_employment_change_qoq() -> pd.DataFrame:
             "x-csrf-token": "x-csrf-token",
             "x-version": "1.0.0",
         }
-        r = requests.get(url, headers=headers, params=params)
+        r = request_get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["商品"] = "欧元区季调后就业人数季率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -388,11 +396,11 @@ def macro_euro_unemployment_rate_mom() -> pd.DataFrame:
         "x-version": "1.0.0",
     }
 
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -407,13 +415,14 @@ def macro_euro_unemployment_rate_mom() -> pd.DataFrame:
             "x-csrf-token": "x-csrf-token",
             "x-version": "1.0.0",
         }
-        r = requests.get(url, headers=headers, params=params)
+        r = request_get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["商品"] = "欧元区失业率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -447,11 +456,11 @@ def macro_euro_trade_balance() -> pd.DataFrame:
         "x-version": "1.0.0",
     }
 
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -466,13 +475,14 @@ def macro_euro_trade_balance() -> pd.DataFrame:
             "x-csrf-token": "x-csrf-token",
             "x-version": "1.0.0",
         }
-        r = requests.get(url, headers=headers, params=params)
+        r = request_get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["商品"] = "欧元区未季调贸易帐"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -506,11 +516,11 @@ def macro_euro_current_account_mom() -> pd.DataFrame:
         "x-version": "1.0.0",
     }
 
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -525,13 +535,14 @@ def macro_euro_current_account_mom() -> pd.DataFrame:
             "x-csrf-token": "x-csrf-token",
             "x-version": "1.0.0",
         }
-        r = requests.get(url, headers=headers, params=params)
+        r = request_get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["商品"] = "欧元区经常帐"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -565,11 +576,11 @@ def macro_euro_industrial_production_mom() -> pd.DataFrame:
         "x-version": "1.0.0",
     }
 
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -584,13 +595,14 @@ def macro_euro_industrial_production_mom() -> pd.DataFrame:
             "x-csrf-token": "x-csrf-token",
             "x-version": "1.0.0",
         }
-        r = requests.get(url, headers=headers, params=params)
+        r = request_get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["商品"] = "欧元区工业产出月率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -624,11 +636,11 @@ def macro_euro_manufacturing_pmi() -> pd.DataFrame:
         "x-version": "1.0.0",
     }
 
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -643,13 +655,14 @@ def macro_euro_manufacturing_pmi() -> pd.DataFrame:
             "x-csrf-token": "x-csrf-token",
             "x-version": "1.0.0",
         }
-        r = requests.get(url, headers=headers, params=params)
+        r = request_get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["商品"] = "欧元区制造业PMI初值"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -683,11 +696,11 @@ def macro_euro_services_pmi() -> pd.DataFrame:
         "x-version": "1.0.0",
     }
 
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -702,13 +715,14 @@ def macro_euro_services_pmi() -> pd.DataFrame:
             "x-csrf-token": "x-csrf-token",
             "x-version": "1.0.0",
         }
-        r = requests.get(url, headers=headers, params=params)
+        r = request_get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["商品"] = "欧元区服务业PMI终值"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -741,11 +755,11 @@ def macro_euro_zew_economic_sentiment() -> pd.DataFrame:
         "x-csrf-token": "x-csrf-token",
         "x-version": "1.0.0",
     }
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -760,13 +774,14 @@ def macro_euro_zew_economic_sentiment() -> pd.DataFrame:
             "x-csrf-token": "x-csrf-token",
             "x-version": "1.0.0",
         }
-        r = requests.get(url, headers=headers, params=params)
+        r = request_get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["商品"] = "欧元区ZEW经济景气指数"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -799,11 +814,11 @@ def macro_euro_sentix_investor_confidence() -> pd.DataFrame:
         "x-csrf-token": "x-csrf-token",
         "x-version": "1.0.0",
     }
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -818,13 +833,14 @@ def macro_euro_sentix_investor_confidence() -> pd.DataFrame:
             "x-csrf-token": "x-csrf-token",
             "x-version": "1.0.0",
         }
-        r = requests.get(url, headers=headers, params=params)
+        r = request_get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["商品"] = "欧元区Sentix投资者信心指数"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -846,7 +862,7 @@ def macro_euro_lme_holding() -> pd.DataFrame:
     """
     t = time.time()
     params = {"_": str(int(round(t * 1000)))}
-    r = requests.get(
+    r = request_get(
         url="https://cdn.jin10.com/data_center/reports/lme_position.json", params=params
     )
     json_data = r.json()
@@ -877,7 +893,7 @@ def macro_euro_lme_stock() -> pd.DataFrame:
     """
     t = time.time()
     params = {"_": str(int(round(t * 1000)))}
-    r = requests.get(
+    r = request_get(
         url="https://cdn.jin10.com/data_center/reports/lme_stock.json", params=params
     )
     json_data = r.json()
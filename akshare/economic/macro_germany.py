@@ -6,7 +6,8 @@ Desc: 东方财富-德国-经济数据
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def macro_germany_core(symbol: str = "EMG00179154") -> pd.DataFrame:
@@ -33,7 +34,7 @@ def macro_germany_core(symbol: str = "EMG00179154") -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.rename(
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/4/4 18:00
+Date: 2026/10/18 15:00
 Desc: 金十数据中心-经济指标-美国
 https://datacenter.jin10.com/economic
 """
@@ -10,7 +10,9 @@ import datetime
 import time
 
 import pandas as pd
-import requests
+
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
 
 
 def __macro_usa_base_func(symbol: str, params: dict) -> pd.DataFrame:
@@ -32,14 +34,14 @@ def __macro_usa_base_func(symbol: str, params: dict) -> pd.DataFrame:
     }
     url = "https://datacenter-api.jin10.com/reports/list_v2"
     params = params
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     while True:
-        r = requests.get(url, params=params, headers=headers)
+        r = request_get(url, params=params, headers=headers)
         data_json = r.json()
         if not data_json["data"]["values"]:
             break
         temp_df = pd.DataFrame(data_json["data"]["values"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
         last_date_str = temp_df.iat[-1, 0]
         last_date_str = (
             (
@@ -50,6 +52,7 @@ def __macro_usa_base_func(symbol: str, params: dict) -> pd.DataFrame:
             .isoformat()
         )
         params.update({"max_date": f"{last_date_str}"})
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "日期",
         "今值",
@@ -98,7 +101,7 @@ def macro_usa_phs() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
@@ -143,7 +146,7 @@ def macro_usa_cpi_yoy() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     data_list = data_json["result"]["data"]
     temp_df = pd.DataFrame(
@@ -472,7 +475,7 @@ def macro_usa_rig_count() -> pd.DataFrame:
     """
     t = time.time()
     params = {"_": t}
-    res = requests.get(
+    res = request_get(
         url="https://cdn.jin10.com/data_center/reports/baker.json", params=params
     )
     temp_df = pd.DataFrame(res.json().get("values")).T
@@ -967,7 +970,7 @@ def macro_usa_crude_inner() -> pd.DataFrame:
     """
     t = time.time()
     params = {"_": t}
-    res = requests.get(
+    res = request_get(
         url="https://cdn.jin10.com/data_center/reports/usa_oil.json", params=params
     )
     temp_df = pd.DataFrame(res.json().get("values")).T
@@ -1003,7 +1006,7 @@ def macro_usa_cftc_nc_holding() -> pd.DataFrame:
     """
     t = time.time()
     params = {"_": str(int(round(t * 1000)))}
-    r = requests.get(
+    r = request_get(
         url="https://cdn.jin10.com/data_center/reports/cftc_4.json", params=params
     )
     json_data = r.json()
@@ -1032,7 +1035,7 @@ def macro_usa_cftc_c_holding() -> pd.DataFrame:
     """
     t = time.time()
     params = {"_": str(int(round(t * 1000)))}
-    r = requests.get(
+    r = request_get(
         url="https://cdn.jin10.com/data_center/reports/cftc_2.json", params=params
     )
     json_data = r.json()
@@ -1061,7 +1064,7 @@ def macro_usa_cftc_merchant_currency_holding() -> pd.DataFrame:
     """
     t = time.time()
     params = {"_": str(int(round(t * 1000)))}
-    r = requests.get(
+    r = request_get(
         url="https://cdn.jin10.com/data_center/reports/cftc_3.json", params=params
     )
     json_data = r.json()
@@ -1090,7 +1093,7 @@ def macro_usa_cftc_merchant_goods_holding() -> pd.DataFrame:
     """
     t = time.time()
     params = {"_": str(int(round(t * 1000)))}
-    r = requests.get(
+    r = request_get(
         url="https://cdn.jin10.com/data_center/reports/cftc_1.json", params=params
     )
     json_data = r.json()
@@ -1119,15 +1122,16 @@ def macro_usa_cme_merchant_goods_holding():
     """
     t = time.time()
     params = {"_": str(int(round(t * 1000)))}
-    r = requests.get(
+    r = request_get(
         url="https://cdn.jin10.com/data_center/reports/cme_3.json", params=params
     )
     json_data = r.json()
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for item in json_data["values"].keys():
         temp_df = pd.DataFrame(json_data["values"][item])
         temp_df["日期"] = item
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.columns = ["pz", "tc", "-", "-", "-", "成交量", "-", "-", "日期"]
     big_df["品种"] = big_df["pz"] + "-" + big_df["tc"]
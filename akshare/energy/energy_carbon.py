@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/6/25 15:00
+Date: 2026/10/18 15:00
 Desc: 碳排放交易
 北京市碳排放权电子交易平台-北京市碳排放权公开交易行情
 https://www.bjets.com.cn/article/jyxx/
@@ -22,12 +22,13 @@ http://www.cnemission.com/article/hqxx/
 from io import StringIO
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
 from akshare.utils import demjson
 from akshare.utils.cons import headers
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
 
 
 def energy_carbon_domestic(symbol: str = "湖北") -> pd.DataFrame:
@@ -44,7 +45,7 @@ def energy_carbon_domestic(symbol: str = "湖北") -> pd.DataFrame:
         "lcnK": "53f75bfcefff58e4046ccfa42171636c",
         "brand": "TAN",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("(") + 1 : -1])
     temp_df = pd.DataFrame(data_json[symbol])
@@ -81,7 +82,7 @@ def energy_carbon_bj() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://www.bjets.com.cn/article/jyxx/"
-    r = requests.get(url, verify=False, headers=headers)
+    r = request_get(url, verify=False, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     total_page = (
         soup.find("table")
@@ -91,7 +92,7 @@ def energy_carbon_bj() -> pd.DataFrame:
         .strip(";")
         .strip('"')
     )
-    temp_df = pd.DataFrame()
+    temp_chunks = ChunkAccumulator()
     for i in tqdm(
         range(1, int(total_page) + 1),
         desc="Please wait for a moment",
@@ -100,10 +101,11 @@ def energy_carbon_bj() -> pd.DataFrame:
         if i == 1:
             i = ""
         url = f"https://www.bjets.com.cn/article/jyxx/?{i}"
-        r = requests.get(url, verify=False, headers=headers)
+        r = request_get(url, verify=False, headers=headers)
         r.encoding = "utf-8"
         df = pd.read_html(StringIO(r.text))[0]
-        temp_df = pd.concat(objs=[temp_df, df], ignore_index=True)
+        temp_chunks.append(df)
+    temp_df = temp_chunks.to_frame()
     temp_df.columns = ["日期", "成交量", "成交均价", "成交额"]
     temp_df["成交单位"] = (
         temp_df["成交额"]
@@ -139,17 +141,19 @@ def energy_carbon_sz() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "http://www.cerx.cn/dailynewsCN/index.htm"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     page_num = int(soup.find(attrs={"class": "pagebar"}).find_all("option")[-1].text)
-    big_df = pd.read_html(StringIO(r.text), header=0)[0]
+    big_chunks = ChunkAccumulator()
+    big_chunks.append(pd.read_html(StringIO(r.text), header=0)[0])
     for page in tqdm(
         range(2, page_num + 1), desc="Please wait for a moment", leave=False
     ):
         url = f"http://www.cerx.cn/dailynewsCN/index_{page}.htm"
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text), header=0)[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["交易日期"] = pd.to_datetime(big_df["交易日期"], errors="coerce").dt.date
     big_df["开盘价"] = pd.to_numeric(big_df["开盘价"], errors="coerce")
     big_df["最高价"] = pd.to_numeric(big_df["最高价"], errors="coerce")
@@ -171,17 +175,19 @@ def energy_carbon_eu() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "http://www.cerx.cn/dailynewsOuter/index.htm"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     page_num = int(soup.find(attrs={"class": "pagebar"}).find_all("option")[-1].text)
-    big_df = pd.read_html(StringIO(r.text), header=0)[0]
+    big_chunks = ChunkAccumulator()
+    big_chunks.append(pd.read_html(StringIO(r.text), header=0)[0])
     for page in tqdm(
         range(2, page_num + 1), desc="Please wait for a moment", leave=False
     ):
         url = f"http://www.cerx.cn/dailynewsOuter/index_{page}.htm"
-        r = requests.get(url)
+        r = request_get(url)
         temp_df = pd.read_html(StringIO(r.text), header=0)[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["交易日期"] = pd.to_datetime(big_df["交易日期"], errors="coerce").dt.date
     big_df["开盘价"] = pd.to_numeric(big_df["开盘价"], errors="coerce")
     big_df["最高价"] = pd.to_numeric(big_df["最高价"], errors="coerce")
@@ -203,7 +209,7 @@ def energy_carbon_hb() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://www.hbets.cn/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     data_text = (
         soup.find(name="div", attrs={"class": "threeLeft"}).find_all("script")[1].text
@@ -252,7 +258,7 @@ def energy_carbon_gz() -> pd.DataFrame:
         "beginTime": "2010-01-01",
         "endTime": "2030-09-12",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     temp_df = pd.read_html(StringIO(r.text), header=0)[1]
     temp_df.columns = [
         "日期",
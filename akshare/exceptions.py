@@ -41,3 +41,12 @@ class RateLimitError(AkshareException):
     """Raised when API rate limit is exceeded"""
 
     pass
+
+
+class CircuitOpenError(RateLimitError):
+    """Raised when requests to a host are suspended by its circuit breaker"""
+
+    def __init__(self, host, retry_after=0.0):
+        self.host = host
+        self.retry_after = retry_after
+        super().__init__(f"Circuit open for {host}, retry after {retry_after:.1f}s")
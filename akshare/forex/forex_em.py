@@ -7,10 +7,10 @@ https://quote.eastmoney.com/center/gridlist.html#forex_all
 """
 
 import pandas as pd
-import requests
 
 from akshare.forex.cons import symbol_market_map
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.request import request_get
 
 
 def forex_spot_em() -> pd.DataFrame:
@@ -97,7 +97,7 @@ def forex_hist_em(symbol: str = "USDCNH") -> pd.DataFrame:
         "ut": "f057cbcbce2a86e2866ab8877db1d059",
         "forcect": 1,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
     temp_df["code"] = data_json["data"]["code"]
@@ -7,9 +7,10 @@ https://www.bloomberg.com/billionaires/
 """
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
+from akshare.utils.request import request_get
+
 
 def index_bloomberg_billionaires_hist(year: str = "2021") -> pd.DataFrame:
     """
@@ -21,7 +22,7 @@ def index_bloomberg_billionaires_hist(year: str = "2021") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = f"https://stats.areppim.com/listes/list_billionairesx{year[-2:]}xwor.htm"
-    r = requests.get(url)
+    r = request_get(url)
     soup = BeautifulSoup(r.text, "lxml")
     trs = soup.findAll("table")[0].findAll("tr")
     heads = trs[1]
@@ -84,7 +85,7 @@ def index_bloomberg_billionaires() -> pd.DataFrame:
         "referer": "https://www.bloomberg.com/",
         "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/83.0.4103.116 Safari/537.36",
     }
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, "lxml")
     big_content_list = list()
     soup_node = soup.find(attrs={"class": "table-chart"}).find_all(
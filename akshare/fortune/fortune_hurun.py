@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2023/12/22 20:00
+Date: 2026/10/18 15:00
 Desc: 胡润排行榜
 https://www.hurun.net/
 """
@@ -12,6 +12,9 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
+
 
 def hurun_rank(indicator: str = "胡润百富榜", year: str = "2023") -> pd.DataFrame:
     """
@@ -25,7 +28,7 @@ def hurun_rank(indicator: str = "胡润百富榜", year: str = "2023") -> pd.Dat
     :rtype: pandas.DataFrame
     """
     url = "https://www.hurun.net/zh-CN/Rank/HsRankDetails?pagetype=rich"
-    r = requests.get(url)
+    r = request_get(url)
     soup = BeautifulSoup(r.text, "lxml")
     url_list = []
     for item in soup.find_all("ul", attrs={"class": "dropdown-menu"}):
@@ -37,7 +40,7 @@ def hurun_rank(indicator: str = "胡润百富榜", year: str = "2023") -> pd.Dat
             name_list.append(inner_item.text.strip())
 
     name_url_map = dict(zip(name_list, url_list))
-    r = requests.get(name_url_map[indicator])
+    r = request_get(name_url_map[indicator])
     soup = BeautifulSoup(r.text, "lxml")
     code_list = [
         item["value"].split("=")[2]
@@ -62,7 +65,7 @@ def hurun_rank(indicator: str = "胡润百富榜", year: str = "2023") -> pd.Dat
         warnings.warn("正在下载中")
         offset = 0
         limit = 20
-        big_df = pd.DataFrame()
+        big_chunks = ChunkAccumulator()
         while offset < 2200:
             try:
                 params.update(
@@ -72,14 +75,15 @@ def hurun_rank(indicator: str = "胡润百富榜", year: str = "2023") -> pd.Dat
                     }
                 )
                 url = "https://www.hurun.net/zh-CN/Rank/HsRankDetailsList"
-                r = requests.get(url, params=params)
+                r = request_get(url, params=params)
                 data_json = r.json()
                 temp_df = pd.DataFrame(data_json["rows"])
                 offset = offset + 20
-                big_df = pd.concat([big_df, temp_df], ignore_index=True)
+                big_chunks.append(temp_df)
             except requests.exceptions.JSONDecodeError:
                 offset = offset + 40
                 continue
+        big_df = big_chunks.to_frame()
         big_df.rename(
             columns={
                 "hs_Rank_Rich_Ranking": "排名",
@@ -102,7 +106,7 @@ def hurun_rank(indicator: str = "胡润百富榜", year: str = "2023") -> pd.Dat
         ]
         return big_df
     url = "https://www.hurun.net/zh-CN/Rank/HsRankDetailsList"
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["rows"])
     if indicator == "胡润百富榜":
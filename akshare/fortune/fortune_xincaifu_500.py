@@ -9,7 +9,8 @@ http://www.xcf.cn/zhuanti/ztzz/hdzt1/500frb/index.html
 import json
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def xincaifu_rank(year: str = "2022") -> pd.DataFrame:
@@ -34,7 +35,7 @@ def xincaifu_rank(year: str = "2022") -> pd.DataFrame:
         "pageNo": "1",
         "from": "jsonp",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = json.loads(data_text[data_text.find("{") : -1])
     temp_df = pd.DataFrame(data_json["data"]["rows"])
@@ -1,15 +1,16 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/4/29 16:00
+Date: 2026/10/18 15:00
 Desc: 中国证券投资基金业协会-信息公示数据
 中国证券投资基金业协会-新版: https://gs.amac.org.cn
 """
 
 import pandas as pd
-import requests
 
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_post
+from akshare.utils.func import ChunkAccumulator
 
 headers = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -23,7 +24,7 @@ def _get_pages(url: str = "", payload: str = "") -> pd.DataFrame:
     中国证券投资基金业协会-信息公示-私募基金管理人公示 页数
     暂时不使用本函数, 直接可以获取所有数据
     """
-    res = requests.post(url=url, json=payload, headers=headers)
+    res = request_post(url=url, json=payload, headers=headers)
     res.encoding = "utf-8"
     json_df = res.json()
     return json_df["totalPages"]
@@ -33,7 +34,7 @@ def get_data(url: str = "", payload: str = "") -> pd.DataFrame:
     """
     中国证券投资基金业协会-信息公示-私募基金管理人公示
     """
-    res = requests.post(url=url, json=payload, headers=headers)
+    res = request_post(url=url, json=payload, headers=headers)
     res.encoding = "utf-8"
     json_df = res.json()
     return json_df
@@ -54,17 +55,18 @@ def amac_member_info() -> pd.DataFrame:
         "page": "1",
         "size": "20",
     }
-    r = requests.post(url, params=params, json={}, headers=headers)
+    r = request_post(url, params=params, json={}, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
-        r = requests.post(url, params=params, json={}, headers=headers)
+        r = request_post(url, params=params, json={}, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     keys_list = [
         "managerName",
         "memberBehalf",
@@ -139,7 +141,7 @@ def amac_person_fund_org_list(symbol: str = "公募基金管理公司") -> pd.Da
         "page": "1",
         "size": "20",
     }
-    r = requests.post(
+    r = request_post(
         url,
         params=params,
         json={"orgType": symbol_map[symbol], "page": "1"},
@@ -147,11 +149,11 @@ def amac_person_fund_org_list(symbol: str = "公募基金管理公司") -> pd.Da
     )
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
-        r = requests.post(
+        r = request_post(
             url,
             params=params,
             json={"orgType": symbol_map[symbol], "page": "1"},
@@ -160,7 +162,8 @@ def amac_person_fund_org_list(symbol: str = "公募基金管理公司") -> pd.Da
         )
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     keys_list = [
         "orgName",
         "orgType",
@@ -250,17 +253,18 @@ def amac_manager_info() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+    r = request_post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+        r = request_post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     keys_list = [
         "managerName",
         "artificialPersonName",
@@ -304,17 +308,18 @@ def amac_manager_classify_info() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+    r = request_post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+        r = request_post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     keys_list = [
         "managerName",
         "artificialPersonName",
@@ -375,17 +380,18 @@ def amac_member_sub_info() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+    r = request_post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+        r = request_post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     keys_list = [
         "managerName",
         "memberBehalf",
@@ -429,21 +435,22 @@ def amac_fund_info(start_page: str = "1", end_page: str = "2000") -> pd.DataFram
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+    r = request_post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = int(data_json["totalPages"])
     if total_page > int(end_page):
         real_end_page = int(end_page)
     else:
         real_end_page = total_page
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(int(start_page) - 1, real_end_page), leave=False):
         params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+        r = request_post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     keys_list = [
         "fundName",
         "managerName",
@@ -486,17 +493,18 @@ def amac_securities_info() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+    r = request_post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+        r = request_post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     keys_list = [
         "cpmc",
         "cpbm",
@@ -540,17 +548,18 @@ def amac_aoin_info() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+    r = request_post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+        r = request_post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     keys_list = [
         "code",
         "name",
@@ -587,17 +596,18 @@ def amac_fund_sub_info() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+    r = request_post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+        r = request_post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     keys_list = [
         "productCode",
         "productName",
@@ -643,17 +653,18 @@ def amac_fund_account_info() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+    r = request_post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+        r = request_post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     keys_list = [
         "registerDate",
         "registerCode",
@@ -688,17 +699,18 @@ def amac_fund_abs() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+    r = request_post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+        r = request_post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True)
     big_df["index"] = range(1, len(big_df) + 1)
     big_df.columns = [
@@ -747,17 +759,18 @@ def amac_futures_info() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+    r = request_post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+        r = request_post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     keys_list = [
         "mpiName",
         "mpiProductCode",
@@ -805,17 +818,18 @@ def amac_manager_cancelled_info() -> pd.DataFrame:
         "page": "1",
         "size": "100",
     }
-    r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+    r = request_post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
-        r = requests.post(url, params=params, json={}, verify=False, headers=headers)
+        r = request_post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     keys_list = [
         "orgName",
         "orgCode",
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/2/15 22:00
+Date: 2026/10/18 15:00
 Desc: 东方财富-ETF行情
 https://quote.eastmoney.com/sh513500.html
 """
@@ -9,9 +9,10 @@ https://quote.eastmoney.com/sh513500.html
 from functools import lru_cache
 
 import pandas as pd
-import requests
 
+from akshare.cache import cached, TTL_SPOT, history_ttl
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.request import request_get
 
 
 @lru_cache()
@@ -41,6 +42,7 @@ def _fund_etf_code_id_map_em() -> dict:
     return temp_dict
 
 
+@cached(ttl=TTL_SPOT)
 def fund_etf_spot_em() -> pd.DataFrame:
     """
     东方财富-ETF 实时行情
@@ -234,16 +236,11 @@ def get_market_id(symbol: str) -> int:
         return 1
 
 
-def fund_etf_hist_em(
-    symbol: str = "159707",
-    period: str = "daily",
-    start_date: str = "19700101",
-    end_date: str = "20500101",
-    adjust: str = "",
-) -> pd.DataFrame:
+def _fund_etf_hist_params(
+    symbol: str, period: str, start_date: str, end_date: str, adjust: str
+) -> dict:
     """
-    东方财富-ETF行情
-    https://quote.eastmoney.com/sz159707.html
+    东方财富-ETF行情-请求参数
     :param symbol: ETF 代码
     :type symbol: str
     :param period: choice of {'daily', 'weekly', 'monthly'}
@@ -254,38 +251,31 @@ def fund_etf_hist_em(
     :type end_date: str
     :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
     :type adjust: str
-    :return: 每日行情
-    :rtype: pandas.DataFrame
+    :return: 请求参数
+    :rtype: dict
     """
-    # code_id_dict = _fund_etf_code_id_map_em()
     adjust_dict = {"qfq": "1", "hfq": "2", "": "0"}
     period_dict = {"daily": "101", "weekly": "102", "monthly": "103"}
-    url = "https://push2his.eastmoney.com/api/qt/stock/kline/get"
-    params = {
+    return {
         "fields1": "f1,f2,f3,f4,f5,f6",
         "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61,f116",
         "ut": "7eea3edcaed734bea9cbfc24409ed989",
         "klt": period_dict[period],
         "fqt": adjust_dict[adjust],
+        "secid": f"{get_market_id(symbol)}.{symbol}",
         "beg": start_date,
         "end": end_date,
     }
-    try:
-        # market_id = code_id_dict[symbol]
-        market_id = get_market_id(symbol)
-        params.update({"secid": f"{market_id}.{symbol}"})
-        r = requests.get(url, timeout=15, params=params)
-        data_json = r.json()
-    except KeyError:
-        market_id = 1
-        params.update({"secid": f"{market_id}.{symbol}"})
-        r = requests.get(url, timeout=15, params=params)
-        data_json = r.json()
-        if not data_json["data"]:
-            market_id = 0
-            params.update({"secid": f"{market_id}.{symbol}"})
-            r = requests.get(url, timeout=15, params=params)
-            data_json = r.json()
+
+
+def _fund_etf_hist_frame(data_json: dict) -> pd.DataFrame:
+    """
+    东方财富-ETF行情-解析接口返回的数据
+    :param data_json: 接口返回的 JSON
+    :type data_json: dict
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
     if not (data_json["data"] and data_json["data"]["klines"]):
         return pd.DataFrame()
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
@@ -317,6 +307,37 @@ def fund_etf_hist_em(
     return temp_df
 
 
+@cached(ttl=history_ttl())
+def fund_etf_hist_em(
+    symbol: str = "159707",
+    period: str = "daily",
+    start_date: str = "19700101",
+    end_date: str = "20500101",
+    adjust: str = "",
+) -> pd.DataFrame:
+    """
+    东方财富-ETF行情
+    https://quote.eastmoney.com/sz159707.html
+    :param symbol: ETF 代码
+    :type symbol: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}
+    :type period: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
+    url = "https://push2his.eastmoney.com/api/qt/stock/kline/get"
+    params = _fund_etf_hist_params(symbol, period, start_date, end_date, adjust)
+    r = request_get(url, timeout=15, params=params)
+    data_json = r.json()
+    return _fund_etf_hist_frame(data_json)
+
+
 def fund_etf_hist_min_em(
     symbol: str = "159707",
     start_date: str = "1979-09-01 09:32:00",
@@ -367,7 +388,7 @@ def fund_etf_hist_min_em(
             "iscr": "0",
             "secid": f"{get_market_id(symbol)}.{symbol}",
         }
-        r = requests.get(url, timeout=15, params=params)
+        r = request_get(url, timeout=15, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             [item.split(",") for item in data_json["data"]["trends"]]
@@ -406,7 +427,7 @@ def fund_etf_hist_min_em(
             "beg": "0",
             "end": "20500000",
         }
-        r = requests.get(url, timeout=15, params=params)
+        r = request_get(url, timeout=15, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             [item.split(",") for item in data_json["data"]["klines"]]
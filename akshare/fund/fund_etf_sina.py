@@ -1,17 +1,16 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/11/10 15:30
+Date: 2026/10/18 15:00
 Desc: 新浪财经-基金行情
 https://vip.stock.finance.sina.com.cn/fund_center/index.html#jjhqetf
 """
 
 import pandas as pd
-import py_mini_racer
-import requests
 
-from akshare.stock.cons import hk_js_decode
-from akshare.utils import demjson
+from akshare.utils import jsonp
+from akshare.utils.request import request_get
+from akshare.utils.sina_decode import decode_sina
 
 
 def fund_etf_category_sina(symbol: str = "LOF基金") -> pd.DataFrame:
@@ -40,9 +39,9 @@ def fund_etf_category_sina(symbol: str = "LOF基金") -> pd.DataFrame:
         "node": fund_map[symbol],
         "[object HTMLDivElement]": "qvvne",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("([") + 1 : -2])
+    data_json = jsonp.loads(data_text[data_text.find("([") + 1 : -2])
     temp_df = pd.DataFrame(data_json)
     if symbol == "封闭式基金":
         temp_df.columns = [
@@ -125,13 +124,10 @@ def fund_etf_hist_sina(symbol: str = "sh510050") -> pd.DataFrame:
     url = (
         f"https://finance.sina.com.cn/realstock/company/{symbol}/hisdata_klc2/klc_kl.js"
     )
-    r = requests.get(url)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
-    temp_df = pd.DataFrame(dict_list)
+    r = request_get(url)
+    temp_df = pd.DataFrame(
+        decode_sina(r.text.split("=")[1].split(";")[0].replace('"', ""))
+    )
     if temp_df.empty:  # 处理获取数据为空的问题
         return pd.DataFrame()
     temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.tz_localize(
@@ -160,11 +156,11 @@ def fund_etf_dividend_sina(symbol: str = "sh510050") -> pd.DataFrame:
     """
     # 构建复权数据URL
     factor_url = f"https://finance.sina.com.cn/realstock/company/{symbol}/hfq.js"
-    r = requests.get(factor_url)
+    r = request_get(factor_url)
     text = r.text
     if text.startswith("var"):
         json_str = text.split("=")[1].strip().rsplit("}", maxsplit=1)[0].strip()
-        data = eval(json_str + "}")  # 这里使用eval而不是json.loads因为数据格式特殊
+        data = jsonp.loads(json_str + "}")
 
         if isinstance(data, dict) and "data" in data:
             df = pd.DataFrame(data["data"])
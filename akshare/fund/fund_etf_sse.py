@@ -7,7 +7,8 @@ https://www.sse.com.cn/assortment/fund/etf/list/scale/
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def fund_etf_scale_sse(date: str = "20250115") -> pd.DataFrame:
@@ -36,7 +37,7 @@ def fund_etf_scale_sse(date: str = "20250115") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/88.0.4324.150 Safari/537.36",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"])
     temp_df.rename(
@@ -1,15 +1,18 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2025/11/19 12:00
+Date: 2026/10/18 15:00
 Desc: 天天基金网-基金数据-分红送配
 https://fund.eastmoney.com/data/fundfenhong.html
 """
 
 import pandas as pd
-import requests
 from tqdm import tqdm
 
+from akshare.utils import jsonp
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
+
 
 def fund_fh_em(year: str = "2025") -> pd.DataFrame:
     """
@@ -30,19 +33,20 @@ def fund_fh_em(year: str = "2025") -> pd.DataFrame:
         "ftype": "",
         "year": year,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
-    total_page = eval(data_text[data_text.find("=") + 1 : data_text.find(";")])[0]
-    big_df = pd.DataFrame()
+    total_page = jsonp.loads_jsonp(data_text)[0]
+    big_chunks = ChunkAccumulator()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"page": str(page)})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
-        temp_list = eval(
+        temp_list = jsonp.loads(
             data_text[data_text.find("[[") : data_text.find(";var jjfh_jjgs")]
         )
         temp_df = pd.DataFrame(temp_list)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
     # 处理空数据时报错的问题
@@ -98,19 +102,20 @@ def fund_cf_em(year: str = "2025") -> pd.DataFrame:
         "ftype": "",
         "year": year,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
-    total_page = eval(data_text[data_text.find("=") + 1 : data_text.find(";")])[0]
-    big_df = pd.DataFrame()
+    total_page = jsonp.loads_jsonp(data_text)[0]
+    big_chunks = ChunkAccumulator()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"page": str(page)})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         temp_str = data_text[data_text.find("[[") : data_text.find(";var jjcf_jjgs")]
         if temp_str:
-            temp_list = eval(temp_str)
+            temp_list = jsonp.loads(temp_str)
             temp_df = pd.DataFrame(temp_list)
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.reset_index(inplace=True)
     big_df.loc[:, "index"] = big_df["index"] + 1
@@ -160,19 +165,20 @@ def fund_fh_rank_em() -> pd.DataFrame:
         "gs": "",
         "ftype": "",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
-    total_page = eval(data_text[data_text.find("=") + 1 : data_text.find(";")])[0]
-    big_df = pd.DataFrame()
+    total_page = jsonp.loads_jsonp(data_text)[0]
+    big_chunks = ChunkAccumulator()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"page": str(page)})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
-        temp_list = eval(
+        temp_list = jsonp.loads(
             data_text[data_text.find("[[") : data_text.find(";var fhph_jjgs")]
         )
         temp_df = pd.DataFrame(temp_list)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
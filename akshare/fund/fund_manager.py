@@ -1,16 +1,17 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/9/14 18:00
+Date: 2026/10/18 15:00
 Desc: 基金经理大全
 https://fund.eastmoney.com/manager/default.html
 """
 
 import pandas as pd
-import requests
 
 from akshare.utils import demjson
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def fund_manager_em() -> pd.DataFrame:
@@ -20,7 +21,7 @@ def fund_manager_em() -> pd.DataFrame:
     :return: 基金经理大全
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     url = "https://fund.eastmoney.com/Data/FundDataPortfolio_Interface.aspx"
     params = {
         "dt": "14",
@@ -31,7 +32,7 @@ def fund_manager_em() -> pd.DataFrame:
         "sc": "abbname",
         "st": "asc",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text.strip("var returnjson= "))
     total_page = data_json["pages"]
@@ -42,11 +43,12 @@ def fund_manager_em() -> pd.DataFrame:
                 "pi": page,
             }
         )
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         data_json = demjson.decode(data_text.strip("var returnjson= "))
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True)
     big_df["index"] = range(1, len(big_df) + 1)
     big_df.columns = [
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/6/7 20:00
+Date: 2026/10/18 15:00
 Desc: 天天基金网-基金档案-投资组合
 https://fundf10.eastmoney.com/ccmx_000001.html
 """
@@ -9,10 +9,11 @@ https://fundf10.eastmoney.com/ccmx_000001.html
 from io import StringIO
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
 from akshare.utils import demjson
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
 
 
 def fund_portfolio_hold_em(symbol: str = "000001", date: str = "2024") -> pd.DataFrame:
@@ -35,7 +36,7 @@ def fund_portfolio_hold_em(symbol: str = "000001", date: str = "2024") -> pd.Dat
         "month": "",
         "rt": "0.913877030254846",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -1])
     soup = BeautifulSoup(data_json["content"], features="lxml")
@@ -123,7 +124,7 @@ def fund_portfolio_bond_hold_em(
         "year": date,
         "rt": "0.913877030254846",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -1])
     soup = BeautifulSoup(data_json["content"], features="lxml")
@@ -131,7 +132,7 @@ def fund_portfolio_bond_hold_em(
         item.text.split("\xa0\xa0")[1]
         for item in soup.find_all(name="h4", attrs={"class": "t"})
     ]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for item in range(len(item_label)):
         temp_df = pd.read_html(
             StringIO(data_json["content"]), converters={"债券代码": str}
@@ -151,7 +152,8 @@ def fund_portfolio_bond_hold_em(
                 "季度",
             ]
         ]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["占净值比例"] = pd.to_numeric(big_df["占净值比例"], errors="coerce")
     big_df["持仓市值"] = pd.to_numeric(big_df["持仓市值"], errors="coerce")
     big_df["序号"] = range(1, len(big_df) + 1)
@@ -189,7 +191,7 @@ def fund_portfolio_industry_allocation_em(
         "year": date,
         "callback": "jQuery183006997159478989867_1648016188499",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -1])
     temp_list = []
@@ -258,7 +260,7 @@ def fund_portfolio_change_em(
         "year": date,
         "rt": "0.913877030254846",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -1])
     soup = BeautifulSoup(data_json["content"], features="lxml")
@@ -266,7 +268,7 @@ def fund_portfolio_change_em(
         item.text.split("\xa0\xa0")[1]
         for item in soup.find_all(name="h4", attrs={"class": "t"})
     ]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for item in range(len(item_label)):
         temp_df = pd.read_html(
             StringIO(data_json["content"]), converters={"股票代码": str}
@@ -296,7 +298,8 @@ def fund_portfolio_change_em(
                 "季度",
             ]
         ]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     del big_df["序号"]
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
@@ -7,9 +7,10 @@ https://fund.eastmoney.com/data/fundrating.html
 """
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
+from akshare.utils.request import request_get
+
 
 def fund_rating_all() -> pd.DataFrame:
     """
@@ -19,7 +20,7 @@ def fund_rating_all() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://fund.eastmoney.com/data/fundrating.html"
-    r = requests.get(url)
+    r = request_get(url)
     soup = BeautifulSoup(r.text, features="lxml")
     data_text = soup.find(name="div", attrs={"id": "fundinfo"}).find("script").string
     data_content = [
@@ -98,7 +99,7 @@ def fund_rating_sh(date: str = "20230630") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://fund.eastmoney.com/data/fundrating_3.html"
-    r = requests.get(url)
+    r = request_get(url)
     soup = BeautifulSoup(r.text, "lxml")
     date_list = [
         item["value"] for item in soup.find("select", attrs={"id": "rqoptions"})
@@ -107,7 +108,7 @@ def fund_rating_sh(date: str = "20230630") -> pd.DataFrame:
     if date_format not in date_list:
         raise "请访问 https://fund.eastmoney.com/data/fundrating_3.html 获取查询日期"
     url = f"https://fund.eastmoney.com/data/fundrating_3_{'-'.join([date[:4], date[4:6], date[6:]])}.html"
-    r = requests.get(url)
+    r = request_get(url)
     soup = BeautifulSoup(r.text, "lxml")
     data_text = soup.find("div", attrs={"id": "fundinfo"}).find("script").string
     data_content = [
@@ -196,7 +197,7 @@ def fund_rating_zs(date: str = "20230331") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://fund.eastmoney.com/data/fundrating_2.html"
-    r = requests.get(url)
+    r = request_get(url)
     soup = BeautifulSoup(r.text, "lxml")
     date_list = [
         item["value"] for item in soup.find("select", attrs={"id": "rqoptions"})
@@ -205,7 +206,7 @@ def fund_rating_zs(date: str = "20230331") -> pd.DataFrame:
     if date_format not in date_list:
         raise "请访问 https://fund.eastmoney.com/data/fundrating_2.html 获取查询日期"
     url = f"https://fund.eastmoney.com/data/fundrating_2_{'-'.join([date[:4], date[4:6], date[6:]])}.html"
-    r = requests.get(url)
+    r = request_get(url)
     soup = BeautifulSoup(r.text, "lxml")
     data_text = soup.find("div", attrs={"id": "fundinfo"}).find("script").string
     data_content = [
@@ -283,7 +284,7 @@ def fund_rating_ja(date: str = "20230331") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://fund.eastmoney.com/data/fundrating_4.html"
-    r = requests.get(url)
+    r = request_get(url)
     soup = BeautifulSoup(r.text, "lxml")
     date_list = [
         item["value"] for item in soup.find("select", attrs={"id": "rqoptions"})
@@ -292,7 +293,7 @@ def fund_rating_ja(date: str = "20230331") -> pd.DataFrame:
     if date_format not in date_list:
         raise "请访问 http://fund.eastmoney.com/data/fundrating_4.html 获取查询日期"
     url = f"https://fund.eastmoney.com/data/fundrating_4_{'-'.join([date[:4], date[4:6], date[6:]])}.html"
-    r = requests.get(url)
+    r = request_get(url)
     soup = BeautifulSoup(r.text, "lxml")
     data_text = soup.find("div", attrs={"id": "fundinfo"}).find("script").string
     data_content = [
@@ -7,10 +7,10 @@ https://webapi.cninfo.com.cn/#/thematicStatistics
 """
 
 import pandas as pd
-import py_mini_racer
-import requests
 
 from akshare.datasets import get_ths_js
+from akshare.utils.request import request_post
+from akshare.utils.js_pool import get_js_pool
 
 
 def _get_file_content_cninfo(file: str = "cninfo.js") -> str:
@@ -37,9 +37,8 @@ def fund_report_stock_cninfo(date: str = "20210630") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1112"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -60,7 +59,7 @@ def fund_report_stock_cninfo(date: str = "20210630") -> pd.DataFrame:
     params = {
         "rdate": "-".join([date[:4], date[4:6], date[6:]]),
     }
-    r = requests.post(url, headers=headers, params=params)
+    r = request_post(url, headers=headers, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     temp_df.rename(
@@ -104,9 +103,8 @@ def fund_report_industry_allocation_cninfo(date: str = "20210630") -> pd.DataFra
     :rtype: pandas.DataFrame
     """
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1113"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -127,7 +125,7 @@ def fund_report_industry_allocation_cninfo(date: str = "20210630") -> pd.DataFra
     params = {
         "rdate": "-".join([date[:4], date[4:6], date[6:]]),
     }
-    r = requests.post(url, headers=headers, params=params)
+    r = request_post(url, headers=headers, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     temp_df.rename(
@@ -166,9 +164,8 @@ def fund_report_asset_allocation_cninfo() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1114"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -186,7 +183,7 @@ def fund_report_asset_allocation_cninfo() -> pd.DataFrame:
         "Chrome/93.0.4577.63 Safari/537.36",
         "X-Requested-With": "XMLHttpRequest",
     }
-    r = requests.post(url, headers=headers)
+    r = request_post(url, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     temp_df.rename(
@@ -1,15 +1,16 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2023/10/27 20:30
+Date: 2026/10/18 15:00
 Desc: 天天基金网-基金数据-规模份额
 https://fund.eastmoney.com/data/cyrjglist.html
 """
 
 import pandas as pd
-import requests
 
 from akshare.utils import demjson
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
 
 
 def fund_scale_change_em() -> pd.DataFrame:
@@ -28,18 +29,19 @@ def fund_scale_change_em() -> pd.DataFrame:
         "st": "desc",
         "sc": "reportdate",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -1])
     total_page = data_json["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in range(1, int(total_page) + 1):
         params.update({"pi": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         data_json = demjson.decode(data_text[data_text.find("{") : -1])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
     big_df.columns = [
@@ -84,18 +86,19 @@ def fund_hold_structure_em() -> pd.DataFrame:
         "st": "desc",
         "sc": "reportdate",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -1])
     total_page = data_json["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in range(1, int(total_page) + 1):
         params.update({"pi": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         data_json = demjson.decode(data_text[data_text.find("{") : -1])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
     big_df.columns = [
@@ -1,15 +1,15 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2024/9/1 16:20
+Date: 2026/10/18 15:00
 Desc: 新浪财经-基金规模
 https://vip.stock.finance.sina.com.cn/fund_center/index.html#jjgmall
 """
 
 import pandas as pd
-import requests
 
-from akshare.utils import demjson
+from akshare.utils import jsonp
+from akshare.utils.request import request_get
 
 
 def fund_scale_open_sina(symbol: str = "股票型基金") -> pd.DataFrame:
@@ -41,9 +41,9 @@ def fund_scale_open_sina(symbol: str = "股票型基金") -> pd.DataFrame:
         "type2": fund_map[symbol],
         "type3": "",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("({") + 1 : -2])
+    data_json = jsonp.loads(data_text[data_text.find("({") + 1 : -2])
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.reset_index(inplace=True)
     temp_df["index"] = range(1, len(temp_df) + 1)
@@ -112,9 +112,9 @@ def fund_scale_close_sina() -> pd.DataFrame:
         "type2": "",
         "type3": "",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("({") + 1 : -2])
+    data_json = jsonp.loads(data_text[data_text.find("({") + 1 : -2])
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.reset_index(inplace=True)
     temp_df["index"] = range(1, len(temp_df) + 1)
@@ -183,9 +183,9 @@ def fund_scale_structured_sina() -> pd.DataFrame:
         "type2": "",
         "type3": "",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("({") + 1 : -2])
+    data_json = jsonp.loads(data_text[data_text.find("({") + 1 : -2])
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.reset_index(inplace=True)
     temp_df["index"] = range(1, len(temp_df) + 1)
@@ -1,13 +1,15 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/10/27 22:30
+Date: 2026/10/18 15:00
 Desc: 雪球基金-基金详情
 https://danjuanfunds.com/funding/003545
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
 
 
 def fund_individual_basic_info_xq(
@@ -28,7 +30,7 @@ def fund_individual_basic_info_xq(
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/80.0.3987.149 Safari/537.36"
     }
-    r = requests.get(url, headers=headers, timeout=timeout)
+    r = request_get(url, headers=headers, timeout=timeout)
     json_data = r.json()["data"]
     temp_df = pd.json_normalize(json_data)
     temp_df.rename(
@@ -93,9 +95,9 @@ def fund_individual_achievement_xq(
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/80.0.3987.149 Safari/537.36"
     }
-    r = requests.get(url, headers=headers, timeout=timeout)
+    r = request_get(url, headers=headers, timeout=timeout)
     json_data = r.json()["data"]
-    combined_df = None
+    combined_chunks = ChunkAccumulator()
     type_dict = {
         "annual_performance_list": "年度业绩",
         "stage_performance_list": "阶段业绩",
@@ -119,7 +121,8 @@ def fund_individual_achievement_xq(
             "本产品最大回撒",
             "周期收益同类排名",
         ]
-        combined_df = pd.concat([combined_df, temp_df], ignore_index=True)
+        combined_chunks.append(temp_df)
+    combined_df = combined_chunks.to_frame()
     combined_df = combined_df.map(
         lambda x: x if "%" not in str(x) else x.replace("%", "")
     )
@@ -147,7 +150,7 @@ def fund_individual_analysis_xq(
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/80.0.3987.149 Safari/537.36"
     }
-    r = requests.get(url, headers=headers, timeout=timeout)
+    r = request_get(url, headers=headers, timeout=timeout)
     json_data = r.json()["data"]["index_data_list"]
     temp_df = pd.json_normalize(json_data)
     temp_df = temp_df[
@@ -200,7 +203,7 @@ def fund_individual_profit_probability_xq(
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/80.0.3987.149 Safari/537.36"
     }
-    r = requests.get(url, headers=headers, timeout=timeout)
+    r = request_get(url, headers=headers, timeout=timeout)
     json_data = r.json()["data"]["data_list"]
     temp_df = pd.DataFrame.from_dict(json_data, orient="columns")
     temp_df = temp_df[
@@ -239,7 +242,7 @@ def fund_individual_detail_info_xq(
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/80.0.3987.149 Safari/537.36"
     }
-    r = requests.get(url, headers=headers, timeout=timeout)
+    r = request_get(url, headers=headers, timeout=timeout)
     json_data = r.json()["data"]
     combined_df = None
     rate_type_dict = {
@@ -291,7 +294,7 @@ def fund_individual_detail_hold_xq(
         "fund_code": f"{symbol}",
         "report_date": f"{'-'.join([date[:4], date[4:6], date[6:]])}",
     }
-    r = requests.get(url, headers=headers, params=params, timeout=timeout)
+    r = request_get(url, headers=headers, params=params, timeout=timeout)
     data_json = r.json()
     temp_df = pd.DataFrame.from_dict(data_json["data"]["chart_list"], orient="columns")
     temp_df = temp_df[
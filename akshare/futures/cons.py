@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/7/21 15:00
+Date: 2026/10/18 15:00
 Desc: 期货配置文件
 """
 
@@ -10,6 +10,10 @@ import json
 import os
 import pickle
 import re
+from functools import lru_cache
+from typing import Iterable, List, Optional, Union
+
+import numpy as np
 
 
 futures_inventory_em_symbol_dict = {
@@ -572,17 +576,178 @@ def get_pk_data(file_name):
     return pickle.load(open(setting_file_path, "rb"))
 
 
+DateLike = Union[str, datetime.date, np.datetime64]
+
+
+class TradingCalendar:
+    """
+    交易日历, 内部为升序排列的 datetime64[D] 数组, 按日期的查询都是二分查找;
+    兼容原有的 YYYYMMDD 字符串列表用法: in, index, 下标和遍历
+    """
+
+    def __init__(self, days: Iterable[str]):
+        self._strings = sorted(set(days))
+        self._string_set = frozenset(self._strings)
+        self._days = np.array(
+            [f"{d[:4]}-{d[4:6]}-{d[6:8]}" for d in self._strings],
+            dtype="datetime64[D]",
+        )
+
+    @staticmethod
+    def to_datetime64(day: DateLike) -> np.datetime64:
+        """
+        转换日期为 datetime64[D]
+        :param day: YYYYMMDD, YYYY-MM-DD, datetime.date, datetime.datetime 或 numpy.datetime64
+        :type day: str
+        :return: 日期
+        :rtype: numpy.datetime64
+        """
+        if isinstance(day, datetime.datetime):
+            day = day.date()
+        if isinstance(day, str):
+            day = convert_date(day)
+            if day is None:
+                raise ValueError("日期格式应为 YYYYMMDD 或 YYYY-MM-DD")
+        return np.datetime64(day, "D")
+
+    def _search(self, day: DateLike, side: str = "left") -> int:
+        return int(np.searchsorted(self._days, self.to_datetime64(day), side=side))
+
+    def _date(self, pos: int) -> Optional[datetime.date]:
+        if 0 <= pos < len(self._days):
+            return self._days[pos].astype(datetime.date)
+        return None
+
+    def is_trading_day(self, day: DateLike) -> bool:
+        """
+        是否为交易日
+        :param day: 日期
+        :type day: str
+        :return: 是否为交易日
+        :rtype: bool
+        """
+        if isinstance(day, str) and day in self._string_set:
+            return True
+        pos = self._search(day)
+        return bool(
+            pos < len(self._days) and self._days[pos] == self.to_datetime64(day)
+        )
+
+    def prev_trading_day(
+        self, day: DateLike, inclusive: bool = False
+    ) -> Optional[datetime.date]:
+        """
+        前一个交易日
+        :param day: 日期
+        :type day: str
+        :param inclusive: day 为交易日时是否返回 day 本身
+        :type inclusive: bool
+        :return: 交易日, 超出日历范围时返回 None
+        :rtype: datetime.date
+        """
+        return self._date(self._search(day, "right" if inclusive else "left") - 1)
+
+    def next_trading_day(
+        self, day: DateLike, inclusive: bool = False
+    ) -> Optional[datetime.date]:
+        """
+        后一个交易日
+        :param day: 日期
+        :type day: str
+        :param inclusive: day 为交易日时是否返回 day 本身
+        :type inclusive: bool
+        :return: 交易日, 超出日历范围时返回 None
+        :rtype: datetime.date
+        """
+        return self._date(self._search(day, "left" if inclusive else "right"))
+
+    def trading_days_between(
+        self, start_day: DateLike, end_day: DateLike
+    ) -> np.ndarray:
+        """
+        区间内的全部交易日, 包含首尾
+        :param start_day: 开始日期
+        :type start_day: str
+        :param end_day: 结束日期
+        :type end_day: str
+        :return: 交易日
+        :rtype: numpy.ndarray
+        """
+        return self._days[self._search(start_day) : self._search(end_day, "right")]
+
+    def offset(self, days, n: int = 1) -> np.ndarray:
+        """
+        向量化的交易日偏移: 返回每个日期之后(n > 0)或之前(n < 0)的第 |n| 个交易日;
+        n 为 0 时交易日返回本身, 非交易日返回后一个交易日; 超出日历范围时为 NaT
+        :param days: 日期数组, 可以转换为 datetime64[D] 即可
+        :type days: numpy.ndarray
+        :param n: 偏移的交易日数量
+        :type n: int
+        :return: 交易日
+        :rtype: numpy.ndarray
+        """
+        days = np.asarray(days, dtype="datetime64[D]")
+        pos = np.searchsorted(self._days, days, side="left")
+        if n > 0:
+            is_trading = self._days[np.minimum(pos, len(self._days) - 1)] == days
+            pos = pos + n - (~is_trading)
+        else:
+            pos = pos + n
+        result = np.full(days.shape, np.datetime64("NaT"), dtype="datetime64[D]")
+        valid = (pos >= 0) & (pos < len(self._days)) & ~np.isnat(days)
+        result[valid] = self._days[pos[valid]]
+        return result
+
+    def to_list(self) -> List[str]:
+        """
+        YYYYMMDD 格式的交易日列表
+        :return: 交易日
+        :rtype: list
+        """
+        return list(self._strings)
+
+    def index(self, day: DateLike) -> int:
+        if not self.is_trading_day(day):
+            raise ValueError(f"{day} is not in calendar")
+        return self._search(day)
+
+    def __contains__(self, day) -> bool:
+        try:
+            return self.is_trading_day(day)
+        except (ValueError, TypeError):
+            return False
+
+    def __getitem__(self, item):
+        return self._strings[item]
+
+    def __iter__(self):
+        return iter(self._strings)
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+@lru_cache(maxsize=1)
+def get_trading_calendar() -> TradingCalendar:
+    """
+    交易日历对象, 进程内只读取和解析一次 calendar.json
+    :return: 交易日历
+    :rtype: TradingCalendar
+    """
+    setting_file_path = get_json_path("calendar.json", __file__)
+    with open(setting_file_path, "r", encoding="utf-8") as f:
+        data_json = json.load(f)
+    return TradingCalendar(data_json)
+
+
 def get_calendar():
     """
     获取交易日历, 这里的交易日历需要按年更新, 主要是从新浪获取的
+    按日期查询时请使用 get_trading_calendar()
     :return: 交易日历
     :rtype: json
     """
-    setting_file_name = "calendar.json"
-    setting_file_path = get_json_path(setting_file_name, __file__)
-    with open(setting_file_path, "r", encoding="utf-8") as f:
-        data_json = json.load(f)
-    return data_json
+    return get_trading_calendar().to_list()
 
 
 def last_trading_day(day):
@@ -591,25 +756,21 @@ def last_trading_day(day):
     :param day: "%Y%m%d" or  datetime.date()
     :return last_day: "%Y%m%d" or  datetime.date()
     """
-    calendar = get_calendar()
+    calendar = get_trading_calendar()
 
     if isinstance(day, str):
         if day not in calendar:
             print("Today is not trading day：" + day)
             return False
-        pos = calendar.index(day)
-        last_day = calendar[pos - 1]
-        return last_day
+        last_day = calendar.prev_trading_day(day)
+        return last_day.strftime("%Y%m%d")
 
     elif isinstance(day, datetime.date):
         d_str = day.strftime("%Y%m%d")
         if d_str not in calendar:
             print("Today is not working day：" + d_str)
             return False
-        pos = calendar.index(d_str)
-        last_day = calendar[pos - 1]
-        last_day = datetime.datetime.strptime(last_day, "%Y%m%d").date()
-        return last_day
+        return calendar.prev_trading_day(day)
 
 
 def get_latest_data_date(day):
@@ -618,16 +779,14 @@ def get_latest_data_date(day):
     :param day: datetime.datetime
     :return string YYYYMMDD
     """
-    calendar = get_calendar()
+    calendar = get_trading_calendar()
     if day.strftime("%Y%m%d") in calendar:
         if day.time() > datetime.time(17, 0, 0):
             return day.strftime("%Y%m%d")
         else:
             return last_trading_day(day.strftime("%Y%m%d"))
     else:
-        while day.strftime("%Y%m%d") not in calendar:
-            day = day - datetime.timedelta(days=1)
-        return day.strftime("%Y%m%d")
+        return calendar.prev_trading_day(day).strftime("%Y%m%d")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/7/21 15:00
+Date: 2026/10/18 15:00
 Desc: 期货-中国-交易所-会员持仓数据接口
 大连商品交易所、上海期货交易所、郑州商品交易所、中国金融期货交易所、广州期货交易所
 采集前 20 会员持仓数据;
@@ -20,18 +20,20 @@ import re
 import time
 import warnings
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from io import StringIO
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
 from akshare.futures import cons
 from akshare.futures.requests_fun import requests_link
 from akshare.futures.symbol_var import symbol_varieties
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get, request_post
 
-calendar = cons.get_calendar()
+calendar = cons.get_trading_calendar()
 rank_columns = [
     "vol_party_name",
     "vol",
@@ -89,22 +91,19 @@ def get_rank_sum_daily(
         if end_day is not None
         else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
     )
-    records = pd.DataFrame()
-    while start_day <= end_day:
-        print(start_day)
-        if start_day.strftime("%Y%m%d") in calendar:
-            data = get_rank_sum(start_day, vars_list)
-            if data is False:
-                print(
-                    f"{start_day.strftime('%Y-%m-%d')}日交易所数据连接失败，已超过20次，您的地址被网站墙了，请保存好返回数据，稍后从该日期起重试"
-                )
-                return records.reset_index(drop=True)
-            records = pd.concat(objs=[records, data], ignore_index=True)
-        else:
-            warnings.warn(f"{start_day.strftime('%Y%m%d')}非交易日")
-        start_day += datetime.timedelta(days=1)
-
-    return records.reset_index(drop=True)
+    records_chunks = ChunkAccumulator()
+    for day in calendar.trading_days_between(start_day, end_day):
+        day = day.astype(datetime.date)
+        print(day)
+        data = get_rank_sum(day, vars_list)
+        if data is False:
+            print(
+                f"{day.strftime('%Y-%m-%d')}日交易所数据连接失败或已被熔断，请保存好返回数据，稍后从该日期起重试, "
+                f"或使用 get_rank_sum_backfill 断点续传"
+            )
+            return records_chunks.to_frame()
+        records_chunks.append(data)
+    return records_chunks.to_frame()
 
 
 def get_rank_sum(date: str = "20210525", vars_list: list = cons.contract_symbols):
@@ -133,143 +132,130 @@ def get_rank_sum(date: str = "20210525", vars_list: list = cons.contract_symbols
     if date.strftime("%Y%m%d") not in calendar:
         warnings.warn("%s非交易日" % date.strftime("%Y%m%d"))
         return None
-    dce_var = [i for i in vars_list if i in cons.market_exchange_symbols["dce"]]
-    shfe_var = [i for i in vars_list if i in cons.market_exchange_symbols["shfe"]]
-    czce_var = [i for i in vars_list if i in cons.market_exchange_symbols["czce"]]
-    cffex_var = [i for i in vars_list if i in cons.market_exchange_symbols["cffex"]]
-    gfex_var = [i for i in vars_list if i in cons.market_exchange_symbols["gfex"]]
-    big_dict = {}
-    if len(dce_var) > 0:
-        data = futures_dce_position_rank(date, dce_var)
-        if data is False:
-            return False
-        big_dict.update(data)
-    if len(shfe_var) > 0:
-        data = get_shfe_rank_table(date, shfe_var)
-        if data is False:
-            return False
-        big_dict.update(data)
-    if len(czce_var) > 0:
-        data = get_rank_table_czce(date)
-        if data is False:
-            return False
-        big_dict.update(data)
-    if len(cffex_var) > 0:
-        data = get_cffex_rank_table(date, cffex_var)
-        if data is False:
-            return False
-        big_dict.update(data)
-    if len(gfex_var) > 0:
-        data = futures_gfex_position_rank(date, gfex_var)
-        if data is False:
-            return False
-        big_dict.update(data)
-    records = pd.DataFrame()
-
-    for symbol, table in big_dict.items():
-        table = table.map(lambda x: 0 if x == "" else x)
-        for symbol_inner in set(table["symbol"]):
-            var = symbol_varieties(symbol_inner)
-            if var in vars_list:
-                if var in czce_var:
-                    for col in [
-                        item
-                        for item in table.columns
-                        if item.find("open_interest") > -1
-                    ] + ["vol", "vol_chg"]:
-                        table[col] = [
-                            float(value.replace(",", "")) if value != "-" else 0.0
-                            for value in table[col]
-                        ]
+    market_vars = _rank_market_vars(vars_list)
+    if not market_vars:
+        return _rank_sum_frame(_rank_long_frame([]), vars_list)
+    # 各交易所的数据同时下载
+    with ThreadPoolExecutor(max_workers=len(market_vars)) as executor:
+        data_list = list(
+            executor.map(
+                lambda item: _get_rank_tables(item[0], date, item[1]),
+                market_vars.items(),
+            )
+        )
+    if any(data is False or data is None for data in data_list):
+        return False
+    long_df = _rank_long_frame([table for data in data_list for table in data.values()])
+    long_df["date"] = date.strftime("%Y%m%d")
+    return _rank_sum_frame(long_df, vars_list)
 
-                table_cut = table[table["symbol"] == symbol_inner]
-                table_cut["rank"] = table_cut["rank"].astype("float")
-                table_cut_top5 = table_cut[table_cut["rank"] <= 5]
-                table_cut_top10 = table_cut[table_cut["rank"] <= 10]
-                table_cut_top15 = table_cut[table_cut["rank"] <= 15]
-                table_cut_top20 = table_cut[table_cut["rank"] <= 20]
-
-                big_dict = {
-                    "symbol": symbol_inner,
-                    "variety": var,
-                    "vol_top5": table_cut_top5["vol"].sum(),
-                    "vol_chg_top5": table_cut_top5["vol_chg"].sum(),
-                    "long_open_interest_top5": table_cut_top5[
-                        "long_open_interest"
-                    ].sum(),
-                    "long_open_interest_chg_top5": table_cut_top5[
-                        "long_open_interest_chg"
-                    ].sum(),
-                    "short_open_interest_top5": table_cut_top5[
-                        "short_open_interest"
-                    ].sum(),
-                    "short_open_interest_chg_top5": table_cut_top5[
-                        "short_open_interest_chg"
-                    ].sum(),
-                    "vol_top10": table_cut_top10["vol"].sum(),
-                    "vol_chg_top10": table_cut_top10["vol_chg"].sum(),
-                    "long_open_interest_top10": table_cut_top10[
-                        "long_open_interest"
-                    ].sum(),
-                    "long_open_interest_chg_top10": table_cut_top10[
-                        "long_open_interest_chg"
-                    ].sum(),
-                    "short_open_interest_top10": table_cut_top10[
-                        "short_open_interest"
-                    ].sum(),
-                    "short_open_interest_chg_top10": table_cut_top10[
-                        "short_open_interest_chg"
-                    ].sum(),
-                    "vol_top15": table_cut_top15["vol"].sum(),
-                    "vol_chg_top15": table_cut_top15["vol_chg"].sum(),
-                    "long_open_interest_top15": table_cut_top15[
-                        "long_open_interest"
-                    ].sum(),
-                    "long_open_interest_chg_top15": table_cut_top15[
-                        "long_open_interest_chg"
-                    ].sum(),
-                    "short_open_interest_top15": table_cut_top15[
-                        "short_open_interest"
-                    ].sum(),
-                    "short_open_interest_chg_top15": table_cut_top15[
-                        "short_open_interest_chg"
-                    ].sum(),
-                    "vol_top20": table_cut_top20["vol"].sum(),
-                    "vol_chg_top20": table_cut_top20["vol_chg"].sum(),
-                    "long_open_interest_top20": table_cut_top20[
-                        "long_open_interest"
-                    ].sum(),
-                    "long_open_interest_chg_top20": table_cut_top20[
-                        "long_open_interest_chg"
-                    ].sum(),
-                    "short_open_interest_top20": table_cut_top20[
-                        "short_open_interest"
-                    ].sum(),
-                    "short_open_interest_chg_top20": table_cut_top20[
-                        "short_open_interest_chg"
-                    ].sum(),
-                    "date": date.strftime("%Y%m%d"),
-                }
-                records = pd.concat(
-                    [records, pd.DataFrame(big_dict, index=[0])], ignore_index=True
-                )
 
-    if len(big_dict.items()) > 0:
-        add_vars = [
-            i
-            for i in cons.market_exchange_symbols["dce"]
-            + cons.market_exchange_symbols["shfe"]
-            + cons.market_exchange_symbols["cffex"]
-            if i in records["variety"].tolist()
-        ]
-        for var in add_vars:
-            records_cut = records[records["variety"] == var]
-            var_record = pd.DataFrame(records_cut.sum()).T
-            var_record["date"] = date.strftime("%Y%m%d")
-            var_record.loc[:, ["variety", "symbol"]] = var
-            records = pd.concat([records, var_record], ignore_index=True)
+def _rank_market_vars(vars_list: list) -> dict:
+    """
+    按交易所拆分品种列表
+    :param vars_list: 合约品种如 ['RB', 'AL'] 等列表
+    :type vars_list: list
+    :return: {交易所: 品种列表}, 只包含有品种的交易所
+    :rtype: dict
+    """
+    market_vars = {}
+    for market in ["dce", "shfe", "czce", "cffex", "gfex"]:
+        var_list = [i for i in vars_list if i in cons.market_exchange_symbols[market]]
+        if var_list:
+            market_vars[market.upper()] = var_list
+    return market_vars
 
-    return records.reset_index(drop=True)
+
+def _get_rank_tables(market: str, date, vars_list: list, strict: bool = False) -> dict:
+    """
+    获取一个交易所一个交易日的会员持仓排名表
+    :param market: 交易所, choice of {'DCE', 'SHFE', 'CZCE', 'CFFEX', 'GFEX'}
+    :type market: str
+    :param date: 交易日
+    :type date: datetime.date
+    :param vars_list: 该交易所的品种列表
+    :type vars_list: list
+    :param strict: 部分合约下载失败时抛出异常, 不返回部分数据; 用于需要完整数据的批量下载
+    :type strict: bool
+    :return: {合约: 持仓排名}, 连接失败时为 False 或 None
+    :rtype: dict
+    """
+    func = _RANK_FUNC[market]
+    if market == "CZCE":
+        return func(date)
+    if market == "GFEX":
+        return func(date, vars_list, strict=strict)
+    return func(date, vars_list)
+
+
+def _rank_long_frame(tables) -> pd.DataFrame:
+    """
+    各合约的持仓排名表合并为长格式, 排名和数值列转换为浮点数, 空值和 "-" 记为 0
+    :param tables: 持仓排名表
+    :type tables: iterable
+    :return: 长格式的持仓排名
+    :rtype: pandas.DataFrame
+    """
+    columns = ["symbol", "rank"] + rank_columns
+    frame_list = [
+        pd.DataFrame(table).reindex(columns=columns) for table in tables if len(table)
+    ]
+    if not frame_list:
+        return pd.DataFrame(columns=columns)
+    temp_df = pd.concat(frame_list, ignore_index=True)
+    temp_df["symbol"] = temp_df["symbol"].astype(str)
+    for col in ["rank"] + intColumns:
+        if temp_df[col].dtype == object:
+            temp_df[col] = temp_df[col].astype(str).str.replace(",", "").str.strip()
+        temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
+    temp_df[intColumns] = temp_df[intColumns].fillna(0)
+    return temp_df
+
+
+def _rank_sum_frame(long_df: pd.DataFrame, vars_list: list) -> pd.DataFrame:
+    """
+    按交易日和合约分组, 计算前 5、前 10、前 15、前 20 会员的合计;
+    大商所、上期所和中金所再按品种加总, 合约和品种列均为品种代码
+    :param long_df: 长格式的持仓排名, 包含 date 列
+    :type long_df: pandas.DataFrame
+    :param vars_list: 合约品种如 ['RB', 'AL'] 等列表
+    :type vars_list: list
+    :return: 持仓排名合计
+    :rtype: pandas.DataFrame
+    """
+    keys = ["date", "symbol", "variety"]
+    sum_columns = [f"{col}_top{top}" for top in (5, 10, 15, 20) for col in intColumns]
+    if long_df.empty:
+        return pd.DataFrame(columns=["symbol", "variety"] + sum_columns + ["date"])
+    temp_df = long_df.copy()
+    variety_map = {
+        symbol: symbol_varieties(symbol) for symbol in temp_df["symbol"].unique()
+    }
+    temp_df["variety"] = temp_df["symbol"].map(variety_map)
+    temp_df = temp_df[temp_df["variety"].isin(vars_list)]
+    records = temp_df[keys].drop_duplicates().set_index(keys)
+    for top in (5, 10, 15, 20):
+        top_df = (
+            temp_df[temp_df["rank"] <= top].groupby(keys, sort=False)[intColumns].sum()
+        )
+        top_df.columns = [f"{col}_top{top}" for col in intColumns]
+        records = records.join(top_df)
+    records = records.fillna(0).reset_index()
+    add_vars = (
+        cons.market_exchange_symbols["dce"]
+        + cons.market_exchange_symbols["shfe"]
+        + cons.market_exchange_symbols["cffex"]
+    )
+    var_records = (
+        records[records["variety"].isin(add_vars)]
+        .groupby(["date", "variety"], sort=False)[sum_columns]
+        .sum()
+        .reset_index()
+    )
+    var_records["symbol"] = var_records["variety"]
+    records = pd.concat([records, var_records], ignore_index=True)
+    records = records.sort_values("date", kind="stable", ignore_index=True)
+    return records[["symbol", "variety"] + sum_columns + ["date"]]
 
 
 def get_shfe_rank_table(
@@ -450,7 +436,7 @@ def get_rank_table_czce(date: str = "20251103") -> dict:
             f"http://www.czce.com.cn/cn/DFSStaticFiles/Future/{date.year}/"
             f"{date.isoformat().replace('-', '')}/FutureDataHolding.xls"
         )
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     temp_df = pd.read_excel(BytesIO(r.content))
 
     temp_pinzhong_index = [
@@ -547,7 +533,7 @@ def _get_dce_contract_list(date, var):
 
     while 1:
         try:
-            r = requests.post(url, params=params, headers=headers)
+            r = request_post(url, params=params, headers=headers)
             soup = BeautifulSoup(r.text, "lxml")
             contract_list = [
                 re.findall(
@@ -563,6 +549,121 @@ def _get_dce_contract_list(date, var):
             continue
 
 
+def _dce_rank_contract(date, date_string, var: str, symbol: str):
+    """
+    大连商品交易所-单个合约的前 20 会员持仓排名
+    :param date: 交易日
+    :type date: datetime.date
+    :param date_string: 原样写入 date 列的日期
+    :type date_string: str
+    :param var: 品种
+    :type var: str
+    :param symbol: 合约
+    :type symbol: str
+    :return: 持仓排名, 请求失败时为空字典
+    :rtype: pandas.DataFrame
+    """
+    url = cons.DCE_VOL_RANK_URL_1 % (
+        var.lower(),
+        symbol,
+        var.lower(),
+        date.year,
+        date.month - 1,
+        date.day,
+    )
+    try:
+        temp_df = pd.read_excel(url[:-3] + "excel", header=0, skiprows=3)
+        temp_df.dropna(how="any", axis=0, inplace=True)
+        temp_df = temp_df.map(lambda x: str(x).replace(",", ""))
+        del temp_df["名次.1"]
+        del temp_df["名次.2"]
+        temp_df.rename(
+            columns={
+                "名次": "rank",
+                "会员简称": "vol_party_name",
+                "成交量": "vol",
+                "增减": "vol_chg",
+                "会员简称.1": "long_party_name",
+                "持买单量": "long_open_interest",
+                "增减.1": "long_open_interest_chg",
+                "会员简称.2": "short_party_name",
+                "持卖单量": "short_open_interest",
+                "增减.2": "short_open_interest_chg",
+            },
+            inplace=True,
+        )
+        temp_df["symbol"] = symbol.upper()
+        temp_df["var"] = var
+        temp_df["date"] = date_string
+        temp_df = temp_df.map(lambda x: str(x).replace("-", "0") if x == "-" else x)
+        temp_df["rank"] = range(1, len(temp_df) + 1)
+        temp_df["vol"] = temp_df["vol"].astype(float)
+        temp_df["vol_chg"] = temp_df["vol_chg"].astype(float)
+        temp_df["long_open_interest"] = temp_df["long_open_interest"].astype(float)
+        temp_df["long_open_interest_chg"] = temp_df["long_open_interest_chg"].astype(
+            float
+        )
+        temp_df["short_open_interest"] = temp_df["short_open_interest"].astype(float)
+        temp_df["short_open_interest_chg"] = temp_df["short_open_interest_chg"].astype(
+            float
+        )
+        return temp_df
+    except:  # noqa: E722
+        temp_url = (
+            "http://portal.dce.com.cn/publicweb/quotesdata/memberDealPosiQuotes.html"
+        )
+        payload = {
+            "memberDealPosiQuotes.variety": var.lower(),
+            "memberDealPosiQuotes.trade_type": "0",
+            "year": date.year,
+            "month": date.month - 1,
+            "day": str(date.day).zfill(2),
+            "contract.contract_id": symbol,
+            "contract.variety_id": var.lower(),
+            "contract": "",
+        }
+        r = request_post(temp_url, data=payload)
+        if r.status_code != 200:
+            return {}
+        else:
+            temp_df = pd.read_html(StringIO(r.text))[1].iloc[:-1, :]
+            del temp_df["名次.1"]
+            del temp_df["名次.2"]
+            temp_df.rename(
+                columns={
+                    "名次": "rank",
+                    "会员简称": "vol_party_name",
+                    "成交量": "vol",
+                    "增减": "vol_chg",
+                    "会员简称.1": "long_party_name",
+                    "持买单量": "long_open_interest",
+                    "增减.1": "long_open_interest_chg",
+                    "会员简称.2": "short_party_name",
+                    "持卖单量": "short_open_interest",
+                    "增减.2": "short_open_interest_chg",
+                },
+                inplace=True,
+            )
+            temp_df["symbol"] = symbol.upper()
+            temp_df["var"] = var
+            temp_df["date"] = date_string
+            temp_df = temp_df.map(lambda x: str(x).replace("-", "0") if x == "-" else x)
+            temp_df["rank"] = range(1, len(temp_df) + 1)
+            temp_df["vol"] = temp_df["vol"].astype(float)
+            temp_df["vol_chg"] = temp_df["vol_chg"].astype(float)
+            temp_df["long_open_interest"] = temp_df["long_open_interest"].astype(float)
+            temp_df["long_open_interest_chg"] = temp_df[
+                "long_open_interest_chg"
+            ].astype(float)
+            temp_df["short_open_interest"] = temp_df["short_open_interest"].astype(
+                float
+            )
+            temp_df["short_open_interest_chg"] = temp_df[
+                "short_open_interest_chg"
+            ].astype(float)
+            return temp_df
+
+
 def get_dce_rank_table(date: str = "20230706", vars_list=cons.contract_symbols) -> dict:
     """
     大连商品交易所前 20 会员持仓排名数据明细, 由于交易所网站问题, 需要 20200720 之后才有数据
@@ -597,119 +698,20 @@ def get_dce_rank_table(date: str = "20230706", vars_list=cons.contract_symbols)
         warnings.warn("%s非交易日" % date.strftime("%Y%m%d"))
         return {}
     vars_list = [i for i in vars_list if i in cons.market_exchange_symbols["dce"]]
-    big_dict = {}
-    for var in vars_list:
-        # var = 'V'
-        symbol_list = _get_dce_contract_list(date, var)
-        for symbol in symbol_list:
-            # print(symbol)
-            url = cons.DCE_VOL_RANK_URL_1 % (
-                var.lower(),
-                symbol,
-                var.lower(),
-                date.year,
-                date.month - 1,
-                date.day,
+    symbol_list = [
+        (var, symbol)
+        for var in vars_list
+        for symbol in _get_dce_contract_list(date, var)
+    ]
+    # 每个合约一次请求, 各合约同时下载
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        table_list = list(
+            executor.map(
+                lambda item: _dce_rank_contract(date, date_string, *item),
+                symbol_list,
             )
-            try:
-                temp_df = pd.read_excel(url[:-3] + "excel", header=0, skiprows=3)
-                temp_df.dropna(how="any", axis=0, inplace=True)
-                temp_df = temp_df.map(lambda x: str(x).replace(",", ""))
-                del temp_df["名次.1"]
-                del temp_df["名次.2"]
-                temp_df.rename(
-                    columns={
-                        "名次": "rank",
-                        "会员简称": "vol_party_name",
-                        "成交量": "vol",
-                        "增减": "vol_chg",
-                        "会员简称.1": "long_party_name",
-                        "持买单量": "long_open_interest",
-                        "增减.1": "long_open_interest_chg",
-                        "会员简称.2": "short_party_name",
-                        "持卖单量": "short_open_interest",
-                        "增减.2": "short_open_interest_chg",
-                    },
-                    inplace=True,
-                )
-                temp_df["symbol"] = symbol.upper()
-                temp_df["var"] = var
-                temp_df["date"] = date_string
-                temp_df = temp_df.map(
-                    lambda x: str(x).replace("-", "0") if x == "-" else x
-                )
-                temp_df["rank"] = range(1, len(temp_df) + 1)
-                temp_df["vol"] = temp_df["vol"].astype(float)
-                temp_df["vol_chg"] = temp_df["vol_chg"].astype(float)
-                temp_df["long_open_interest"] = temp_df["long_open_interest"].astype(
-                    float
-                )
-                temp_df["long_open_interest_chg"] = temp_df[
-                    "long_open_interest_chg"
-                ].astype(float)
-                temp_df["short_open_interest"] = temp_df["short_open_interest"].astype(
-                    float
-                )
-                temp_df["short_open_interest_chg"] = temp_df[
-                    "short_open_interest_chg"
-                ].astype(float)
-                big_dict[symbol] = temp_df
-            except:  # noqa: E722
-                temp_url = "http://portal.dce.com.cn/publicweb/quotesdata/memberDealPosiQuotes.html"
-                payload = {
-                    "memberDealPosiQuotes.variety": var.lower(),
-                    "memberDealPosiQuotes.trade_type": "0",
-                    "year": date.year,
-                    "month": date.month - 1,
-                    "day": str(date.day).zfill(2),
-                    "contract.contract_id": symbol,
-                    "contract.variety_id": var.lower(),
-                    "contract": "",
-                }
-                r = requests.post(temp_url, data=payload)
-                if r.status_code != 200:
-                    big_dict[symbol] = {}
-                else:
-                    temp_df = pd.read_html(StringIO(r.text))[1].iloc[:-1, :]
-                    del temp_df["名次.1"]
-                    del temp_df["名次.2"]
-                    temp_df.rename(
-                        columns={
-                            "名次": "rank",
-                            "会员简称": "vol_party_name",
-                            "成交量": "vol",
-                            "增减": "vol_chg",
-                            "会员简称.1": "long_party_name",
-                            "持买单量": "long_open_interest",
-                            "增减.1": "long_open_interest_chg",
-                            "会员简称.2": "short_party_name",
-                            "持卖单量": "short_open_interest",
-                            "增减.2": "short_open_interest_chg",
-                        },
-                        inplace=True,
-                    )
-                    temp_df["symbol"] = symbol.upper()
-                    temp_df["var"] = var
-                    temp_df["date"] = date_string
-                    temp_df = temp_df.map(
-                        lambda x: str(x).replace("-", "0") if x == "-" else x
-                    )
-                    temp_df["rank"] = range(1, len(temp_df) + 1)
-                    temp_df["vol"] = temp_df["vol"].astype(float)
-                    temp_df["vol_chg"] = temp_df["vol_chg"].astype(float)
-                    temp_df["long_open_interest"] = temp_df[
-                        "long_open_interest"
-                    ].astype(float)
-                    temp_df["long_open_interest_chg"] = temp_df[
-                        "long_open_interest_chg"
-                    ].astype(float)
-                    temp_df["short_open_interest"] = temp_df[
-                        "short_open_interest"
-                    ].astype(float)
-                    temp_df["short_open_interest_chg"] = temp_df[
-                        "short_open_interest_chg"
-                    ].astype(float)
-                    big_dict[symbol] = temp_df
+        )
+    big_dict = {symbol: table for (var, symbol), table in zip(symbol_list, table_list)}
     return big_dict
 
 
@@ -761,7 +763,7 @@ def get_cffex_rank_table(date: str = "20190805", vars_list=cons.contract_symbols
         )
         # url = 'http://www.cffex.com.cn/sj/ccpm/201908/05/IF_1.csv'
         # url = 'http://www.cffex.com.cn/sj/ccpm/202308/08/IF_1.csv'
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         # 20200316 开始数据结构变化，统一格式
         if r.status_code == 200:
             try:
@@ -841,7 +843,7 @@ def futures_dce_position_rank(
         "tradeType": "1",
         "lang": "zh",
     }
-    r = requests.post(url, json=payload)
+    r = request_post(url, json=payload)
     big_dict = dict()
     with zipfile.ZipFile(BytesIO(r.content), mode="r") as z:
         for i in z.namelist():
@@ -1073,7 +1075,7 @@ def futures_dce_position_rank_other(date: str = "20160104"):
         "contract.variety_id": "c",
         "contract": "",
     }
-    r = requests.post(url, data=payload)
+    r = request_post(url, data=payload)
     soup = BeautifulSoup(r.text, features="lxml")
     symbol_list = [
         item["onclick"].strip("javascript:setVariety(").strip("');")
@@ -1091,7 +1093,7 @@ def futures_dce_position_rank_other(date: str = "20160104"):
             "contract.variety_id": symbol,
             "contract": "",
         }
-        r = requests.post(url, data=payload)
+        r = request_post(url, data=payload)
         soup = BeautifulSoup(r.text, features="lxml")
         contract_list = [
             item["onclick"].strip("javascript:setContract_id('").strip("');")
@@ -1111,7 +1113,7 @@ def futures_dce_position_rank_other(date: str = "20160104"):
                         "contract.variety_id": symbol,
                         "contract": "",
                     }
-                    r = requests.post(url, data=payload)
+                    r = request_post(url, data=payload)
                     temp_df = pd.read_html(StringIO(r.text))[1].iloc[:-1, :]
                     temp_df.columns = [
                         "rank",
@@ -1161,7 +1163,7 @@ def __futures_gfex_vars_list() -> list:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/119.0.0.0 Safari/537.36"
     }
-    r = requests.post(url=url, headers=headers)
+    r = request_post(url=url, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     var_list = temp_df["varietyId"].tolist()
@@ -1188,7 +1190,7 @@ def __futures_gfex_contract_list(symbol: str = "si", date: str = "20240729") ->
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/119.0.0.0 Safari/537.36"
     }
-    r = requests.post(url=url, data=payload, headers=headers)
+    r = request_post(url=url, data=payload, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     if temp_df.empty:
@@ -1231,7 +1233,7 @@ def __futures_gfex_contract_data(
                 "data_type": page,
             }
         )
-        r = requests.post(url=url, data=payload, headers=headers)
+        r = request_post(url=url, data=payload, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"])
         if "qtySub" in temp_df.columns:
@@ -1289,7 +1291,9 @@ def __futures_gfex_contract_data(
     return big_df
 
 
-def futures_gfex_position_rank(date: str = "20231113", vars_list: list = None):
+def futures_gfex_position_rank(
+    date: str = "20231113", vars_list: list = None, strict: bool = False
+):
     """
     广州期货交易所-日成交持仓排名
     http://www.gfex.com.cn/gfex/rcjccpm/hqsj_tjsj.shtml
@@ -1297,6 +1301,8 @@ def futures_gfex_position_rank(date: str = "20231113", vars_list: list = None):
     :type date: str
     :param vars_list: 商品代码列表
     :type vars_list: list
+    :param strict: 为 True 时合约列表或合约数据下载失败直接抛出异常; 为 False 时返回失败之前的合约
+    :type strict: bool
     :return: 日成交持仓排名
     :rtype: pandas.DataFrame
     """
@@ -1309,25 +1315,47 @@ def futures_gfex_position_rank(date: str = "20231113", vars_list: list = None):
         vars_list = __futures_gfex_vars_list()
     else:
         vars_list = [item.lower() for item in vars_list]
-    big_dict = {}
+    contract_list = []
     for item in vars_list:
         try:
             futures_contract_list = __futures_gfex_contract_list(
                 symbol=item.lower(), date=date
             )
         except:  # noqa: E722
-            return big_dict
-        for name in futures_contract_list:
+            if strict:
+                raise
+            break
+        contract_list.extend((item.lower(), name) for name in futures_contract_list)
+    # 每个合约需要三次请求, 各合约同时下载; 失败时返回失败之前的合约, strict 时抛出异常
+    big_dict = {}
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        future_list = [
+            executor.submit(
+                __futures_gfex_contract_data, symbol=symbol, contract_id=name, date=date
+            )
+            for symbol, name in contract_list
+        ]
+        for (symbol, name), future in zip(contract_list, future_list):
             try:
-                temp_df = __futures_gfex_contract_data(
-                    symbol=item.lower(), contract_id=name, date=date
-                )
-                big_dict[name] = temp_df
+                big_dict[name] = future.result()
             except:  # noqa: E722
-                return big_dict
+                for item in future_list:
+                    item.cancel()
+                if strict:
+                    raise
+                break
     return big_dict
 
 
+_RANK_FUNC = {
+    "DCE": futures_dce_position_rank,
+    "SHFE": get_shfe_rank_table,
+    "CZCE": get_rank_table_czce,
+    "CFFEX": get_cffex_rank_table,
+    "GFEX": futures_gfex_position_rank,
+}
+
+
 if __name__ == "__main__":
     # 郑州商品交易所
     get_rank_table_czce_df = get_rank_table_czce(date="20230109")
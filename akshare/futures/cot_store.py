@@ -0,0 +1,180 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 期货-中国-交易所-会员持仓排名-批量下载与断点续传
+各交易所同时下载, 每个交易所的并发数单独限制; 每个交易所每个交易日的持仓排名明细
+写入 store_dir/futures_rank/交易所/YYYYMMDD.parquet, 已完成的日期记录在检查点文件中,
+中断后再次调用只下载缺失的日期, 最近的有数据的交易日及之后没有数据的日期不记录到检查点;
+前 5、前 10、前 15、前 20 会员合计由本地明细统一计算
+"""
+
+import datetime
+import os
+from functools import partial
+from typing import Dict, Union
+
+import pandas as pd
+
+from akshare.futures import cons, cot
+from akshare.utils.batch import _call_with_retry
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.store import (
+    DEFAULT_STORE_DIR,
+    Checkpoint,
+    partition_workers,
+    read_parquet,
+    run_partitioned,
+    write_parquet,
+)
+
+# 各交易所网站的默认并发请求数; 单个交易所内部的合约已经并发下载
+RANK_CONCURRENCY = {
+    "DCE": 1,
+    "SHFE": 2,
+    "CZCE": 2,
+    "CFFEX": 2,
+    "GFEX": 1,
+}
+
+_CHECKPOINT_FILE = "_checkpoint.jsonl"
+
+
+def futures_rank_store_path(
+    market: str, date: str, store_dir: str = DEFAULT_STORE_DIR
+) -> str:
+    """
+    会员持仓排名明细的本地文件路径
+    :param market: 交易所, 如 SHFE
+    :type market: str
+    :param date: 交易日, YYYYMMDD
+    :type date: str
+    :param store_dir: 本地存储目录
+    :type store_dir: str
+    :return: 文件路径
+    :rtype: str
+    """
+    return os.path.join(store_dir, "futures_rank", market.upper(), f"{date}.parquet")
+
+
+def _fetch_rank_day(
+    market: str,
+    date: str,
+    checkpoint: Checkpoint,
+    store_dir: str,
+    retries: int,
+    retry_delay: float,
+    latest_date: str,
+) -> None:
+    """
+    下载一个交易所一个交易日的全部品种的持仓排名明细并写入本地文件, 完成后记录到检查点;
+    latest_date 及之后的日期没有数据时可能是尚未发布, 不记录;
+    部分合约下载失败时抛出异常, 不写入部分数据
+    :param market: 交易所
+    :type market: str
+    :param date: 交易日, YYYYMMDD
+    :type date: str
+    :param checkpoint: 检查点
+    :type checkpoint: Checkpoint
+    :param store_dir: 本地存储目录
+    :type store_dir: str
+    :param retries: 失败后的重试次数
+    :type retries: int
+    :param retry_delay: 首次重试前的等待时间（秒）
+    :type retry_delay: float
+    :param latest_date: 最近的有数据的交易日, YYYYMMDD
+    :type latest_date: str
+    :return: None
+    :rtype: None
+    """
+
+    def fetch() -> dict:
+        data = cot._get_rank_tables(
+            market,
+            cons.convert_date(date),
+            cons.market_exchange_symbols[market.lower()],
+            strict=True,
+        )
+        if data is False or data is None:
+            raise ConnectionError(f"{market} {date} 持仓排名下载失败")
+        return data
+
+    data = _call_with_retry(fetch, retries, retry_delay)
+    long_df = cot._rank_long_frame(data.values())
+    if not long_df.empty:
+        write_parquet(long_df, futures_rank_store_path(market, date, store_dir))
+    elif date >= latest_date:
+        return
+    checkpoint.mark(market, date)
+
+
+def get_rank_sum_backfill(
+    start_day: str = "20210510",
+    end_day: str = None,
+    vars_list: list = cons.contract_symbols,
+    store_dir: str = DEFAULT_STORE_DIR,
+    max_workers: Union[int, Dict[str, int], None] = None,
+    retries: int = 2,
+    retry_delay: float = 1.0,
+) -> pd.DataFrame:
+    """
+    采集五个期货交易所前 5、前 10、前 15、前 20 会员持仓排名数据, 明细保存到本地, 可以断点续传
+    本地保存交易所全部品种的明细, vars_list 只影响返回的合计, 因此更换品种不需要重新下载;
+    失败的 (交易所, 交易日) 及异常保存在返回数据的 attrs["errors"] 中, 再次调用时重新下载
+    :param start_day: 开始日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象
+    :type start_day: str
+    :param end_day: 结束日期, 为空时为最近的有数据的交易日
+    :type end_day: str
+    :param vars_list: 合约品种如 ['RB', 'AL'] 等列表
+    :type vars_list: list
+    :param store_dir: 本地存储目录
+    :type store_dir: str
+    :param max_workers: 每个交易所同时下载的交易日数, 可以是整数或 {交易所: 并发数}, 为空时使用 RANK_CONCURRENCY
+    :type max_workers: int or dict
+    :param retries: 单个交易日失败后的重试次数
+    :type retries: int
+    :param retry_delay: 首次重试前的等待时间（秒）
+    :type retry_delay: float
+    :return: 会员持仓排名合计, 字段与 get_rank_sum_daily 一致
+    :rtype: pandas.DataFrame
+    """
+    latest_date = cons.get_latest_data_date(datetime.datetime.now())
+    if end_day is None:
+        end_day = latest_date
+    days = cot.calendar.trading_days_between(
+        cons.convert_date(start_day), cons.convert_date(end_day)
+    )
+    dates = pd.to_datetime(days).strftime("%Y%m%d").tolist()
+    market_list = list(cot._rank_market_vars(vars_list))
+    checkpoint = Checkpoint(os.path.join(store_dir, "futures_rank", _CHECKPOINT_FILE))
+    fetch_rank_day = partial(
+        _fetch_rank_day,
+        checkpoint=checkpoint,
+        store_dir=store_dir,
+        retries=retries,
+        retry_delay=retry_delay,
+        latest_date=latest_date,
+    )
+    error_dict = run_partitioned(
+        fetch_rank_day,
+        [(item, date) for item in market_list for date in dates],
+        partition_workers(max_workers, RANK_CONCURRENCY),
+        checkpoint,
+    )
+    long_chunks = ChunkAccumulator()
+    for date in dates:
+        for item in market_list:
+            temp_df = read_parquet(futures_rank_store_path(item, date, store_dir))
+            if temp_df is not None:
+                temp_df["date"] = date
+                long_chunks.append(temp_df)
+    big_df = cot._rank_sum_frame(long_chunks.to_frame(), vars_list)
+    big_df.attrs["errors"] = error_dict
+    return big_df
+
+
+if __name__ == "__main__":
+    get_rank_sum_backfill_df = get_rank_sum_backfill(
+        start_day="20251027", end_day="20251031"
+    )
+    print(get_rank_sum_backfill_df)
+    print(get_rank_sum_backfill_df.attrs["errors"])
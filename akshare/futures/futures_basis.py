@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/12/12 17:00
+Date: 2026/10/18 15:00
 Desc: 生意社网站采集大宗商品现货价格及相应基差数据, 数据时间段从 20110104-至今
 备注：现期差 = 现货价格 - 期货价格(这里的期货价格为结算价)
 黄金为 元/克, 白银为 元/千克, 玻璃现货为 元/平方米, 鸡蛋现货为 元/公斤, 鸡蛋期货为 元/500千克, 其余为 元/吨.
@@ -24,8 +24,9 @@ import pandas as pd
 from akshare.futures import cons
 from akshare.futures.requests_fun import pandas_read_html_link
 from akshare.futures.symbol_var import chinese_to_english
+from akshare.utils.func import ChunkAccumulator
 
-calendar = cons.get_calendar()
+calendar = cons.get_trading_calendar()
 
 
 def futures_spot_price_daily(
@@ -172,7 +173,7 @@ def _check_information(df_data, date):
         "dominant_contract",
         "dominant_contract_price",
     ]
-    records = pd.DataFrame()
+    records_chunks = ChunkAccumulator()
     for string in df_data["symbol"].tolist():
         news = "".join(re.findall(r"[\u4e00-\u9fa5]", string))
         if news == "":
@@ -211,7 +212,8 @@ def _check_information(df_data, date):
                 symbol == "LH"
             ):  # 上表中现货单位为元/公斤, 期货单位为元/吨. 换算公式：元/公斤*1000=元/吨(http://www.100ppi.com/sf/959.html)
                 record.loc[:, "spot_price"] = float(record["spot_price"].iloc[0]) * 1000
-            records = pd.concat([records, record])
+            records_chunks.append(record)
+    records = records_chunks.to_frame(ignore_index=False)
 
     # 20241129:如果某日没有数据，直接返回返回空表
     if records.empty:
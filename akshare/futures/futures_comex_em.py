@@ -1,15 +1,16 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2023/11/15 18:00
+Date: 2026/10/18 15:00
 Desc: 东方财富网-数据中心-期货期权-COMEX库存数据
 https://data.eastmoney.com/pmetal/comex/by.html
 """
 
 import pandas as pd
-import requests
 
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def futures_comex_inventory(symbol: str = "黄金") -> pd.DataFrame:
@@ -38,10 +39,10 @@ def futures_comex_inventory(symbol: str = "黄金") -> pd.DataFrame:
         "client": "WEB",
         "filter": f'(INDICATOR_ID1="{symbol_map[symbol]}")(@STORAGE_TON<>"NULL")',
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
@@ -49,10 +50,11 @@ def futures_comex_inventory(symbol: str = "黄金") -> pd.DataFrame:
                 "pageNumber": page,
             }
         )
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], axis=0, ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
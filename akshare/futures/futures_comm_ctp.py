@@ -10,9 +10,10 @@ from datetime import datetime
 from io import StringIO
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
+from akshare.utils.request import request_get
+
 
 def futures_fees_info() -> pd.DataFrame:
     """
@@ -22,7 +23,7 @@ def futures_fees_info() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "http://openctp.cn/fees.html"
-    r = requests.get(url)
+    r = request_get(url)
     r.encoding = "utf-8"
     soup = BeautifulSoup(r.text, features="lxml")
     datetime_str = soup.find("p").string.strip("Generated at ").strip(".")
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/11/30 18:00
+Date: 2026/10/18 15:00
 Desc: 期货日线行情
 """
 
@@ -17,8 +17,9 @@ import requests
 
 from akshare.futures import cons
 from akshare.futures.requests_fun import requests_link
+from akshare.utils.request import request_get, request_post
 
-calendar = cons.get_calendar()
+calendar = cons.get_trading_calendar()
 
 
 def _futures_daily_czce(
@@ -35,7 +36,7 @@ def _futures_daily_czce(
     :rtype: pandas.DataFrame
     """
     url = f"http://www.czce.com.cn/cn/exchange/{dataset}.zip"
-    r = requests.get(url)
+    r = request_get(url)
     with zipfile.ZipFile(BytesIO(r.content)) as file:
         with file.open(f"{dataset}.txt") as my_file:
             data = my_file.read().decode("gb2312")
@@ -123,7 +124,7 @@ def get_cffex_daily(date: str = "20100416") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/108.0.0.0 Safari/537.36",
     }
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     try:
         with zipfile.ZipFile(BytesIO(r.content)) as file:
             with file.open(f"{date}_1.csv") as my_file:
@@ -229,7 +230,7 @@ def get_gfex_daily(date: str = "20221223") -> pd.DataFrame:
         "X-Requested-With": "XMLHttpRequest",
         "content-type": "application/x-www-form-urlencoded",
     }
-    r = requests.post(url, data=payload, headers=headers)
+    r = request_post(url, data=payload, headers=headers)
     try:
         data_json = r.json()
     except:  # noqa: E722
@@ -288,7 +289,7 @@ def get_ine_daily(date: str = "20241129") -> pd.DataFrame:
         # warnings.warn(f"{day.strftime('%Y%m%d')}非交易日")
         return pd.DataFrame()
     url = f"https://www.ine.cn/data/tradedata/future/dailydata/kx{day.strftime('%Y%m%d')}.dat"
-    r = requests.get(url, headers=cons.shfe_headers)
+    r = request_get(url, headers=cons.shfe_headers)
     result_df = pd.DataFrame()
     try:
         data_json = r.json()
@@ -366,7 +367,7 @@ def get_czce_daily(date: str = "20050525") -> pd.DataFrame:
         listed_columns = cons.CZCE_COLUMNS
         output_columns = cons.OUTPUT_COLUMNS
         try:
-            r = requests.get(url, headers=headers)
+            r = request_get(url, headers=headers)
             if datetime.date(2015, 11, 12) <= day <= datetime.date(2017, 12, 27):
                 html = str(r.content, encoding="gbk")
             else:
@@ -547,7 +548,7 @@ def get_dce_daily(date: str = "20251027") -> pd.DataFrame:
         "tradeType": "1",
         "varietyId": "all",
     }
-    r = requests.post(url, json=payload)
+    r = request_post(url, json=payload)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.rename(
@@ -634,6 +635,30 @@ def get_dce_daily(date: str = "20251027") -> pd.DataFrame:
     return temp_df
 
 
+_MARKET_FUNC = {
+    "CFFEX": get_cffex_daily,
+    "CZCE": get_czce_daily,
+    "SHFE": get_shfe_daily,
+    "DCE": get_dce_daily,
+    "INE": get_ine_daily,
+    "GFEX": get_gfex_daily,
+}
+
+
+def trading_dates_between(start_date, end_date) -> list:
+    """
+    区间内的全部交易日, 包含首尾, 非交易日不再逐日请求
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :return: YYYYMMDD 格式的交易日
+    :rtype: list
+    """
+    days = calendar.trading_days_between(start_date, end_date)
+    return pd.to_datetime(days).strftime("%Y%m%d").tolist()
+
+
 def get_futures_daily(
     start_date: str = "20220208",
     end_date: str = "20220208",
@@ -650,19 +675,8 @@ def get_futures_daily(
     :return: 交易所日交易数据
     :rtype: pandas.DataFrame
     """
-    if market.upper() == "CFFEX":
-        f = get_cffex_daily
-    elif market.upper() == "CZCE":
-        f = get_czce_daily
-    elif market.upper() == "SHFE":
-        f = get_shfe_daily
-    elif market.upper() == "DCE":
-        f = get_dce_daily
-    elif market.upper() == "INE":
-        f = get_ine_daily
-    elif market.upper() == "GFEX":
-        f = get_gfex_daily
-    else:
+    f = _MARKET_FUNC.get(market.upper())
+    if f is None:
         print("Invalid Market Symbol")
         return pd.DataFrame()
 
@@ -678,11 +692,10 @@ def get_futures_daily(
     )
 
     df_list = list()
-    while start_date <= end_date:
-        df = f(date=str(start_date).replace("-", ""))
+    for date in trading_dates_between(start_date, end_date):
+        df = f(date=date)
         if not df.empty:
             df_list.append(df)
-        start_date += datetime.timedelta(days=1)
 
     if len(df_list) == 0:
         return pd.DataFrame()
@@ -0,0 +1,196 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 期货交易所日交易数据-多交易所多日期批量下载
+只请求交易日历中的交易日; 各交易所同时下载, 每个交易所的并发数单独限制;
+每个交易日的数据写入 store_dir/futures_daily/交易所/YYYYMMDD.parquet,
+已完成的日期记录在检查点文件中, 中断后再次调用只下载缺失的日期;
+最近的有数据的交易日及之后没有数据的日期可能尚未发布, 不记录到检查点;
+各交易所的接口在请求失败时也返回空数据, 因此数据开始日期之后的历史交易日没有数据时视为失败
+"""
+
+import datetime
+import os
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+from akshare.futures import cons, futures_daily_bar
+from akshare.utils.batch import _call_with_retry
+from akshare.utils.store import (
+    DEFAULT_STORE_DIR,
+    Checkpoint,
+    partition_workers,
+    read_parquet,
+    run_partitioned,
+    write_parquet,
+)
+
+# 各交易所网站的默认并发请求数
+EXCHANGE_CONCURRENCY = {
+    "CFFEX": 2,
+    "CZCE": 2,
+    "SHFE": 2,
+    "DCE": 1,
+    "INE": 2,
+    "GFEX": 1,
+}
+
+# 各交易所日交易数据的开始日期, 之前的交易日没有数据属于正常情况; 表中没有的交易所任何历史交易日都应有数据
+EXCHANGE_DATA_START = {
+    "CFFEX": "20100416",
+    "CZCE": "20050525",
+    "INE": "20180326",
+    "GFEX": "20221222",
+}
+
+_CHECKPOINT_FILE = "_checkpoint.jsonl"
+
+
+def futures_daily_store_path(
+    market: str, date: str, store_dir: str = DEFAULT_STORE_DIR
+) -> str:
+    """
+    期货交易所日交易数据的本地文件路径
+    :param market: 交易所, 如 CFFEX
+    :type market: str
+    :param date: 交易日, YYYYMMDD
+    :type date: str
+    :param store_dir: 本地存储目录
+    :type store_dir: str
+    :return: 文件路径
+    :rtype: str
+    """
+    return os.path.join(store_dir, "futures_daily", market.upper(), f"{date}.parquet")
+
+
+def _fetch_day(
+    market: str,
+    date: str,
+    checkpoint: Checkpoint,
+    store_dir: str,
+    retries: int,
+    retry_delay: float,
+    latest_date: str,
+) -> None:
+    """
+    下载一个交易所一个交易日的数据并写入本地文件, 完成后记录到检查点;
+    latest_date 及之后的日期没有数据时可能是尚未发布, 不记录;
+    数据开始日期之后的历史交易日没有数据时按失败重试, 最终抛出异常
+    :param market: 交易所
+    :type market: str
+    :param date: 交易日, YYYYMMDD
+    :type date: str
+    :param checkpoint: 检查点
+    :type checkpoint: Checkpoint
+    :param store_dir: 本地存储目录
+    :type store_dir: str
+    :param retries: 失败后的重试次数
+    :type retries: int
+    :param retry_delay: 首次重试前的等待时间（秒）
+    :type retry_delay: float
+    :param latest_date: 最近的有数据的交易日, YYYYMMDD
+    :type latest_date: str
+    :return: None
+    :rtype: None
+    """
+
+    def fetch(date: str) -> pd.DataFrame:
+        temp_df = futures_daily_bar._MARKET_FUNC[market](date=date)
+        if temp_df.empty and EXCHANGE_DATA_START.get(market, "") <= date < latest_date:
+            raise ValueError(f"{market} {date} 没有数据")
+        return temp_df
+
+    temp_df = _call_with_retry(fetch, retries, retry_delay, date=date)
+    if not temp_df.empty:
+        temp_df = temp_df[~temp_df["symbol"].str.contains("efp")]
+        temp_df.reset_index(drop=True, inplace=True)
+        write_parquet(temp_df, futures_daily_store_path(market, date, store_dir))
+    elif date >= latest_date:
+        return
+    checkpoint.mark(market, date)
+
+
+def get_futures_daily_bulk(
+    start_date: str = "20220208",
+    end_date: Optional[str] = None,
+    market: Union[str, Iterable[str], None] = None,
+    store_dir: str = DEFAULT_STORE_DIR,
+    max_workers: Union[int, Dict[str, int], None] = None,
+    retries: int = 2,
+    retry_delay: float = 1.0,
+    return_data: bool = True,
+) -> pd.DataFrame:
+    """
+    期货交易所日交易数据-批量下载并保存到本地
+    失败的 (交易所, 交易日) 及异常保存在返回数据的 attrs["errors"] 中, 再次调用时重新下载
+    :param start_date: 开始日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象
+    :type start_date: str
+    :param end_date: 结束日期, 为空时为最近的有数据的交易日
+    :type end_date: str
+    :param market: 交易所或交易所列表, choice of {'CFFEX', 'CZCE', 'SHFE', 'DCE', 'INE', 'GFEX'}, 为空时为全部交易所
+    :type market: str or list
+    :param store_dir: 本地存储目录
+    :type store_dir: str
+    :param max_workers: 每个交易所的并发数, 可以是整数或 {交易所: 并发数}, 为空时使用 EXCHANGE_CONCURRENCY
+    :type max_workers: int or dict
+    :param retries: 单个交易日失败后的重试次数
+    :type retries: int
+    :param retry_delay: 首次重试前的等待时间（秒）
+    :type retry_delay: float
+    :param return_data: 是否读取并返回区间内的数据; 下载多年数据时可以设为 False, 之后按需读取本地文件
+    :type return_data: bool
+    :return: 交易所日交易数据
+    :rtype: pandas.DataFrame
+    """
+    if market is None:
+        market_list = list(futures_daily_bar._MARKET_FUNC)
+    elif isinstance(market, str):
+        market_list = [item.strip().upper() for item in market.split(",")]
+    else:
+        market_list = [item.upper() for item in market]
+    unknown = [
+        item for item in market_list if item not in futures_daily_bar._MARKET_FUNC
+    ]
+    if unknown:
+        raise ValueError(f"Invalid Market Symbol: {', '.join(unknown)}")
+    latest_date = cons.get_latest_data_date(datetime.datetime.now())
+    if end_date is None:
+        end_date = latest_date
+    dates = futures_daily_bar.trading_dates_between(
+        cons.convert_date(start_date), cons.convert_date(end_date)
+    )
+    checkpoint = Checkpoint(os.path.join(store_dir, "futures_daily", _CHECKPOINT_FILE))
+    fetch_day = partial(
+        _fetch_day,
+        checkpoint=checkpoint,
+        store_dir=store_dir,
+        retries=retries,
+        retry_delay=retry_delay,
+        latest_date=latest_date,
+    )
+    error_dict = run_partitioned(
+        fetch_day,
+        [(item, date) for item in market_list for date in dates],
+        partition_workers(max_workers, EXCHANGE_CONCURRENCY),
+        checkpoint,
+    )
+    frame_list: List[pd.DataFrame] = []
+    if return_data:
+        for item in market_list:
+            for date in dates:
+                temp_df = read_parquet(futures_daily_store_path(item, date, store_dir))
+                if temp_df is not None:
+                    frame_list.append(temp_df)
+    big_df = pd.concat(frame_list, ignore_index=True) if frame_list else pd.DataFrame()
+    big_df.attrs["errors"] = error_dict
+    return big_df
+
+
+if __name__ == "__main__":
+    get_futures_daily_bulk_df = get_futures_daily_bulk(
+        start_date="20250701", end_date="20250710"
+    )
+    print(get_futures_daily_bulk_df)
+    print(get_futures_daily_bulk_df.attrs["errors"])
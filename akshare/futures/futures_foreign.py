@@ -10,11 +10,11 @@ from datetime import datetime
 from io import StringIO
 
 import pandas as pd
-import requests
 
 from akshare.futures.futures_hq_sina import (
     futures_foreign_commodity_subscribe_exchange_symbol,
 )
+from akshare.utils.request import request_get
 
 
 def futures_foreign_hist(symbol: str = "ZSD") -> pd.DataFrame:
@@ -36,7 +36,7 @@ def futures_foreign_hist(symbol: str = "ZSD") -> pd.DataFrame:
         "_": today,
         "source": "web",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_df = pd.read_json(StringIO(data_text[data_text.find("[") : -2]))
     return data_df
@@ -51,7 +51,7 @@ def futures_foreign_detail(symbol: str = "ZSD") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = f"https://finance.sina.com.cn/futures/quotes/{symbol}.shtml"
-    r = requests.get(url)
+    r = request_get(url)
     r.encoding = "gbk"
     data_text = r.text
     data_df = pd.read_html(StringIO(data_text))[6]
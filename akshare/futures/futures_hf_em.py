@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/9 22:00
+Date: 2026/10/18 15:00
 Desc: 东方财富网-行情中心-期货市场-国际期货
 https://quote.eastmoney.com/center/gridlist.html#futures_global
 """
@@ -10,9 +10,10 @@ import math
 from typing import Optional
 
 import pandas as pd
-import requests
 
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def __futures_global_hist_market_code(symbol: str = "HG00Y") -> Optional[int]:
@@ -101,18 +102,19 @@ def futures_global_spot_em() -> pd.DataFrame:
         "field": "dm,sc,name,p,zsjd,zde,zdf,f152,o,h,l,zjsj,vol,wp,np,ccl",
         "blockName": "callback",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_num = data_json["total"]
     total_page = math.ceil(total_num / 20) - 1
     tqdm = get_tqdm()
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in tqdm(range(total_page), leave=False):
         params.update({"pageIndex": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["list"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
     big_df.rename(
@@ -191,7 +193,7 @@ def futures_global_hist_em(symbol: str = "HG00Y") -> pd.DataFrame:
         "ut": "f057cbcbce2a86e2866ab8877db1d059",
         "forcect": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
     temp_df["code"] = data_json["data"]["code"]
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/5 18:00
+Date: 2026/10/18 15:00
 Desc: 新浪财经-外盘期货
 https://finance.sina.com.cn/money/future/hf.html
 """
@@ -10,10 +10,10 @@ import time
 from typing import Union, List
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
-from akshare.utils import demjson
+from akshare.utils import jsonp
+from akshare.utils.request import request_get
 
 
 def _get_real_name_list() -> list:
@@ -24,13 +24,13 @@ def _get_real_name_list() -> list:
     :rtype: list
     """
     url = "https://finance.sina.com.cn/money/future/hf.html"
-    r = requests.get(url)
+    r = request_get(url)
     r.encoding = "gb2312"
     data_text = r.text
     need_text = data_text[
         data_text.find("var oHF_1 = ") + 12 : data_text.find("var oHF_2") - 2
     ].replace("\n\t", "")
-    data_json = demjson.decode(need_text)
+    data_json = jsonp.loads(need_text)
     name_list = [item[0].strip() for item in data_json.values()]
     return name_list
 
@@ -43,10 +43,10 @@ def futures_foreign_commodity_subscribe_exchange_symbol() -> list:
     :rtype: list
     """
     url = "https://finance.sina.com.cn/money/future/hf.html"
-    r = requests.get(url)
+    r = request_get(url)
     r.encoding = "gb2312"
     data_text = r.text
-    data_json = demjson.decode(
+    data_json = jsonp.loads(
         data_text[
             data_text.find("var oHF_1 = ") + 12 : data_text.find("var oHF_2 = ") - 2
         ]
@@ -133,7 +133,7 @@ def futures_foreign_commodity_realtime(symbol: Union[str, List[str]]) -> pd.Data
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/97.0.4692.71 Safari/537.36",
     }
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     data_text = r.text
     data_df = pd.DataFrame(
         [
@@ -236,7 +236,7 @@ def futures_foreign_commodity_realtime(symbol: Union[str, List[str]]) -> pd.Data
 
     # 获取转换比例数据
     url = "https://finance.sina.com.cn/money/future/hf.html"
-    r = requests.get(url)
+    r = request_get(url)
     r.encoding = "utf-8"
     soup = BeautifulSoup(r.text, features="lxml")
     data_text = soup.find_all(name="script", attrs={"type": "text/javascript"})[
@@ -244,7 +244,7 @@ def futures_foreign_commodity_realtime(symbol: Union[str, List[str]]) -> pd.Data
     ].string.strip()
     raw_text = data_text[data_text.find("oHF_1 = ") : data_text.find("oHF_2")]
     need_text = raw_text[raw_text.find("{") : raw_text.rfind("}") + 1]
-    data_json = demjson.decode(need_text)
+    data_json = jsonp.loads(need_text)
     price_mul = pd.DataFrame(
         [
             [item[0] for item in data_json.values()],
@@ -258,7 +258,7 @@ def futures_foreign_commodity_realtime(symbol: Union[str, List[str]]) -> pd.Data
 
     # 获取汇率数据
     url = "https://hq.sinajs.cn/?list=USDCNY"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     data_text = r.text
     usd_rmb = float(
         data_text[data_text.find('"') + 1 : data_text.find(",美元人民币")].split(",")[
@@ -9,7 +9,8 @@ http://www.ccidx.com/
 import json
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def futures_index_ccidx(symbol: str = "中证商品期货指数") -> pd.DataFrame:
@@ -27,7 +28,7 @@ def futures_index_ccidx(symbol: str = "中证商品期货指数") -> pd.DataFram
     }
     url = "http://www.ccidx.com/CCI-ZZZS/index/getDateLine"
     params = {"indexId": futures_index_map[symbol]}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(
         [json.loads(item) for item in data_json["data"]["dateLineJson"]]
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/7/16 17:40
+Date: 2026/10/18 15:00
 Desc: 中国期货各合约展期收益率
 日线数据从 daily_bar 函数获取, 需要在收盘后运行
 """
@@ -16,8 +16,9 @@ import pandas as pd
 from akshare.futures import cons
 from akshare.futures.futures_daily_bar import get_futures_daily
 from akshare.futures.symbol_var import symbol_market, symbol_varieties
+from akshare.utils.func import ChunkAccumulator
 
-calendar = cons.get_calendar()
+calendar = cons.get_trading_calendar()
 
 
 def get_roll_yield(date=None, var="BB", symbol1=None, symbol2=None, df=None):
@@ -108,55 +109,49 @@ def get_roll_yield_bar(
         return df
 
     if type_method == "var":
-        df = pd.DataFrame()
+        df_chunks = ChunkAccumulator()
         for market in ["dce", "cffex", "shfe", "czce", "gfex"]:
-            df = pd.concat(
-                [
-                    df,
-                    get_futures_daily(start_date=date, end_date=date, market=market),
-                ]
+            df_chunks.append(
+                get_futures_daily(start_date=date, end_date=date, market=market)
             )
+        df = df_chunks.to_frame(ignore_index=False)
         var_list = list(set(df["variety"]))
         for i_remove in ["IO", "MO", "HO"]:
             if i_remove in var_list:
                 var_list.remove(i_remove)
-        df_l = pd.DataFrame()
+        df_l_chunks = ChunkAccumulator()
         for var in var_list:
             ry = get_roll_yield(date, var, df=df)
             if ry:
-                df_l = pd.concat(
-                    [
-                        df_l,
-                        pd.DataFrame(
-                            [ry],
-                            index=[var],
-                            columns=["roll_yield", "near_by", "deferred"],
-                        ),
-                    ]
+                df_l_chunks.append(
+                    pd.DataFrame(
+                        [ry],
+                        index=[var],
+                        columns=["roll_yield", "near_by", "deferred"],
+                    )
                 )
+        df_l = df_l_chunks.to_frame(ignore_index=False)
         df_l["date"] = date
         df_l = df_l.sort_values("roll_yield")
         return df_l
 
     if type_method == "date":
-        df_l = pd.DataFrame()
+        df_l_chunks = ChunkAccumulator()
         while start_day <= end_day:
             try:
                 ry = get_roll_yield(start_day, var)
                 if ry:
-                    df_l = pd.concat(
-                        [
-                            df_l,
-                            pd.DataFrame(
-                                [ry],
-                                index=[start_day],
-                                columns=["roll_yield", "near_by", "deferred"],
-                            ),
-                        ]
+                    df_l_chunks.append(
+                        pd.DataFrame(
+                            [ry],
+                            index=[start_day],
+                            columns=["roll_yield", "near_by", "deferred"],
+                        )
                     )
             except:  # noqa: E722
                 pass
             start_day += datetime.timedelta(days=1)
+        df_l = df_l_chunks.to_frame(ignore_index=False)
         return df_l
 
 
@@ -7,9 +7,9 @@ https://data.eastmoney.com/ifdata/xhgp.html
 """
 
 import pandas as pd
-import requests
 
 from akshare.utils import demjson
+from akshare.utils.request import request_get
 
 
 def futures_spot_stock(symbol: str = "能源") -> pd.DataFrame:
@@ -45,7 +45,7 @@ def futures_spot_stock(symbol: str = "能源") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36",
     }
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     data_text = r.text
     temp_json = demjson.decode(
         data_text[
@@ -1,14 +1,16 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/1/22 20:30
+Date: 2026/10/18 15:00
 Desc: 期货-期转现-交割
 """
 
 from io import StringIO, BytesIO
 
 import pandas as pd
-import requests
+
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get, request_post
 
 
 def futures_to_spot_shfe(date: str = "202312") -> pd.DataFrame:
@@ -27,7 +29,7 @@ def futures_to_spot_shfe(date: str = "202312") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/100.0.4896.127 Safari/537.36",
     }
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["ExchangeDelivery"])
     temp_df.columns = [
@@ -81,7 +83,7 @@ def futures_delivery_dce(date: str = "202312") -> pd.DataFrame:
         "Upgrade-Insecure-Requests": "1",
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36",
     }
-    r = requests.post(url, params=params, headers=headers)
+    r = request_post(url, params=params, headers=headers)
     temp_df = pd.read_html(StringIO(r.text))[0]
     temp_df["交割日期"] = (
         temp_df["交割日期"].astype(str).str.split(".", expand=True).iloc[:, 0]
@@ -111,7 +113,7 @@ def futures_to_spot_dce(date: str = "202312") -> pd.DataFrame:
         "ftsDealQuotes.begin_month": date,
         "ftsDealQuotes.end_month": date,
     }
-    r = requests.post(url, params=params)
+    r = request_post(url, params=params)
     temp_df = pd.read_html(StringIO(r.text))[0]
     temp_df["期转现发生日期"] = (
         temp_df["期转现发生日期"].astype(str).str.split(".", expand=True).iloc[:, 0]
@@ -140,7 +142,7 @@ def futures_delivery_match_dce(symbol: str = "a") -> pd.DataFrame:
         "contract.contract_id": "all",
         "contract.variety_id": symbol,
     }
-    r = requests.post(url, params=params)
+    r = request_post(url, params=params)
     temp_df = pd.read_html(StringIO(r.text))[0]
     temp_df["配对日期"] = (
         temp_df["配对日期"].astype(str).str.split(".", expand=True).iloc[:, 0]
@@ -174,7 +176,7 @@ def futures_to_spot_czce(date: str = "20231228") -> pd.DataFrame:
         "Upgrade-Insecure-Requests": "1",
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36",
     }
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     r.encoding = "utf-8"
     temp_df = pd.read_excel(BytesIO(r.content), skiprows=1)
 
@@ -205,11 +207,11 @@ def futures_delivery_match_czce(date: str = "20210106") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = f"http://www.czce.com.cn/cn/DFSStaticFiles/Future/{date[:4]}/{date}/FutureDataDelsettle.xls"
-    r = requests.get(url)
+    r = request_get(url)
     r.encoding = "utf-8"
     temp_df = pd.read_excel(BytesIO(r.content), skiprows=0)
     index_flag = temp_df[temp_df.iloc[:, 0].str.contains("配对日期")].index.values
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for i, item in enumerate(index_flag):
         try:
             temp_inner_df = temp_df[index_flag[i] + 1 : index_flag[i + 1]]
@@ -225,7 +227,8 @@ def futures_delivery_match_czce(date: str = "20210106") -> pd.DataFrame:
         symbol = date_contract_str.split("：")[-1]
         temp_inner_df["配对日期"] = inner_date
         temp_inner_df["合约代码"] = symbol
-        big_df = pd.concat([big_df, temp_inner_df], ignore_index=True)
+        big_chunks.append(temp_inner_df)
+    big_df = big_chunks.to_frame()
 
     big_df.columns = [
         "卖方会员",
@@ -251,7 +254,7 @@ def futures_delivery_czce(date: str = "20210112") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = f"http://www.czce.com.cn/cn/DFSStaticFiles/Future/{date[:4]}/{date}/FutureDataSettlematched.xls"
-    r = requests.get(url)
+    r = request_get(url)
     r.encoding = "utf-8"
     temp_df = pd.read_excel(BytesIO(r.content), skiprows=1)
     temp_df.columns = [
@@ -281,7 +284,7 @@ def futures_delivery_shfe(date: str = "202312") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/100.0.4896.127 Safari/537.36",
     }
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     r.encoding = "utf-8"
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["o_curdelivery"])
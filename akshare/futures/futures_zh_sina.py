@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/3/20 16:00
+Date: 2026/10/18 15:00
 Desc: 新浪财经-国内期货-实时数据获取
 https://vip.stock.finance.sina.com.cn/quotes_service/view/qihuohangqing.html#titlePos_3
 P.S. 注意采集速度, 容易封禁 IP, 如果不能访问请稍后再试
@@ -12,16 +12,17 @@ import time
 from functools import lru_cache
 
 import pandas as pd
-import requests
-import py_mini_racer
 
+from akshare.cache import cached, TTL_DAILY
 from akshare.futures.cons import (
     zh_subscribe_exchange_symbol_url,
     zh_match_main_contract_url,
     zh_match_main_contract_payload,
 )
 from akshare.futures.futures_contract_detail import futures_contract_detail
-from akshare.utils import demjson
+from akshare.utils import jsonp
+from akshare.utils.request import request_get
+from akshare.utils.sina_hq import fetch_hq
 
 
 @lru_cache()
@@ -35,11 +36,11 @@ def futures_symbol_mark() -> pd.DataFrame:
     url = (
         "https://vip.stock.finance.sina.com.cn/quotes_service/view/js/qihuohangqing.js"
     )
-    r = requests.get(url)
+    r = request_get(url)
     r.encoding = "gb2312"
     data_text = r.text
     raw_json = data_text[data_text.find("{") : data_text.find("}") + 1]
-    data_json = demjson.decode(raw_json)
+    data_json = jsonp.loads(raw_json)
     czce_mark_list = [item[1] for item in data_json["czce"][1:]]
     dce_mark_list = [item[1] for item in data_json["dce"][1:]]
     shfe_mark_list = [item[1] for item in data_json["shfe"][1:]]
@@ -109,7 +110,7 @@ def futures_zh_realtime(symbol: str = "PTA") -> pd.DataFrame:
         "node": symbol_mark_map[symbol],
         "base": "futures",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json)
 
@@ -145,12 +146,10 @@ def zh_subscribe_exchange_symbol(symbol: str = "cffex") -> pd.DataFrame:
     :return: 交易所具体的可交易品种
     :rtype: dict
     """
-    r = requests.get(zh_subscribe_exchange_symbol_url)
+    r = request_get(zh_subscribe_exchange_symbol_url)
     r.encoding = "gbk"
     data_text = r.text
-    data_json = demjson.decode(
-        data_text[data_text.find("{") : data_text.find("};") + 1]
-    )
+    data_json = jsonp.loads(data_text[data_text.find("{") : data_text.find("};") + 1])
     if symbol == "czce":
         data_json["czce"].remove("郑州商品交易所")
         return pd.DataFrame(data_json["czce"])
@@ -182,10 +181,10 @@ def match_main_contract(symbol: str = "cffex") -> str:
     for item in exchange_symbol_list:
         # item = 'sngz_qh'
         zh_match_main_contract_payload.update({"node": item})
-        res = requests.get(
+        res = request_get(
             zh_match_main_contract_url, params=zh_match_main_contract_payload
         )
-        data_json = demjson.decode(res.text)
+        data_json = jsonp.loads(res.text)
         data_df = pd.DataFrame(data_json)
         try:
             main_contract = data_df[data_df.iloc[:, 3:].duplicated()]
@@ -202,60 +201,46 @@ def match_main_contract(symbol: str = "cffex") -> str:
     return ",".join([item for item in subscribe_exchange_list])
 
 
-def futures_zh_spot(
-    symbol: str = "V2309",
-    market: str = "CF",
-    adjust: str = "0",
+def _futures_contract_exchange_min(contract_name: str) -> tuple:
+    """
+    合约的上市交易所和最小变动价位
+    :param contract_name: 合约名称
+    :type contract_name: str
+    :return: (上市交易所, 最小变动价位)
+    :rtype: tuple
+    """
+    temp_df = futures_contract_detail(symbol=contract_name)
+    exchange_name = temp_df[temp_df["item"] == "上市交易所"]["value"].values[0]
+    contract_min = temp_df[temp_df["item"] == "最小变动价位"]["value"].values[0]
+    return exchange_name, contract_min
+
+
+def _futures_zh_spot_frame(
+    data_df: pd.DataFrame,
+    subscribe_list: str,
+    market: str,
+    adjust: str,
+    contract_details: list = None,
 ) -> pd.DataFrame:
     """
-    期货的实时行情数据
-    https://vip.stock.finance.sina.com.cn/quotes_service/view/qihuohangqing.html#titlePos_1
-    :param symbol: 合约名称的字符串组合
-    :type symbol: str
+    期货的实时行情数据-整理字段
+    :param data_df: 行情原始字段
+    :type data_df: pandas.DataFrame
+    :param subscribe_list: 带 nf_ 前缀的合约, 逗号分隔
+    :type subscribe_list: str
     :param market: CF 为商品期货
     :type market: str
-    :param adjust: '1' or '0'；字符串的 0 或 1；返回合约、交易所和最小变动单位的实时数据, 返回数据会变慢
+    :param adjust: '1' or '0'
     :type adjust: str
+    :param contract_details: adjust 为 '1' 时各合约的 (上市交易所, 最小变动价位)
+    :type contract_details: list
     :return: 期货的实时行情数据
     :rtype: pandas.DataFrame
     """
-    file_data = "Math.round(Math.random() * 2147483648).toString(16)"
-    ctx = py_mini_racer.MiniRacer()
-    rn_code = ctx.eval(file_data)
-    subscribe_list = ",".join(["nf_" + item.strip() for item in symbol.split(",")])
-    url = f"https://hq.sinajs.cn/rn={rn_code}&list={subscribe_list}"
-    headers = {
-        "Accept": "*/*",
-        "Accept-Encoding": "gzip, deflate",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        "Cache-Control": "no-cache",
-        "Host": "hq.sinajs.cn",
-        "Pragma": "no-cache",
-        "Proxy-Connection": "keep-alive",
-        "Referer": "https://vip.stock.finance.sina.com.cn/",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/97.0.4692.71 Safari/537.36",
-    }
-    r = requests.get(url, headers=headers)
-    data_df = pd.DataFrame(
-        [
-            item.strip().split("=")[1].split(",")
-            for item in r.text.split(";")
-            if item.strip() != ""
-        ]
-    )
-    data_df.iloc[:, 0] = data_df.iloc[:, 0].str.replace('"', "")
-    data_df.iloc[:, -1] = data_df.iloc[:, -1].str.replace('"', "")
     if adjust == "1":
         contract_name_list = [item.split("_")[1] for item in subscribe_list.split(",")]
-        contract_min_list = []
-        contract_exchange_list = []
-        for contract_name in contract_name_list:
-            temp_df = futures_contract_detail(symbol=contract_name)
-            exchange_name = temp_df[temp_df["item"] == "上市交易所"]["value"].values[0]
-            contract_exchange_list.append(exchange_name)
-            contract_min = temp_df[temp_df["item"] == "最小变动价位"]["value"].values[0]
-            contract_min_list.append(contract_min)
+        contract_exchange_list = [item[0] for item in contract_details]
+        contract_min_list = [item[1] for item in contract_details]
         if market == "CF":
             data_df.columns = [
                 "symbol",
@@ -612,6 +597,38 @@ def futures_zh_spot(
             return data_df
 
 
+def futures_zh_spot(
+    symbol: str = "V2309",
+    market: str = "CF",
+    adjust: str = "0",
+) -> pd.DataFrame:
+    """
+    期货的实时行情数据
+    https://vip.stock.finance.sina.com.cn/quotes_service/view/qihuohangqing.html#titlePos_1
+    :param symbol: 合约名称的字符串组合
+    :type symbol: str
+    :param market: CF 为商品期货
+    :type market: str
+    :param adjust: '1' or '0'；字符串的 0 或 1；返回合约、交易所和最小变动单位的实时数据, 返回数据会变慢
+    :type adjust: str
+    :return: 期货的实时行情数据
+    :rtype: pandas.DataFrame
+    """
+    subscribe_list = ",".join(["nf_" + item.strip() for item in symbol.split(",")])
+    quotes = fetch_hq(subscribe_list.split(","))
+    # 按请求的合约顺序取行, 重复或缺失的合约也与 contract_name_list 一一对应
+    data_df = pd.DataFrame([quotes.get(item, []) for item in subscribe_list.split(",")])
+    contract_details = None
+    if adjust == "1":
+        contract_details = [
+            _futures_contract_exchange_min(item.split("_")[1])
+            for item in subscribe_list.split(",")
+        ]
+    return _futures_zh_spot_frame(
+        data_df, subscribe_list, market, adjust, contract_details
+    )
+
+
 def futures_zh_minute_sina(symbol: str = "IF2008", period: str = "1") -> pd.DataFrame:
     """
     中国各品种期货分钟频率数据
@@ -628,7 +645,7 @@ def futures_zh_minute_sina(symbol: str = "IF2008", period: str = "1") -> pd.Data
         "symbol": symbol,
         "type": period,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     temp_df = pd.DataFrame(json.loads(r.text.split("=(")[1].split(");")[0]))
     temp_df.columns = [
         "datetime",
@@ -648,6 +665,7 @@ def futures_zh_minute_sina(symbol: str = "IF2008", period: str = "1") -> pd.Data
     return temp_df
 
 
+@cached(ttl=TTL_DAILY)
 def futures_zh_daily_sina(symbol: str = "RB0") -> pd.DataFrame:
     """
     中国各品种期货日频率数据
@@ -666,7 +684,7 @@ def futures_zh_daily_sina(symbol: str = "RB0") -> pd.DataFrame:
         "symbol": symbol,
         "type": "_".join([date[:4], date[4:6], date[6:]]),
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     temp_df = pd.DataFrame(json.loads(r.text.split("=(")[1].split(");")[0]))
     temp_df.columns = [
         "date",
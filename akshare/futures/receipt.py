@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/7/21 15:00
+Date: 2026/10/18 15:00
 Desc: 每日注册仓单数据
 大连商品交易所, 上海期货交易所, 郑州商品交易所, 广州期货交易所
 """
@@ -13,13 +13,14 @@ from io import BytesIO
 from typing import List
 
 import pandas as pd
-import requests
 
 from akshare.futures import cons
 from akshare.futures.requests_fun import requests_link, pandas_read_html_link
 from akshare.futures.symbol_var import chinese_to_english
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get, request_post
 
-calendar = cons.get_calendar()
+calendar = cons.get_trading_calendar()
 shfe_20100126 = pd.DataFrame(
     {
         "var": ["CU", "AL", "ZN", "RU", "FU", "AU", "RB", "WR"],
@@ -56,10 +57,10 @@ def get_dce_receipt(date: str = None, vars_list: List = cons.contract_symbols):
         "tradeDate": date.strftime("%Y%m%d"),
         "varietyId": "all",
     }
-    r = requests.post(url, json=payload)
+    r = request_post(url, json=payload)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"]["entityList"])
-    records = pd.DataFrame()
+    records_chunks = ChunkAccumulator()
     for x in temp_df.to_dict(orient="records"):
         if isinstance(x["variety"], str):
             if x["variety"][-2:] == "小计":
@@ -70,7 +71,8 @@ def get_dce_receipt(date: str = None, vars_list: List = cons.contract_symbols):
                     "receipt_chg": int(x["diff"]),
                     "date": date.strftime("%Y%m%d"),
                 }
-                records = pd.concat([records, pd.DataFrame(temp_data, index=[0])])
+                records_chunks.append(pd.DataFrame(temp_data, index=[0]))
+    records = records_chunks.to_frame(ignore_index=False)
 
     if len(records.index) != 0:
         records.index = records["var"]
@@ -133,7 +135,7 @@ def get_shfe_receipt_1(
         data = pandas_read_html_link(url)[0]
         indexes = [x for x in data.index if (data[0].tolist()[x] in var_list)]
         last_index = [x for x in data.index if "注" in str(data[0].tolist()[x])][0] - 1
-        records = pd.DataFrame()
+        records_chunks = ChunkAccumulator()
         for i in list(range(len(indexes))):
             if i != len(indexes) - 1:
                 data_cut = data.loc[indexes[i] : indexes[i + 1] - 1, :]
@@ -145,7 +147,8 @@ def get_shfe_receipt_1(
             data_dict["receipt"] = int(data_cut[2].tolist()[-1])
             data_dict["receipt_chg"] = int(data_cut[3].tolist()[-1])
             data_dict["date"] = date
-            records = pd.concat([records, pd.DataFrame(data_dict, index=[0])])
+            records_chunks.append(pd.DataFrame(data_dict, index=[0]))
+        records = records_chunks.to_frame(ignore_index=False)
     if len(records.index) != 0:
         records.index = records["var"]
         vars_in_market = [i for i in vars_list if i in records.index]
@@ -239,7 +242,7 @@ def get_shfe_receipt_3(
         warnings.warn("%s 非交易日" % date.strftime("%Y%m%d"))
         return pd.DataFrame()
     url = f"https://www.shfe.com.cn/data/tradedata/future/stockdata/dailystock_{date}/ZH/all.html"
-    r = requests.get(url, headers=cons.shfe_headers)
+    r = request_get(url, headers=cons.shfe_headers)
     from io import StringIO
 
     temp_tables = pd.read_html(StringIO(r.text))
@@ -291,7 +294,7 @@ def get_czce_receipt_1(date: str = None, vars_list: List = cons.contract_symbols
     r = requests_link(url, encoding="utf-8", headers=cons.shfe_headers)
     context = r.text
     data = pd.read_html(context)[1]
-    records = pd.DataFrame()
+    records_chunks = ChunkAccumulator()
     indexes = [x for x in data.index if "品种：" in str(data[0].tolist()[x])]
     ends = [x for x in data.index if "总计" in str(data[0].tolist()[x])]
     for i in list(range(len(indexes))):
@@ -317,7 +320,8 @@ def get_czce_receipt_1(date: str = None, vars_list: List = cons.contract_symbols
             "receipt_chg": int(receipt_chg),
             "date": date,
         }
-        records = pd.concat([records, pd.DataFrame(data_dict, index=[0])])
+        records_chunks.append(pd.DataFrame(data_dict, index=[0]))
+    records = records_chunks.to_frame(ignore_index=False)
     if len(records.index) != 0:
         records.index = records["var"]
         vars_in_market = [i for i in vars_list if i in records.index]
@@ -348,10 +352,10 @@ def get_czce_receipt_2(date: str = None, vars_list: List = cons.contract_symbols
         warnings.warn("%s非交易日" % date.strftime("%Y%m%d"))
         return None
     url = cons.CZCE_RECEIPT_URL_2 % (date[:4], date)
-    r = requests.get(url)
+    r = request_get(url)
     r.encoding = "utf-8"
     data = pd.read_html(r.text)[3:]
-    records = pd.DataFrame()
+    records_chunks = ChunkAccumulator()
     for data_cut in data:
         if len(data_cut.columns) > 3:
             last_indexes = [
@@ -375,7 +379,8 @@ def get_czce_receipt_2(date: str = None, vars_list: List = cons.contract_symbols
                 "receipt_chg": int(receipt_chg),
                 "date": date,
             }
-            records = pd.concat([records, pd.DataFrame(data_dict, index=[0])])
+            records_chunks.append(pd.DataFrame(data_dict, index=[0]))
+    records = records_chunks.to_frame(ignore_index=False)
     if len(records.index) != 0:
         records.index = records["var"]
         vars_in_market = [i for i in vars_list if i in records.index]
@@ -537,7 +542,7 @@ def get_gfex_receipt(
         "X-Requested-With": "XMLHttpRequest",
         "content-type": "application/x-www-form-urlencoded",
     }
-    r = requests.post(url, data=payload, headers=headers)
+    r = request_post(url, data=payload, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df = temp_df[temp_df["variety"].str.contains("小计")]
@@ -596,7 +601,7 @@ def get_receipt(
         if end_date is not None
         else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
     )
-    records = pd.DataFrame()
+    records_chunks = ChunkAccumulator()
     while start_date <= end_date:
         if start_date.strftime("%Y%m%d") not in calendar:
             warnings.warn(f"{start_date.strftime('%Y%m%d')} 非交易日")
@@ -655,8 +660,9 @@ def get_receipt(
                 get_vars = [var for var in vars_list if var in market_vars]
                 if market != "cffex" and get_vars != []:
                     if f is not None:
-                        records = pd.concat([records, f(start_date, get_vars)])
+                        records_chunks.append(f(start_date, get_vars))
         start_date += datetime.timedelta(days=1)
+    records = records_chunks.to_frame(ignore_index=False)
     records.reset_index(drop=True, inplace=True)
     if records.empty:
         return records
@@ -1,8 +1,8 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2023/9/15 19:00
-Desc: 请求网站内容的函数: 在链接失败后可重复 20 次
+Date: 2026/10/18 15:00
+Desc: 请求网站内容的函数: 在链接失败后可重复 20 次, 主机熔断时立即放弃
 """
 
 import time
@@ -12,6 +12,9 @@ from typing import Dict
 import pandas as pd
 import requests
 
+from akshare.exceptions import CircuitOpenError
+from akshare.utils.request import request_get, request_post
+
 
 def requests_link(
     url: str,
@@ -21,7 +24,8 @@ def requests_link(
     headers: Dict = None,
 ):
     """
-    利用 requests 请求网站, 爬取网站内容, 如网站链接失败, 可重复爬取 20 次
+    利用 requests 请求网站, 爬取网站内容, 如网站链接失败, 可重复爬取 20 次;
+    连续被拒绝或连接被重置时主机熔断 (akshare.utils.rate_limit), 不再重试, 直接返回 None
     :param url: string 网站地址
     :param encoding: string 编码类型: "utf-8", "gbk", "gb2312"
     :param method: string 访问方法: "get", "post"
@@ -33,15 +37,18 @@ def requests_link(
     while True:
         try:
             if method == "get":
-                r = requests.get(url, timeout=20, headers=headers)
+                r = request_get(url, timeout=20, headers=headers)
                 r.encoding = encoding
                 return r
             elif method == "post":
-                r = requests.post(url, timeout=20, data=data, headers=headers)
+                r = request_post(url, timeout=20, data=data, headers=headers)
                 r.encoding = encoding
                 return r
             else:
                 raise ValueError("请提供正确的请求方式")
+        except CircuitOpenError as e:
+            print(f"{e}, 停止请求")
+            return None
         except:  # noqa: E722
             i += 1
             print(f"第{str(i)}次链接失败, 最多尝试 20 次")
@@ -70,12 +77,12 @@ def pandas_read_html_link(
     while True:
         try:
             if method == "get":
-                r = requests.get(url, timeout=20, headers=headers)
+                r = request_get(url, timeout=20, headers=headers)
                 r.encoding = encoding
                 r = pd.read_html(StringIO(r.text), encoding=encoding)
                 return r
             elif method == "post":
-                r = requests.post(url, timeout=20, data=data, headers=headers)
+                r = request_post(url, timeout=20, data=data, headers=headers)
                 r.encoding = encoding
                 r = pd.read_html(StringIO(r.text), encoding=encoding)
                 return r
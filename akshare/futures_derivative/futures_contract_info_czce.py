@@ -9,7 +9,8 @@ http://www.czce.com.cn/cn/jysj/cksj/H770322index_1.htm
 import xml.etree.ElementTree as ET
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def futures_contract_info_czce(date: str = "20240228") -> pd.DataFrame:
@@ -29,7 +30,7 @@ def futures_contract_info_czce(date: str = "20240228") -> pd.DataFrame:
         "Host": "www.czce.com.cn",
     }
     url = f"http://www.czce.com.cn/cn/DFSStaticFiles/Future/{date[:4]}/{date}/FutureDataReferenceData.xml"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     xml_data = r.text
     # 解析 XML
     tree = ET.ElementTree(ET.fromstring(xml_data))
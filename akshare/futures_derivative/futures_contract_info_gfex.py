@@ -7,7 +7,8 @@ http://www.gfex.com.cn/gfex/hyxx/ywcs.shtml
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_post
 
 
 def futures_contract_info_gfex() -> pd.DataFrame:
@@ -25,7 +26,7 @@ def futures_contract_info_gfex() -> pd.DataFrame:
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36"
     }
-    r = requests.post(url, params=params, headers=headers)
+    r = request_post(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.rename(
@@ -7,7 +7,8 @@ https://www.ine.cn/bourseService/summary/?name=currinstrumentprop
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def futures_contract_info_ine(date: str = "20241129") -> pd.DataFrame:
@@ -25,7 +26,7 @@ def futures_contract_info_ine(date: str = "20241129") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/119.0.0.0 Safari/537.36"
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["ContractBaseInfo"])
     temp_df.rename(
@@ -7,7 +7,8 @@ https://tsite.shfe.com.cn/bourseService/businessdata/summaryinquiry/
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def futures_contract_info_shfe(date: str = "20240513") -> pd.DataFrame:
@@ -26,7 +27,7 @@ def futures_contract_info_shfe(date: str = "20240513") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/119.0.0.0 Safari/537.36"
     }
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["ContractBaseInfo"])
     temp_df.rename(
@@ -9,7 +9,8 @@ https://vip.stock.finance.sina.com.cn/q/view/vFutures_Positions_cjcc.php
 from io import StringIO
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def futures_hold_pos_sina(
@@ -30,7 +31,7 @@ def futures_hold_pos_sina(
     date = "-".join([date[:4], date[4:6], date[6:]])
     url = "https://vip.stock.finance.sina.com.cn/q/view/vFutures_Positions_cjcc.php"
     params = {"t_breed": contract, "t_date": date}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     if symbol == "成交量":
         temp_df = pd.read_html(StringIO(r.text))[2].iloc[:-1, :]
         temp_df["名次"] = pd.to_numeric(temp_df["名次"], errors="coerce")
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/3/1 23:00
+Date: 2026/10/18 15:00
 Desc: 新浪财经-期货的主力合约数据
 https://finance.sina.com.cn/futuremarket/index.shtml
 """
@@ -9,14 +9,15 @@ https://finance.sina.com.cn/futuremarket/index.shtml
 from io import StringIO
 
 import pandas as pd
-import requests
 
 from akshare.futures.cons import (
     zh_subscribe_exchange_symbol_url,
     zh_match_main_contract_url,
     zh_match_main_contract_payload,
 )
-from akshare.utils import demjson
+from akshare.utils import jsonp
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
 
 
 def zh_subscribe_exchange_symbol(symbol: str = "dce") -> pd.DataFrame:
@@ -28,12 +29,10 @@ def zh_subscribe_exchange_symbol(symbol: str = "dce") -> pd.DataFrame:
     :return: 订阅指定交易所品种的代码
     :rtype: pandas.DataFrame
     """
-    r = requests.get(zh_subscribe_exchange_symbol_url)
+    r = request_get(zh_subscribe_exchange_symbol_url)
     r.encoding = "gb2312"
     data_text = r.text
-    data_json = demjson.decode(
-        data_text[data_text.find("{") : data_text.find("};") + 1]
-    )
+    data_json = jsonp.loads(data_text[data_text.find("{") : data_text.find("};") + 1])
     if symbol == "czce":
         data_json["czce"].remove("郑州商品交易所")
         return pd.DataFrame(data_json["czce"])
@@ -64,10 +63,10 @@ def match_main_contract(symbol: str = "shfe") -> pd.DataFrame:
     exchange_symbol_list = zh_subscribe_exchange_symbol(symbol).iloc[:, 1].tolist()
     for item in exchange_symbol_list:
         zh_match_main_contract_payload.update({"node": item})
-        res = requests.get(
+        res = request_get(
             zh_match_main_contract_url, params=zh_match_main_contract_payload
         )
-        data_json = demjson.decode(res.text)
+        data_json = jsonp.loads(res.text)
         data_df = pd.DataFrame(data_json)
         try:
             main_contract = data_df[
@@ -93,9 +92,10 @@ def futures_display_main_sina() -> pd.DataFrame:
     :return: 新浪主力连续合约品种一览表
     :rtype: pandas.DataFrame
     """
-    temp_df = pd.DataFrame()
+    temp_chunks = ChunkAccumulator()
     for item in ["dce", "czce", "shfe", "cffex", "gfex"]:
-        temp_df = pd.concat([temp_df, match_main_contract(symbol=item)])
+        temp_chunks.append(match_main_contract(symbol=item))
+    temp_df = temp_chunks.to_frame(ignore_index=False)
     temp_df.reset_index(inplace=True, drop=True)
     return temp_df
 
@@ -120,7 +120,7 @@ def futures_main_sina(
     trade_date = "20210817"
     trade_date = trade_date[:4] + "_" + trade_date[4:6] + "_" + trade_date[6:]
     url = f"https://stock2.finance.sina.com.cn/futures/api/jsonp.php/var%20_{symbol}{trade_date}=/InnerFuturesNewService.getDailyKLine?symbol={symbol}&_={trade_date}"
-    r = requests.get(url)
+    r = request_get(url)
     data_text = r.text
     data_json = data_text[data_text.find("([") + 1 : data_text.rfind("])") + 1]
     temp_df = pd.read_json(StringIO(data_json))
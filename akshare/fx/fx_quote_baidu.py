@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2026/1/9 22:12
+Date: 2026/10/18 15:00
 Desc: 百度股市通-外汇-行情榜单
 https://gushitong.baidu.com/top/foreign-common-%E5%B8%B8%E7%94%A8
 """
@@ -9,6 +9,8 @@ https://gushitong.baidu.com/top/foreign-common-%E5%B8%B8%E7%94%A8
 import pandas as pd
 from curl_cffi import requests
 
+from akshare.utils.func import ChunkAccumulator
+
 
 def fx_quote_baidu(symbol: str = "人民币") -> pd.DataFrame:
     """
@@ -24,7 +26,7 @@ def fx_quote_baidu(symbol: str = "人民币") -> pd.DataFrame:
         "美元": "dollar",
     }
     num = 0
-    out_df = pd.DataFrame()
+    out_chunks = ChunkAccumulator()
     while True:
         try:
             url = "https://finance.pae.baidu.com/api/getforeignrank"
@@ -54,10 +56,11 @@ def fx_quote_baidu(symbol: str = "人民币") -> pd.DataFrame:
             big_df["最新价"] = pd.to_numeric(big_df["最新价"])
             big_df["涨跌额"] = pd.to_numeric(big_df["涨跌额"])
             big_df["涨跌幅"] = pd.to_numeric(big_df["涨跌幅"].str.strip("%")) / 100
-            out_df = pd.concat(objs=[out_df, big_df], ignore_index=True)
+            out_chunks.append(big_df)
             num = num + 20
         except:  # noqa: E722
             break
+    out_df = out_chunks.to_frame()
     return out_df
 
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/6/17 14:00
+Date: 2026/10/18 15:00
 Desc: 股票指数成份股数据, 新浪有两个接口, 这里使用老接口:
 新接口：https://vip.stock.finance.sina.com.cn/mkt/#zhishu_000001
 老接口：https://vip.stock.finance.sina.com.cn/corp/view/vII_NewestComponent.php?page=1&indexid=399639
@@ -11,10 +11,11 @@ import math
 from io import BytesIO, StringIO
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
 from akshare.utils import demjson
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
 
 
 def index_stock_cons_sina(symbol: str = "000300") -> pd.DataFrame:
@@ -33,9 +34,9 @@ def index_stock_cons_sina(symbol: str = "000300") -> pd.DataFrame:
             "/Market_Center.getHQNodeStockCountSimple"
         )
         params = {"node": f"{symbol}"}
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         page_num = math.ceil(int(r.json()) / 80) + 1
-        temp_df = pd.DataFrame()
+        temp_chunks = ChunkAccumulator()
         for page in range(1, page_num):
             url = "https://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getHQNodeData"
             params = {
@@ -47,10 +48,9 @@ def index_stock_cons_sina(symbol: str = "000300") -> pd.DataFrame:
                 "symbol": "",
                 "_s_r_a": "init",
             }
-            r = requests.get(url, params=params)
-            temp_df = pd.concat(
-                objs=[temp_df, pd.DataFrame(demjson.decode(r.text))], ignore_index=True
-            )
+            r = request_get(url, params=params)
+            temp_chunks.append(pd.DataFrame(demjson.decode(r.text)))
+        temp_df = temp_chunks.to_frame()
         return temp_df
 
     url = "https://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getHQNodeDataSimple"
@@ -62,7 +62,7 @@ def index_stock_cons_sina(symbol: str = "000300") -> pd.DataFrame:
         "node": f"zhishu_{symbol}",
         "_s_r_a": "setlen",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     temp = pd.DataFrame(demjson.decode(r.text))
     return temp
 
@@ -75,7 +75,7 @@ def index_stock_info() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://www.joinquant.com/data/dict/indexData"
-    r = requests.get(url)
+    r = request_get(url)
     r.encoding = "utf-8"
     index_df = pd.read_html(StringIO(r.text))[0]
     index_df["指数代码"] = index_df["指数代码"].str.split(".", expand=True)[0]
@@ -94,7 +94,7 @@ def index_stock_cons(symbol: str = "399639") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = f"https://vip.stock.finance.sina.com.cn/corp/go.php/vII_NewestComponent/indexid/{symbol}.phtml"
-    r = requests.get(url)
+    r = request_get(url)
     r.encoding = "gb2312"
     soup = BeautifulSoup(r.text, "lxml")
     page_num = (
@@ -109,15 +109,13 @@ def index_stock_cons(symbol: str = "399639") -> pd.DataFrame:
         temp_df["品种代码"] = temp_df["品种代码"].astype(str).str.zfill(6)
         return temp_df
 
-    temp_df = pd.DataFrame()
+    temp_chunks = ChunkAccumulator()
     for page in range(1, int(page_num) + 1):
         url = f"https://vip.stock.finance.sina.com.cn/corp/view/vII_NewestComponent.php?page={page}&indexid={symbol}"
-        r = requests.get(url)
+        r = request_get(url)
         r.encoding = "gb2312"
-        temp_df = pd.concat(
-            objs=[temp_df, pd.read_html(StringIO(r.text), header=1)[3]],
-            ignore_index=True,
-        )
+        temp_chunks.append(pd.read_html(StringIO(r.text), header=1)[3])
+    temp_df = temp_chunks.to_frame()
     temp_df = temp_df.iloc[:, :3]
     temp_df["品种代码"] = temp_df["品种代码"].astype(str).str.zfill(6)
     return temp_df
@@ -136,7 +134,7 @@ def index_stock_cons_csindex(symbol: str = "000300") -> pd.DataFrame:
         f"https://oss-ch.csindex.com.cn/static/"
         f"html/csindex/public/uploads/file/autofile/cons/{symbol}cons.xls"
     )
-    r = requests.get(url)
+    r = request_get(url)
     temp_df = pd.read_excel(BytesIO(r.content))
     temp_df.columns = [
         "日期",
@@ -170,7 +168,7 @@ def index_stock_cons_weight_csindex(symbol: str = "000300") -> pd.DataFrame:
         f"https://oss-ch.csindex.com.cn/static/html/csindex/"
         f"public/uploads/file/autofile/closeweight/{symbol}closeweight.xls"
     )
-    r = requests.get(url)
+    r = request_get(url)
     temp_df = pd.read_excel(BytesIO(r.content))
     temp_df.columns = [
         "日期",
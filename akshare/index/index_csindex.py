@@ -10,7 +10,8 @@ import warnings
 from io import BytesIO
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_post
 
 
 def index_csindex_all() -> pd.DataFrame:
@@ -45,7 +46,7 @@ def index_csindex_all() -> pd.DataFrame:
             "undefined": None,
         },
     }
-    r = requests.post(url, json=playloads, headers=headers)
+    r = request_post(url, json=playloads, headers=headers)
 
     temp_df = pd.read_excel(BytesIO(r.content))
     temp_df["基日"] = pd.to_datetime(
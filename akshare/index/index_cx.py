@@ -7,7 +7,8 @@ https://yun.ccxe.com.cn/indices/dei
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def index_pmi_com_cx() -> pd.DataFrame:
@@ -19,7 +20,7 @@ def index_pmi_com_cx() -> pd.DataFrame:
     """
     url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
     params = {"type": "com"}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化值", "综合PMI", "日期"]
@@ -47,7 +48,7 @@ def index_pmi_man_cx() -> pd.DataFrame:
     """
     url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
     params = {"type": "man"}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化值", "制造业PMI", "日期"]
@@ -75,7 +76,7 @@ def index_pmi_ser_cx() -> pd.DataFrame:
     """
     url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
     params = {"type": "ser"}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化值", "服务业PMI", "日期"]
@@ -103,7 +104,7 @@ def index_dei_cx() -> pd.DataFrame:
     """
     url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
     params = {"type": "dei"}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化值", "数字经济指数", "日期"]
@@ -131,7 +132,7 @@ def index_ii_cx() -> pd.DataFrame:
     """
     url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
     params = {"type": "ii"}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化值", "产业指数", "日期"]
@@ -159,7 +160,7 @@ def index_si_cx() -> pd.DataFrame:
     """
     url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
     params = {"type": "si"}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化值", "溢出指数", "日期"]
@@ -187,7 +188,7 @@ def index_fi_cx() -> pd.DataFrame:
     """
     url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
     params = {"type": "fi"}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化值", "融合指数", "日期"]
@@ -215,7 +216,7 @@ def index_bi_cx() -> pd.DataFrame:
     """
     url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
     params = {"type": "bi"}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化值", "基础指数", "日期"]
@@ -243,7 +244,7 @@ def index_nei_cx() -> pd.DataFrame:
     """
     url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
     params = {"type": "nei"}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化值", "中国新经济指数", "日期"]
@@ -271,7 +272,7 @@ def index_li_cx() -> pd.DataFrame:
     """
     url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
     params = {"type": "li"}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化值", "劳动力投入指数", "日期"]
@@ -299,7 +300,7 @@ def index_ci_cx() -> pd.DataFrame:
     """
     url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
     params = {"type": "ci"}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化值", "资本投入指数", "日期"]
@@ -327,7 +328,7 @@ def index_ti_cx() -> pd.DataFrame:
     """
     url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
     params = {"type": "ti"}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化值", "科技投入指数", "日期"]
@@ -355,7 +356,7 @@ def index_neaw_cx() -> pd.DataFrame:
     """
     url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
     params = {"type": "neaw"}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化值", "新经济行业入职平均工资水平", "日期"]
@@ -383,7 +384,7 @@ def index_awpr_cx() -> pd.DataFrame:
     """
     url = "https://yun.ccxe.com.cn/api/index/pro/cxIndexTrendInfo"
     params = {"type": "awpr"}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化值", "新经济入职工资溢价水平", "日期"]
@@ -415,7 +416,7 @@ def index_cci_cx() -> pd.DataFrame:
         "code": "1000050",
         "month": "-1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化值", "大宗商品指数", "日期"]
@@ -447,7 +448,7 @@ def index_qli_cx() -> pd.DataFrame:
         "code": "1000050",
         "month": "-1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化幅度", "高质量因子指数", "日期"]
@@ -479,7 +480,7 @@ def index_ai_cx() -> pd.DataFrame:
         "code": "1000050",
         "month": "-1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化幅度", "AI策略指数", "日期"]
@@ -511,7 +512,7 @@ def index_bei_cx() -> pd.DataFrame:
         "code": "930927",
         "month": "-1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化幅度", "基石经济指数", "日期"]
@@ -543,7 +544,7 @@ def index_neei_cx() -> pd.DataFrame:
         "code": "930928",
         "month": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["变化幅度", "新动能指数", "日期"]
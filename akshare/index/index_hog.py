@@ -7,7 +7,8 @@ https://hqb.nxin.com/pigindex/index.shtml
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def index_hog_spot_price() -> pd.DataFrame:
@@ -19,7 +20,7 @@ def index_hog_spot_price() -> pd.DataFrame:
     """
     url = "https://hqb.nxin.com/pigindex/getPigIndexChart.shtml"
     params = {"regionId": "0"}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = [
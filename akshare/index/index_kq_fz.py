@@ -1,15 +1,17 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2023/5/18 17:10
+Date: 2026/10/18 15:00
 Desc: 中国柯桥纺织指数
 http://www.kqindex.cn/flzs/jiage
 """
 
 import pandas as pd
-import requests
 from tqdm import tqdm
 
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
+
 
 def index_kq_fz(symbol: str = "价格指数") -> pd.DataFrame:
     """
@@ -33,10 +35,10 @@ def index_kq_fz(symbol: str = "价格指数") -> pd.DataFrame:
         "indexType": f"{symbol_map[symbol]}",
         "pageindex": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     page_num = data_json["page"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in tqdm(range(1, page_num + 1), leave=False):
         params = {
             "category": "0",
@@ -45,10 +47,11 @@ def index_kq_fz(symbol: str = "价格指数") -> pd.DataFrame:
             "indexType": f"{symbol_map[symbol]}",
             "pageindex": page,
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     if symbol == "价格指数":
         big_df.columns = [
             "期次",
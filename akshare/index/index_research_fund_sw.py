@@ -7,9 +7,9 @@ https://www.swsresearch.com/institute_sw/allIndex/releasedIndex
 """
 
 import pandas as pd
-import requests
 
 from akshare.utils.cons import headers
+from akshare.utils.request import request_post
 
 
 def index_realtime_fund_sw(symbol: str = "基础一级") -> pd.DataFrame:
@@ -30,7 +30,7 @@ def index_realtime_fund_sw(symbol: str = "基础一级") -> pd.DataFrame:
         "rule": "",
         "indexType": 1,
     }
-    r = requests.post(url, json=payload, headers=headers)
+    r = request_post(url, json=payload, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"]["list"])
     temp_df.rename(
@@ -76,7 +76,7 @@ def index_hist_fund_sw(symbol: str = "807200", period: str = "day") -> pd.DataFr
     }
     url = "https://www.swsresearch.com/insWechatSw/fundIndex/getFundKChartData"
     payload = {"swIndexCode": symbol, "type": period_map[period]}
-    r = requests.post(url, json=payload, headers=headers)
+    r = request_post(url, json=payload, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.rename(
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/10/23 13:00
+Date: 2026/10/18 15:00
 Desc: 申万宏源研究-指数系列
 https://www.swsresearch.com/institute_sw/allIndex/releasedIndex
 """
@@ -9,9 +9,10 @@ https://www.swsresearch.com/institute_sw/allIndex/releasedIndex
 import math
 
 import pandas as pd
-import requests
 
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get, request_post
+from akshare.utils.func import ChunkAccumulator
 
 
 def index_hist_sw(symbol: str = "801030", period: str = "day") -> pd.DataFrame:
@@ -39,7 +40,7 @@ def index_hist_sw(symbol: str = "801030", period: str = "day") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/114.0.0.0 Safari/537.36",
     }
-    r = requests.get(url, params=params, headers=headers, verify=False)
+    r = request_get(url, params=params, headers=headers, verify=False)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.rename(
@@ -97,7 +98,7 @@ def index_min_sw(symbol: str = "801001") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/114.0.0.0 Safari/537.36"
     }
-    r = requests.get(url, params=params, headers=headers, verify=False)
+    r = request_get(url, params=params, headers=headers, verify=False)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.rename(
@@ -139,7 +140,7 @@ def index_component_sw(symbol: str = "801001") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/114.0.0.0 Safari/537.36"
     }
-    r = requests.get(url, params=params, headers=headers, verify=False)
+    r = request_get(url, params=params, headers=headers, verify=False)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"]["results"])
     temp_df.reset_index(inplace=True)
@@ -190,7 +191,7 @@ def __index_realtime_sw(symbol: str = "大类风格指数") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/114.0.0.0 Safari/537.36"
     }
-    r = requests.post(url, json=payload, headers=headers, verify=False)
+    r = request_post(url, json=payload, headers=headers, verify=False)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"]["list"])
     temp_df.rename(
@@ -236,18 +237,19 @@ def index_realtime_sw(symbol: str = "二级行业") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/114.0.0.0 Safari/537.36"
     }
-    r = requests.get(url, params=params, headers=headers, verify=False)
+    r = request_get(url, params=params, headers=headers, verify=False)
     data_json = r.json()
     total_num = data_json["data"]["count"]
     total_page = math.ceil(total_num / 50)
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"page": page})
-        r = requests.get(url, params=params, headers=headers, verify=False)
+        r = request_get(url, params=params, headers=headers, verify=False)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["results"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "指数代码",
         "指数名称",
@@ -313,18 +315,19 @@ def index_analysis_daily_sw(
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/114.0.0.0 Safari/537.36"
     }
-    r = requests.get(url, params=params, headers=headers, verify=False)
+    r = request_get(url, params=params, headers=headers, verify=False)
     data_json = r.json()
     total_num = data_json["data"]["count"]
     total_page = math.ceil(total_num / 50)
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"page": page})
-        r = requests.get(url, params=params, headers=headers, verify=False)
+        r = request_get(url, params=params, headers=headers, verify=False)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["results"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.rename(
         columns={
             "swindexcode": "指数代码",
@@ -375,7 +378,7 @@ def index_analysis_week_month_sw(symbol: str = "month") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/114.0.0.0 Safari/537.36"
     }
-    r = requests.get(url, params=params, headers=headers, verify=False)
+    r = request_get(url, params=params, headers=headers, verify=False)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df["bargaindate"] = pd.to_datetime(
@@ -413,18 +416,19 @@ def index_analysis_weekly_sw(
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/114.0.0.0 Safari/537.36"
     }
-    r = requests.get(url, params=params, headers=headers, verify=False)
+    r = request_get(url, params=params, headers=headers, verify=False)
     data_json = r.json()
     total_num = data_json["data"]["count"]
     total_page = math.ceil(total_num / 50)
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"page": page})
-        r = requests.get(url, params=params, headers=headers, verify=False)
+        r = request_get(url, params=params, headers=headers, verify=False)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["results"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.rename(
         columns={
             "swindexcode": "指数代码",
@@ -488,18 +492,19 @@ def index_analysis_monthly_sw(
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/114.0.0.0 Safari/537.36"
     }
-    r = requests.get(url, params=params, headers=headers, verify=False)
+    r = request_get(url, params=params, headers=headers, verify=False)
     data_json = r.json()
     total_num = data_json["data"]["count"]
     total_page = math.ceil(total_num / 50)
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"page": page})
-        r = requests.get(url, params=params, headers=headers, verify=False)
+        r = request_get(url, params=params, headers=headers, verify=False)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["results"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.rename(
         columns={
             "swindexcode": "指数代码",
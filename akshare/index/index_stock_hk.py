@@ -11,13 +11,12 @@ https://quote.eastmoney.com/gb/zsHSTECF2L.html
 import re
 
 import pandas as pd
-import requests
-import py_mini_racer
 
 from functools import lru_cache
 
-from akshare.stock.cons import hk_js_decode
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.request import request_get
+from akshare.utils.sina_decode import decode_sina
 
 
 def _replace_comma(x) -> str:
@@ -41,7 +40,7 @@ def get_hk_index_page_count() -> int:
     :return: 需要抓取的指数的总页数
     :rtype: int
     """
-    res = requests.get(
+    res = request_get(
         "https://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getNameCount?node=zs_hk"
     )
     page_count = int(re.findall(re.compile(r"\d+"), res.text)[0]) / 80
@@ -66,7 +65,7 @@ def stock_hk_index_spot_sina() -> pd.DataFrame:
         "hkSSE180GV,hkSSE380,hkSSE50,hkSSECEQT,hkSSECOMP,hkSSEDIV,hkSSEITOP,hkSSEMCAP,hkSSEMEGA,hkVHSI"
     )
     headers = {"Referer": "https://vip.stock.finance.sina.com.cn/"}
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     data_text = r.text
     data_list = [
         item.split('"')[1].split(",")
@@ -129,13 +128,10 @@ def stock_hk_index_daily_sina(symbol: str = "CES100") -> pd.DataFrame:
     """
     url = f"https://finance.sina.com.cn/stock/hkstock/{symbol}/klc_kl.js"
     params = {"d": "2023_5_01"}
-    res = requests.get(url, params=params)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", res.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
-    temp_df = pd.DataFrame(dict_list)
+    res = request_get(url, params=params)
+    temp_df = pd.DataFrame(
+        decode_sina(res.text.split("=")[1].split(";")[0].replace('"', ""))
+    )
     temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
     temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
     temp_df["close"] = pd.to_numeric(temp_df["close"], errors="coerce")
@@ -261,7 +257,7 @@ def stock_hk_index_daily_em(symbol: str = "HSTECF2L") -> pd.DataFrame:
         "ut": "f057cbcbce2a86e2866ab8877db1d059",
         "forcect": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
     temp_df.columns = [
@@ -1,18 +1,15 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/3/17 18:20
+Date: 2026/10/18 15:00
 Desc: 新浪财经-美股指数行情
 https://stock.finance.sina.com.cn/usstock/quotes/.IXIC.html
 """
 
 import pandas as pd
-import requests
-import py_mini_racer
 
-from akshare.stock.cons import (
-    zh_js_decode,
-)
+from akshare.utils.request import request_get
+from akshare.utils.sina_decode import decode_sina
 
 
 def index_us_stock_sina(symbol: str = ".INX") -> pd.DataFrame:
@@ -25,11 +22,10 @@ def index_us_stock_sina(symbol: str = ".INX") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = f"https://finance.sina.com.cn/staticdata/us/{symbol}"
-    r = requests.get(url)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(zh_js_decode)
-    dict_list = js_code.call("d", r.text.split("=")[1].split(";")[0].replace('"', ""))
-    temp_df = pd.DataFrame(dict_list)
+    r = request_get(url)
+    temp_df = pd.DataFrame(
+        decode_sina(r.text.split("=")[1].split(";")[0].replace('"', ""))
+    )
     temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
     temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
     temp_df["high"] = pd.to_numeric(temp_df["high"], errors="coerce")
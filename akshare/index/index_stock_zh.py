@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/10 18:30
+Date: 2026/10/18 15:00
 Desc: 股票指数数据-新浪-东财-腾讯
 所有指数-实时行情数据和历史行情数据
 https://finance.sina.com.cn/realstock/company/sz399552/nc.shtml
@@ -11,19 +11,19 @@ import datetime
 import re
 
 import pandas as pd
-import py_mini_racer
-import requests
 
+from akshare.cache import cached, history_ttl
 from akshare.index.cons import (
     zh_sina_index_stock_payload,
     zh_sina_index_stock_url,
     zh_sina_index_stock_count_url,
     zh_sina_index_stock_hist_url,
 )
-from akshare.stock.cons import hk_js_decode
 from akshare.utils import demjson
-from akshare.utils.func import fetch_paginated_data
+from akshare.utils.func import ChunkAccumulator, fetch_paginated_data
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.sina_decode import decode_sina
 
 
 def _replace_comma(x):
@@ -47,7 +47,7 @@ def get_zh_index_page_count() -> int:
     :return: 需要抓取的指数的总页数
     :rtype: int
     """
-    res = requests.get(zh_sina_index_stock_count_url)
+    res = request_get(zh_sina_index_stock_count_url)
     page_count = int(re.findall(re.compile(r"\d+"), res.text)[0]) / 80
     if isinstance(page_count, int):
         return page_count
@@ -63,15 +63,16 @@ def stock_zh_index_spot_sina() -> pd.DataFrame:
     :return: 所有指数的实时行情数据
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     page_count = get_zh_index_page_count()
     zh_sina_stock_payload_copy = zh_sina_index_stock_payload.copy()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_count + 1), leave=False):
         zh_sina_stock_payload_copy.update({"page": page})
-        res = requests.get(zh_sina_index_stock_url, params=zh_sina_stock_payload_copy)
+        res = request_get(zh_sina_index_stock_url, params=zh_sina_stock_payload_copy)
         data_json = demjson.decode(res.text)
-        big_df = pd.concat(objs=[big_df, pd.DataFrame(data_json)], ignore_index=True)
+        big_chunks.append(pd.DataFrame(data_json))
+    big_df = big_chunks.to_frame()
     big_df = big_df.map(_replace_comma)
     big_df["trade"] = pd.to_numeric(big_df["trade"], errors="coerce")
     big_df["pricechange"] = pd.to_numeric(big_df["pricechange"], errors="coerce")
@@ -149,7 +150,7 @@ def __stock_zh_main_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,f21,"
         "f23,f24,f25,f26,f22,f11,f62,f128,f136,f115,f152",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"]["diff"])
     temp_df.reset_index(inplace=True)
@@ -300,13 +301,10 @@ def stock_zh_index_daily(symbol: str = "sh000922") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     params = {"d": "2020_2_4"}
-    res = requests.get(zh_sina_index_stock_hist_url.format(symbol), params=params)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", res.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
-    temp_df = pd.DataFrame(dict_list)
+    res = request_get(zh_sina_index_stock_hist_url.format(symbol), params=params)
+    temp_df = pd.DataFrame(
+        decode_sina(res.text.split("=")[1].split(";")[0].replace('"', ""))
+    )
     temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
     temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
     temp_df["close"] = pd.to_numeric(temp_df["close"], errors="coerce")
@@ -332,7 +330,7 @@ def get_tx_start_year(symbol: str = "sh000919") -> str:
         "_var": "trend_qfq",
         "r": "0.3506048543943414",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     if not demjson.decode(data_text[data_text.find("={") + 1 :])["data"]:
         url = "https://proxy.finance.qq.com/ifzqgtimg/appstock/app/newfqkline/get"
@@ -341,7 +339,7 @@ def get_tx_start_year(symbol: str = "sh000919") -> str:
             "param": f"{symbol},day,,,320,qfq",
             "r": "0.751892490072597",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         start_date = demjson.decode(data_text[data_text.find("={") + 1 :])["data"][
             symbol
@@ -366,7 +364,7 @@ def stock_zh_index_daily_tx(symbol: str = "sz980017") -> pd.DataFrame:
     url = "https://proxy.finance.qq.com/ifzqgtimg/appstock/app/newfqkline/get"
     range_start = int(start_date.split("-")[0])
     range_end = datetime.date.today().year + 1
-    temp_df = pd.DataFrame()
+    temp_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for year in tqdm(range(range_start, range_end), leave=False):
         params = {
@@ -374,7 +372,7 @@ def stock_zh_index_daily_tx(symbol: str = "sz980017") -> pd.DataFrame:
             "param": f"{symbol},day,{year}-01-01,{year + 1}-12-31,640,qfq",
             "r": "0.8205512681390605",
         }
-        res = requests.get(url, params=params)
+        res = request_get(url, params=params)
         text = res.text
         try:
             inner_temp_df = pd.DataFrame(
@@ -384,7 +382,8 @@ def stock_zh_index_daily_tx(symbol: str = "sz980017") -> pd.DataFrame:
             inner_temp_df = pd.DataFrame(
                 demjson.decode(text[text.find("={") + 1 :])["data"][symbol]["qfqday"]
             )
-        temp_df = pd.concat(objs=[temp_df, inner_temp_df], ignore_index=True)
+        temp_chunks.append(inner_temp_df)
+    temp_df = temp_chunks.to_frame()
     if temp_df.shape[1] == 6:
         temp_df.columns = ["date", "open", "close", "high", "low", "amount"]
     else:
@@ -400,6 +399,7 @@ def stock_zh_index_daily_tx(symbol: str = "sz980017") -> pd.DataFrame:
     return temp_df
 
 
+@cached(ttl=history_ttl())
 def stock_zh_index_daily_em(
     symbol: str = "csi931151",
     start_date: str = "19900101",
@@ -438,7 +438,7 @@ def stock_zh_index_daily_em(
         "beg": start_date,
         "end": end_date,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
     if temp_df.empty:
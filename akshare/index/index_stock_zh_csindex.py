@@ -7,7 +7,8 @@ https://www.csindex.com.cn/zh-CN/indices/index-detail/H30374#/indices/family/lis
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def stock_zh_index_hist_csindex(
@@ -34,7 +35,7 @@ def stock_zh_index_hist_csindex(
         "startDate": start_date,
         "endDate": end_date,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = [
@@ -6,9 +6,10 @@ Desc: 沐甜科技数据中心-中国食糖指数
 https://www.msweet.com.cn/mtkj/sjzx13/index.html
 """
 
-import requests
 import pandas as pd
 
+from akshare.utils.request import request_get
+
 
 def index_sugar_msweet() -> pd.DataFrame:
     """
@@ -22,7 +23,7 @@ def index_sugar_msweet() -> pd.DataFrame:
         "struts.portlet.action": "/portlet/price!getSTZSJson.action",
         "moduleId": "cb752447cfe24b44b18c7a7e9abab048",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.concat(
         [pd.DataFrame(data_json["category"]), pd.DataFrame(data_json["data"])], axis=1
@@ -44,7 +45,7 @@ def index_inner_quote_sugar_msweet() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://www.msweet.com.cn/datacenterapply/datacenter/json/JinKongTang.json"
-    r = requests.get(url)
+    r = request_get(url)
     data_json = r.json()
     temp_df = pd.concat(
         [pd.DataFrame(data_json["category"]), pd.DataFrame(data_json["data"])], axis=1
@@ -89,7 +90,7 @@ def index_outer_quote_sugar_msweet() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://www.msweet.com.cn/datacenterapply/datacenter/json/Jkpewlr.json"
-    r = requests.get(url)
+    r = request_get(url)
     data_json = r.json()
     temp_df = pd.concat(
         [pd.DataFrame(data_json["category"]), pd.DataFrame(data_json["data"])], axis=1
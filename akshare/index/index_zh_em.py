@@ -8,9 +8,9 @@ Desc: 东方财富网-指数行情数据
 from functools import lru_cache
 
 import pandas as pd
-import requests
 
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.request import request_get
 
 
 @lru_cache()
@@ -84,7 +84,7 @@ def index_zh_a_hist(
             "beg": "0",
             "end": "20500000",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         if data_json["data"] is None:
             params = {
@@ -97,7 +97,7 @@ def index_zh_a_hist(
                 "beg": "0",
                 "end": "20500000",
             }
-            r = requests.get(url, params=params)
+            r = request_get(url, params=params)
             data_json = r.json()
             if data_json["data"] is None:
                 params = {
@@ -110,7 +110,7 @@ def index_zh_a_hist(
                     "beg": "0",
                     "end": "20500000",
                 }
-                r = requests.get(url, params=params)
+                r = request_get(url, params=params)
                 data_json = r.json()
                 if data_json["data"] is None:
                     params = {
@@ -123,7 +123,7 @@ def index_zh_a_hist(
                         "beg": "0",
                         "end": "20500000",
                     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     try:
         temp_df = pd.DataFrame(
@@ -141,7 +141,7 @@ def index_zh_a_hist(
             "beg": "0",
             "end": "20500000",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             [item.split(",") for item in data_json["data"]["klines"]]
@@ -214,7 +214,7 @@ def index_zh_a_hist_min_em(
                 "ndays": "5",
                 "secid": f"1.{symbol}",
             }
-            r = requests.get(url, params=params)
+            r = request_get(url, params=params)
             data_json = r.json()
             if data_json["data"] is None:
                 params = {
@@ -224,7 +224,7 @@ def index_zh_a_hist_min_em(
                     "ndays": "5",
                     "secid": f"0.{symbol}",
                 }
-                r = requests.get(url, params=params)
+                r = request_get(url, params=params)
                 data_json = r.json()
                 if data_json["data"] is None:
                     params = {
@@ -234,7 +234,7 @@ def index_zh_a_hist_min_em(
                         "ndays": "5",
                         "secid": f"47.{symbol}",
                     }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             [item.split(",") for item in data_json["data"]["trends"]]
@@ -285,7 +285,7 @@ def index_zh_a_hist_min_em(
                 "beg": "0",
                 "end": "20500000",
             }
-            r = requests.get(url, params=params)
+            r = request_get(url, params=params)
             data_json = r.json()
             if data_json["data"] is None:
                 params = {
@@ -298,7 +298,7 @@ def index_zh_a_hist_min_em(
                     "beg": "0",
                     "end": "20500000",
                 }
-                r = requests.get(url, params=params)
+                r = request_get(url, params=params)
                 data_json = r.json()
                 if data_json["data"] is None:
                     params = {
@@ -311,7 +311,7 @@ def index_zh_a_hist_min_em(
                         "beg": "0",
                         "end": "20500000",
                     }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             [item.split(",") for item in data_json["data"]["klines"]]
@@ -1,14 +1,15 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/5/11 22:00
+Date: 2026/10/18 15:00
 Desc: 东方财富网-经济数据-银行间拆借利率
 https://data.eastmoney.com/shibor/shibor.aspx
 """
 
 import pandas as pd
-import requests
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def rate_interbank(
@@ -86,10 +87,10 @@ def rate_interbank(
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
@@ -100,10 +101,11 @@ def rate_interbank(
                 "pageNum": page,
             }
         )
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "报告日",
         "-",
@@ -13,9 +13,10 @@ import json
 import os
 
 import pandas as pd  # type: ignore
-import requests
 import py_mini_racer  # type: ignore
 
+from akshare.utils.request import request_post
+
 
 def _get_js_path(name: str = "", module_file: str = "") -> str:
     """
@@ -77,7 +78,7 @@ def business_value_artist() -> pd.DataFrame:
         "PageSize": "100",
         "MethodName": "Data_GetList_Star",
     }
-    r = requests.post(url, data=payload)
+    r = request_post(url, data=payload)
     r.encoding = "utf8"
     data_json = json.loads(decrypt(r.text))
     temp_df = pd.DataFrame(data_json["Data"]["Table"])
@@ -115,7 +116,7 @@ def online_value_artist() -> pd.DataFrame:
         "PageSize": 100,
         "MethodName": "Data_GetList_Star",
     }
-    r = requests.post(url, data=payload)
+    r = request_post(url, data=payload)
     r.encoding = "utf8"
     data_json = json.loads(decrypt(r.text))
     temp_df = pd.DataFrame(data_json["Data"]["Table"])
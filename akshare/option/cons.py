@@ -1,15 +1,20 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2019/9/30 13:58
+Date: 2026/10/18 15:00
 Desc: 期权配置文件
 """
 
 import datetime
-import json
 import os
 import re
 
+from akshare.futures.cons import (  # noqa: F401
+    get_latest_data_date,
+    get_trading_calendar,
+    last_trading_day,
+)
+
 # 中国金融期货交易所
 
 CFFEX_OPTION_URL_300 = "http://www.cffex.com.cn/quote_IO.txt"
@@ -95,57 +100,11 @@ def get_json_path(name, module_file):
 
 def get_calendar():
     """
-    获取交易日历至 2019 年结束, 这里的交易日历需要按年更新
-    :return: json
-    """
-    setting_file_name = "calendar.json"
-    setting_file_path = get_json_path(setting_file_name, __file__)
-    return json.load(open(setting_file_path, "r"))
-
-
-def last_trading_day(day):
-    """
-    获取前一个交易日
-    :param day: "%Y%m%d" or  datetime.date()
-    :return last_day: "%Y%m%d" or  datetime.date()
-    """
-    calendar = get_calendar()
-
-    if isinstance(day, str):
-        if day not in calendar:
-            print("Today is not trading day：" + day)
-            return False
-        pos = calendar.index(day)
-        last_day = calendar[pos - 1]
-        return last_day
-
-    elif isinstance(day, datetime.date):
-        d_str = day.strftime("%Y%m%d")
-        if d_str not in calendar:
-            print("Today is not working day：" + d_str)
-            return False
-        pos = calendar.index(d_str)
-        last_day = calendar[pos - 1]
-        last_day = datetime.datetime.strptime(last_day, "%Y%m%d").date()
-        return last_day
-
-
-def get_latest_data_date(day):
-    """
-    获取最新的有数据的交易日
-    :param day: datetime.datetime
-    :return string YYYYMMDD
+    获取交易日历, 与期货共用 akshare.futures.cons 中缓存的交易日历
+    :return: 交易日历, 支持 in 判断是否为交易日
+    :rtype: akshare.futures.cons.TradingCalendar
     """
-    calendar = get_calendar()
-    if day.strftime("%Y%m%d") in calendar:
-        if day.time() > datetime.time(17, 0, 0):
-            return day.strftime("%Y%m%d")
-        else:
-            return last_trading_day(day.strftime("%Y%m%d"))
-    else:
-        while day.strftime("%Y%m%d") not in calendar:
-            day = day - datetime.timedelta(days=1)
-        return day.strftime("%Y%m%d")
+    return get_trading_calendar()
 
 
 if __name__ == "__main__":
@@ -9,7 +9,8 @@ https://investor.szse.cn/market/option/day/index.html
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def option_daily_stats_sse(date: str = "20240626") -> pd.DataFrame:
@@ -39,7 +40,7 @@ def option_daily_stats_sse(date: str = "20240626") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/101.0.4951.67 Safari/537.36",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"])
     temp_df.rename(
@@ -99,7 +100,7 @@ def option_daily_stats_szse(date: str = "20240626") -> pd.DataFrame:
         "txtQueryDate": "-".join([date[:4], date[4:6], date[6:]]),
         "random": "0.0652692406565949",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json[0]["data"])
     temp_df.rename(
@@ -7,8 +7,8 @@ https://quote.eastmoney.com/center/qqsc.html
 """
 
 import pandas as pd
-import requests
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.request import request_get
 
 
 def option_current_em() -> pd.DataFrame:
@@ -121,7 +121,7 @@ def option_current_cffex_em() -> pd.DataFrame:
         "blockName": "callback",
         "_:": "1706689899924",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["list"])
     temp_df.reset_index(inplace=True)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/2/24 15:18
+Date: 2026/10/18 15:00
 Desc: 金融期权数据
 http://www.sse.com.cn/assortment/options/price/
 http://www.szse.cn/market/product/option/index.html
@@ -12,7 +12,6 @@ http://www.cffex.com.cn/zz1000gzqq/
 from io import BytesIO
 
 import pandas as pd
-import requests
 
 from akshare.option.cons import (
     SH_OPTION_PAYLOAD,
@@ -29,6 +28,8 @@ from akshare.option.cons import (
     SH_OPTION_URL_KING_50_YFD,
     CFFEX_OPTION_URL_300,
 )
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
 
 
 def option_finance_sse_underlying(symbol: str = "华夏科创50ETF期权") -> pd.DataFrame:
@@ -47,7 +48,7 @@ def option_finance_sse_underlying(symbol: str = "华夏科创50ETF期权") -> pd
         "华夏科创50ETF期权": SH_OPTION_URL_KC_50,
         "易方达科创50ETF期权": SH_OPTION_URL_KC_50_YFD,
     }
-    r = requests.get(symbol_map[symbol], params=SH_OPTION_PAYLOAD)
+    r = request_get(symbol_map[symbol], params=SH_OPTION_PAYLOAD)
     data_json = r.json()
     raw_data = pd.DataFrame(data_json["list"])
     raw_data.at[0, 0] = "510300"
@@ -90,7 +91,7 @@ def option_finance_board(
     """
     end_month = end_month[-2:]
     if symbol == "华夏上证50ETF期权":
-        r = requests.get(
+        r = request_get(
             SH_OPTION_URL_KING_50.format(end_month),
             params=SH_OPTION_PAYLOAD_OTHER,
         )
@@ -113,7 +114,7 @@ def option_finance_board(
         ]
         return raw_data
     elif symbol == "华泰柏瑞沪深300ETF期权":
-        r = requests.get(
+        r = request_get(
             SH_OPTION_URL_KING_300.format(end_month),
             params=SH_OPTION_PAYLOAD_OTHER,
         )
@@ -136,7 +137,7 @@ def option_finance_board(
         ]
         return raw_data
     elif symbol == "南方中证500ETF期权":
-        r = requests.get(
+        r = request_get(
             SH_OPTION_URL_KING_500.format(end_month),
             params=SH_OPTION_PAYLOAD_OTHER,
         )
@@ -159,7 +160,7 @@ def option_finance_board(
         ]
         return raw_data
     elif symbol == "华夏科创50ETF期权":
-        r = requests.get(
+        r = request_get(
             SH_OPTION_URL_KC_KING_50.format(end_month),
             params=SH_OPTION_PAYLOAD_OTHER,
         )
@@ -182,7 +183,7 @@ def option_finance_board(
         ]
         return raw_data
     elif symbol == "易方达科创50ETF期权":
-        r = requests.get(
+        r = request_get(
             SH_OPTION_URL_KING_50_YFD.format(end_month),
             params=SH_OPTION_PAYLOAD_OTHER,
         )
@@ -213,10 +214,10 @@ def option_finance_board(
             "PAGENO": "1",
             "random": "0.10642298535346595",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         page_num = data_json[0]["metadata"]["pagecount"]
-        big_df = pd.DataFrame()
+        big_chunks = ChunkAccumulator()
         for page in range(1, page_num + 1):
             params = {
                 "SHOWTYPE": "JSON",
@@ -225,10 +226,11 @@ def option_finance_board(
                 "PAGENO": page,
                 "random": "0.10642298535346595",
             }
-            r = requests.get(url, params=params)
+            r = request_get(url, params=params)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json[0]["data"])
-            big_df = pd.concat([big_df, temp_df], ignore_index=True)
+            big_chunks.append(temp_df)
+        big_df = big_chunks.to_frame()
 
         big_df.columns = [
             "合约编码",
@@ -250,7 +252,7 @@ def option_finance_board(
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36"
         }
-        r = requests.get(CFFEX_OPTION_URL_300, headers=headers)
+        r = request_get(CFFEX_OPTION_URL_300, headers=headers)
         raw_df = pd.read_table(BytesIO(r.content), sep=",")
         raw_df["end_month"] = (
             raw_df["instrument"]
@@ -269,7 +271,7 @@ def option_finance_board(
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36"
         }
         url = "http://www.cffex.com.cn/quote_MO.txt"
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         raw_df = pd.read_table(BytesIO(r.content), sep=",")
         raw_df["end_month"] = (
             raw_df["instrument"]
@@ -288,7 +290,7 @@ def option_finance_board(
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36"
         }
         url = "http://www.cffex.com.cn/quote_HO.txt"
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         raw_df = pd.read_table(BytesIO(r.content), sep=",")
         raw_df["end_month"] = (
             raw_df["instrument"]
@@ -9,9 +9,9 @@ Desc: 奇货可查网站目前已经商业化运营, 特提供奇货可查-工
 from typing import AnyStr
 
 import pandas as pd
-import requests
 
 from akshare.futures.cons import QHKC_TOOL_FOREIGN_URL, QHKC_TOOL_GDP_URL
+from akshare.utils.request import request_post
 
 
 def qhkc_tool_foreign(url: AnyStr = QHKC_TOOL_FOREIGN_URL):
@@ -43,7 +43,7 @@ def qhkc_tool_foreign(url: AnyStr = QHKC_TOOL_FOREIGN_URL):
      美棉花  10/07 23:30      61.69        61.05 -1.037
     """
     payload_id = {"page": 1, "limit": 10}
-    r = requests.post(url, data=payload_id)
+    r = request_post(url, data=payload_id)
     print("数据获取成功")
     json_data = r.json()
     name = []
@@ -89,7 +89,7 @@ def qhkc_tool_nebula(url: AnyStr = QHKC_TOOL_FOREIGN_URL):
      美棉花  10/07 23:30      61.69        61.05 -1.037
     """
     payload_id = {"page": 1, "limit": 10}
-    r = requests.post(url, data=payload_id)
+    r = request_post(url, data=payload_id)
     print("数据获取成功")
     json_data = r.json()
     name = []
@@ -11,7 +11,8 @@ from functools import lru_cache
 from typing import Dict
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 @lru_cache()
@@ -35,7 +36,7 @@ def __reits_code_market_map() -> Dict:
         "fs": "m:1 t:9 e:97,m:0 t:10 e:97",
         "fields": "f12,f13",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"]["diff"])
     temp_dict = dict(zip(temp_df["f12"], temp_df["f13"]))
@@ -62,7 +63,7 @@ def reits_realtime_em() -> pd.DataFrame:
         "fs": "m:1 t:9 e:97,m:0 t:10 e:97",
         "fields": "f2,f3,f4,f5,f6,f12,f14,f15,f16,f17,f18",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"]["diff"])
     temp_df.reset_index(inplace=True)
@@ -136,7 +137,7 @@ def reits_hist_em(symbol: str = "508097") -> pd.DataFrame:
         "ut": "f057cbcbce2a86e2866ab8877db1d059",
         "forcect": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
     temp_df.columns = [
@@ -190,7 +191,7 @@ def reits_hist_min_em(symbol: str = "508097") -> pd.DataFrame:
         "ut": "f057cbcbce2a86e2866ab8877db1d059",
         "ndays": "5",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["trends"]])
     temp_df.columns = [
@@ -7,10 +7,10 @@ https://webapi.cninfo.com.cn/#/dataBrowse
 """
 
 import pandas as pd
-import py_mini_racer
-import requests
 
 from akshare.datasets import get_ths_js
+from akshare.utils.request import request_post
+from akshare.utils.js_pool import get_js_pool
 
 
 def _get_file_content_cninfo(file: str = "cninfo.js") -> str:
@@ -52,9 +52,8 @@ def stock_allotment_cninfo(
         if not end_date
         else f"{end_date[0:4]}-{end_date[4:6]}-{end_date[6:8]}",
     }
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -70,7 +69,7 @@ def stock_allotment_cninfo(
         "Referer": "https://webapi.cninfo.com.cn/",
         "X-Requested-With": "XMLHttpRequest",
     }
-    r = requests.post(url, params=params, headers=headers)
+    r = request_post(url, params=params, headers=headers)
     data_json = r.json()
     columns = [
         "记录标识",
@@ -10,9 +10,9 @@ import re
 from functools import lru_cache
 
 import pandas as pd
-import requests
 
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.request import request_get
 
 
 @lru_cache()
@@ -243,7 +243,7 @@ def stock_board_industry_spot_em(symbol: str = "小金属") -> pd.DataFrame:
         fltt="1",
         secid=f"90.{em_code}",
     )
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_dict = r.json()
     result = pd.DataFrame.from_dict(data_dict["data"], orient="index")
     result.rename(field_map, inplace=True)
@@ -304,7 +304,7 @@ def stock_board_industry_hist_em(
         "smplmt": "10000",
         "lmt": "1000000",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
     temp_df.columns = [
@@ -375,7 +375,7 @@ def stock_board_industry_hist_min_em(
             "ndays": "1",
             "secid": f"90.{em_code}",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             [item.split(",") for item in data_json["data"]["trends"]]
@@ -412,7 +412,7 @@ def stock_board_industry_hist_min_em(
             "smplmt": "10000",
             "lmt": "1000000",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             [item.split(",") for item in data_json["data"]["klines"]]
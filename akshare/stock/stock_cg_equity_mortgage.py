@@ -7,10 +7,10 @@ https://webapi.cninfo.com.cn/#/thematicStatistics
 """
 
 import pandas as pd
-import py_mini_racer
-import requests
 
 from akshare.datasets import get_ths_js
+from akshare.utils.request import request_post
+from akshare.utils.js_pool import get_js_pool
 
 
 def _get_file_content_ths(file: str = "cninfo.js") -> str:
@@ -37,9 +37,8 @@ def stock_cg_equity_mortgage_cninfo(date: str = "20210930") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1094"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -60,7 +59,7 @@ def stock_cg_equity_mortgage_cninfo(date: str = "20210930") -> pd.DataFrame:
     params = {
         "tdate": "-".join([date[:4], date[4:6], date[6:]]),
     }
-    r = requests.post(url, headers=headers, params=params)
+    r = request_post(url, headers=headers, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     temp_df.columns = [
@@ -7,10 +7,10 @@ https://webapi.cninfo.com.cn/#/thematicStatistics
 """
 
 import pandas as pd
-import requests
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
+from akshare.utils.request import request_post
+from akshare.utils.js_pool import get_js_pool
 
 
 def _get_file_content_ths(file: str = "cninfo.js") -> str:
@@ -50,9 +50,8 @@ def stock_cg_guarantee_cninfo(
         "科创板": "012029",
     }
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1054"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -75,7 +74,7 @@ def stock_cg_guarantee_cninfo(
         "edate": "-".join([end_date[:4], end_date[4:6], end_date[6:]]),
         "market": symbol_map[symbol],
     }
-    r = requests.post(url, headers=headers, params=params)
+    r = request_post(url, headers=headers, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     temp_df.columns = [
@@ -9,9 +9,10 @@ http://webapi.cninfo.com.cn/#/thematicStatistics
 import time
 
 import pandas as pd
-import requests
 import py_mini_racer
 
+from akshare.utils.request import request_post
+
 js_str = """
     function mcode(input) {
                 var keyStr = "ABCDEFGHIJKLMNOP" + "QRSTUVWXYZabcdef" + "ghijklmnopqrstuv"   + "wxyz0123456789+/" + "=";
@@ -90,7 +91,7 @@ def stock_cg_lawsuit_cninfo(
         "edate": "-".join([end_date[:4], end_date[4:6], end_date[6:]]),
         "market": symbol_map[symbol],
     }
-    r = requests.post(url, headers=headers, params=params)
+    r = request_post(url, headers=headers, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     temp_df.columns = [
@@ -7,10 +7,10 @@ https://webapi.cninfo.com.cn/#/company?companyid=600009
 """
 
 import pandas as pd
-import py_mini_racer
-import requests
 
 from akshare.datasets import get_ths_js
+from akshare.utils.request import request_post
+from akshare.utils.js_pool import get_js_pool
 
 
 def _get_file_content_ths(file: str = "cninfo.js") -> str:
@@ -38,9 +38,8 @@ def stock_dividend_cninfo(symbol: str = "600009") -> pd.DataFrame:
     """
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1139"
     params = {"scode": symbol}
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -58,7 +57,7 @@ def stock_dividend_cninfo(symbol: str = "600009") -> pd.DataFrame:
         "Chrome/93.0.4577.63 Safari/537.36",
         "X-Requested-With": "XMLHttpRequest",
     }
-    r = requests.post(url, params=params, headers=headers)
+    r = request_post(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     temp_df.rename(
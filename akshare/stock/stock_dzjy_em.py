@@ -1,13 +1,15 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/1/13 22:30
+Date: 2026/10/18 15:00
 Desc: 东方财富网-数据中心-大宗交易-市场统计
 https://data.eastmoney.com/dzjy/
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
 
 
 def stock_dzjy_sctj() -> pd.DataFrame:
@@ -29,16 +31,17 @@ def stock_dzjy_sctj() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = int(data_json["result"]["pages"])
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in range(1, total_page + 1):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
     big_df.columns = [
@@ -106,7 +109,7 @@ def stock_dzjy_mrmx(
         '{"-".join([start_date[:4], start_date[4:6], start_date[6:]])}')(TRADE_DATE<=
         '{"-".join([end_date[:4], end_date[4:6], end_date[6:]])}')""",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     if not data_json["result"]["data"]:
         return pd.DataFrame()
@@ -238,7 +241,7 @@ def stock_dzjy_mrtj(
         "filter": f"(TRADE_DATE>='{'-'.join([start_date[:4], start_date[4:6], start_date[6:]])}')(TRADE_DATE<="
         f"'{'-'.join([end_date[:4], end_date[4:6], end_date[6:]])}')",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.reset_index(inplace=True)
@@ -321,16 +324,17 @@ def stock_dzjy_hygtj(symbol: str = "近三月") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"(DATE_TYPE_CODE={period_map[symbol]})",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in range(1, int(total_page) + 1):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
     big_df.columns = [
@@ -428,16 +432,17 @@ def stock_dzjy_hyyybtj(symbol: str = "近3日") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"(N_DATE=-{period_map[symbol]})",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in range(1, int(total_page) + 1):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
     big_df.columns = [
@@ -511,16 +516,17 @@ def stock_dzjy_yybph(symbol: str = "近三月") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"(N_DATE=-{period_map[symbol]})",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in range(1, int(total_page) + 1):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
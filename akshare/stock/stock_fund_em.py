@@ -11,10 +11,10 @@ import time
 from functools import lru_cache
 
 import pandas as pd
-import requests
 
 from akshare.utils.func import fetch_paginated_data
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
 
 
 def stock_individual_fund_flow(
@@ -45,7 +45,7 @@ def stock_individual_fund_flow(
         "ut": "b2884a393a59ad64002292a3e90d46a5",
         "_": int(time.time() * 1000),
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     content_list = data_json["data"]["klines"]
     temp_df = pd.DataFrame([item.split(",") for item in content_list])
@@ -159,7 +159,7 @@ def stock_individual_fund_flow_rank(indicator: str = "5日") -> pd.DataFrame:
         "fs": "m:0+t:6+f:!2,m:0+t:13+f:!2,m:0+t:80+f:!2,m:1+t:2+f:!2,m:1+t:23+f:!2,m:0+t:7+f:!2,m:1+t:3+f:!2",
         "fields": indicator_map[indicator][1],
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = math.ceil(data_json["data"]["total"] / 100)
     temp_list = []
@@ -170,7 +170,7 @@ def stock_individual_fund_flow_rank(indicator: str = "5日") -> pd.DataFrame:
                 "pn": page,
             }
         )
-        r = requests.get(url, params=params, timeout=15)
+        r = request_get(url, params=params, timeout=15)
         data_json = r.json()
         inner_temp_df = pd.DataFrame(data_json["data"]["diff"])
         temp_list.append(inner_temp_df)
@@ -366,7 +366,7 @@ def stock_market_fund_flow() -> pd.DataFrame:
         "ut": "b2884a393a59ad64002292a3e90d46a5",
         "_": int(time.time() * 1000),
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     content_list = data_json["data"]["klines"]
     temp_df = pd.DataFrame([item.split(",") for item in content_list])
@@ -495,7 +495,7 @@ def stock_sector_fund_flow_rank(
         "rt": "52975239",
         "_": int(time.time() * 1000),
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     total_page = math.ceil(data_json["data"]["total"] / 100)
     temp_list = []
@@ -506,7 +506,7 @@ def stock_sector_fund_flow_rank(
                 "pn": page,
             }
         )
-        r = requests.get(url, params=params, timeout=15)
+        r = request_get(url, params=params, timeout=15)
         data_json = r.json()
         inner_temp_df = pd.DataFrame(data_json["data"]["diff"])
         temp_list.append(inner_temp_df)
@@ -700,7 +700,7 @@ def stock_sector_fund_flow_summary(
             "fs": f"b:{code_name_map[symbol]}",
             "fields": "f12,f14,f2,f3,f62,f184,f66,f69,f72,f75,f78,f81,f84,f87,f204,f205,f124,f1,f13",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["diff"]).T
         temp_df.reset_index(inplace=True)
@@ -789,7 +789,7 @@ def stock_sector_fund_flow_summary(
             "fs": f"b:{code_name_map[symbol]}",
             "fields": "f12,f14,f2,f109,f164,f165,f166,f167,f168,f169,f170,f171,f172,f173,f257,f258,f124,f1,f13",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["diff"]).T
         temp_df.reset_index(inplace=True)
@@ -878,7 +878,7 @@ def stock_sector_fund_flow_summary(
             "fs": f"b:{code_name_map[symbol]}",
             "fields": "f12,f14,f2,f160,f174,f175,f176,f177,f178,f179,f180,f181,f182,f183,f260,f261,f124,f1,f13",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["diff"]).T
         temp_df.reset_index(inplace=True)
@@ -977,7 +977,7 @@ def stock_sector_fund_flow_hist(symbol: str = "汽车服务") -> pd.DataFrame:
         "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61,f62,f63,f64,f65",
         "secid": f"90.{code_name_map[symbol]}",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
     temp_df.columns = [
@@ -1089,7 +1089,7 @@ def stock_concept_fund_flow_hist(symbol: str = "数据要素") -> pd.DataFrame:
         "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61,f62,f63,f64,f65",
         "secid": f"90.{code_name_map[symbol]}",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
     temp_df.columns = [
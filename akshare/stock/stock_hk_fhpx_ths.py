@@ -9,7 +9,8 @@ https://stockpage.10jqka.com.cn/HK0700/bonus/
 from io import StringIO
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def stock_hk_fhpx_detail_ths(symbol: str = "0700") -> pd.DataFrame:
@@ -27,7 +28,7 @@ def stock_hk_fhpx_detail_ths(symbol: str = "0700") -> pd.DataFrame:
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/89.0.4389.90 Safari/537.36",
     }
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     r.encoding = "utf-8"
     temp_df = pd.read_html(StringIO(r.text))[0]
     temp_df.columns = [
@@ -1,21 +1,22 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/2/18 16:00
+Date: 2026/10/18 15:00
 Desc: 新浪财经-港股-实时行情数据和历史行情数据(包含前复权和后复权因子)
 https://stock.finance.sina.com.cn/hkstock/quotes/00700.html
 """
 
 import pandas as pd
-import py_mini_racer
-import requests
 
 from akshare.stock.cons import (
-    hk_js_decode,
     hk_sina_stock_hist_url,
     hk_sina_stock_hist_hfq_url,
     hk_sina_stock_hist_qfq_url,
 )
+from akshare.utils import jsonp
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
+from akshare.utils.sina_decode import decode_sina
 
 
 def stock_hk_spot() -> pd.DataFrame:
@@ -34,18 +35,19 @@ def stock_hk_spot() -> pd.DataFrame:
         "node": "qbgg_hk",
         "_s_r_a": "init",
     }
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     from akshare.utils.tqdm import get_tqdm
 
     tqdm = get_tqdm()
     for page in tqdm(range(1, 100), leave=False):
         params["page"] = str(page)
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         if not data_json:
             break
         temp_df = pd.DataFrame(data_json)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.columns = [
         "代码",
@@ -118,13 +120,10 @@ def stock_hk_daily(symbol: str = "00981", adjust: str = "") -> pd.DataFrame:
     :return: 指定 adjust 的数据
     :rtype: pandas.DataFrame
     """
-    r = requests.get(hk_sina_stock_hist_url.format(symbol))
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
-    data_df = pd.DataFrame(dict_list)
+    r = request_get(hk_sina_stock_hist_url.format(symbol))
+    data_df = pd.DataFrame(
+        decode_sina(r.text.split("=")[1].split(";")[0].replace('"', ""))
+    )
     data_df.index = pd.to_datetime(data_df["date"]).dt.date
     del data_df["date"]
     data_df = data_df.astype("float")
@@ -135,11 +134,9 @@ def stock_hk_daily(symbol: str = "00981", adjust: str = "") -> pd.DataFrame:
         return data_df
 
     if adjust == "hfq":
-        r = requests.get(hk_sina_stock_hist_hfq_url.format(symbol))
+        r = request_get(hk_sina_stock_hist_hfq_url.format(symbol))
         try:
-            hfq_factor_df = pd.DataFrame(
-                eval(r.text.split("=")[1].split("\n")[0])["data"]
-            )
+            hfq_factor_df = pd.DataFrame(jsonp.loads_jsonp(r.text)["data"])
             if len(hfq_factor_df) == 1:
                 data_df.reset_index(inplace=True)
                 data_df["date"] = pd.to_datetime(data_df["date"]).dt.date
@@ -199,11 +196,9 @@ def stock_hk_daily(symbol: str = "00981", adjust: str = "") -> pd.DataFrame:
         return temp_df
 
     if adjust == "qfq":
-        r = requests.get(hk_sina_stock_hist_qfq_url.format(symbol))
+        r = request_get(hk_sina_stock_hist_qfq_url.format(symbol))
         try:
-            qfq_factor_df = pd.DataFrame(
-                eval(r.text.split("=")[1].split("\n")[0])["data"]
-            )
+            qfq_factor_df = pd.DataFrame(jsonp.loads_jsonp(r.text)["data"])
             if len(qfq_factor_df) == 1:
                 data_df.reset_index(inplace=True)
                 data_df["date"] = pd.to_datetime(data_df["date"]).dt.date
@@ -264,8 +259,8 @@ def stock_hk_daily(symbol: str = "00981", adjust: str = "") -> pd.DataFrame:
         return temp_df
 
     if adjust == "hfq-factor":
-        r = requests.get(hk_sina_stock_hist_hfq_url.format(symbol))
-        hfq_factor_df = pd.DataFrame(eval(r.text.split("=")[1].split("\n")[0])["data"])
+        r = request_get(hk_sina_stock_hist_hfq_url.format(symbol))
+        hfq_factor_df = pd.DataFrame(jsonp.loads_jsonp(r.text)["data"])
         hfq_factor_df.columns = ["date", "hfq_factor", "cash"]
         hfq_factor_df.index = pd.to_datetime(hfq_factor_df.date)
         del hfq_factor_df["date"]
@@ -274,8 +269,8 @@ def stock_hk_daily(symbol: str = "00981", adjust: str = "") -> pd.DataFrame:
         return hfq_factor_df
 
     if adjust == "qfq-factor":
-        r = requests.get(hk_sina_stock_hist_qfq_url.format(symbol))
-        qfq_factor_df = pd.DataFrame(eval(r.text.split("=")[1].split("\n")[0])["data"])
+        r = request_get(hk_sina_stock_hist_qfq_url.format(symbol))
+        qfq_factor_df = pd.DataFrame(jsonp.loads_jsonp(r.text)["data"])
         qfq_factor_df.columns = ["date", "qfq_factor"]
         qfq_factor_df.index = pd.to_datetime(qfq_factor_df.date)
         del qfq_factor_df["date"]
@@ -12,10 +12,10 @@ https://webapi.cninfo.com.cn/#/thematicStatistics
 import datetime
 
 import pandas as pd
-import py_mini_racer
-import requests
 
 from akshare.datasets import get_ths_js
+from akshare.utils.request import request_get, request_post
+from akshare.utils.js_pool import get_js_pool
 
 
 def _get_file_content_cninfo(file: str = "cninfo.js") -> str:
@@ -49,9 +49,8 @@ def stock_hold_control_cninfo(symbol: str = "全部") -> pd.DataFrame:
         "全部": "",
     }
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1033"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -72,7 +71,7 @@ def stock_hold_control_cninfo(symbol: str = "全部") -> pd.DataFrame:
     params = {
         "ctype": symbol_map[symbol],
     }
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     temp_df.columns = [
@@ -118,9 +117,8 @@ def stock_hold_management_detail_cninfo(symbol: str = "增持") -> pd.DataFrame:
     }
     current_date = datetime.datetime.now().date().isoformat()
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1030"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -143,7 +141,7 @@ def stock_hold_management_detail_cninfo(symbol: str = "增持") -> pd.DataFrame:
         "edate": current_date,
         "varytype": symbol_map[symbol],
     }
-    r = requests.post(url, headers=headers, params=params)
+    r = request_post(url, headers=headers, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     temp_df.columns = [
@@ -213,9 +211,8 @@ def stock_hold_change_cninfo(symbol: str = "全部") -> pd.DataFrame:
         "全部": "",
     }
     url = "https://webapi.cninfo.com.cn/api/sysapi/p_sysapi1029"
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_cninfo("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "/",
@@ -236,7 +233,7 @@ def stock_hold_change_cninfo(symbol: str = "全部") -> pd.DataFrame:
     params = {
         "market": symbol_map[symbol],
     }
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     temp_df.columns = [
@@ -1,15 +1,17 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/5/19 18:30
+Date: 2026/10/18 15:00
 Desc: 东方财富网-数据中心-特色数据-高管持股
 https://data.eastmoney.com/executive/list.html
 """
 
 import pandas as pd
-import requests
 from tqdm import tqdm
 
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
+
 
 def stock_hold_management_detail_em() -> pd.DataFrame:
     """
@@ -34,10 +36,10 @@ def stock_hold_management_detail_em() -> pd.DataFrame:
         "pageNo": "1",
         "pageNum": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
             {
@@ -47,10 +49,11 @@ def stock_hold_management_detail_em() -> pd.DataFrame:
                 "pageNum": page,
             }
         )
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.rename(
         columns={
@@ -134,7 +137,7 @@ def stock_hold_management_person_em(
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.rename(
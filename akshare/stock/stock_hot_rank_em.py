@@ -7,7 +7,8 @@ https://guba.eastmoney.com/rank/
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get, request_post
 
 
 def stock_hot_rank_em() -> pd.DataFrame:
@@ -25,7 +26,7 @@ def stock_hot_rank_em() -> pd.DataFrame:
         "pageNo": 1,
         "pageSize": 100,
     }
-    r = requests.post(url, json=payload)
+    r = request_post(url, json=payload)
     data_json = r.json()
     temp_rank_df = pd.DataFrame(data_json["data"])
 
@@ -42,7 +43,7 @@ def stock_hot_rank_em() -> pd.DataFrame:
         "secids": ",".join(temp_rank_df["mark"]) + ",?v=08926209912590994",
     }
     url = "https://push2.eastmoney.com/api/qt/ulist.np/get"
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"]["diff"])
     temp_df.columns = ["最新价", "涨跌幅", "代码", "股票名称"]
@@ -82,7 +83,7 @@ def stock_hot_rank_detail_em(symbol: str = "SZ000665") -> pd.DataFrame:
         "srcSecurityCode": symbol,
         "yearType": "5",
     }
-    r = requests.post(url_rank, json=payload)
+    r = request_post(url_rank, json=payload)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df["证券代码"] = symbol
@@ -90,7 +91,7 @@ def stock_hot_rank_detail_em(symbol: str = "SZ000665") -> pd.DataFrame:
     temp_df = temp_df[["时间", "排名", "证券代码"]]
 
     url_follow = "https://emappdata.eastmoney.com/stockrank/getHisProfileList"
-    r = requests.post(url_follow, json=payload)
+    r = request_post(url_follow, json=payload)
     data_json = r.json()
     temp_df["新晋粉丝"] = (
         pd.DataFrame(data_json["data"])["newUidRate"].str.strip("%").astype(float) / 100
@@ -118,7 +119,7 @@ def stock_hot_rank_detail_realtime_em(symbol: str = "SZ000665") -> pd.DataFrame:
         "marketType": "",
         "srcSecurityCode": symbol,
     }
-    r = requests.post(url, json=payload)
+    r = request_post(url, json=payload)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.columns = ["时间", "排名"]
@@ -140,7 +141,7 @@ def stock_hot_keyword_em(symbol: str = "SZ000665") -> pd.DataFrame:
         "globalId": "786e4c21-70dc-435a-93bb-38",
         "srcSecurityCode": symbol,
     }
-    r = requests.post(url, json=payload)
+    r = request_post(url, json=payload)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     del temp_df["flag"]
@@ -164,7 +165,7 @@ def stock_hot_rank_latest_em(symbol: str = "SZ000665") -> pd.DataFrame:
         "marketType": "",
         "srcSecurityCode": symbol,
     }
-    r = requests.post(url, json=payload)
+    r = request_post(url, json=payload)
     data_json = r.json()
     temp_df = pd.DataFrame.from_dict(data_json["data"], orient="index")
     temp_df.reset_index(inplace=True)
@@ -187,7 +188,7 @@ def stock_hot_rank_relate_em(symbol: str = "SZ000665") -> pd.DataFrame:
         "globalId": "786e4c21-70dc-435a-93bb-38",
         "srcSecurityCode": symbol,
     }
-    r = requests.post(url, json=payload)
+    r = request_post(url, json=payload)
     data_json = r.json()
     temp_df = pd.DataFrame.from_dict(data_json["data"])
     temp_df.columns = ["时间", "-", "股票代码", "-", "相关股票代码", "涨跌幅", "-"]
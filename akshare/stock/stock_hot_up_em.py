@@ -7,7 +7,8 @@ https://guba.eastmoney.com/rank/
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get, request_post
 
 
 def stock_hot_up_em() -> pd.DataFrame:
@@ -25,7 +26,7 @@ def stock_hot_up_em() -> pd.DataFrame:
         "pageNo": 1,
         "pageSize": 100,
     }
-    r = requests.post(url, json=payload)
+    r = request_post(url, json=payload)
     data_json = r.json()
     temp_rank_df = pd.DataFrame(data_json["data"])
 
@@ -42,7 +43,7 @@ def stock_hot_up_em() -> pd.DataFrame:
         "secids": ",".join(temp_rank_df["mark"]) + ",?v=08926209912590994",
     }
     url = "https://push2.eastmoney.com/api/qt/ulist.np/get"
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"]["diff"])
     temp_df.columns = ["最新价", "涨跌幅", "代码", "股票名称"]
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2023/5/9 17:06
+Date: 2026/10/18 15:00
 Desc: 新浪行业-板块行情
 http://finance.sina.com.cn/stock/sl/
 """
@@ -10,11 +10,13 @@ import json
 import math
 
 import pandas as pd
-import requests
 
 from akshare.utils import demjson
+from akshare.utils.request import request_get
 from tqdm import tqdm
 
+from akshare.utils.func import ChunkAccumulator
+
 
 def stock_sector_spot(indicator: str = "新浪行业") -> pd.DataFrame:
     """
@@ -27,23 +29,23 @@ def stock_sector_spot(indicator: str = "新浪行业") -> pd.DataFrame:
     """
     if indicator == "新浪行业":
         url = "http://vip.stock.finance.sina.com.cn/q/view/newSinaHy.php"
-        r = requests.get(url)
+        r = request_get(url)
     if indicator == "启明星行业":
         url = "http://biz.finance.sina.com.cn/hq/qmxIndustryHq.php"
-        r = requests.get(url)
+        r = request_get(url)
         r.encoding = "gb2312"
     if indicator == "概念":
         url = "http://money.finance.sina.com.cn/q/view/newFLJK.php"
         params = {"param": "class"}
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
     if indicator == "地域":
         url = "http://money.finance.sina.com.cn/q/view/newFLJK.php"
         params = {"param": "area"}
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
     if indicator == "行业":
         url = "http://money.finance.sina.com.cn/q/view/newFLJK.php"
         params = {"param": "industry"}
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
     text_data = r.text
     json_data = json.loads(text_data[text_data.find("{") :])
     temp_df = pd.DataFrame([value.split(",") for key, value in json_data.items()])
@@ -85,10 +87,10 @@ def stock_sector_detail(sector: str = "gn_gfgn") -> pd.DataFrame:
     """
     url = "http://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getHQNodeStockCount"
     params = {"node": sector}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     total_num = int(r.json())
     total_page_num = math.ceil(int(total_num) / 80)
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     url = "http://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getHQNodeData"
     for page in tqdm(range(1, total_page_num + 1), leave=True):
         params = {
@@ -100,11 +102,12 @@ def stock_sector_detail(sector: str = "gn_gfgn") -> pd.DataFrame:
             "symbol": "",
             "_s_r_a": "page",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         data_json = demjson.decode(data_text)
         temp_df = pd.DataFrame(data_json)
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["trade"] = pd.to_numeric(big_df["trade"], errors="coerce")
     big_df["pricechange"] = pd.to_numeric(big_df["pricechange"], errors="coerce")
     big_df["changepercent"] = pd.to_numeric(big_df["changepercent"], errors="coerce")
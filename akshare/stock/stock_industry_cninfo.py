@@ -9,10 +9,10 @@ https://webapi.cninfo.com.cn/api/stock/p_stock2110
 
 import numpy as np
 import pandas as pd
-import requests
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
+from akshare.utils.request import request_get, request_post
+from akshare.utils.js_pool import get_js_pool
 
 
 def _get_file_content_ths(file: str = "cninfo.js") -> str:
@@ -52,9 +52,8 @@ def stock_industry_category_cninfo(symbol: str = "巨潮行业分类标准") ->
     }
     url = "https://webapi.cninfo.com.cn/api/stock/p_public0002"
     params = {"indcode": "", "indtype": symbol_map[symbol], "format": "json"}
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -72,7 +71,7 @@ def stock_industry_category_cninfo(symbol: str = "巨潮行业分类标准") ->
         "Chrome/93.0.4577.63 Safari/537.36",
         "X-Requested-With": "XMLHttpRequest",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     cols_map = {
@@ -126,9 +125,8 @@ def stock_industry_change_cninfo(
         "sdate": "-".join([start_date[:4], start_date[4:6], start_date[6:]]),
         "edate": "-".join([end_date[:4], end_date[4:6], end_date[6:]]),
     }
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -146,7 +144,7 @@ def stock_industry_change_cninfo(
         "Chrome/93.0.4577.63 Safari/537.36",
         "X-Requested-With": "XMLHttpRequest",
     }
-    r = requests.post(url, params=params, headers=headers)
+    r = request_post(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["records"])
     cols_map = {
@@ -9,9 +9,9 @@ http://www.swhyresearch.com/institute_sw/allIndex/downloadCenter/industryType
 import io
 
 import pandas as pd
-import requests
 
 from akshare.utils.cons import headers
+from akshare.utils.request import request_get
 
 
 def stock_industry_clf_hist_sw() -> pd.DataFrame:
@@ -22,7 +22,7 @@ def stock_industry_clf_hist_sw() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://www.swsresearch.com/swindex/pdf/SwClass2021/StockClassifyUse_stock.xls"  # 此处为 https
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     temp_df = pd.read_excel(
         io.BytesIO(r.content), dtype={"股票代码": "str", "行业代码": "str"}
     )
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/5/27 15:30
+Date: 2026/10/18 15:00
 Desc: 股票基本信息
 """
 
@@ -12,8 +12,9 @@ from io import BytesIO
 from io import StringIO
 
 import pandas as pd
-import requests
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get, request_post
+from akshare.utils.func import ChunkAccumulator
 
 
 @lru_cache()
@@ -39,7 +40,7 @@ def stock_info_sz_name_code(symbol: str = "A股列表") -> pd.DataFrame:
         "TABKEY": indicator_map[symbol],
         "random": "0.6935816432433362",
     }
-    r = requests.get(url, params=params, timeout=15)
+    r = request_get(url, params=params, timeout=15)
     with warnings.catch_warnings(record=True):
         warnings.simplefilter("always")
         temp_df = pd.read_excel(BytesIO(r.content))
@@ -152,7 +153,7 @@ def stock_info_sh_name_code(symbol: str = "主板A股") -> pd.DataFrame:
         "pageHelp.pageNo": "1",
         "pageHelp.endPage": "1",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"])
     col_stock_code = "B_STOCK_CODE" if symbol == "主板B股" else "A_STOCK_CODE"
@@ -202,20 +203,21 @@ def stock_info_bj_name_code() -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/110.0.0.0 Safari/537.36"
     }
-    r = requests.post(url, data=payload, headers=headers)
+    r = request_post(url, data=payload, headers=headers)
     data_text = r.text
     data_json = json.loads(data_text[data_text.find("[") : -1])
     total_page = data_json[0]["totalPages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(total_page), leave=False):
         payload.update({"page": page})
-        r = requests.post(url, data=payload, headers=headers)
+        r = request_post(url, data=payload, headers=headers)
         data_text = r.text
         data_json = json.loads(data_text[data_text.find("[") : -1])
         temp_df = data_json[0]["content"]
         temp_df = pd.DataFrame(temp_df)
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "上市日期",
         "-",
@@ -325,7 +327,7 @@ def stock_info_sh_delist(symbol: str = "全部") -> pd.DataFrame:
         "pageHelp.pageNo": "1",
         "pageHelp.endPage": "1",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"])
     temp_df.rename(
@@ -369,7 +371,7 @@ def stock_info_sz_delist(symbol: str = "终止上市公司") -> pd.DataFrame:
         "TABKEY": indicator_map[symbol],
         "random": "0.6935816432433362",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     with warnings.catch_warnings(record=True):
         warnings.simplefilter("always")
         temp_df = pd.read_excel(BytesIO(r.content))
@@ -398,7 +400,7 @@ def stock_info_sz_change_name(symbol: str = "全称变更") -> pd.DataFrame:
         "TABKEY": indicator_map[symbol],
         "random": "0.6935816432433362",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     with warnings.catch_warnings(record=True):
         warnings.simplefilter("always")
         temp_df = pd.read_excel(BytesIO(r.content))
@@ -418,7 +420,7 @@ def stock_info_change_name(symbol: str = "000503") -> pd.DataFrame:
     :rtype: list
     """
     url = f"https://vip.stock.finance.sina.com.cn/corp/go.php/vCI_CorpInfo/stockid/{symbol}.phtml"
-    r = requests.get(url)
+    r = request_get(url)
     temp_df = pd.read_html(StringIO(r.text))[3].iloc[:, :2]
     temp_df.dropna(inplace=True)
     temp_df.columns = ["item", "value"]
@@ -7,7 +7,8 @@ https://quote.eastmoney.com/concept/sh603777.html?from=classic
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def stock_individual_info_em(
@@ -37,7 +38,7 @@ def stock_individual_info_em(
         "f275,f276,f265,f266,f289,f290,f286,f285,f292,f293,f294,f295,f43",
         "secid": f"{market_code}.{symbol}",
     }
-    r = requests.get(url, params=params, timeout=timeout)
+    r = request_get(url, params=params, timeout=timeout)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json)
     temp_df.reset_index(inplace=True)
@@ -1,29 +1,140 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/10 18:00
+Date: 2026/10/18 15:00
 Desc: 东财财富-日内分时数据
 https://quote.eastmoney.com/f1.html?newcode=0.000001
 """
 
+import asyncio
+import datetime
 import json
+import os
+import queue
+import threading
+from collections import deque
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Union
 
 import pandas as pd
 import requests
 
+from akshare.utils.request import request_get
+from akshare.utils.store import (
+    DEFAULT_STORE_DIR,
+    ParquetAppender,
+    check_parquet_engine,
+    read_parquet_parts,
+)
 
-def __event_stream(url, params):
+_SSE_URL = "https://70.push2.eastmoney.com/api/qt/stock/details/sse"
+
+_SSE_PARAMS = {
+    "fields1": "f1,f2,f3,f4",
+    "fields2": "f51,f52,f53,f54,f55",
+    "mpi": "2000",
+    "ut": "bd1d9ddb04089700cf9c27f6f7426281",
+    "fltt": "2",
+    "pos": "-0",
+    "wbp2u": "|0|0|0|web",
+}
+
+_SIDE_MAP = {"2": "买盘", "1": "卖盘", "4": "中性盘"}
+
+
+def _event_stream(url, params, timeout=None, on_open=None):
     # 使用 stream=True 参数来启用流式请求
-    response = requests.get(url, params=params, stream=True)
+    response = request_get(url, params=params, stream=True, timeout=timeout)
+    if on_open is not None:
+        on_open(response)
     event_data = ""
+    try:
+        for line in response.iter_lines():
+            # 过滤掉保持连接的空行
+            if line:
+                event_data += line.decode() + "\n"
+            elif event_data:
+                yield event_data
+                event_data = ""
+    finally:
+        response.close()
+
+
+def _trade_date() -> str:
+    """
+    当前的交易日, 用于 Parquet 分片的目录名
+    :return: 交易日, 如 20261018
+    :rtype: str
+    """
+    return datetime.date.today().strftime("%Y%m%d")
+
+
+def _secid(symbol: str) -> str:
+    """
+    股票代码转换为东方财富的 secid, 已经是 secid 的原样返回
+    :param symbol: 股票代码, 如 000001 或 0.000001
+    :type symbol: str
+    :return: secid
+    :rtype: str
+    """
+    if "." in symbol:
+        return symbol
+    market_code = 1 if symbol.startswith("6") else 0
+    return f"{market_code}.{symbol}"
+
+
+def _parse_event(event: str) -> Optional[Dict]:
+    """
+    解析一个 SSE 事件, 心跳等没有数据的事件返回 None
+    :param event: 事件文本
+    :type event: str
+    :return: 接口返回的 JSON
+    :rtype: dict
+    """
+    data = "".join(
+        line[5:].strip() for line in event.splitlines() if line.startswith("data:")
+    )
+    return json.loads(data) if data else None
+
+
+def _details_frame(details: List[str]) -> pd.DataFrame:
+    """
+    成交明细转换为数据框
+    :param details: 形如 "09:25:00,11.28,3276,0,4" 的明细
+    :type details: list
+    :return: 分时数据
+    :rtype: pandas.DataFrame
+    """
+    temp_df = pd.DataFrame(
+        [item.split(",")[:5] for item in details],
+        columns=["时间", "成交价", "手数", "-", "买卖盘性质"],
+    )
+    temp_df["买卖盘性质"] = temp_df["买卖盘性质"].map(_SIDE_MAP)
+    temp_df = temp_df[["时间", "成交价", "手数", "买卖盘性质"]]
+    temp_df["成交价"] = pd.to_numeric(temp_df["成交价"], errors="coerce")
+    temp_df["手数"] = pd.to_numeric(temp_df["手数"], errors="coerce")
+    return temp_df
+
 
-    for line in response.iter_lines():
-        # 过滤掉保持连接的空行
-        if line:
-            event_data += line.decode() + "\n"
-        elif event_data:
-            yield event_data
-            event_data = ""
+def _advance_mark(mark: tuple, times: List[str]) -> tuple:
+    """
+    输出一批成交后的位置
+    :param mark: (交易日, 最后一笔成交时间, 该时间已输出的笔数)
+    :type mark: tuple
+    :param times: 新输出的成交时间, 按时间顺序
+    :type times: list
+    :return: 新的位置
+    :rtype: tuple
+    """
+    trade_date, last_time, repeat = mark
+    if not times:
+        return mark
+    if times[-1] != last_time:
+        last_time, repeat = times[-1], 0
+    for tick_time in reversed(times):
+        if tick_time != last_time:
+            break
+        repeat += 1
+    return trade_date, last_time, repeat
 
 
 def stock_intraday_em(symbol: str = "000001") -> pd.DataFrame:
@@ -35,41 +146,301 @@ def stock_intraday_em(symbol: str = "000001") -> pd.DataFrame:
     :return: 分时数据
     :rtype: pandas.DataFrame
     """
-    market_code = 1 if symbol.startswith("6") else 0
-    url = "https://70.push2.eastmoney.com/api/qt/stock/details/sse"
-    params = {
-        "fields1": "f1,f2,f3,f4",
-        "fields2": "f51,f52,f53,f54,f55",
-        "mpi": "2000",
-        "ut": "bd1d9ddb04089700cf9c27f6f7426281",
-        "fltt": "2",
-        "pos": "-0",
-        "secid": f"{market_code}.{symbol}",
-        "wbp2u": "|0|0|0|web",
-    }
-
-    big_df = pd.DataFrame()  # 创建一个空的 DataFrame
-
-    for event in __event_stream(url, params):
-        # 从每个事件的数据行中删除 "data: "，然后解析 JSON
-        event_json = json.loads(event.replace("data: ", ""))
-        # 将 JSON 数据转换为 DataFrame，然后添加到主 DataFrame 中
-        temp_df = pd.DataFrame(
-            [item.split(",") for item in event_json["data"]["details"]]
+    params = {**_SSE_PARAMS, "secid": _secid(symbol)}
+    details = []
+    for event in _event_stream(_SSE_URL, params):
+        # 第一个事件是当日的全量明细
+        event_json = _parse_event(event)
+        if event_json and event_json.get("data"):
+            details = event_json["data"]["details"]
+            break
+    return _details_frame(details)
+
+
+class IntradayTickStream:
+    """
+    东方财富-分时数据-持续推送
+    每个 secid 保持一个 SSE 长连接, 由后台线程读取; 迭代时按到达顺序输出增量成交明细,
+    每批为一个数据框, 包含 代码 列. 连接断开后自动重连, 重连时重新请求当日全量明细,
+    按已经输出的最后一笔成交时间及该时间已输出的笔数跳过已收到的部分, 全量明细比已输出的少
+    或只包含最近的部分成交时也不会重复输出; 交易日变化后重新计数.
+    最近 buffer_size 笔成交保存在环形缓冲区中; 指定 spill_dir 时每批成交同时追加写入
+    spill_dir/stock_intraday_em/交易日/secid/ 下的 Parquet 分片, 交易日取写入时的日期,
+    跨日后写入新的目录; 当日目录中已有的分片视为已经输出, 重新启动时不会重复输出和写入
+    """
+
+    def __init__(
+        self,
+        symbols: Union[str, List[str]],
+        buffer_size: int = 100000,
+        spill_dir: Optional[str] = None,
+        timeout: float = 30,
+        reconnect_delay: float = 1.0,
+        max_reconnects: Optional[int] = None,
+    ):
+        """
+        :param symbols: 股票代码或 secid, 多个代码用列表或逗号分隔
+        :type symbols: str or list
+        :param buffer_size: 环形缓冲区保留的成交笔数
+        :type buffer_size: int
+        :param spill_dir: Parquet 分片的根目录, 为 None 时不写入文件, 为 "" 时使用默认目录
+        :type spill_dir: str
+        :param timeout: 连接和读取超时时间（秒）, 超时视为断线并重连
+        :type timeout: float
+        :param reconnect_delay: 重连前的等待时间（秒）
+        :type reconnect_delay: float
+        :param max_reconnects: 每个连接的最大重连次数, 为 None 时不限制
+        :type max_reconnects: int
+        """
+        if isinstance(symbols, str):
+            symbols = symbols.split(",")
+        self.secids = list(dict.fromkeys(_secid(item.strip()) for item in symbols))
+        self.timeout = timeout
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnects = max_reconnects
+        self.positions = {secid: 0 for secid in self.secids}
+        # 每个 secid 已输出的 (交易日, 最后一笔成交时间, 该时间已输出的笔数)
+        self._marks = {secid: (_trade_date(), "", 0) for secid in self.secids}
+        self._buffer = deque(maxlen=buffer_size)
+        self._queue = queue.Queue(maxsize=1024)
+        self._stop = threading.Event()
+        self._threads = []
+        self._responses = {}
+        self._appenders = {}
+        self._spill_dates = {}
+        self._spill_root = None
+        if spill_dir is not None:
+            check_parquet_engine()
+            self._spill_root = os.path.join(
+                spill_dir or DEFAULT_STORE_DIR, "stock_intraday_em"
+            )
+            trade_date = _trade_date()
+            for secid in self.secids:
+                times = read_parquet_parts(
+                    os.path.join(self._spill_root, trade_date, secid), columns=["时间"]
+                )["时间"].tolist()
+                self.positions[secid] = len(times)
+                self._marks[secid] = _advance_mark((trade_date, "", 0), times)
+
+    def _appender(self, secid: str) -> ParquetAppender:
+        # 交易日变化时关闭旧的分片, 在新交易日的目录下写入
+        trade_date = _trade_date()
+        appender = self._appenders.get(secid)
+        if appender is not None and self._spill_dates[secid] != trade_date:
+            appender.close()
+            appender = None
+        if appender is None:
+            appender = ParquetAppender(
+                os.path.join(self._spill_root, trade_date, secid)
+            )
+            self._appenders[secid] = appender
+            self._spill_dates[secid] = trade_date
+        return appender
+
+    def _new_details(self, secid: str, event_json: Dict) -> List[str]:
+        data = event_json.get("data") or {}
+        details = data.get("details") or []
+        trade_date = _trade_date()
+        mark = self._marks[secid]
+        if mark[0] != trade_date:
+            mark = (trade_date, "", 0)
+            self.positions[secid] = 0
+        if event_json.get("full") == 1:
+            # 全量明细: 首次连接或重连, 可能被截短或只有最近的部分, 按成交时间跳过已输出的成交
+            _, last_time, repeat = mark
+            start = 0
+            for detail in details:
+                tick_time = detail.split(",", 1)[0]
+                if tick_time < last_time:
+                    start += 1
+                elif tick_time == last_time and repeat > 0:
+                    repeat -= 1
+                    start += 1
+                else:
+                    break
+            details = details[start:]
+        self._marks[secid] = _advance_mark(
+            mark, [item.split(",", 1)[0] for item in details]
         )
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-        break
+        self.positions[secid] += len(details)
+        return details
+
+    def _put(self, item) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self, secid: str) -> None:
+        params = {**_SSE_PARAMS, "secid": secid}
+        reconnects = 0
+        try:
+            while not self._stop.is_set():
+                try:
+                    for event in _event_stream(
+                        _SSE_URL,
+                        params,
+                        timeout=self.timeout,
+                        on_open=lambda r: self._responses.__setitem__(secid, r),
+                    ):
+                        event_json = _parse_event(event)
+                        if event_json:
+                            details = self._new_details(secid, event_json)
+                            if details:
+                                reconnects = 0
+                                self._publish(secid, details)
+                        if self._stop.is_set():
+                            return
+                except (requests.RequestException, ValueError):
+                    pass
+                except Exception:
+                    # close() 关闭连接时, 阻塞中的读取会抛出异常
+                    if not self._stop.is_set():
+                        raise
+                reconnects += 1
+                if self.max_reconnects is not None and reconnects > self.max_reconnects:
+                    return
+                self._stop.wait(self.reconnect_delay)
+        finally:
+            self._put((secid, None))
+
+    def _publish(self, secid: str, details: List[str]) -> None:
+        temp_df = _details_frame(details)
+        temp_df.insert(0, "代码", secid.split(".", 1)[-1])
+        self._buffer.extend(temp_df.itertuples(index=False, name=None))
+        if self._spill_root is not None:
+            self._appender(secid).write(temp_df)
+        self._put((secid, temp_df))
+
+    def start(self) -> "IntradayTickStream":
+        """
+        启动后台连接
+        :return: 数据流对象
+        :rtype: IntradayTickStream
+        """
+        if not self._threads:
+            self._threads = [
+                threading.Thread(target=self._run, args=(secid,), daemon=True)
+                for secid in self.secids
+            ]
+            for thread in self._threads:
+                thread.start()
+        return self
 
-    big_df.columns = ["时间", "成交价", "手数", "-", "买卖盘性质"]
-    big_df["买卖盘性质"] = big_df["买卖盘性质"].map(
-        {"2": "买盘", "1": "卖盘", "4": "中性盘"}
+    def close(self) -> None:
+        """
+        断开全部连接并关闭 Parquet 分片
+        :return: None
+        :rtype: None
+        """
+        self._stop.set()
+        for response in list(self._responses.values()):
+            response.close()
+        for thread in self._threads:
+            thread.join()
+        for appender in self._appenders.values():
+            appender.close()
+
+    def buffer(self) -> pd.DataFrame:
+        """
+        环形缓冲区中最近的成交明细
+        :return: 分时数据
+        :rtype: pandas.DataFrame
+        """
+        return pd.DataFrame(
+            list(self._buffer), columns=["代码", "时间", "成交价", "手数", "买卖盘性质"]
+        )
+
+    def _next_batch(self, alive: set) -> Optional[pd.DataFrame]:
+        while alive:
+            try:
+                secid, temp_df = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return None
+                continue
+            if temp_df is None:
+                alive.discard(secid)
+            else:
+                return temp_df
+        return None
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        self.start()
+        alive = set(self.secids)
+        try:
+            while True:
+                temp_df = self._next_batch(alive)
+                if temp_df is None:
+                    return
+                yield temp_df
+        finally:
+            self.close()
+
+    async def __aiter__(self) -> AsyncIterator[pd.DataFrame]:
+        self.start()
+        alive = set(self.secids)
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                temp_df = await loop.run_in_executor(None, self._next_batch, alive)
+                if temp_df is None:
+                    return
+                yield temp_df
+        finally:
+            self.close()
+
+    def __enter__(self) -> "IntradayTickStream":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def stock_intraday_em_stream(
+    symbol: Union[str, List[str]] = "000001",
+    buffer_size: int = 100000,
+    spill_dir: Optional[str] = None,
+    timeout: float = 30,
+    reconnect_delay: float = 1.0,
+    max_reconnects: Optional[int] = None,
+) -> IntradayTickStream:
+    """
+    东方财富-分时数据-持续推送; 迭代(for 或 async for)返回的对象得到增量成交明细
+    https://quote.eastmoney.com/f1.html?newcode=0.000001
+    :param symbol: 股票代码或 secid, 多个代码用列表或逗号分隔
+    :type symbol: str or list
+    :param buffer_size: 环形缓冲区保留的成交笔数
+    :type buffer_size: int
+    :param spill_dir: Parquet 分片的根目录, 为 None 时不写入文件, 为 "" 时使用默认目录
+    :type spill_dir: str
+    :param timeout: 连接和读取超时时间（秒）
+    :type timeout: float
+    :param reconnect_delay: 重连前的等待时间（秒）
+    :type reconnect_delay: float
+    :param max_reconnects: 每个连接的最大重连次数, 为 None 时不限制
+    :type max_reconnects: int
+    :return: 数据流对象
+    :rtype: IntradayTickStream
+    """
+    return IntradayTickStream(
+        symbols=symbol,
+        buffer_size=buffer_size,
+        spill_dir=spill_dir,
+        timeout=timeout,
+        reconnect_delay=reconnect_delay,
+        max_reconnects=max_reconnects,
     )
-    big_df = big_df[["时间", "成交价", "手数", "买卖盘性质"]]
-    big_df["成交价"] = pd.to_numeric(big_df["成交价"], errors="coerce")
-    big_df["手数"] = pd.to_numeric(big_df["手数"], errors="coerce")
-    return big_df
 
 
 if __name__ == "__main__":
     stock_intraday_em_df = stock_intraday_em(symbol="000001")
     print(stock_intraday_em_df)
+
+    for stock_intraday_em_stream_df in stock_intraday_em_stream(
+        symbol=["000001", "600000"]
+    ):
+        print(stock_intraday_em_stream_df)
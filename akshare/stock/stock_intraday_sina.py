@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/9/28 13:30
+Date: 2026/10/18 15:00
 Desc: 新浪财经-日内分时数据
 https://quote.eastmoney.com/f1.html?newcode=0.000001
 """
@@ -9,9 +9,10 @@ https://quote.eastmoney.com/f1.html?newcode=0.000001
 import math
 
 import pandas as pd
-import requests
 
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def stock_intraday_sina(
@@ -44,18 +45,19 @@ def stock_intraday_sina(
         "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/107.0.0.0 Safari/537.36",
     }
-    r = requests.get(url=url, params=params, headers=headers)
+    r = request_get(url=url, params=params, headers=headers)
     data_json = r.json()
     total_page = math.ceil(int(data_json) / 60)
     url = "https://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/CN_Bill.GetBillList"
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"page": page})
-        r = requests.get(url=url, params=params, headers=headers)
+        r = request_get(url=url, params=params, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.sort_values(by=["ticktime"], inplace=True, ignore_index=True)
     big_df["price"] = pd.to_numeric(big_df["price"], errors="coerce")
     big_df["volume"] = pd.to_numeric(big_df["volume"], errors="coerce")
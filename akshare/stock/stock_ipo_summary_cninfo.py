@@ -7,10 +7,10 @@ https://webapi.cninfo.com.cn/#/company
 """
 
 import pandas as pd
-import requests
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
+from akshare.utils.request import request_post
+from akshare.utils.js_pool import get_js_pool
 
 
 def _get_file_content_ths(file: str = "cninfo.js") -> str:
@@ -40,9 +40,8 @@ def stock_ipo_summary_cninfo(symbol: str = "600030") -> pd.DataFrame:
     params = {
         "scode": symbol,
     }
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("cninfo.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     mcode = js_code.call("getResCode1")
     headers = {
         "Accept": "*/*",
@@ -58,7 +57,7 @@ def stock_ipo_summary_cninfo(symbol: str = "600030") -> pd.DataFrame:
         "Referer": "https://webapi.cninfo.com.cn/",
         "X-Requested-With": "XMLHttpRequest",
     }
-    r = requests.post(url, params=params, headers=headers)
+    r = request_post(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame.from_dict(data_json["records"][0], orient="index").T
     temp_df.columns = [
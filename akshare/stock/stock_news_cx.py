@@ -7,7 +7,8 @@ https://cxdata.caixin.com/pc/
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def stock_news_main_cx() -> pd.DataFrame:
@@ -27,7 +28,7 @@ def stock_news_main_cx() -> pd.DataFrame:
         "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36",
         "referer": "https://cxdata.caixin.com/index/newsTab?tab=latest",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"]["data"])
     temp_df = temp_df[["tag", "summary", "url"]]
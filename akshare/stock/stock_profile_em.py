@@ -7,7 +7,8 @@ https://emweb.securities.eastmoney.com/PC_HKF10/pages/home/index.html?code=03900
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def stock_hk_security_profile_em(symbol: str = "03900") -> pd.DataFrame:
@@ -35,7 +36,7 @@ def stock_hk_security_profile_em(symbol: str = "03900") -> pd.DataFrame:
         "client": "PC",
         "v": "04748497219912483",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     field_mapping = {
@@ -101,7 +102,7 @@ def stock_hk_company_profile_em(symbol: str = "03900") -> pd.DataFrame:
         "client": "PC",
         "v": "04748497219912483",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     field_mapping = {
@@ -178,7 +179,7 @@ def stock_hk_financial_indicator_em(symbol: str = "03900") -> pd.DataFrame:
         "client": "PC",
         "v": "07945646099062258",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     field_mapping = {
@@ -258,7 +259,7 @@ def stock_hk_dividend_payout_em(symbol: str = "03900") -> pd.DataFrame:
         "client": "PC",
         "v": "035584639294227527",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
 
     field_mapping = {
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/11/8 17:00
+Date: 2026/10/18 15:00
 Desc: 董监高及相关人员持股变动
 北京证券交易所-信息披露-监管信息-董监高及相关人员持股变动
 https://www.bse.cn/disclosure/djg_sharehold_change.html
@@ -14,9 +14,11 @@ https://www.sse.com.cn/disclosure/credibility/supervision/change/
 import json
 
 import pandas as pd
-import requests
 from tqdm import tqdm
 
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
+
 
 def stock_share_hold_change_sse(symbol: str = "600000") -> pd.DataFrame:
     """
@@ -49,10 +51,10 @@ def stock_share_hold_change_sse(symbol: str = "600000") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/93.0.4577.63 Safari/537.36",
     }
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     total_page = data_json["pageHelp"]["pageCount"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
             {
@@ -61,10 +63,11 @@ def stock_share_hold_change_sse(symbol: str = "600000") -> pd.DataFrame:
                 "pageHelp.endPage": page,
             }
         )
-        r = requests.get(url, headers=headers, params=params)
+        r = request_get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"])
-        big_df = pd.concat(objs=[big_df, temp_df], axis=0, ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.rename(
         columns={
             "STOCK_TYPE": "股票种类",
@@ -137,20 +140,21 @@ def stock_share_hold_change_szse(symbol: str = "全部") -> pd.DataFrame:
         "random": "0.7874198771222201",
     }
     params if symbol == "全部" else params.update({"txtDMorJC": symbol})
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     total_page = data_json[0]["metadata"]["pagecount"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
             {
                 "PAGENO": page,
             }
         )
-        r = requests.get(url, headers=headers, params=params)
+        r = request_get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json[0]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], axis=0, ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.rename(
         columns={
             "zqdm": "证券代码",
@@ -218,24 +222,25 @@ def stock_share_hold_change_bse(symbol: str = "430489") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/93.0.4577.63 Safari/537.36",
     }
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_text = r.text
     data_text = data_text.strip("null(").strip(")")
     data_json = json.loads(data_text)
     total_page = data_json[0]["result"]["totalPages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in tqdm(range(0, total_page), leave=False):
         params.update(
             {
                 "page": page,
             }
         )
-        r = requests.get(url, headers=headers, params=params)
+        r = request_get(url, headers=headers, params=params)
         data_text = r.text
         data_text = data_text.strip("null(").strip(")")
         data_json = json.loads(data_text)
         temp_df = pd.DataFrame(data_json[0]["result"]["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], axis=0, ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.rename(
         columns={
             "changeAmount": "变动股数",
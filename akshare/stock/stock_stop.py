@@ -7,7 +7,8 @@ https://quote.eastmoney.com/center/gridlist.html#staq_net_board
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def stock_staq_net_stop() -> pd.DataFrame:
@@ -30,7 +31,7 @@ def stock_staq_net_stop() -> pd.DataFrame:
         "fs": "m:0 s:3",
         "fields": "f12,f14",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"]["diff"]).T
     temp_df.reset_index(inplace=True)
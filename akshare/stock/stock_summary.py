@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/5/5 00:00
+Date: 2026/10/18 15:00
 Desc: 股票数据-总貌-市场总貌
 股票数据-总貌-成交概括
 https://www.szse.cn/market/overview/index.html
@@ -12,9 +12,11 @@ import warnings
 from io import BytesIO, StringIO
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
+from akshare.utils import jsonp
+from akshare.utils.request import request_get
+
 
 def stock_szse_summary(date: str = "20240830") -> pd.DataFrame:
     """
@@ -33,7 +35,7 @@ def stock_szse_summary(date: str = "20240830") -> pd.DataFrame:
         "txtQueryDate": "-".join([date[:4], date[4:6], date[6:]]),
         "random": "0.39339437497296137",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     with warnings.catch_warnings(record=True):
         warnings.simplefilter("always")
         temp_df = pd.read_excel(BytesIO(r.content), engine="openpyxl")
@@ -64,7 +66,7 @@ def stock_szse_area_summary(date: str = "202203") -> pd.DataFrame:
         "DATETIME": "-".join([date[:4], date[4:6]]),
         "random": "0.39349437497296137",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     with warnings.catch_warnings(record=True):
         warnings.simplefilter("always")
         temp_df = pd.read_excel(BytesIO(r.content), engine="openpyxl")
@@ -118,14 +120,14 @@ def stock_szse_sector_summary(
     :rtype: pandas.DataFrame
     """
     url = "https://www.szse.cn/market/periodical/month/index.html"
-    r = requests.get(url)
+    r = request_get(url)
     r.encoding = "utf8"
     soup = BeautifulSoup(r.text, features="lxml")
     tags_list = soup.find_all(name="div", attrs={"class": "g-container"})[1].find_all(
         "script"
     )
     tags_dict = [
-        eval(
+        jsonp.loads(
             item.string[item.string.find("{") : item.string.find("}") + 1]
             .replace("\n", "")
             .replace(" ", "")
@@ -142,7 +144,7 @@ def stock_szse_sector_summary(
     )
     date_format = "-".join([date[:4], date[4:]])
     url = f"https://www.szse.cn/market/periodical/month/{date_url_dict[date_format]}"
-    r = requests.get(url)
+    r = request_get(url)
     r.encoding = "utf8"
     soup = BeautifulSoup(r.text, features="lxml")
     url = [
@@ -150,7 +152,7 @@ def stock_szse_sector_summary(
     ][0]["href"]
 
     if symbol == "当月":
-        r = requests.get(url)
+        r = request_get(url)
         temp_df = pd.read_html(StringIO(r.text), encoding="gbk")[0]
         temp_df.columns = [
             "项目名称",
@@ -213,7 +215,7 @@ def stock_sse_summary() -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/89.0.4389.90 Safari/537.36",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]).T
     temp_df.reset_index(inplace=True)
@@ -260,7 +262,7 @@ def stock_sse_deal_daily(date: str = "20241216") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/89.0.4389.90 Safari/537.36",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"])
     temp_df = temp_df.T
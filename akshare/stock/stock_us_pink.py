@@ -1,15 +1,16 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/6/17 14:00
+Date: 2026/10/18 15:00
 Desc: 东方财富网-行情中心-美股市场-粉单市场
 https://quote.eastmoney.com/center/gridlist.html#us_pinksheet
 """
 
 import pandas as pd
-import requests
 
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def stock_us_pink_spot_em() -> pd.DataFrame:
@@ -34,19 +35,20 @@ def stock_us_pink_spot_em() -> pd.DataFrame:
         "dect": "1",
         "ut": "bd1d9ddb04089700cf9c27f6f7426281",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     import math
 
     total_page = math.ceil(data_json["data"]["total"] / 100)
     tqdm = get_tqdm()
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pn": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["diff"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "_",
         "最新价",
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/1/14 17:00
+Date: 2026/10/18 15:00
 Desc: 新浪财经-美股实时行情数据和历史行情数据
 https://finance.sina.com.cn/stock/usstock/sector.shtml
 """
@@ -10,17 +10,19 @@ import json
 from functools import lru_cache
 
 import pandas as pd
-import requests
-import py_mini_racer
 from tqdm import tqdm
 
 from akshare.stock.cons import (
     js_hash_text,
-    zh_js_decode,
     us_sina_stock_list_url,
     us_sina_stock_dict_payload,
     us_sina_stock_hist_qfq_url,
 )
+from akshare.utils import jsonp
+from akshare.utils.request import request_get
+from akshare.utils.js_pool import get_js_pool
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.sina_decode import decode_sina
 
 
 @lru_cache()
@@ -35,11 +37,10 @@ def __get_us_page_count() -> int:
     us_js_decode = (
         f"US_CategoryService.getList?page={page}&num=20&sort=&asc=0&market=&id="
     )
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(js_hash_text)
+    js_code = get_js_pool(js_hash_text)
     dict_list = js_code.call("d", us_js_decode)  # 执行js解密代码
     us_sina_stock_dict_payload.update({"page": "{}".format(page)})
-    res = requests.get(
+    res = request_get(
         us_sina_stock_list_url.format(dict_list),
         params=us_sina_stock_dict_payload,
     )
@@ -60,7 +61,7 @@ def get_us_stock_name() -> pd.DataFrame:
     :return: stock's english name, chinese name and symbol
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     page_count = __get_us_page_count()
     for page in tqdm(range(1, page_count + 1), leave=False):
         us_js_decode = (
@@ -68,18 +69,16 @@ def get_us_stock_name() -> pd.DataFrame:
                 page
             )
         )
-        js_code = py_mini_racer.MiniRacer()
-        js_code.eval(js_hash_text)
+        js_code = get_js_pool(js_hash_text)
         dict_list = js_code.call("d", us_js_decode)  # 执行js解密代码
         us_sina_stock_dict_payload.update({"page": "{}".format(page)})
-        res = requests.get(
+        res = request_get(
             us_sina_stock_list_url.format(dict_list),
             params=us_sina_stock_dict_payload,
         )
         data_json = json.loads(res.text[res.text.find("({") + 1 : res.text.rfind(");")])
-        big_df = pd.concat(
-            objs=[big_df, pd.DataFrame(data_json["data"])], ignore_index=True
-        )
+        big_chunks.append(pd.DataFrame(data_json["data"]))
+    big_df = big_chunks.to_frame()
     return big_df[["name", "cname", "symbol"]]
 
 
@@ -90,7 +89,7 @@ def stock_us_spot() -> pd.DataFrame:
     :return: 美股所有股票实时行情
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     page_count = __get_us_page_count()
     for page in tqdm(range(1, page_count + 1), leave=False):
         # page = "1"
@@ -99,18 +98,16 @@ def stock_us_spot() -> pd.DataFrame:
                 page
             )
         )
-        js_code = py_mini_racer.MiniRacer()
-        js_code.eval(js_hash_text)
+        js_code = get_js_pool(js_hash_text)
         dict_list = js_code.call("d", us_js_decode)  # 执行js解密代码
         us_sina_stock_dict_payload.update({"page": "{}".format(page)})
-        res = requests.get(
+        res = request_get(
             us_sina_stock_list_url.format(dict_list),
             params=us_sina_stock_dict_payload,
         )
         data_json = json.loads(res.text[res.text.find("({") + 1 : res.text.rfind(");")])
-        big_df = pd.concat(
-            objs=[big_df, pd.DataFrame(data_json["data"])], ignore_index=True
-        )
+        big_chunks.append(pd.DataFrame(data_json["data"]))
+    big_df = big_chunks.to_frame()
     return big_df
 
 
@@ -129,19 +126,18 @@ def stock_us_daily(symbol: str = "FB", adjust: str = "") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = f"https://finance.sina.com.cn/staticdata/us/{symbol}"
-    res = requests.get(url)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(zh_js_decode)
-    dict_list = js_code.call("d", res.text.split("=")[1].split(";")[0].replace('"', ""))
-    data_df = pd.DataFrame(dict_list)
+    res = request_get(url)
+    data_df = pd.DataFrame(
+        decode_sina(res.text.split("=")[1].split(";")[0].replace('"', ""))
+    )
     data_df["date"] = pd.to_datetime(data_df["date"]).dt.date
     data_df.index = pd.to_datetime(data_df["date"])
     del data_df["amount"]
     del data_df["date"]
     data_df = data_df.astype("float")
     url = us_sina_stock_hist_qfq_url.format(symbol)
-    res = requests.get(url)
-    qfq_factor_df = pd.DataFrame(eval(res.text.split("=")[1].split("\n")[0])["data"])
+    res = request_get(url)
+    qfq_factor_df = pd.DataFrame(jsonp.loads_jsonp(res.text)["data"])
     qfq_factor_df.rename(
         columns={
             "c": "adjust",
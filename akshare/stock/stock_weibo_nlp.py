@@ -14,7 +14,8 @@ import time
 from typing import Dict
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def stock_js_weibo_nlp_time() -> Dict:
@@ -42,7 +43,7 @@ def stock_js_weibo_nlp_time() -> Dict:
         "accept-language": "zh-CN,zh;q=0.9,en;q=0.8",
     }
 
-    r = requests.get(url, headers=headers, data=payload)
+    r = request_get(url, headers=headers, data=payload)
     return r.json()["data"]["timescale"]
 
 
@@ -74,7 +75,7 @@ def stock_js_weibo_report(time_period: str = "CNHOUR12") -> pd.DataFrame:
         "accept-language": "zh-CN,zh;q=0.9,en;q=0.8",
     }
 
-    r = requests.get(url, params=payload, headers=headers)
+    r = request_get(url, params=payload, headers=headers)
     temp_df = pd.DataFrame(r.json()["data"])
     temp_df["rate"] = pd.to_numeric(temp_df["rate"])
     return temp_df
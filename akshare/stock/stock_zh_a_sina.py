@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2026/1/9 22:00
+Date: 2026/10/18 15:00
 Desc: 新浪财经-A股-实时行情数据和历史行情数据(包含前复权和后复权因子)
 https://finance.sina.com.cn/realstock/company/sh689009/nc.shtml
 """
@@ -10,21 +10,24 @@ import json
 import re
 
 import pandas as pd
-import py_mini_racer
-import requests
 
+from akshare.cache import cached, history_ttl
 from akshare.stock.cons import (
     zh_sina_a_stock_payload,
     zh_sina_a_stock_url,
     zh_sina_a_stock_count_url,
     zh_sina_a_stock_hist_url,
-    hk_js_decode,
     zh_sina_a_stock_hfq_url,
     zh_sina_a_stock_qfq_url,
     zh_sina_a_stock_amount_url,
 )
-from akshare.utils import demjson
+from akshare.utils import jsonp
+from akshare.utils.adjust import PRICE_COLUMNS, asof_factor
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.sina_hq import fetch_hq
+from akshare.utils.sina_decode import decode_sina
+from akshare.utils.func import ChunkAccumulator
 
 
 def _get_zh_a_page_count() -> int:
@@ -34,7 +37,7 @@ def _get_zh_a_page_count() -> int:
     :return: 需要采集的股票总页数
     :rtype: int
     """
-    res = requests.get(zh_sina_a_stock_count_url)
+    res = request_get(zh_sina_a_stock_count_url)
     page_count = int(re.findall(re.compile(r"\d+"), res.text)[0]) / 80
     if isinstance(page_count, int):
         return page_count
@@ -49,7 +52,7 @@ def stock_zh_a_spot() -> pd.DataFrame:
     :return: 所有股票的实时行情数据
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     page_count = _get_zh_a_page_count()
     zh_sina_stock_payload_copy = zh_sina_a_stock_payload.copy()
     tqdm = get_tqdm()
@@ -57,9 +60,10 @@ def stock_zh_a_spot() -> pd.DataFrame:
         range(1, page_count + 1), leave=False, desc="Please wait for a moment"
     ):
         zh_sina_stock_payload_copy.update({"page": page})
-        r = requests.get(zh_sina_a_stock_url, params=zh_sina_stock_payload_copy)
-        data_json = demjson.decode(r.text)
-        big_df = pd.concat(objs=[big_df, pd.DataFrame(data_json)], ignore_index=True)
+        r = request_get(zh_sina_a_stock_url, params=zh_sina_stock_payload_copy)
+        data_json = jsonp.loads(r.text)
+        big_chunks.append(pd.DataFrame(data_json))
+    big_df = big_chunks.to_frame()
 
     big_df = big_df.astype(
         {
@@ -124,63 +128,89 @@ def stock_zh_a_spot() -> pd.DataFrame:
     return big_df
 
 
-def stock_zh_a_daily(
-    symbol: str = "sh603843",
-    start_date: str = "19900101",
-    end_date: str = "21000118",
-    adjust: str = "",
-) -> pd.DataFrame:
+_OHLCVA_COLUMNS = ["open", "high", "low", "close", "volume", "amount"]
+
+
+def _zh_a_fq_factor(symbol: str, method: str) -> pd.DataFrame:
     """
-    新浪财经-A 股-个股的历史行情数据, 大量抓取容易封 IP
-    https://finance.sina.com.cn/realstock/company/sh603843/nc.shtml
+    新浪财经-A 股-复权因子
     :param symbol: sh600000
     :type symbol: str
-    :param start_date: 20201103; 开始日期
-    :type start_date: str
-    :param end_date: 20201103; 结束日期
-    :type end_date: str
-    :param adjust: 默认为空: 返回不复权的数据; qfq: 返回前复权后的数据; hfq: 返回后复权后的数据; hfq-factor: 返回后复权因子; qfq-factor: 返回前复权因子
-    :type adjust: str
-    :return: 行情数据
+    :param method: choice of {"qfq", "hfq"}
+    :type method: str
+    :return: 复权因子, 每行为一次除权除息后生效的因子
+    :rtype: pandas.DataFrame
+    """
+    url = zh_sina_a_stock_hfq_url if method == "hfq" else zh_sina_a_stock_qfq_url
+    r = request_get(url.format(symbol))
+    factor_df = pd.DataFrame(jsonp.loads_jsonp(r.text)["data"])
+    if factor_df.shape[0] == 0:
+        raise ValueError(f"sina {method} factor not available")
+    factor_df.columns = ["date", f"{method}_factor"]
+    factor_df.index = pd.to_datetime(factor_df.date)
+    del factor_df["date"]
+    factor_df.reset_index(inplace=True)
+    return factor_df
+
+
+def _zh_a_share_amount(symbol: str) -> pd.DataFrame:
+    """
+    新浪财经-A 股-个股的流通股本变动
+    :param symbol: sh600000
+    :type symbol: str
+    :return: 以变动日期为索引的流通股本(万股)
     :rtype: pandas.DataFrame
     """
+    r = request_get(zh_sina_a_stock_amount_url.format(symbol, symbol))
+    amount_data_json = jsonp.loads(r.text[r.text.find("[") : r.text.rfind("]") + 1])
+    amount_data_df = pd.DataFrame(amount_data_json)
+    amount_data_df.columns = ["date", "outstanding_share"]
+    amount_data_df.index = pd.to_datetime(amount_data_df.date)
+    del amount_data_df["date"]
+    return amount_data_df
 
-    def _fq_factor(method: str) -> pd.DataFrame:
-        if method == "hfq":
-            r = requests.get(zh_sina_a_stock_hfq_url.format(symbol))
-            hfq_factor_df = pd.DataFrame(
-                eval(r.text.split("=")[1].split("\n")[0])["data"]
-            )
-            if hfq_factor_df.shape[0] == 0:
-                raise ValueError("sina hfq factor not available")
-            hfq_factor_df.columns = ["date", "hfq_factor"]
-            hfq_factor_df.index = pd.to_datetime(hfq_factor_df.date)
-            del hfq_factor_df["date"]
-            hfq_factor_df.reset_index(inplace=True)
-            return hfq_factor_df
-        else:
-            r = requests.get(zh_sina_a_stock_qfq_url.format(symbol))
-            qfq_factor_df = pd.DataFrame(
-                eval(r.text.split("=")[1].split("\n")[0])["data"]
-            )
-            if qfq_factor_df.shape[0] == 0:
-                raise ValueError("sina hfq factor not available")
-            qfq_factor_df.columns = ["date", "qfq_factor"]
-            qfq_factor_df.index = pd.to_datetime(qfq_factor_df.date)
-            del qfq_factor_df["date"]
-            qfq_factor_df.reset_index(inplace=True)
-            return qfq_factor_df
 
-    if adjust in ("hfq-factor", "qfq-factor"):
-        return _fq_factor(adjust.split("-")[0])
-
-    r = requests.get(zh_sina_a_stock_hist_url.format(symbol))
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
-    data_df = pd.DataFrame(dict_list)
+def _zh_a_daily_quote(symbol: str) -> pd.DataFrame:
+    """
+    新浪财经-A 股-个股最近一个交易日的不复权行情, 来自实时行情接口, 字段与 _zh_a_daily_raw 一致;
+    另有 prevclose 列为前收盘价, 当日没有成交(如停牌)时返回空数据框
+    https://hq.sinajs.cn/list=sh600000
+    :param symbol: sh600000
+    :type symbol: str
+    :return: 以日期为索引的不复权行情
+    :rtype: pandas.DataFrame
+    """
+    fields = fetch_hq([symbol]).get(symbol) or []
+    columns = _OHLCVA_COLUMNS + ["outstanding_share", "turnover", "prevclose"]
+    if len(fields) < 31 or float(fields[8] or 0) == 0:
+        return pd.DataFrame(columns=columns)
+    temp_df = pd.DataFrame(
+        [[fields[i] for i in (1, 4, 5, 3, 8, 9, 2)]],
+        columns=_OHLCVA_COLUMNS + ["prevclose"],
+        index=pd.Index([pd.to_datetime(fields[30])], name="date"),
+    ).astype(float)
+    amount_data_df = _zh_a_share_amount(symbol).sort_index()
+    outstanding_share = amount_data_df["outstanding_share"].astype(float)
+    outstanding_share = outstanding_share[: temp_df.index[0]]
+    temp_df["outstanding_share"] = (
+        outstanding_share.iloc[-1] * 10000 if len(outstanding_share) else float("nan")
+    )
+    temp_df["turnover"] = temp_df["volume"] / temp_df["outstanding_share"]
+    return temp_df[columns]
+
+
+def _zh_a_daily_raw(symbol: str) -> pd.DataFrame:
+    """
+    新浪财经-A 股-个股的不复权历史行情, 合并流通股本并计算换手率
+    :param symbol: sh600000
+    :type symbol: str
+    :return: 以日期为索引的不复权行情
+    :rtype: pandas.DataFrame
+    """
+    r = request_get(zh_sina_a_stock_hist_url.format(symbol))
+    data_df = pd.DataFrame(
+        decode_sina(r.text.split("=")[1].split(";")[0].replace('"', ""))
+    )
     data_df.index = pd.to_datetime(data_df["date"]).dt.date
     del data_df["date"]
     try:
@@ -193,24 +223,11 @@ def stock_zh_a_daily(
     except:  # noqa: E722
         pass
     data_df = data_df.astype("float")
-    r = requests.get(zh_sina_a_stock_amount_url.format(symbol, symbol))
-    amount_data_json = demjson.decode(r.text[r.text.find("[") : r.text.rfind("]") + 1])
-    amount_data_df = pd.DataFrame(amount_data_json)
-    amount_data_df.columns = ["date", "outstanding_share"]
-    amount_data_df.index = pd.to_datetime(amount_data_df.date)
-    del amount_data_df["date"]
+    amount_data_df = _zh_a_share_amount(symbol)
     temp_df = pd.merge(
         data_df, amount_data_df, left_index=True, right_index=True, how="outer"
     )
-    try:
-        # try for pandas >= 2.1.0
-        temp_df.ffill(inplace=True)
-    except Exception:
-        try:
-            temp_df.fillna(method="ffill", inplace=True)
-        except Exception as e:
-            print("Error:", e)
-
+    temp_df.ffill(inplace=True)
     temp_df = temp_df.astype(float)
     temp_df["outstanding_share"] = temp_df["outstanding_share"] * 10000
     temp_df["turnover"] = temp_df["volume"] / temp_df["outstanding_share"]
@@ -224,107 +241,77 @@ def stock_zh_a_daily(
         "outstanding_share",
         "turnover",
     ]
+    temp_df.index.name = "date"
+    return temp_df
+
+
+def _zh_a_daily_frame(
+    temp_df: pd.DataFrame, start_date: str, end_date: str
+) -> pd.DataFrame:
+    """
+    按日期截取行情, 价格保留两位小数, 日期转换为列
+    :param temp_df: 以日期为索引的行情
+    :type temp_df: pandas.DataFrame
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :return: 行情数据
+    :rtype: pandas.DataFrame
+    """
+    temp_df = temp_df[start_date:end_date].copy()
+    temp_df[PRICE_COLUMNS] = temp_df[PRICE_COLUMNS].round(2)
+    temp_df.dropna(inplace=True)
+    temp_df.drop_duplicates(inplace=True)
+    temp_df.reset_index(inplace=True)
+    temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
+    return temp_df
+
+
+@cached(ttl=history_ttl())
+def stock_zh_a_daily(
+    symbol: str = "sh603843",
+    start_date: str = "19900101",
+    end_date: str = "21000118",
+    adjust: str = "",
+) -> pd.DataFrame:
+    """
+    新浪财经-A 股-个股的历史行情数据, 大量抓取容易封 IP;
+    请求频率和熔断由 akshare.utils.rate_limit 按主机统一控制, 可用 set_rate_limit("finance.sina.com.cn", ...) 调整
+    https://finance.sina.com.cn/realstock/company/sh603843/nc.shtml
+    需要反复切换复权方式或以任意日期为基准前复权时, 可以使用 stock_zh_a_daily_local, 只在本地计算
+    :param symbol: sh600000
+    :type symbol: str
+    :param start_date: 20201103; 开始日期
+    :type start_date: str
+    :param end_date: 20201103; 结束日期
+    :type end_date: str
+    :param adjust: 默认为空: 返回不复权的数据; qfq: 返回前复权后的数据; hfq: 返回后复权后的数据; hfq-factor: 返回后复权因子; qfq-factor: 返回前复权因子
+    :type adjust: str
+    :return: 行情数据
+    :rtype: pandas.DataFrame
+    """
+    if adjust in ("hfq-factor", "qfq-factor"):
+        return _zh_a_fq_factor(symbol, adjust.split("-")[0])
+
+    temp_df = _zh_a_daily_raw(symbol)
     if adjust == "":
         temp_df = temp_df[start_date:end_date]
-        temp_df.drop_duplicates(
-            subset=["open", "high", "low", "close", "volume", "amount"], inplace=True
-        )
-        temp_df["open"] = round(temp_df["open"], 2)
-        temp_df["high"] = round(temp_df["high"], 2)
-        temp_df["low"] = round(temp_df["low"], 2)
-        temp_df["close"] = round(temp_df["close"], 2)
-        temp_df.dropna(inplace=True)
-        temp_df.drop_duplicates(inplace=True)
-        temp_df.reset_index(inplace=True)
-        temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-        return temp_df
-    if adjust == "hfq":
-        res = requests.get(zh_sina_a_stock_hfq_url.format(symbol))
-        hfq_factor_df = pd.DataFrame(
-            eval(res.text.split("=")[1].split("\n")[0])["data"]
-        )
-        hfq_factor_df.columns = ["date", "hfq_factor"]
-        hfq_factor_df.index = pd.to_datetime(hfq_factor_df.date)
-        del hfq_factor_df["date"]
-        temp_df = pd.merge(
-            temp_df,
-            hfq_factor_df,
-            left_index=True,
-            right_index=True,
-            how="outer",
-        )
-        try:
-            # try for pandas >= 2.1.0
-            temp_df.ffill(inplace=True)
-        except Exception:
-            try:
-                # try for pandas < 2.1.0
-                temp_df.fillna(method="ffill", inplace=True)
-            except Exception as e:
-                print("Error:", e)
-        temp_df = temp_df.astype(float)
-        temp_df.dropna(inplace=True)
-        temp_df.drop_duplicates(
-            subset=["open", "high", "low", "close", "volume", "amount"], inplace=True
-        )
-        temp_df["open"] = temp_df["open"] * temp_df["hfq_factor"]
-        temp_df["high"] = temp_df["high"] * temp_df["hfq_factor"]
-        temp_df["close"] = temp_df["close"] * temp_df["hfq_factor"]
-        temp_df["low"] = temp_df["low"] * temp_df["hfq_factor"]
-        temp_df = temp_df.iloc[:, :-1]
-        temp_df = temp_df[start_date:end_date]
-        temp_df["open"] = round(temp_df["open"], 2)
-        temp_df["high"] = round(temp_df["high"], 2)
-        temp_df["low"] = round(temp_df["low"], 2)
-        temp_df["close"] = round(temp_df["close"], 2)
-        temp_df.dropna(inplace=True)
-        temp_df.reset_index(inplace=True)
-        temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-        return temp_df
-
-    if adjust == "qfq":
-        res = requests.get(zh_sina_a_stock_qfq_url.format(symbol))
-        qfq_factor_df = pd.DataFrame(
-            eval(res.text.split("=")[1].split("\n")[0])["data"]
-        )
-        qfq_factor_df.columns = ["date", "qfq_factor"]
-        qfq_factor_df.index = pd.to_datetime(qfq_factor_df.date)
-        del qfq_factor_df["date"]
-        temp_df = pd.merge(
-            temp_df,
-            qfq_factor_df,
-            left_index=True,
-            right_index=True,
-            how="outer",
-        )
-        try:
-            # try for pandas >= 2.1.0
-            temp_df.ffill(inplace=True)
-        except Exception:
-            try:
-                # try for pandas < 2.1.0
-                temp_df.fillna(method="ffill", inplace=True)
-            except Exception as e:
-                print("Error:", e)
-        temp_df = temp_df.astype(float)
-        temp_df.dropna(inplace=True)
-        temp_df.drop_duplicates(
-            subset=["open", "high", "low", "close", "volume", "amount"], inplace=True
+    else:
+        temp_df = temp_df.dropna()
+    temp_df = temp_df.drop_duplicates(subset=_OHLCVA_COLUMNS)
+    if adjust in ("hfq", "qfq"):
+        factor_df = _zh_a_fq_factor(symbol, adjust)
+        factor = asof_factor(
+            temp_df.index,
+            factor_df["date"],
+            factor_df[f"{adjust}_factor"].astype(float),
         )
-        temp_df["open"] = temp_df["open"] / temp_df["qfq_factor"]
-        temp_df["high"] = temp_df["high"] / temp_df["qfq_factor"]
-        temp_df["close"] = temp_df["close"] / temp_df["qfq_factor"]
-        temp_df["low"] = temp_df["low"] / temp_df["qfq_factor"]
-        temp_df = temp_df.iloc[:, :-1]
-        temp_df = temp_df[start_date:end_date]
-        temp_df["open"] = round(temp_df["open"], 2)
-        temp_df["high"] = round(temp_df["high"], 2)
-        temp_df["low"] = round(temp_df["low"], 2)
-        temp_df["close"] = round(temp_df["close"], 2)
-        temp_df.dropna(inplace=True)
-        temp_df.reset_index(inplace=True)
-        temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-        return temp_df
+        # 后复权价格 = 价格 * 后复权因子; 前复权价格 = 价格 / 前复权因子
+        if adjust == "qfq":
+            factor = 1 / factor
+        temp_df[PRICE_COLUMNS] = temp_df[PRICE_COLUMNS].to_numpy() * factor[:, None]
+    return _zh_a_daily_frame(temp_df, start_date, end_date)
 
 
 def stock_zh_a_cdr_daily(
@@ -344,13 +331,10 @@ def stock_zh_a_cdr_daily(
     :return: specific data
     :rtype: pandas.DataFrame
     """
-    res = requests.get(zh_sina_a_stock_hist_url.format(symbol))
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", res.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
-    data_df = pd.DataFrame(dict_list)
+    res = request_get(zh_sina_a_stock_hist_url.format(symbol))
+    data_df = pd.DataFrame(
+        decode_sina(res.text.split("=")[1].split(";")[0].replace('"', ""))
+    )
     data_df.index = pd.to_datetime(data_df["date"])
     del data_df["date"]
     data_df = data_df.astype("float")
@@ -388,7 +372,7 @@ def stock_zh_a_minute(
         "ma": "no",
         "datalen": "1970",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     try:
         data_json = json.loads(data_text.split("=(")[1].split(");")[0])
@@ -401,7 +385,7 @@ def stock_zh_a_minute(
             "ma": "no",
             "datalen": "1970",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         data_json = json.loads(data_text.split("=(")[1].split(");")[0])
         temp_df = pd.DataFrame(data_json).iloc[:, :6]
@@ -1,7 +1,7 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2025/3/19 15:30
+Date: 2026/10/18 15:00
 Desc: 新股和风险警示股
 新浪-行情中心-沪深股市-次新股
 https://vip.stock.finance.sina.com.cn/mkt/#new_stock
@@ -12,9 +12,9 @@ https://quote.eastmoney.com/center/gridlist.html#st_board
 import math
 
 import pandas as pd
-import requests
 
-from akshare.utils.func import fetch_paginated_data
+from akshare.utils.func import ChunkAccumulator, fetch_paginated_data
+from akshare.utils.request import request_get
 
 
 def stock_zh_a_st_em() -> pd.DataFrame:
@@ -296,10 +296,10 @@ def stock_zh_a_new() -> pd.DataFrame:
     """
     url = "https://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getHQNodeStockCount"
     params = {"node": "new_stock"}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     total_page = math.ceil(int(r.json()) / 80)
     url = "https://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getHQNodeData"
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in range(1, total_page + 1):
         params = {
             "page": str(page),
@@ -310,11 +310,12 @@ def stock_zh_a_new() -> pd.DataFrame:
             "symbol": "",
             "_s_r_a": "page",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         r.encoding = "gb2312"
         data_json = r.json()
         temp_df = pd.DataFrame(data_json)
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df = big_df[
         [
             "symbol",
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2023/10/27 22:08
+Date: 2026/10/18 15:00
 Desc: 腾讯-股票-实时行情-成交明细
 成交明细-每个交易日 16:00 提供当日数据
 港股报价延时 15 分钟
@@ -10,7 +10,10 @@ Desc: 腾讯-股票-实时行情-成交明细
 import warnings
 
 import pandas as pd
-import requests
+
+from akshare.utils import jsonp
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
 
 
 def stock_zh_a_tick_tx_js(symbol: str = "sz000001") -> pd.DataFrame:
@@ -22,7 +25,7 @@ def stock_zh_a_tick_tx_js(symbol: str = "sz000001") -> pd.DataFrame:
     :return: 历史分笔数据
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     page = 0
     warnings.warn("正在下载数据，请稍等")
     while True:
@@ -34,17 +37,20 @@ def stock_zh_a_tick_tx_js(symbol: str = "sz000001") -> pd.DataFrame:
                 "c": symbol,
                 "p": page,
             }
-            r = requests.get(url, params=params)
+            r = request_get(url, params=params)
             text_data = r.text
             temp_df = (
-                pd.DataFrame(eval(text_data[text_data.find("[") :])[1].split("|"))
+                pd.DataFrame(
+                    jsonp.loads_jsonp(text_data[text_data.find("[") :])[1].split("|")
+                )
                 .iloc[:, 0]
                 .str.split("/", expand=True)
             )
             page += 1
-            big_df = pd.concat([big_df, temp_df], ignore_index=True)
+            big_chunks.append(temp_df)
         except:  # noqa: E722
             break
+    big_df = big_chunks.to_frame()
     if not big_df.empty:
         big_df = big_df.iloc[:, 1:].copy()
         big_df.columns = [
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/2/26 15:10
+Date: 2026/10/18 15:00
 Desc: 腾讯财经-A+H股数据, 实时行情数据和历史行情数据(后复权)
 https://stockapp.finance.qq.com/mstats/#mod=list&id=hk_ah&module=HK&type=AH&sort=3&page=3&max=20
 """
@@ -9,7 +9,6 @@ https://stockapp.finance.qq.com/mstats/#mod=list&id=hk_ah&module=HK&type=AH&sort
 import random
 
 import pandas as pd
-import requests
 
 from akshare.stock.cons import (
     hk_url,
@@ -18,8 +17,10 @@ from akshare.stock.cons import (
     hk_stock_headers,
     hk_stock_payload,
 )
-from akshare.utils import demjson
+from akshare.utils import jsonp
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def _get_zh_stock_ah_page_count() -> int:
@@ -31,8 +32,8 @@ def _get_zh_stock_ah_page_count() -> int:
     """
     hk_payload_copy = hk_payload.copy()
     hk_payload_copy.update({"reqPage": 1})
-    r = requests.get(hk_url, params=hk_payload_copy, headers=hk_headers)
-    data_json = demjson.decode(r.text[r.text.find("{") : r.text.rfind("}") + 1])
+    r = request_get(hk_url, params=hk_payload_copy, headers=hk_headers)
+    data_json = jsonp.loads(r.text[r.text.find("{") : r.text.rfind("}") + 1])
     page_count = data_json["data"]["page_count"]
     return page_count
 
@@ -45,21 +46,18 @@ def stock_zh_ah_spot() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     page_count = _get_zh_stock_ah_page_count()
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for i in tqdm(range(0, page_count), leave=False):
         hk_payload.update({"reqPage": i})
-        r = requests.get(hk_url, params=hk_payload, headers=hk_headers)
-        data_json = demjson.decode(r.text[r.text.find("{") : r.text.rfind("}") + 1])
-        big_df = pd.concat(
-            objs=[
-                big_df,
-                pd.DataFrame(data_json["data"]["page_data"])
-                .iloc[:, 0]
-                .str.split("~", expand=True),
-            ],
-            ignore_index=True,
+        r = request_get(hk_url, params=hk_payload, headers=hk_headers)
+        data_json = jsonp.loads(r.text[r.text.find("{") : r.text.rfind("}") + 1])
+        big_chunks.append(
+            pd.DataFrame(data_json["data"]["page_data"])
+            .iloc[:, 0]
+            .str.split("~", expand=True)
         )
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "代码",
         "名称",
@@ -119,8 +117,8 @@ def stock_zh_ah_name() -> pd.DataFrame:
     tqdm = get_tqdm()
     for i in tqdm(range(0, page_count), leave=False):
         hk_payload.update({"reqPage": i})
-        r = requests.get(hk_url, params=hk_payload, headers=hk_headers)
-        data_json = demjson.decode(r.text[r.text.find("{") : r.text.rfind("}") + 1])
+        r = request_get(hk_url, params=hk_payload, headers=hk_headers)
+        data_json = jsonp.loads(r.text[r.text.find("{") : r.text.rfind("}") + 1])
         big_df = pd.concat(
             objs=[
                 big_df,
@@ -174,7 +172,7 @@ def stock_zh_ah_daily(
     :return: 指定股票在指定年份的日频率历史行情数据
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for year in tqdm(range(int(start_year), int(end_year)), leave=False):
         # year = "2003"
@@ -203,18 +201,18 @@ def stock_zh_ah_daily(
                 "Referer": "http://gu.qq.com/hk01033/gp",
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/84.0.4147.125 Safari/537.36",
             }
-            r = requests.get(
+            r = request_get(
                 url="http://web.ifzq.gtimg.cn/appstock/app/kline/kline",
                 params=hk_stock_payload_copy,
                 headers=headers,
             )
         else:
-            r = requests.get(
+            r = request_get(
                 url="https://web.ifzq.gtimg.cn/appstock/app/hkfqkline/get",
                 params=hk_stock_payload_copy,
                 headers=hk_stock_headers,
             )
-        data_json = demjson.decode(r.text[r.text.find("{") : r.text.rfind("}") + 1])
+        data_json = jsonp.loads(r.text[r.text.find("{") : r.text.rfind("}") + 1])
         try:
             if adjust == "":
                 temp_df = pd.DataFrame(data_json["data"][f"hk{symbol}"]["day"])
@@ -249,7 +247,8 @@ def stock_zh_ah_daily(
             except:  # noqa
                 temp_df.columns = ["日期", "开盘", "收盘", "最高", "最低", "成交量"]
             temp_df = temp_df[["日期", "开盘", "收盘", "最高", "最低", "成交量"]]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["日期"] = pd.to_datetime(big_df["日期"], errors="coerce").dt.date
     big_df["开盘"] = pd.to_numeric(big_df["开盘"], errors="coerce")
     big_df["收盘"] = pd.to_numeric(big_df["收盘"], errors="coerce")
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/7/22 18:30
+Date: 2026/10/18 15:00
 Desc: 新浪财经-B股-实时行情数据和历史行情数据(包含前复权和后复权因子)
 https://finance.sina.com.cn/realstock/company/sh689009/nc.shtml
 """
@@ -11,18 +11,18 @@ import re
 from functools import lru_cache
 
 import pandas as pd
-import requests
-import py_mini_racer
 
 from akshare.stock.cons import (
     zh_sina_a_stock_url,
     zh_sina_a_stock_hist_url,
-    hk_js_decode,
     zh_sina_a_stock_hfq_url,
     zh_sina_a_stock_qfq_url,
     zh_sina_a_stock_amount_url,
 )
-from akshare.utils import demjson
+from akshare.utils import jsonp
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
+from akshare.utils.sina_decode import decode_sina
 
 
 @lru_cache()
@@ -37,7 +37,7 @@ def _get_zh_b_page_count() -> int:
         "https://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/"
         "Market_Center.getHQNodeStockCount?node=hs_b"
     )
-    r = requests.get(url)
+    r = request_get(url)
     page_count = int(re.findall(re.compile(r"\d+"), r.text)[0]) / 80
     if isinstance(page_count, int):
         return page_count
@@ -62,12 +62,13 @@ def stock_zh_b_spot() -> pd.DataFrame:
         "symbol": "",
         "_s_r_a": "page",
     }
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in range(1, page_count + 1):
         zh_sina_stock_payload_copy.update({"page": page})
-        r = requests.get(zh_sina_a_stock_url, params=zh_sina_stock_payload_copy)
-        data_json = demjson.decode(r.text)
-        big_df = pd.concat(objs=[big_df, pd.DataFrame(data_json)], ignore_index=True)
+        r = request_get(zh_sina_a_stock_url, params=zh_sina_stock_payload_copy)
+        data_json = jsonp.loads(r.text)
+        big_chunks.append(pd.DataFrame(data_json))
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "代码",
         "_",
@@ -144,10 +145,8 @@ def stock_zh_b_daily(
 
     def _fq_factor(method: str) -> pd.DataFrame:
         if method == "hfq":
-            r = requests.get(zh_sina_a_stock_hfq_url.format(symbol))
-            hfq_factor_df = pd.DataFrame(
-                eval(r.text.split("=")[1].split("\n")[0])["data"]
-            )
+            r = request_get(zh_sina_a_stock_hfq_url.format(symbol))
+            hfq_factor_df = pd.DataFrame(jsonp.loads_jsonp(r.text)["data"])
             if hfq_factor_df.shape[0] == 0:
                 raise ValueError("sina hfq factor not available")
             hfq_factor_df.columns = ["date", "hfq_factor"]
@@ -156,10 +155,8 @@ def stock_zh_b_daily(
             hfq_factor_df.reset_index(inplace=True)
             return hfq_factor_df
         else:
-            r = requests.get(zh_sina_a_stock_qfq_url.format(symbol))
-            qfq_factor_df = pd.DataFrame(
-                eval(r.text.split("=")[1].split("\n")[0])["data"]
-            )
+            r = request_get(zh_sina_a_stock_qfq_url.format(symbol))
+            qfq_factor_df = pd.DataFrame(jsonp.loads_jsonp(r.text)["data"])
             if qfq_factor_df.shape[0] == 0:
                 raise ValueError("sina hfq factor not available")
             qfq_factor_df.columns = ["date", "qfq_factor"]
@@ -171,21 +168,18 @@ def stock_zh_b_daily(
     if adjust in ("hfq-factor", "qfq-factor"):
         return _fq_factor(adjust.split("-")[0])
 
-    r = requests.get(zh_sina_a_stock_hist_url.format(symbol))
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
-    )  # 执行js解密代码
-    data_df = pd.DataFrame(dict_list)
+    r = request_get(zh_sina_a_stock_hist_url.format(symbol))
+    data_df = pd.DataFrame(
+        decode_sina(r.text.split("=")[1].split(";")[0].replace('"', ""))
+    )
     data_df.index = pd.to_datetime(data_df["date"]).dt.date
     del data_df["date"]
     del data_df["amount"]
     del data_df["prevclose"]
 
     data_df = data_df.astype("float")
-    r = requests.get(zh_sina_a_stock_amount_url.format(symbol, symbol))
-    amount_data_json = demjson.decode(r.text[r.text.find("[") : r.text.rfind("]") + 1])
+    r = request_get(zh_sina_a_stock_amount_url.format(symbol, symbol))
+    amount_data_json = jsonp.loads(r.text[r.text.find("[") : r.text.rfind("]") + 1])
     amount_data_df = pd.DataFrame(amount_data_json)
     amount_data_df.index = pd.to_datetime(amount_data_df.date)
     del amount_data_df["date"]
@@ -220,8 +214,8 @@ def stock_zh_b_daily(
         return temp_df
 
     if adjust == "hfq":
-        r = requests.get(zh_sina_a_stock_hfq_url.format(symbol))
-        hfq_factor_df = pd.DataFrame(eval(r.text.split("=")[1].split("\n")[0])["data"])
+        r = request_get(zh_sina_a_stock_hfq_url.format(symbol))
+        hfq_factor_df = pd.DataFrame(jsonp.loads_jsonp(r.text)["data"])
         hfq_factor_df.columns = ["date", "hfq_factor"]
         hfq_factor_df.index = pd.to_datetime(hfq_factor_df.date)
         del hfq_factor_df["date"]
@@ -249,8 +243,8 @@ def stock_zh_b_daily(
         return temp_df
 
     if adjust == "qfq":
-        r = requests.get(zh_sina_a_stock_qfq_url.format(symbol))
-        qfq_factor_df = pd.DataFrame(eval(r.text.split("=")[1].split("\n")[0])["data"])
+        r = request_get(zh_sina_a_stock_qfq_url.format(symbol))
+        qfq_factor_df = pd.DataFrame(jsonp.loads_jsonp(r.text)["data"])
         qfq_factor_df.columns = ["date", "qfq_factor"]
         qfq_factor_df.index = pd.to_datetime(qfq_factor_df.date)
         del qfq_factor_df["date"]
@@ -301,7 +295,7 @@ def stock_zh_b_minute(
         "scale": period,
         "datalen": "1970",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     temp_df = pd.DataFrame(json.loads(r.text.split("=(")[1].split(");")[0])).iloc[:, :6]
     if temp_df.empty:
         return pd.DataFrame()
@@ -1,15 +1,17 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/7/21 18:00
+Date: 2026/10/18 15:00
 Desc: 科创板报告
 https://data.eastmoney.com/notices/kcb.html
 """
 
 import pandas as pd
-import requests
 from tqdm import tqdm
 
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
+
 
 def _stock_zh_kcb_report_em_page() -> int:
     """
@@ -28,7 +30,7 @@ def _stock_zh_kcb_report_em_page() -> int:
         "f_node": "0",
         "s_node": "0",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     page_num = int(
         int(data_json["data"]["total_hits"]) / int(data_json["data"]["page_size"])
@@ -49,7 +51,7 @@ def stock_zh_kcb_report_em(from_page: int = 1, to_page: int = 100) -> pd.DataFra
     """
     url = "https://np-anotice-stock.eastmoney.com/api/security/ann"
     total_page = _stock_zh_kcb_report_em_page()
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     if to_page >= total_page:
         to_page = total_page
     for i in tqdm(range(from_page, to_page + 1), leave=False):
@@ -62,7 +64,7 @@ def stock_zh_kcb_report_em(from_page: int = 1, to_page: int = 100) -> pd.DataFra
             "f_node": "0",
             "s_node": "0",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(
             [
@@ -77,7 +79,8 @@ def stock_zh_kcb_report_em(from_page: int = 1, to_page: int = 100) -> pd.DataFra
                 [item["art_code"] for item in data_json["data"]["list"]],
             ]
         ).T
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.columns = [
         "代码",
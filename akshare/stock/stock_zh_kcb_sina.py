@@ -1,16 +1,15 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2023/7/6 19:28
+Date: 2026/10/18 15:00
 Desc: 新浪财经-科创板-实时行情数据和历史行情数据(包含前复权和后复权因子)
 """
 
 import datetime
 import re
 
-from akshare.utils import demjson
+from akshare.utils import jsonp
 import pandas as pd
-import requests
 from tqdm import tqdm
 
 from akshare.stock.cons import (
@@ -22,6 +21,8 @@ from akshare.stock.cons import (
     zh_sina_kcb_stock_qfq_url,
     zh_sina_kcb_stock_amount_url,
 )
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
 
 
 def get_zh_kcb_page_count() -> int:
@@ -31,7 +32,7 @@ def get_zh_kcb_page_count() -> int:
     :return: 所有股票的总页数
     :rtype: int
     """
-    res = requests.get(zh_sina_kcb_stock_count_url)
+    res = request_get(zh_sina_kcb_stock_count_url)
     page_count = int(re.findall(re.compile(r"\d+"), res.text)[0]) / 80
     if isinstance(page_count, int):
         return page_count
@@ -46,15 +47,16 @@ def stock_zh_kcb_spot() -> pd.DataFrame:
     :return: 科创板实时行情数据
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     page_count = get_zh_kcb_page_count()
     zh_sina_stock_payload_copy = zh_sina_kcb_stock_payload.copy()
     for page in tqdm(range(1, page_count + 1), leave=False):
         zh_sina_stock_payload_copy.update({"page": page})
         zh_sina_stock_payload_copy.update({"_s_r_a": "page"})
-        res = requests.get(zh_sina_kcb_stock_url, params=zh_sina_stock_payload_copy)
-        data_json = demjson.decode(res.text)
-        big_df = pd.concat([big_df, pd.DataFrame(data_json)], ignore_index=True)
+        res = request_get(zh_sina_kcb_stock_url, params=zh_sina_stock_payload_copy)
+        data_json = jsonp.loads(res.text)
+        big_chunks.append(pd.DataFrame(data_json))
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "代码",
         "-",
@@ -131,19 +133,19 @@ def stock_zh_kcb_daily(symbol: str = "sh688399", adjust: str = "") -> pd.DataFra
     :return: 科创板股票的历史行情数据
     :rtype: pandas.DataFrame
     """
-    res = requests.get(
+    res = request_get(
         zh_sina_kcb_stock_hist_url.format(
             symbol, datetime.datetime.now().strftime("%Y_%m_%d"), symbol
         )
     )
-    data_json = demjson.decode(res.text[res.text.find("[") : res.text.rfind("]") + 1])
+    data_json = jsonp.loads(res.text[res.text.find("[") : res.text.rfind("]") + 1])
     data_df = pd.DataFrame(data_json)
     data_df.index = pd.to_datetime(data_df["d"])
     data_df.index.name = "date"
     del data_df["d"]
 
-    r = requests.get(zh_sina_kcb_stock_amount_url.format(symbol, symbol))
-    amount_data_json = demjson.decode(r.text[r.text.find("[") : r.text.rfind("]") + 1])
+    r = request_get(zh_sina_kcb_stock_amount_url.format(symbol, symbol))
+    amount_data_json = jsonp.loads(r.text[r.text.find("[") : r.text.rfind("]") + 1])
     amount_data_df = pd.DataFrame(amount_data_json)
     amount_data_df.index = pd.to_datetime(amount_data_df.date)
     del amount_data_df["date"]
@@ -180,10 +182,8 @@ def stock_zh_kcb_daily(symbol: str = "sh688399", adjust: str = "") -> pd.DataFra
         return temp_df
 
     if adjust == "hfq":
-        res = requests.get(zh_sina_kcb_stock_hfq_url.format(symbol))
-        hfq_factor_df = pd.DataFrame(
-            eval(res.text.split("=")[1].split("\n")[0])["data"]
-        )
+        res = request_get(zh_sina_kcb_stock_hfq_url.format(symbol))
+        hfq_factor_df = pd.DataFrame(jsonp.loads_jsonp(res.text)["data"])
         hfq_factor_df.columns = ["date", "hfq_factor"]
         hfq_factor_df.index = pd.to_datetime(hfq_factor_df.date)
         del hfq_factor_df["date"]
@@ -211,10 +211,8 @@ def stock_zh_kcb_daily(symbol: str = "sh688399", adjust: str = "") -> pd.DataFra
         return temp_df
 
     if adjust == "qfq":
-        res = requests.get(zh_sina_kcb_stock_qfq_url.format(symbol))
-        qfq_factor_df = pd.DataFrame(
-            eval(res.text.split("=")[1].split("\n")[0])["data"]
-        )
+        res = request_get(zh_sina_kcb_stock_qfq_url.format(symbol))
+        qfq_factor_df = pd.DataFrame(jsonp.loads_jsonp(res.text)["data"])
         qfq_factor_df.columns = ["date", "qfq_factor"]
         qfq_factor_df.index = pd.to_datetime(qfq_factor_df.date)
         del qfq_factor_df["date"]
@@ -242,10 +240,8 @@ def stock_zh_kcb_daily(symbol: str = "sh688399", adjust: str = "") -> pd.DataFra
         return temp_df
 
     if adjust == "hfq-factor":
-        res = requests.get(zh_sina_kcb_stock_hfq_url.format(symbol))
-        hfq_factor_df = pd.DataFrame(
-            eval(res.text.split("=")[1].split("\n")[0])["data"]
-        )
+        res = request_get(zh_sina_kcb_stock_hfq_url.format(symbol))
+        hfq_factor_df = pd.DataFrame(jsonp.loads_jsonp(res.text)["data"])
         hfq_factor_df.columns = ["date", "hfq_factor"]
         hfq_factor_df.index = pd.to_datetime(hfq_factor_df.date)
         del hfq_factor_df["date"]
@@ -254,10 +250,8 @@ def stock_zh_kcb_daily(symbol: str = "sh688399", adjust: str = "") -> pd.DataFra
         return hfq_factor_df
 
     if adjust == "qfq-factor":
-        res = requests.get(zh_sina_kcb_stock_qfq_url.format(symbol))
-        qfq_factor_df = pd.DataFrame(
-            eval(res.text.split("=")[1].split("\n")[0])["data"]
-        )
+        res = request_get(zh_sina_kcb_stock_qfq_url.format(symbol))
+        qfq_factor_df = pd.DataFrame(jsonp.loads_jsonp(res.text)["data"])
         qfq_factor_df.columns = ["date", "qfq_factor"]
         qfq_factor_df.index = pd.to_datetime(qfq_factor_df.date)
         del qfq_factor_df["date"]
@@ -7,9 +7,9 @@ https://www.legulegu.com/stockdata/below-net-asset-statistics
 """
 
 import pandas as pd
-import requests
 
 from akshare.utils.cons import headers
+from akshare.utils.request import request_get
 
 
 def stock_a_below_net_asset_statistics(symbol: str = "全部A股") -> pd.DataFrame:
@@ -32,7 +32,7 @@ def stock_a_below_net_asset_statistics(symbol: str = "全部A股") -> pd.DataFra
         "marketId": symbol_map[symbol],
         "token": "325843825a2745a2a8f9b9e3355cb864",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json)
     temp_df["date"] = pd.to_datetime(temp_df["date"], unit="ms").dt.date
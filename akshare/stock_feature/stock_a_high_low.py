@@ -7,9 +7,9 @@ https://www.legulegu.com/stockdata/high-low-statistics
 """
 
 import pandas as pd
-import requests
 
 from akshare.utils.cons import headers
+from akshare.utils.request import request_get
 
 
 def stock_a_high_low_statistics(symbol: str = "all") -> pd.DataFrame:
@@ -22,7 +22,7 @@ def stock_a_high_low_statistics(symbol: str = "all") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = f"https://www.legulegu.com/stockdata/member-ship/get-high-low-statistics/{symbol}"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json)
     del temp_df["indexCode"]
@@ -15,6 +15,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from akshare.utils.cons import headers
+from akshare.utils.request import request_get
 
 
 def get_cookie_csrf(url: str = "") -> dict:
@@ -66,7 +67,7 @@ def stock_hk_indicator_eniu(
     """
     if indicator == "港股":
         url = "https://eniu.com/static/data/stock_list.json"
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json)
         temp_df = temp_df[temp_df["stock_id"].str.contains("hk")]
@@ -82,7 +83,7 @@ def stock_hk_indicator_eniu(
         url = f"https://eniu.com/chart/roeh/{symbol}"
     else:
         url = f"https://eniu.com/chart/marketvalueh/{symbol}"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json)
     return temp_df
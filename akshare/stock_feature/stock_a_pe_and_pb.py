@@ -9,10 +9,10 @@ https://legulegu.com/stockdata/shanghaiPE
 from datetime import datetime
 
 import pandas as pd
-import py_mini_racer
-import requests
 
 from akshare.stock_feature.stock_a_indicator import get_cookie_csrf
+from akshare.utils.request import request_get
+from akshare.utils.js_pool import get_js_pool
 
 hash_code = """
 function e(n) {
@@ -328,8 +328,7 @@ def stock_market_pe_lg(symbol: str = "深证") -> pd.DataFrame:
     :return: 指定市场的市盈率数据
     :rtype: pandas.DataFrame
     """
-    js_functions = py_mini_racer.MiniRacer()
-    js_functions.eval(hash_code)
+    js_functions = get_js_pool(hash_code)
     token = js_functions.call("hex", datetime.now().date().isoformat()).lower()
     if symbol in {"上证", "深证", "创业板"}:
         url = "https://legulegu.com/api/stock-data/market-pe"
@@ -344,7 +343,7 @@ def stock_market_pe_lg(symbol: str = "深证") -> pd.DataFrame:
             "创业板": "https://legulegu.com/stockdata/cybPE",
         }
         params = {"token": token, "marketId": symbol_map[symbol]}
-        r = requests.get(url, params=params, **get_cookie_csrf(url=url_map[symbol]))
+        r = request_get(url, params=params, **get_cookie_csrf(url=url_map[symbol]))
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"])
         temp_df["date"] = (
@@ -368,7 +367,7 @@ def stock_market_pe_lg(symbol: str = "深证") -> pd.DataFrame:
     else:
         url = "https://legulegu.com/api/stockdata/get-ke-chuang-ban-pe"
         params = {"token": token}
-        r = requests.get(
+        r = request_get(
             url,
             params=params,
             **get_cookie_csrf(url="https://legulegu.com/stockdata/ke-chuang-ban-pe"),
@@ -404,8 +403,7 @@ def stock_index_pe_lg(symbol: str = "沪深300") -> pd.DataFrame:
     :return: 指定指数的市盈率数据
     :rtype: pandas.DataFrame
     """
-    js_functions = py_mini_racer.MiniRacer()
-    js_functions.eval(hash_code)
+    js_functions = get_js_pool(hash_code)
     token = js_functions.call("hex", datetime.now().date().isoformat()).lower()
     symbol_map = {
         "上证50": "000016.SH",
@@ -423,7 +421,7 @@ def stock_index_pe_lg(symbol: str = "沪深300") -> pd.DataFrame:
     }
     url = "https://legulegu.com/api/stockdata/index-basic-pe"
     params = {"token": token, "indexCode": symbol_map[symbol]}
-    r = requests.get(
+    r = request_get(
         url,
         params=params,
         **get_cookie_csrf(url="https://legulegu.com/stockdata/sz50-ttm-lyr"),
@@ -469,8 +467,7 @@ def stock_market_pb_lg(symbol: str = "上证") -> pd.DataFrame:
     :return: 指定市场的市净率数据
     :rtype: pandas.DataFrame
     """
-    js_functions = py_mini_racer.MiniRacer()
-    js_functions.eval(hash_code)
+    js_functions = get_js_pool(hash_code)
     token = js_functions.call("hex", datetime.now().date().isoformat()).lower()
     url = "https://legulegu.com/api/stockdata/index-basic-pb"
     symbol_map = {"上证": "1", "深证": "2", "创业板": "4", "科创版": "7"}
@@ -481,7 +478,7 @@ def stock_market_pb_lg(symbol: str = "上证") -> pd.DataFrame:
         "科创版": "https://legulegu.com/stockdata/ke-chuang-ban-pb",
     }
     params = {"token": token, "indexCode": symbol_map[symbol]}
-    r = requests.get(url, params=params, **get_cookie_csrf(url=url_map[symbol]))
+    r = request_get(url, params=params, **get_cookie_csrf(url=url_map[symbol]))
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df["date"] = (
@@ -517,8 +514,7 @@ def stock_index_pb_lg(symbol: str = "上证50") -> pd.DataFrame:
     :return: 指定指数的市净率数据
     :rtype: pandas.DataFrame
     """
-    js_functions = py_mini_racer.MiniRacer()
-    js_functions.eval(hash_code)
+    js_functions = get_js_pool(hash_code)
     token = js_functions.call("hex", datetime.now().date().isoformat()).lower()
     symbol_map = {
         "上证50": "000016.SH",
@@ -536,7 +532,7 @@ def stock_index_pb_lg(symbol: str = "上证50") -> pd.DataFrame:
     }
     url = "https://legulegu.com/api/stockdata/index-basic-pb"
     params = {"token": token, "indexCode": symbol_map[symbol]}
-    r = requests.get(
+    r = request_get(
         url,
         params=params,
         **get_cookie_csrf(url="https://legulegu.com/stockdata/zz500-ttm-lyr"),
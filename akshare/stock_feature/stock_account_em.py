@@ -8,7 +8,8 @@ https://data.eastmoney.com/cjsj/gpkhsj.html
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def stock_account_statistics_em() -> pd.DataFrame:
@@ -32,7 +33,7 @@ def stock_account_statistics_em() -> pd.DataFrame:
         "pageNum": "1",
         "pageNumber": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
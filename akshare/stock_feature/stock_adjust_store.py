@@ -0,0 +1,224 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 新浪财经-A 股-不复权行情和复权因子的本地存储, 在本地计算前复权和后复权
+不复权行情和后复权因子分别保存在 store_dir/stock_zh_a_daily/symbol.parquet
+和 store_dir/stock_zh_a_factor/symbol.parquet, 每个自然日最多更新一次;
+新浪的历史行情接口只能下载全部历史, 本地行情连续时只用实时行情接口追加最近一个交易日;
+复权价格由不复权价格和后复权因子计算, 切换复权方式或前复权的基准日都不需要重新下载.
+交易所调整除权除息信息时只需要更新因子表, 不存在需要失效的复权数据
+"""
+
+import datetime
+import os
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from akshare.futures.cons import get_trading_calendar
+from akshare.stock.stock_zh_a_sina import (
+    _OHLCVA_COLUMNS,
+    _zh_a_daily_frame,
+    _zh_a_daily_quote,
+    _zh_a_daily_raw,
+    _zh_a_fq_factor,
+)
+from akshare.utils.adjust import adjust_prices
+from akshare.utils.store import DEFAULT_STORE_DIR, read_parquet, write_parquet
+
+
+def stock_zh_a_daily_store_path(symbol: str, store_dir: str = DEFAULT_STORE_DIR) -> str:
+    """
+    不复权行情的本地文件路径
+    :param symbol: sh600000
+    :type symbol: str
+    :param store_dir: 本地存储目录
+    :type store_dir: str
+    :return: 文件路径
+    :rtype: str
+    """
+    return os.path.join(store_dir, "stock_zh_a_daily", f"{symbol}.parquet")
+
+
+def stock_zh_a_factor_store_path(
+    symbol: str, store_dir: str = DEFAULT_STORE_DIR
+) -> str:
+    """
+    后复权因子的本地文件路径
+    :param symbol: sh600000
+    :type symbol: str
+    :param store_dir: 本地存储目录
+    :type store_dir: str
+    :return: 文件路径
+    :rtype: str
+    """
+    return os.path.join(store_dir, "stock_zh_a_factor", f"{symbol}.parquet")
+
+
+def _need_download(path: str, refresh: Optional[bool]) -> bool:
+    """
+    是否需要重新下载: refresh 为 None 时, 文件不存在或不是今天写入的才下载
+    :param path: 文件路径
+    :type path: str
+    :param refresh: True 总是下载, False 只在文件不存在时下载, None 每个自然日最多下载一次
+    :type refresh: bool
+    :return: 是否需要下载
+    :rtype: bool
+    """
+    if not os.path.exists(path):
+        return True
+    if refresh is None:
+        modified = datetime.date.fromtimestamp(os.path.getmtime(path))
+        return modified < datetime.date.today()
+    return refresh
+
+
+def stock_zh_a_factor_sync(
+    symbol: str = "sh600000",
+    store_dir: str = DEFAULT_STORE_DIR,
+    refresh: Optional[bool] = None,
+) -> pd.DataFrame:
+    """
+    新浪财经-A 股-后复权因子-本地同步
+    因子表以新下载的为准并替换本地文件, 交易所修订或撤销的除权除息事件不会残留在本地
+    :param symbol: sh600000
+    :type symbol: str
+    :param store_dir: 本地存储目录
+    :type store_dir: str
+    :param refresh: True 总是下载, False 只在本地没有时下载, None 每个自然日最多下载一次
+    :type refresh: bool
+    :return: 按日期升序的后复权因子, 列为 date 和 hfq_factor
+    :rtype: pandas.DataFrame
+    """
+    path = stock_zh_a_factor_store_path(symbol, store_dir)
+    stored_df = read_parquet(path)
+    if stored_df is not None and not _need_download(path, refresh):
+        return stored_df
+    temp_df = _zh_a_fq_factor(symbol, "hfq")
+    temp_df["hfq_factor"] = temp_df["hfq_factor"].astype(float)
+    temp_df.sort_values("date", inplace=True, ignore_index=True)
+    write_parquet(temp_df, path)
+    return temp_df
+
+
+def _append_latest_bar(symbol: str, stored_df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """
+    用实时行情追加最近一个交易日的不复权行情; 无法确认本地行情连续时返回 None, 需要重新下载全部历史:
+    最近一个交易日没有成交(如停牌), 本地缺少前一个交易日的行情(如多日未更新),
+    或其收盘价与实时行情的前收盘价不一致(如保存了盘中的行情)
+    :param symbol: sh600000
+    :type symbol: str
+    :param stored_df: 本地保存的不复权行情, date 为列
+    :type stored_df: pandas.DataFrame
+    :return: 更新后的不复权行情, date 为列
+    :rtype: pandas.DataFrame
+    """
+    quote_df = _zh_a_daily_quote(symbol)
+    if quote_df.empty:
+        return None
+    quote_date = quote_df.index[0]
+    prev_date = get_trading_calendar().prev_trading_day(quote_date)
+    if prev_date is None:
+        return None
+    prev_df = stored_df[stored_df["date"] == pd.Timestamp(prev_date)]
+    if prev_df.empty or not np.isclose(
+        prev_df["close"].iloc[-1], quote_df["prevclose"].iloc[0], rtol=0, atol=1e-4
+    ):
+        return None
+    quote_df = quote_df.drop(columns="prevclose").reset_index()
+    return pd.concat(
+        [stored_df[stored_df["date"] < quote_date], quote_df[stored_df.columns]],
+        ignore_index=True,
+    )
+
+
+def stock_zh_a_daily_raw_sync(
+    symbol: str = "sh600000",
+    store_dir: str = DEFAULT_STORE_DIR,
+    refresh: Optional[bool] = None,
+) -> pd.DataFrame:
+    """
+    新浪财经-A 股-不复权历史行情-本地同步
+    第一次调用下载全部历史并保存到本地; 之后本地行情连续时只追加最近一个交易日, 否则重新下载全部历史
+    :param symbol: sh600000
+    :type symbol: str
+    :param store_dir: 本地存储目录
+    :type store_dir: str
+    :param refresh: True 总是下载全部历史, False 只在本地没有时下载, None 每个自然日最多更新一次
+    :type refresh: bool
+    :return: 以日期为索引的不复权行情
+    :rtype: pandas.DataFrame
+    """
+    path = stock_zh_a_daily_store_path(symbol, store_dir)
+    stored_df = read_parquet(path)
+    if stored_df is not None and not _need_download(path, refresh):
+        return stored_df.set_index("date")
+    temp_df = None
+    if stored_df is not None and refresh is None:
+        temp_df = _append_latest_bar(symbol, stored_df)
+    if temp_df is None:
+        temp_df = _zh_a_daily_raw(symbol).reset_index()
+        temp_df["date"] = pd.to_datetime(temp_df["date"])
+    write_parquet(temp_df, path)
+    return temp_df.set_index("date")
+
+
+def stock_zh_a_daily_local(
+    symbol: str = "sh603843",
+    start_date: str = "19900101",
+    end_date: str = "21000118",
+    adjust: str = "",
+    anchor_date: Optional[str] = None,
+    store_dir: str = DEFAULT_STORE_DIR,
+    refresh: Optional[bool] = None,
+) -> pd.DataFrame:
+    """
+    新浪财经-A 股-个股的历史行情数据-本地复权
+    字段与 stock_zh_a_daily 一致; 前复权价格以后复权因子换算, 与新浪前复权因子的结果在四舍五入误差内一致
+    https://finance.sina.com.cn/realstock/company/sh603843/nc.shtml
+    :param symbol: sh600000
+    :type symbol: str
+    :param start_date: 20201103; 开始日期
+    :type start_date: str
+    :param end_date: 20201103; 结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param anchor_date: 前复权的基准日, 该日之后到下一次除权除息之前的价格与不复权价格相同; 默认为最新
+    :type anchor_date: str
+    :param store_dir: 本地存储目录
+    :type store_dir: str
+    :param refresh: True 总是下载, False 只使用本地数据(本地没有时下载), None 每个自然日最多下载一次
+    :type refresh: bool
+    :return: 行情数据
+    :rtype: pandas.DataFrame
+    """
+    temp_df = stock_zh_a_daily_raw_sync(symbol, store_dir=store_dir, refresh=refresh)
+    if adjust == "":
+        temp_df = temp_df[start_date:end_date]
+    else:
+        temp_df = temp_df.dropna()
+    temp_df = temp_df.drop_duplicates(subset=_OHLCVA_COLUMNS)
+    if adjust:
+        factor_df = stock_zh_a_factor_sync(symbol, store_dir=store_dir, refresh=refresh)
+        temp_df = adjust_prices(
+            temp_df,
+            factor_df["date"],
+            factor_df["hfq_factor"],
+            adjust=adjust,
+            anchor_date=anchor_date,
+        )
+    return _zh_a_daily_frame(temp_df, start_date, end_date)
+
+
+if __name__ == "__main__":
+    stock_zh_a_daily_local_df = stock_zh_a_daily_local(
+        symbol="sh600000", start_date="20200101", end_date="20240101", adjust="qfq"
+    )
+    print(stock_zh_a_daily_local_df)
+
+    stock_zh_a_daily_local_df = stock_zh_a_daily_local(
+        symbol="sh600000", adjust="qfq", anchor_date="20200102", refresh=False
+    )
+    print(stock_zh_a_daily_local_df)
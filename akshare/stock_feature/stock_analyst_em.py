@@ -1,15 +1,16 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2023/8/20 20:00
+Date: 2026/10/18 15:00
 Desc: 东方财富网-数据中心-研究报告-东方财富分析师指数
 https://data.eastmoney.com/invest/invest/list.html
 """
 
 import pandas as pd
-import requests
 from akshare.utils.tqdm import get_tqdm
 from akshare.utils.cons import headers
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def stock_analyst_rank_em(year: str = "2024") -> pd.DataFrame:
@@ -35,17 +36,18 @@ def stock_analyst_rank_em(year: str = "2024") -> pd.DataFrame:
         "distinct": "ANALYST_CODE",
         "limit": "top100",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params, headers=headers)
+        r = request_get(url, params=params, headers=headers)
         data_json = r.json()
         data_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, data_df], ignore_index=True)
+        big_chunks.append(data_df)
+    big_df = big_chunks.to_frame()
 
     big_df.reset_index(inplace=True)
     big_df["index"] = list(range(1, len(big_df) + 1))
@@ -128,7 +130,7 @@ def stock_analyst_detail_em(
             "pageSize": "1000",
             "filter": f'(ANALYST_CODE="{analyst_id}")',
         }
-        r = requests.get(url, params=params, headers=headers)
+        r = request_get(url, params=params, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
         temp_df.reset_index(inplace=True)
@@ -186,7 +188,7 @@ def stock_analyst_detail_em(
             "pageSize": "1000",
             "filter": f'(ANALYST_CODE="{analyst_id}")',
         }
-        r = requests.get(url, params=params, headers=headers)
+        r = request_get(url, params=params, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
         temp_df.reset_index(inplace=True)
@@ -235,7 +237,7 @@ def stock_analyst_detail_em(
             "source": "WEB",
             "client": "WEB",
         }
-        r = requests.get(url, params=params, headers=headers)
+        r = request_get(url, params=params, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
         temp_df = temp_df[
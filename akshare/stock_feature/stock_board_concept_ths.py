@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/27 14:20
+Date: 2026/10/18 15:00
 Desc: 同花顺-板块-概念板块
 https://q.10jqka.com.cn/thshy/
 """
@@ -12,13 +12,14 @@ from functools import lru_cache
 from io import StringIO
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
 from akshare.utils import demjson
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.js_pool import get_js_pool
+from akshare.utils.func import ChunkAccumulator
 
 
 def _get_file_content_ths(file: str = "ths.js") -> str:
@@ -42,9 +43,8 @@ def _get_stock_board_concept_name_ths() -> dict:
     :return: 获取同花顺概念板块代码和名称字典
     :rtype: dict
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -52,7 +52,7 @@ def _get_stock_board_concept_name_ths() -> dict:
         "Cookie": f"v={v_code}",
     }
     url = "https://q.10jqka.com.cn/gn/detail/code/307822/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     code_list = [
         item["href"].split("/")[-2]
@@ -106,7 +106,7 @@ def stock_board_concept_info_ths(symbol: str = "阿里巴巴概念") -> pd.DataF
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/89.0.4389.90 Safari/537.36",
     }
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     name_list = [
         item.text.strip()
@@ -138,9 +138,8 @@ def stock_board_concept_index_ths(
     :return: 指数数据
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
 
     code_map = _get_stock_board_concept_name_ths()
@@ -150,10 +149,10 @@ def stock_board_concept_index_ths(
         "Chrome/89.0.4389.90 Safari/537.36",
     }
     url = f"https://q.10jqka.com.cn/gn/detail/code/{symbol_code}"
-    r = requests.get(url=url, headers=headers)
+    r = request_get(url=url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     inner_code = soup.find(name="input", attrs={"id": "clid"})["value"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     current_year = datetime.now().year
     begin_year = int(start_date[:4])
     tqdm = get_tqdm()
@@ -166,7 +165,7 @@ def stock_board_concept_index_ths(
             "Host": "d.10jqka.com.cn",
             "Cookie": f"v={v_code}",
         }
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         data_text = r.text
 
         try:
@@ -176,7 +175,8 @@ def stock_board_concept_index_ths(
         temp_df = demjson.decode(data_text[data_text.find("{") : -1])
         temp_df = pd.DataFrame(temp_df["data"].split(";"))
         temp_df = temp_df.iloc[:, 0].str.split(",", expand=True)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     if len(big_df.columns) == 11:
         big_df.columns = [
@@ -239,9 +239,8 @@ def __stock_board_concept_summary_ths() -> Dict:
     :return: 概念时间表
     :rtype: dict
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -249,14 +248,14 @@ def __stock_board_concept_summary_ths() -> Dict:
         "Cookie": f"v={v_code}",
     }
     url = "http://q.10jqka.com.cn/gn/index/field/addtime/order/desc/page/1/ajax/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     page_num = soup.find(name="span", attrs={"class": "page_info"}).text.split("/")[1]
     big_dict = dict()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
         url = f"http://q.10jqka.com.cn/gn/index/field/addtime/order/desc/page/{page}/ajax/1/"
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         try:
             soup = BeautifulSoup(r.text, features="lxml")
             temp_dict = {
@@ -277,9 +276,8 @@ def stock_board_concept_summary_ths() -> pd.DataFrame:
     :return: 概念时间表
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -287,19 +285,20 @@ def stock_board_concept_summary_ths() -> pd.DataFrame:
         "Cookie": f"v={v_code}",
     }
     url = "http://q.10jqka.com.cn/gn/index/field/addtime/order/desc/page/1/ajax/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     page_num = soup.find(name="span", attrs={"class": "page_info"}).text.split("/")[1]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
         url = f"http://q.10jqka.com.cn/gn/index/field/addtime/order/desc/page/{page}/ajax/1/"
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         try:
             temp_df = pd.read_html(StringIO(r.text))[0]
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_chunks.append(temp_df)
         except ValueError:
             break
+    big_df = big_chunks.to_frame()
     big_df["日期"] = pd.to_datetime(big_df["日期"], errors="coerce").dt.date
     big_df["成分股数量"] = pd.to_numeric(big_df["成分股数量"], errors="coerce")
     return big_df
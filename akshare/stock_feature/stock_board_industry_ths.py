@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/2/28 13:20
+Date: 2026/10/18 15:00
 Desc: 同花顺-板块-同花顺行业
 https://q.10jqka.com.cn/thshy/
 """
@@ -11,13 +11,14 @@ from functools import lru_cache
 from io import StringIO
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
-import py_mini_racer
 
 from akshare.datasets import get_ths_js
 from akshare.utils import demjson
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.js_pool import get_js_pool
+from akshare.utils.func import ChunkAccumulator
 
 
 def _get_file_content_ths(file: str = "ths.js") -> str:
@@ -41,9 +42,8 @@ def _get_stock_board_industry_name_ths() -> dict:
     :return: 获取同花顺行业代码和名称字典
     :rtype: dict
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -51,7 +51,7 @@ def _get_stock_board_industry_name_ths() -> dict:
         "Cookie": f"v={v_code}",
     }
     url = "https://q.10jqka.com.cn/thshy/detail/code/881272/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     code_list = [
         item["href"].split("/")[-2]
@@ -103,7 +103,7 @@ def stock_board_industry_info_ths(symbol: str = "半导体") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/89.0.4389.90 Safari/537.36",
     }
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     name_list = [
         item.text.strip()
@@ -137,13 +137,12 @@ def stock_board_industry_index_ths(
     """
     code_map = _get_stock_board_industry_name_ths()
     symbol_code = code_map[symbol]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     current_year = datetime.now().year
     begin_year = int(start_date[:4])
     tqdm = get_tqdm()
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     for year in tqdm(range(begin_year, current_year + 1), leave=False):
         url = f"https://d.10jqka.com.cn/v4/line/bk_{symbol_code}/01/{year}.js"
@@ -154,7 +153,7 @@ def stock_board_industry_index_ths(
             "Host": "d.10jqka.com.cn",
             "Cookie": f"v={v_code}",
         }
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         data_text = r.text
 
         try:
@@ -164,7 +163,8 @@ def stock_board_industry_index_ths(
         temp_df = demjson.decode(data_text[data_text.find("{") : -1])
         temp_df = pd.DataFrame(temp_df["data"].split(";"))
         temp_df = temp_df.iloc[:, 0].str.split(",", expand=True)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     if len(big_df.columns) == 11:
         big_df.columns = [
@@ -226,9 +226,8 @@ def stock_xgsr_ths() -> pd.DataFrame:
     :return: 新股上市首日
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -237,10 +236,10 @@ def stock_xgsr_ths() -> pd.DataFrame:
         "hexin-v": v_code,
     }
     url = "https://data.10jqka.com.cn/ipo/xgsr/field/SSRQ/order/desc/page/1/ajax/1/free/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     page_num = soup.find(name="span", attrs={"class": "page_info"}).text.split("/")[1]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
         url = f"https://data.10jqka.com.cn/ipo/xgsr/field/SSRQ/order/desc/page/{page}/ajax/1/free/1/"
@@ -251,9 +250,10 @@ def stock_xgsr_ths() -> pd.DataFrame:
             "Cookie": f"v={v_code}",
             "hexin-v": v_code,
         }
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.rename(columns={"发行价(元)": "发行价"}, inplace=True)
     big_df["序号"] = pd.to_numeric(big_df["序号"], errors="coerce")
@@ -278,9 +278,8 @@ def stock_ipo_benefit_ths() -> pd.DataFrame:
     :return: IPO受益股
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -289,10 +288,10 @@ def stock_ipo_benefit_ths() -> pd.DataFrame:
         "hexin-v": v_code,
     }
     url = "https://data.10jqka.com.cn/ipo/syg/field/invest/order/desc/page/1/ajax/1/free/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     page_num = soup.find(name="span", attrs={"class": "page_info"}).text.split("/")[1]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
         url = f"https://data.10jqka.com.cn/ipo/syg/field/invest/order/desc/page/{page}/ajax/1/free/1/"
@@ -303,9 +302,10 @@ def stock_ipo_benefit_ths() -> pd.DataFrame:
             "Cookie": f"v={v_code}",
             "hexin-v": v_code,
         }
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.columns = [
         "序号",
@@ -335,9 +335,8 @@ def stock_board_industry_summary_ths() -> pd.DataFrame:
     :return: 同花顺行业一览表
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -345,16 +344,17 @@ def stock_board_industry_summary_ths() -> pd.DataFrame:
         "Cookie": f"v={v_code}",
     }
     url = "http://q.10jqka.com.cn/thshy/index/field/199112/order/desc/page/1/ajax/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     page_num = soup.find(name="span", attrs={"class": "page_info"}).text.split("/")[1]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
         url = f"http://q.10jqka.com.cn/thshy/index/field/199112/order/desc/page/{page}/ajax/1/"
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.columns = [
         "序号",
@@ -7,9 +7,9 @@ https://legulegu.com/stockdata/marketcap-gdp
 """
 
 import pandas as pd
-import requests
 
 from akshare.stock_feature.stock_a_indicator import get_token_lg, get_cookie_csrf
+from akshare.utils.request import request_get
 
 
 def stock_buffett_index_lg() -> pd.DataFrame:
@@ -22,7 +22,7 @@ def stock_buffett_index_lg() -> pd.DataFrame:
     token = get_token_lg()
     url = "https://legulegu.com/api/stockdata/marketcap-gdp/get-marketcap-gdp"
     params = {"token": token}
-    r = requests.get(
+    r = request_get(
         url,
         params=params,
         **get_cookie_csrf(url="https://legulegu.com/stockdata/marketcap-gdp"),
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2022/7/13 16:16
+Date: 2026/10/18 15:00
 Desc: 新浪财经-股票-行业分类
 http://vip.stock.finance.sina.com.cn/mkt/
 """
@@ -9,10 +9,12 @@ http://vip.stock.finance.sina.com.cn/mkt/
 import math
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
+
 
 def stock_classify_board() -> dict:
     """
@@ -21,7 +23,7 @@ def stock_classify_board() -> dict:
     :rtype: dict
     """
     url = "http://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getHQNodes"
-    r = requests.get(url)
+    r = request_get(url)
     data_json = r.json()
     big_dict = {}
     class_name_list = [
@@ -55,11 +57,11 @@ def stock_classify_sina(symbol: str = "热门概念") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     stock_classify_board_dict = stock_classify_board()
-    data_df = pd.DataFrame()
+    data_chunks = ChunkAccumulator()
     for num in tqdm(range(len(stock_classify_board_dict[symbol]["code"])), leave=False):
         url = "http://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getHQNodeStockCount"
         params = {"node": stock_classify_board_dict[symbol]["code"][num]}
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         page_num = math.ceil(int(r.json()) / 80)
         url = "http://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getHQNodeData"
         big_df = pd.DataFrame()
@@ -73,12 +75,13 @@ def stock_classify_sina(symbol: str = "热门概念") -> pd.DataFrame:
                 "symbol": "",
                 "_s_r_a": "init",
             }
-            r = requests.get(url, params=params)
+            r = request_get(url, params=params)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json)
             big_df = pd.concat([big_df, temp_df], ignore_index=True)
             big_df["class"] = stock_classify_board_dict[symbol]["name"][num]
-        data_df = pd.concat([data_df, big_df], ignore_index=True)
+        data_chunks.append(big_df)
+    data_df = data_chunks.to_frame()
     return data_df
 
 
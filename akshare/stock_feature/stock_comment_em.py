@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/4/4 18:20
+Date: 2026/10/18 15:00
 Desc: 东方财富网-数据中心-特色数据-千股千评
 https://data.eastmoney.com/stockcomment/
 """
@@ -11,9 +11,10 @@ import re
 import time
 
 import pandas as pd
-import requests
 
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def stock_comment_em() -> pd.DataFrame:
@@ -36,17 +37,18 @@ def stock_comment_em() -> pd.DataFrame:
         "filter": "",
         "token": "894050c76af8597a853f5b408b759f5d",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
@@ -136,7 +138,7 @@ def stock_comment_detail_zlkp_jgcyd_em(symbol: str = "600000") -> pd.DataFrame:
         "sortColumns": "TRADE_DATE",
         "sortTypes": "-1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df = temp_df[["TRADE_DATE", "ORG_PARTICIPATE"]]
@@ -167,7 +169,7 @@ def stock_comment_detail_zhpj_lspf_em(symbol: str = "600000") -> pd.DataFrame:
         "sortColumns": "DIAGNOSE_DATE",
         "sortTypes": "1",
     }
-    r = requests.get(url=url, params=params)
+    r = request_get(url=url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.rename(
@@ -205,7 +207,7 @@ def stock_comment_detail_scrd_focus_em(symbol: str = "600000") -> pd.DataFrame:
         "sortTypes": "-1",
         "pageSize": "30",
     }
-    r = requests.get(url=url, params=params)
+    r = request_get(url=url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.rename(
@@ -254,7 +256,7 @@ def stock_comment_detail_scrd_desire_em(
         "Accept": "*/*",
         "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     jsonp_data = r.text
     json_str = re.search(r"\((.*)\)", jsonp_data).group(1)
     data_json = json.loads(json_str)
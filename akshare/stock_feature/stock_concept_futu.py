@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/7/16 22:00
+Date: 2026/10/18 15:00
 Desc: 富途牛牛-主题投资-概念板块-成分股
 https://www.futunn.com/quote/sparks-us
 """
@@ -9,9 +9,11 @@ https://www.futunn.com/quote/sparks-us
 import json
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
+
 
 def _stock_concept_cons_futu(symbol: str = "巴菲特持仓") -> pd.DataFrame:
     """
@@ -33,7 +35,7 @@ def _stock_concept_cons_futu(symbol: str = "巴菲特持仓") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     temp_code_name = [
         item.find_all("div", attrs={"class": "fix-left"})
@@ -122,10 +124,10 @@ def stock_concept_cons_futu(symbol: str = "特朗普概念股") -> pd.DataFrame:
             "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36",
             "Quote-Token": "7f74cd2a5e",
         }
-        r = requests.get(url, params=params, headers=headers)
+        r = request_get(url, params=params, headers=headers)
         data_json = r.json()
         total_page = data_json["data"]["pagination"]["pageCount"]
-        big_df = pd.DataFrame()
+        big_chunks = ChunkAccumulator()
         for page in range(0, total_page):
             params.update(
                 {
@@ -134,10 +136,11 @@ def stock_concept_cons_futu(symbol: str = "特朗普概念股") -> pd.DataFrame:
             )
             if page == 1:
                 headers.update({"Quote-Token": "a3043d6fed"})
-            r = requests.get(url, params=params, headers=headers)
+            r = request_get(url, params=params, headers=headers)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["data"]["list"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_chunks.append(temp_df)
+        big_df = big_chunks.to_frame()
 
         big_df.rename(
             columns={
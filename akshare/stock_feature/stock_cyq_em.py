@@ -10,7 +10,8 @@ from datetime import datetime
 
 import pandas as pd
 import py_mini_racer
-import requests
+
+from akshare.utils.request import request_get
 
 
 def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
@@ -230,7 +231,7 @@ def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
         "end": datetime.now().date().strftime("%Y%m%d"),
         "lmt": "210",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
     temp_df.columns = [
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/5/1 20:00
+Date: 2026/10/18 15:00
 Desc: 巨潮资讯-首页-公告查询-信息披露
 http://www.cninfo.com.cn/new/commonUrl/pageOfSearch?url=disclosure/list/search
 """
@@ -10,9 +10,10 @@ import math
 from functools import lru_cache
 
 import pandas as pd
-import requests
 
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get, request_post
+from akshare.utils.func import ChunkAccumulator
 
 
 @lru_cache()
@@ -74,7 +75,7 @@ def __get_stock_json(symbol: str = "沪深京") -> dict:
         url = "http://www.cninfo.com.cn/new/data/fund_stock.json"
     elif symbol == "债券":
         url = "http://www.cninfo.com.cn/new/data/bond_stock.json"
-    r = requests.get(url)
+    r = request_get(url)
     text_json = r.json()
     temp_df = pd.DataFrame([item for item in text_json["stockList"]])
     return dict(zip(temp_df["code"], temp_df["orgId"]))
@@ -142,17 +143,18 @@ def stock_zh_a_disclosure_report_cninfo(
         "sortType": "",
         "isHLtitle": "true",
     }
-    r = requests.post(url, params=payload)
+    r = request_post(url, params=payload)
     text_json = r.json()
     page_num = math.ceil(int(text_json["totalAnnouncement"]) / 30)
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         payload.update({"pageNum": page})
-        r = requests.post(url, data=payload)
+        r = request_post(url, data=payload)
         text_json = r.json()
         temp_df = pd.DataFrame(text_json["announcements"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.rename(
         columns={
             "secCode": "代码",
@@ -237,17 +239,18 @@ def stock_zh_a_disclosure_relation_cninfo(
         "sortType": "",
         "isHLtitle": "true",
     }
-    r = requests.post(url, data=payload)
+    r = request_post(url, data=payload)
     text_json = r.json()
     page_num = math.ceil(int(text_json["totalAnnouncement"]) / 30)
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         payload.update({"pageNum": page})
-        r = requests.post(url, data=payload)
+        r = request_post(url, data=payload)
         text_json = r.json()
         temp_df = pd.DataFrame(text_json["announcements"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.rename(
         columns={
             "secCode": "代码",
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/2/1 16:20
+Date: 2026/10/18 15:00
 Desc: 东方财富网-数据中心-新股数据-打新收益率
 东方财富网-数据中心-新股申购-打新收益率
 https://data.eastmoney.com/xg/xg/dxsyl.html
@@ -10,9 +10,10 @@ https://data.eastmoney.com/xg/xg/default_2.html
 """
 
 import pandas as pd
-import requests
 
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def stock_dxsyl_em() -> pd.DataFrame:
@@ -36,17 +37,18 @@ def stock_dxsyl_em() -> pd.DataFrame:
         "client": "WEB",
         "filter": """((APPLY_DATE>'2010-01-01')(|@APPLY_DATE="NULL"))((LISTING_DATE>'2010-01-01')(|@LISTING_DATE="NULL"))(TRADE_MARKET_CODE!="069001017")""",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
     big_df.rename(
@@ -154,17 +156,18 @@ def stock_xgsglb_em(symbol: str = "全部股票") -> pd.DataFrame:
             "source": "NEEQSELECT",
             "client": "WEB",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_chunks = ChunkAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, 1 + int(total_page)), leave=False):
             params.update({"pageNumber": page})
-            r = requests.get(url, params=params)
+            r = request_get(url, params=params)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat([big_df, temp_df], ignore_index=True)
+            big_chunks.append(temp_df)
+        big_df = big_chunks.to_frame()
 
         big_df.rename(
             columns={
@@ -290,17 +293,18 @@ def stock_xgsglb_em(symbol: str = "全部股票") -> pd.DataFrame:
             "source": "WEB",
             "client": "WEB",
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_chunks = ChunkAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, total_page + 1), leave=False):
             params.update({"pageNumber": page})
-            r = requests.get(url, params=params)
+            r = request_get(url, params=params)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_chunks.append(temp_df)
+        big_df = big_chunks.to_frame()
         big_df.rename(
             columns={
                 "SECURITY_CODE": "股票代码",
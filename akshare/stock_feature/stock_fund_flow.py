@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/8/15 18:00
+Date: 2026/10/18 15:00
 Desc: 同花顺-数据中心-资金流向
 同花顺-数据中心-资金流向-个股资金流
 https://data.10jqka.com.cn/funds/ggzjl/#refCountId=data_55f13c2c_254
@@ -16,12 +16,13 @@ https://data.10jqka.com.cn/funds/ddzz/#refCountId=data_55f13c2c_254
 from io import StringIO
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
-import py_mini_racer
 from akshare.utils.tqdm import get_tqdm
 
 from akshare.datasets import get_ths_js
+from akshare.utils.request import request_get
+from akshare.utils.js_pool import get_js_pool
+from akshare.utils.func import ChunkAccumulator
 
 
 def _get_file_content_ths(file: str = "ths.js") -> str:
@@ -47,9 +48,8 @@ def stock_fund_flow_individual(symbol: str = "即时") -> pd.DataFrame:
     :return: 个股资金流
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "Accept": "text/html, */*; q=0.01",
@@ -66,7 +66,7 @@ def stock_fund_flow_individual(symbol: str = "即时") -> pd.DataFrame:
         "X-Requested-With": "XMLHttpRequest",
     }
     url = "http://data.10jqka.com.cn/funds/ggzjl/field/code/order/desc/ajax/1/free/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     raw_page = soup.find(name="span", attrs={"class": "page_info"}).text
     page_num = raw_page.split("/")[1]
@@ -80,12 +80,11 @@ def stock_fund_flow_individual(symbol: str = "即时") -> pd.DataFrame:
         url = "http://data.10jqka.com.cn/funds/ggzjl/board/20/field/zdf/order/desc/page/{}/ajax/1/free/1/"
     else:
         url = "http://data.10jqka.com.cn/funds/ggzjl/field/zdf/order/desc/page/{}/ajax/1/free/1/"
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
-        js_code = py_mini_racer.MiniRacer()
         js_content = _get_file_content_ths("ths.js")
-        js_code.eval(js_content)
+        js_code = get_js_pool(js_content)
         v_code = js_code.call("v")
         headers = {
             "Accept": "text/html, */*; q=0.01",
@@ -101,9 +100,10 @@ def stock_fund_flow_individual(symbol: str = "即时") -> pd.DataFrame:
             "Chrome/90.0.4430.85 Safari/537.36",
             "X-Requested-With": "XMLHttpRequest",
         }
-        r = requests.get(url.format(page), headers=headers)
+        r = request_get(url.format(page), headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     del big_df["序号"]
     big_df.reset_index(inplace=True)
@@ -143,9 +143,8 @@ def stock_fund_flow_concept(symbol: str = "即时") -> pd.DataFrame:
     :return: 概念资金流
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "Accept": "text/html, */*; q=0.01",
@@ -164,7 +163,7 @@ def stock_fund_flow_concept(symbol: str = "即时") -> pd.DataFrame:
     url = (
         "http://data.10jqka.com.cn/funds/gnzjl/field/tradezdf/order/desc/ajax/1/free/1/"
     )
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     raw_page = soup.find(name="span", attrs={"class": "page_info"}).text
     page_num = raw_page.split("/")[1]
@@ -178,12 +177,11 @@ def stock_fund_flow_concept(symbol: str = "即时") -> pd.DataFrame:
         url = "http://data.10jqka.com.cn/funds/gnzjl/board/20/field/tradezdf/order/desc/page/{}/ajax/1/free/1/"
     else:
         url = "http://data.10jqka.com.cn/funds/gnzjl/field/tradezdf/order/desc/page/{}/ajax/1/free/1/"
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
-        js_code = py_mini_racer.MiniRacer()
         js_content = _get_file_content_ths("ths.js")
-        js_code.eval(js_content)
+        js_code = get_js_pool(js_content)
         v_code = js_code.call("v")
         headers = {
             "Accept": "text/html, */*; q=0.01",
@@ -199,9 +197,10 @@ def stock_fund_flow_concept(symbol: str = "即时") -> pd.DataFrame:
             "Chrome/90.0.4430.85 Safari/537.36",
             "X-Requested-With": "XMLHttpRequest",
         }
-        r = requests.get(url.format(page), headers=headers)
+        r = request_get(url.format(page), headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     del big_df["序号"]
     big_df.reset_index(inplace=True)
@@ -249,9 +248,8 @@ def stock_fund_flow_industry(symbol: str = "即时") -> pd.DataFrame:
     :return: 行业资金流
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "Accept": "text/html, */*; q=0.01",
@@ -270,7 +268,7 @@ def stock_fund_flow_industry(symbol: str = "即时") -> pd.DataFrame:
     url = (
         "http://data.10jqka.com.cn/funds/hyzjl/field/tradezdf/order/desc/ajax/1/free/1/"
     )
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     raw_page = soup.find(name="span", attrs={"class": "page_info"}).text
     page_num = raw_page.split("/")[1]
@@ -284,12 +282,11 @@ def stock_fund_flow_industry(symbol: str = "即时") -> pd.DataFrame:
         url = "http://data.10jqka.com.cn/funds/hyzjl/board/20/field/tradezdf/order/desc/page/{}/ajax/1/free/1/"
     else:
         url = "http://data.10jqka.com.cn/funds/hyzjl/field/tradezdf/order/desc/page/{}/ajax/1/free/1/"
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
-        js_code = py_mini_racer.MiniRacer()
         js_content = _get_file_content_ths("ths.js")
-        js_code.eval(js_content)
+        js_code = get_js_pool(js_content)
         v_code = js_code.call("v")
         headers = {
             "Accept": "text/html, */*; q=0.01",
@@ -305,9 +302,10 @@ def stock_fund_flow_industry(symbol: str = "即时") -> pd.DataFrame:
             "Chrome/90.0.4430.85 Safari/537.36",
             "X-Requested-With": "XMLHttpRequest",
         }
-        r = requests.get(url.format(page), headers=headers)
+        r = request_get(url.format(page), headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     del big_df["序号"]
     big_df.reset_index(inplace=True)
@@ -353,9 +351,8 @@ def stock_fund_flow_big_deal() -> pd.DataFrame:
     :return: 大单追踪
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "Accept": "text/html, */*; q=0.01",
@@ -372,17 +369,16 @@ def stock_fund_flow_big_deal() -> pd.DataFrame:
         "X-Requested-With": "XMLHttpRequest",
     }
     url = "http://data.10jqka.com.cn/funds/ddzz/order/desc/ajax/1/free/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     raw_page = soup.find(name="span", attrs={"class": "page_info"}).text
     page_num = raw_page.split("/")[1]
     url = "http://data.10jqka.com.cn/funds/ddzz/order/asc/page/{}/ajax/1/free/1/"
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
-        js_code = py_mini_racer.MiniRacer()
         js_content = _get_file_content_ths("ths.js")
-        js_code.eval(js_content)
+        js_code = get_js_pool(js_content)
         v_code = js_code.call("v")
         headers = {
             "Accept": "text/html, */*; q=0.01",
@@ -398,9 +394,10 @@ def stock_fund_flow_big_deal() -> pd.DataFrame:
             "Chrome/90.0.4430.85 Safari/537.36",
             "X-Requested-With": "XMLHttpRequest",
         }
-        r = requests.get(url.format(page), headers=headers)
+        r = request_get(url.format(page), headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.columns = [
         "成交时间",
@@ -7,9 +7,9 @@ https://data.eastmoney.com/gdfx/
 """
 
 import pandas as pd
-import requests
 
-from akshare.utils.tqdm import get_tqdm
+from akshare.utils.datacenter import fetch_datacenter
+from akshare.utils.request import request_get
 
 
 def stock_gdfx_free_holding_statistics_em(
@@ -23,7 +23,6 @@ def stock_gdfx_free_holding_statistics_em(
     :return: 十大流通股东
     :rtype: pandas.DataFrame
     """
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     params = {
         "sortColumns": "STATISTICS_TIMES,COOPERATION_HOLDER_MARK",
         "sortTypes": "-1,-1",
@@ -35,17 +34,7 @@ def stock_gdfx_free_holding_statistics_em(
         "client": "WEB",
         "filter": f"""(HOLDNUM_CHANGE_TYPE="001")(END_DATE='{"-".join([date[:4], date[4:6], date[6:]])}')""",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = fetch_datacenter(params)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
     big_df.columns = [
@@ -125,7 +114,6 @@ def stock_gdfx_holding_statistics_em(date: str = "20210930") -> pd.DataFrame:
     :return: 十大股东
     :rtype: pandas.DataFrame
     """
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     params = {
         "sortColumns": "STATISTICS_TIMES,COOPERATION_HOLDER_MARK",
         "sortTypes": "-1,-1",
@@ -137,17 +125,7 @@ def stock_gdfx_holding_statistics_em(date: str = "20210930") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"""(HOLDNUM_CHANGE_TYPE="001")(END_DATE='{"-".join([date[:4], date[4:6], date[6:]])}')""",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+    big_df = fetch_datacenter(params)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
@@ -228,7 +206,6 @@ def stock_gdfx_free_holding_change_em(date: str = "20210930") -> pd.DataFrame:
     :return: 十大流通股东
     :rtype: pandas.DataFrame
     """
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     params = {
         "sortColumns": "HOLDER_NUM,HOLDER_NEW",
         "sortTypes": "-1,-1",
@@ -240,17 +217,7 @@ def stock_gdfx_free_holding_change_em(date: str = "20210930") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"(END_DATE='{'-'.join([date[:4], date[4:6], date[6:]])}')",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = fetch_datacenter(params)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
@@ -318,7 +285,6 @@ def stock_gdfx_holding_change_em(date: str = "20210930") -> pd.DataFrame:
     :return: 十大流通股东
     :rtype: pandas.DataFrame
     """
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     params = {
         "sortColumns": "HOLDER_NUM,HOLDER_NEW",
         "sortTypes": "-1,-1",
@@ -330,17 +296,7 @@ def stock_gdfx_holding_change_em(date: str = "20210930") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"(END_DATE='{'-'.join([date[:4], date[4:6], date[6:]])}')",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = fetch_datacenter(params)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
@@ -409,7 +365,7 @@ def stock_gdfx_free_top_10_em(
         "code": f"{symbol.upper()}",
         "date": f"{'-'.join([date[:4], date[4:6], date[6:]])}",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["sdltgd"])
     temp_df.reset_index(inplace=True)
@@ -466,7 +422,7 @@ def stock_gdfx_top_10_em(
         "code": f"{symbol.upper()}",
         "date": f"{'-'.join([date[:4], date[4:6], date[6:]])}",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["sdgd"])
     temp_df.reset_index(inplace=True)
@@ -510,7 +466,6 @@ def stock_gdfx_free_holding_detail_em(date: str = "20210930") -> pd.DataFrame:
     :return: 十大流通股东
     :rtype: pandas.DataFrame
     """
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     params = {
         "sortColumns": "UPDATE_DATE,SECURITY_CODE,HOLDER_RANK",
         "sortTypes": "-1,1,1",
@@ -522,17 +477,7 @@ def stock_gdfx_free_holding_detail_em(date: str = "20210930") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"(END_DATE='{'-'.join([date[:4], date[4:6], date[6:]])}')",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+    big_df = fetch_datacenter(params)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
@@ -607,7 +552,6 @@ def stock_gdfx_holding_detail_em(
     import warnings
 
     warnings.filterwarnings(action="ignore", category=FutureWarning)
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     params = {
         "sortColumns": "NOTICE_DATE,SECURITY_CODE,RANK",
         "sortTypes": "-1,1,1",
@@ -619,17 +563,7 @@ def stock_gdfx_holding_detail_em(
         "client": "WEB",
         "filter": f"""(HOLDER_NEWTYPE="{indicator}")(HOLDNUM_CHANGE_NAME="{symbol}")(END_DATE='{"-".join([date[:4], date[4:6], date[6:]])}')""",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = fetch_datacenter(params)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
@@ -694,7 +628,6 @@ def stock_gdfx_free_holding_analyse_em(date: str = "20230930") -> pd.DataFrame:
     :return: 十大流通股东
     :rtype: pandas.DataFrame
     """
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     params = {
         "sortColumns": "UPDATE_DATE,SECURITY_CODE,HOLDER_RANK",
         "sortTypes": "-1,1,1",
@@ -706,17 +639,7 @@ def stock_gdfx_free_holding_analyse_em(date: str = "20230930") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"(END_DATE='{'-'.join([date[:4], date[4:6], date[6:]])}')",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = fetch_datacenter(params)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
@@ -792,7 +715,6 @@ def stock_gdfx_holding_analyse_em(date: str = "20230331") -> pd.DataFrame:
     :return: 十大股东
     :rtype: pandas.DataFrame
     """
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     params = {
         "sortColumns": "NOTICE_DATE,SECURITY_CODE,RANK",
         "sortTypes": "-1,1,1",
@@ -804,17 +726,7 @@ def stock_gdfx_holding_analyse_em(date: str = "20230331") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"(END_DATE='{'-'.join([date[:4], date[4:6], date[6:]])}')",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = fetch_datacenter(params)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
@@ -896,7 +808,6 @@ def stock_gdfx_free_holding_teamwork_em(symbol: str = "社保") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     symbol_dict = {} if symbol == "全部" else {"filter": f'(HOLDER_TYPE="{symbol}")'}
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     params = {
         "sortColumns": "COOPERAT_NUM,HOLDER_NEW,COOPERAT_HOLDER_NEW",
         "sortTypes": "-1,-1,-1",
@@ -908,17 +819,7 @@ def stock_gdfx_free_holding_teamwork_em(symbol: str = "社保") -> pd.DataFrame:
         "client": "WEB",
     }
     params.update(symbol_dict)
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = fetch_datacenter(params)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
@@ -959,7 +860,6 @@ def stock_gdfx_holding_teamwork_em(symbol: str = "社保") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     symbol_dict = {} if symbol == "全部" else {"filter": f'(HOLDER_TYPE="{symbol}")'}
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     params = {
         "sortColumns": "COOPERAT_NUM,HOLDER_NEW,COOPERAT_HOLDER_NEW",
         "sortTypes": "-1,-1,-1",
@@ -971,17 +871,7 @@ def stock_gdfx_holding_teamwork_em(symbol: str = "社保") -> pd.DataFrame:
         "client": "WEB",
     }
     params.update(symbol_dict)
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = fetch_datacenter(params)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
@@ -1,15 +1,16 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/6/16 18:03
+Date: 2026/10/18 15:00
 Desc: 东方财富网-数据中心-特色数据-高管持股
 https://data.eastmoney.com/executive/gdzjc.html
 """
 
 import pandas as pd
-import requests
 
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def stock_ggcg_em(symbol: str = "全部") -> pd.DataFrame:
@@ -40,10 +41,10 @@ def stock_ggcg_em(symbol: str = "全部") -> pd.DataFrame:
         "client": "WEB",
         "filter": symbol_map[symbol],
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
@@ -51,10 +52,11 @@ def stock_ggcg_em(symbol: str = "全部") -> pd.DataFrame:
                 "pageNumber": page,
             }
         )
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.columns = [
         "持股变动信息-变动数量",
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 东方财富网-沪深京 A 股-每日行情-本地增量同步
+按 股票代码/周期/复权方式 将历史行情保存为本地 Parquet 文件, 每次只请求最后保存日期之后的数据;
+前复权数据在除权除息后会整体改写, 检测到重叠部分的价格发生变化时重新下载该股票的全部历史
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from akshare.stock_feature.stock_hist_em import stock_zh_a_hist
+from akshare.utils.store import DEFAULT_STORE_DIR, read_parquet, write_parquet
+
+_PRICE_COLUMNS = ["开盘", "收盘", "最高", "最低"]
+
+
+def stock_zh_a_hist_store_path(
+    symbol: str = "000001",
+    period: str = "daily",
+    adjust: str = "",
+    store_dir: str = DEFAULT_STORE_DIR,
+) -> str:
+    """
+    本地历史行情文件路径
+    :param symbol: 股票代码
+    :type symbol: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}
+    :type period: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param store_dir: 本地存储目录
+    :type store_dir: str
+    :return: 文件路径
+    :rtype: str
+    """
+    return os.path.join(
+        store_dir, "stock_zh_a_hist", period, adjust or "none", f"{symbol}.parquet"
+    )
+
+
+def _is_history_rewritten(stored_row: pd.Series, fetched_df: pd.DataFrame) -> bool:
+    """
+    比较重叠的 K 线, 判断历史数据是否被改写(如前复权的除权除息)
+    :param stored_row: 本地保存的重叠 K 线
+    :type stored_row: pandas.Series
+    :param fetched_df: 新下载的数据
+    :type fetched_df: pandas.DataFrame
+    :return: 是否被改写
+    :rtype: bool
+    """
+    matched_df = fetched_df[fetched_df["日期"] == stored_row["日期"]]
+    if matched_df.empty:
+        return True
+    return not np.allclose(
+        matched_df[_PRICE_COLUMNS].iloc[0].to_numpy(dtype=float),
+        stored_row[_PRICE_COLUMNS].to_numpy(dtype=float),
+        rtol=0,
+        atol=1e-6,
+        equal_nan=True,
+    )
+
+
+def stock_zh_a_hist_sync(
+    symbol: str = "000001",
+    period: str = "daily",
+    start_date: str = "19700101",
+    end_date: str = "20500101",
+    adjust: str = "",
+    store_dir: str = DEFAULT_STORE_DIR,
+    timeout: float = None,
+) -> pd.DataFrame:
+    """
+    东方财富网-行情首页-沪深京 A 股-每日行情-本地增量同步
+    第一次调用下载全部历史并保存到本地, 之后只下载倒数第二根 K 线之后的数据:
+    倒数第二根 K 线已经收盘, 用于检测复权数据是否被改写; 最后一根 K 线可能是未走完的周线或月线, 直接替换
+    https://quote.eastmoney.com/concept/sh603777.html?from=classic
+    :param symbol: 股票代码
+    :type symbol: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}
+    :type period: str
+    :param start_date: 返回数据的开始日期
+    :type start_date: str
+    :param end_date: 返回数据的结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param store_dir: 本地存储目录
+    :type store_dir: str
+    :param timeout: choice of None or a positive float number
+    :type timeout: float
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
+    path = stock_zh_a_hist_store_path(
+        symbol=symbol, period=period, adjust=adjust, store_dir=store_dir
+    )
+    stored_df = read_parquet(path)
+    temp_df = None
+    if stored_df is not None and len(stored_df) >= 2:
+        anchor_row = stored_df.iloc[-2]
+        fetched_df = stock_zh_a_hist(
+            symbol=symbol,
+            period=period,
+            start_date=anchor_row["日期"].strftime("%Y%m%d"),
+            end_date="20500101",
+            adjust=adjust,
+            timeout=timeout,
+        )
+        if fetched_df.empty:
+            temp_df = stored_df
+        elif not _is_history_rewritten(anchor_row, fetched_df):
+            temp_df = pd.concat(
+                objs=[stored_df[stored_df["日期"] < anchor_row["日期"]], fetched_df],
+                ignore_index=True,
+            )
+            write_parquet(temp_df, path)
+    if temp_df is None:
+        temp_df = stock_zh_a_hist(
+            symbol=symbol,
+            period=period,
+            start_date="19700101",
+            end_date="20500101",
+            adjust=adjust,
+            timeout=timeout,
+        )
+        if temp_df.empty:
+            return temp_df
+        write_parquet(temp_df, path)
+    start = pd.to_datetime(start_date).date()
+    end = pd.to_datetime(end_date).date()
+    temp_df = temp_df[(temp_df["日期"] >= start) & (temp_df["日期"] <= end)]
+    temp_df.reset_index(drop=True, inplace=True)
+    return temp_df
+
+
+if __name__ == "__main__":
+    stock_zh_a_hist_sync_df = stock_zh_a_hist_sync(
+        symbol="000001", period="daily", adjust="qfq"
+    )
+    print(stock_zh_a_hist_sync_df)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/10/15 22:30
+Date: 2026/10/18 15:00
 Desc: 腾讯证券-行情首页-沪深京A股
 https://quote.eastmoney.com/
 """
@@ -9,11 +9,12 @@ https://quote.eastmoney.com/
 import datetime
 
 import pandas as pd
-import requests
 
 from akshare.index.index_stock_zh import get_tx_start_year
-from akshare.utils import demjson
+from akshare.utils import jsonp
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def stock_zh_a_hist_tx(
@@ -48,7 +49,7 @@ def stock_zh_a_hist_tx(
         range_end = datetime.date.today().year + 1
     else:
         range_end = int(end_date.split("-")[0]) + 1
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for year in tqdm(range(range_start, range_end), leave=False):
         params = {
@@ -56,18 +57,17 @@ def stock_zh_a_hist_tx(
             "param": f"{symbol},day,{year}-01-01,{year + 1}-12-31,640,{adjust}",
             "r": "0.8205512681390605",
         }
-        r = requests.get(url, params=params, timeout=timeout)
+        r = request_get(url, params=params, timeout=timeout)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("={") + 1 :])["data"][
-            symbol
-        ]
+        data_json = jsonp.loads_jsonp(data_text)["data"][symbol]
         if "day" in data_json.keys():
             temp_df = pd.DataFrame(data_json["day"])
         elif "hfqday" in data_json.keys():
             temp_df = pd.DataFrame(data_json["hfqday"])
         else:
             temp_df = pd.DataFrame(data_json["qfqday"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df = big_df.iloc[:, :6]
     big_df.columns = ["date", "open", "close", "high", "low", "amount"]
     big_df["date"] = pd.to_datetime(big_df["date"], errors="coerce").dt.date
@@ -1,18 +1,18 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2025/3/4 23:00
+Date: 2026/10/18 15:00
 Desc: 东方财富网-数据中心-沪深港通持股
 https://data.eastmoney.com/hsgtcg/
 沪深港通详情: https://finance.eastmoney.com/news/1622,20161118685370149.html
 """
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
-from akshare.utils.func import fetch_paginated_data
+from akshare.utils.func import ChunkAccumulator, fetch_paginated_data
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
 
 
 def stock_hsgt_fund_flow_summary_em() -> pd.DataFrame:
@@ -38,7 +38,7 @@ def stock_hsgt_fund_flow_summary_em() -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
@@ -182,7 +182,7 @@ def stock_hsgt_hold_stock_em(
     :rtype: pandas.DataFrame
     """
     url = "https://data.eastmoney.com/hsgtcg/list.html"
-    r = requests.get(url)
+    r = request_get(url)
     soup = BeautifulSoup(r.text, features="lxml")
     date = (
         soup.find(name="div", attrs={"class": "title"})
@@ -224,17 +224,18 @@ def stock_hsgt_hold_stock_em(
         "client": "WEB",
         "filter": filter_str,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.reset_index(inplace=True)
     big_df["index"] = range(1, len(big_df) + 1)
@@ -373,17 +374,18 @@ def stock_hsgt_stock_statistics_em(
                 {"filter": f"""(INTERVAL_TYPE="1")(RN=1)(TRADE_DATE='{start_date}')"""}
             )
         url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_chunks = ChunkAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, int(total_page) + 1), leave=False):
             params.update({"pageNumber": page})
-            r = requests.get(url, params=params)
+            r = request_get(url, params=params)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_chunks.append(temp_df)
+        big_df = big_chunks.to_frame()
 
         big_df.columns = [
             "-",
@@ -468,17 +470,18 @@ def stock_hsgt_stock_statistics_em(
                 }
             )
         url = "http://datacenter-web.eastmoney.com/api/data/v1/get"
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_chunks = ChunkAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, int(total_page) + 1), leave=False):
             params.update({"pageNumber": page})
-            r = requests.get(url, params=params)
+            r = request_get(url, params=params)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_chunks.append(temp_df)
+        big_df = big_chunks.to_frame()
 
         big_df.columns = [
             "-",
@@ -576,17 +579,18 @@ def stock_hsgt_stock_statistics_em(
                 }
             )
         url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_chunks = ChunkAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, int(total_page) + 1), leave=False):
             params.update({"pageNumber": page})
-            r = requests.get(url, params=params)
+            r = request_get(url, params=params)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_chunks.append(temp_df)
+        big_df = big_chunks.to_frame()
         big_df.columns = [
             "-",
             "-",
@@ -684,17 +688,18 @@ def stock_hsgt_stock_statistics_em(
                 }
             )
         url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_chunks = ChunkAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, int(total_page) + 1), leave=False):
             params.update({"pageNumber": page})
-            r = requests.get(url, params=params)
+            r = request_get(url, params=params)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_chunks.append(temp_df)
+        big_df = big_chunks.to_frame()
         big_df.columns = [
             "-",
             "-",
@@ -811,7 +816,7 @@ def stock_hsgt_institution_statistics_em(
             "filter": f"""(MARKET_TYPE="S")(HOLD_DATE>='{start_date}')(HOLD_DATE<='{end_date}')""",
         }
         url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-        r = requests.get(url, params=params, headers=headers)
+        r = request_get(url, params=params, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
         temp_df.columns = [
@@ -874,17 +879,18 @@ def stock_hsgt_institution_statistics_em(
             "filter": f"""(MARKET_TYPE="N")(HOLD_DATE>='{start_date}')(HOLD_DATE<='{end_date}')""",
         }
         url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-        r = requests.get(url, params=params, headers=headers)
+        r = request_get(url, params=params, headers=headers)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_chunks = ChunkAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, total_page + 1), leave=False):
             params.update({"pageNumber": page})
-            r = requests.get(url, params=params, headers=headers)
+            r = request_get(url, params=params, headers=headers)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_chunks.append(temp_df)
+        big_df = big_chunks.to_frame()
         big_df.columns = [
             "持股日期",
             "_",
@@ -942,17 +948,18 @@ def stock_hsgt_institution_statistics_em(
             "filter": f"""(MARKET_TYPE="001")(HOLD_DATE>='{start_date}')(HOLD_DATE<='{end_date}')""",
         }
         url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-        r = requests.get(url, params=params, headers=headers)
+        r = request_get(url, params=params, headers=headers)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_chunks = ChunkAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, total_page + 1), leave=False):
             params.update({"pageNumber": page})
-            r = requests.get(url, params=params, headers=headers)
+            r = request_get(url, params=params, headers=headers)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_chunks.append(temp_df)
+        big_df = big_chunks.to_frame()
         big_df.columns = [
             "持股日期",
             "_",
@@ -1010,17 +1017,18 @@ def stock_hsgt_institution_statistics_em(
             "filter": f"""(MARKET_TYPE="003")(HOLD_DATE>='{start_date}')(HOLD_DATE<='{end_date}')""",
         }
         url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-        r = requests.get(url, params=params, headers=headers)
+        r = request_get(url, params=params, headers=headers)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_chunks = ChunkAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, total_page + 1), leave=False):
             params.update({"pageNumber": page})
-            r = requests.get(url, params=params, headers=headers)
+            r = request_get(url, params=params, headers=headers)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_chunks.append(temp_df)
+        big_df = big_chunks.to_frame()
         big_df.columns = [
             "持股日期",
             "_",
@@ -1099,14 +1107,14 @@ def stock_hsgt_hist_em(symbol: str = "北向资金") -> pd.DataFrame:
         "client": "WEB",
         "filter": f'(MUTUAL_TYPE="00{symbol_map[symbol]}")',
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
     temp_list = []
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
         temp_list.append(temp_df)
@@ -1201,7 +1209,7 @@ def stock_hsgt_board_rank_em(
     :rtype: pandas.DataFrame
     """
     url = "https://data.eastmoney.com/hsgtcg/hy.html"
-    r = requests.get(url)
+    r = request_get(url)
     soup = BeautifulSoup(r.text, features="lxml")
     current_date = soup.find(attrs={"id": "bkph_date"}).text.strip("（").strip("）")
     symbol_map = {
@@ -1231,7 +1239,7 @@ def stock_hsgt_board_rank_em(
         "client": "WEB",
         "filter": f"""(BOARD_TYPE="{symbol_map[symbol]}")(TRADE_DATE='{current_date}')(INTERVAL_TYPE="{indicator_map[indicator]}")""",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.reset_index(inplace=True)
@@ -1348,13 +1356,13 @@ def __stock_hsgt_individual_zh_hk_em(symbol: str = "00700") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"""(SECUCODE="{symbol}.HK")(MUTUAL_TYPE="002")""",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
     temp_df = pd.DataFrame(data_json["result"]["data"])
     for page in range(1, total_page + 1):
         params.update({"pageNumber": str(page)})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         if page == 1:
             temp_df = pd.DataFrame(data_json["result"]["data"])
@@ -1441,13 +1449,13 @@ def __stock_hsgt_individual_zh_a_em(symbol: str = "002008") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"""(SECURITY_CODE="{symbol}")(INTERVAL_TYPE="1")""",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
     temp_df = pd.DataFrame(data_json["result"]["data"])
     for page in range(1, total_page + 1):
         params.update({"pageNumber": str(page)})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         if page == 1:
             temp_df = pd.DataFrame(data_json["result"]["data"])
@@ -1555,7 +1563,7 @@ def stock_hsgt_individual_detail_em(
         >='{"-".join([start_date[:4], start_date[4:6], start_date[6:]])}')(HOLD_DATE
         <='{"-".join([end_date[:4], end_date[4:6], end_date[6:]])}')""",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     try:
         data_json["result"]["pages"]
@@ -1567,17 +1575,18 @@ def stock_hsgt_individual_detail_em(
                 <='{"-".join([end_date[:4], end_date[4:6], end_date[6:]])}')""",
             }
         )
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.rename(
         columns={
             "SECUCODE": "-",
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/8/25 15:00
+Date: 2026/10/18 15:00
 Desc: 东方财富-财经早餐
 https://stock.eastmoney.com/a/czpnc.html
 """
@@ -9,10 +9,11 @@ https://stock.eastmoney.com/a/czpnc.html
 from datetime import datetime
 
 import pandas as pd
-import requests
 
 from akshare.request import make_request_with_retry_json
 from akshare.utils.cons import headers
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
 
 
 def stock_info_cjzc_em() -> pd.DataFrame:
@@ -34,13 +35,14 @@ def stock_info_cjzc_em() -> pd.DataFrame:
         "req_trace": "1710314682980",
         "fields": "code,showTime,title,mediaName,summary,image,url,uniqueUrl,Np_dst",
     }
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in range(1, 3):
         params.update({"page_index": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["list"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df = big_df[["title", "summary", "showTime", "uniqueUrl"]]
     big_df.rename(
@@ -71,7 +73,7 @@ def stock_info_global_em() -> pd.DataFrame:
         "pageSize": "200",
         "req_trace": "1710315450384",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"]["fastNewsList"])
     temp_df = temp_df[["title", "summary", "showTime", "code"]]
@@ -108,7 +110,7 @@ def stock_info_global_sina() -> pd.DataFrame:
         "pagesize": "20",
         "type": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     time_list = [
         item["create_time"] for item in data_json["result"]["data"]["feed"]["list"]
@@ -136,7 +138,7 @@ def stock_info_global_futu() -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko)"
         " Chrome/111.0.0.0 Safari/537.36"
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"]["data"]["news"])
     temp_df = temp_df[["title", "content", "time", "detailUrl"]]
@@ -169,7 +171,7 @@ def stock_info_global_ths() -> pd.DataFrame:
         "tag": "",
         "track": "website",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"]["list"])
     temp_df = temp_df[["title", "digest", "rtime", "url"]]
@@ -7,7 +7,8 @@ https://xueqiu.com/hq/insider
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def stock_inner_trade_xq() -> pd.DataFrame:
@@ -42,7 +43,7 @@ def stock_inner_trade_xq() -> pd.DataFrame:
         "Chrome/100.0.4896.127 Safari/537.36",
         "X-Requested-With": "XMLHttpRequest",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"]["items"])
     temp_df.columns = [
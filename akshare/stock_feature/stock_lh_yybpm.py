@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/5/6 20:30
+Date: 2026/10/18 15:00
 Desc: 同花顺-数据中心-营业部排名
 https://data.10jqka.com.cn/market/longhu/
 """
@@ -9,11 +9,12 @@ https://data.10jqka.com.cn/market/longhu/
 from io import StringIO
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
 from akshare.utils.tqdm import get_tqdm
 from akshare.utils.cons import headers
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def stock_lh_yyb_most() -> pd.DataFrame:
@@ -24,17 +25,18 @@ def stock_lh_yyb_most() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://data.10jqka.com.cn/ifmarket/lhbyyb/type/1/tab/sbcs/field/sbcs/sort/desc/page/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     page_str = soup.find(name="span", attrs={"class": "page_info"}).text
     total_page = int(page_str.split("/")[1]) + 1
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page), leave=False):
         url = f"https://data.10jqka.com.cn/ifmarket/lhbyyb/type/1/tab/sbcs/field/sbcs/sort/desc/page/{page}/"
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True, drop=True)
     return big_df
 
@@ -47,17 +49,18 @@ def stock_lh_yyb_capital() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://data.10jqka.com.cn/ifmarket/lhbyyb/type/1/tab/zjsl/field/zgczje/sort/desc/page/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     page_str = soup.find(name="span", attrs={"class": "page_info"}).text
     total_page = int(page_str.split("/")[1]) + 1
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page), leave=False):
         url = f"https://data.10jqka.com.cn/ifmarket/lhbyyb/type/1/tab/zjsl/field/zgczje/sort/desc/page/{page}/"
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True, drop=True)
     return big_df
 
@@ -70,17 +73,18 @@ def stock_lh_yyb_control() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://data.10jqka.com.cn/ifmarket/lhbyyb/type/1/tab/btcz/field/xsjs/sort/desc/page/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     page_str = soup.find(name="span", attrs={"class": "page_info"}).text
     total_page = int(page_str.split("/")[1]) + 1
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page), leave=False):
         url = f"https://data.10jqka.com.cn/ifmarket/lhbyyb/type/1/tab/btcz/field/xsjs/sort/desc/page/{page}/"
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True, drop=True)
     return big_df
 
@@ -1,68 +1,25 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2024/4/22 14:00
+Date: 2026/10/18 15:00
 Desc: 东方财富网-数据中心-龙虎榜单
 https://data.eastmoney.com/stock/tradedetail.html
 """
 
 import pandas as pd
-import requests
-from akshare.utils.tqdm import get_tqdm
 
+from akshare.utils.datacenter import (
+    ReportSchema,
+    fetch_datacenter,
+    register_report_schema,
+)
+from akshare.utils.request import request_get
 
-def stock_lhb_detail_em(
-    start_date: str = "20230403", end_date: str = "20230417"
-) -> pd.DataFrame:
-    """
-    东方财富网-数据中心-龙虎榜单-龙虎榜详情
-    https://data.eastmoney.com/stock/tradedetail.html
-    :param start_date: 开始日期
-    :type start_date: str
-    :param end_date: 结束日期
-    :type end_date: str
-    :return: 龙虎榜详情
-    :rtype: pandas.DataFrame
-    """
-    start_date = "-".join([start_date[:4], start_date[4:6], start_date[6:]])
-    end_date = "-".join([end_date[:4], end_date[4:6], end_date[6:]])
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
-    params = {
-        "sortColumns": "SECURITY_CODE,TRADE_DATE",
-        "sortTypes": "1,-1",
-        "pageSize": "5000",
-        "pageNumber": "1",
-        "reportName": "RPT_DAILYBILLBOARD_DETAILSNEW",
-        "columns": "SECURITY_CODE,SECUCODE,SECURITY_NAME_ABBR,TRADE_DATE,EXPLAIN,CLOSE_PRICE,CHANGE_RATE,"
-        "BILLBOARD_NET_AMT,BILLBOARD_BUY_AMT,BILLBOARD_SELL_AMT,BILLBOARD_DEAL_AMT,ACCUM_AMOUNT,"
-        "DEAL_NET_RATIO,DEAL_AMOUNT_RATIO,TURNOVERRATE,FREE_MARKET_CAP,EXPLANATION,D1_CLOSE_ADJCHRATE,"
-        "D2_CLOSE_ADJCHRATE,D5_CLOSE_ADJCHRATE,D10_CLOSE_ADJCHRATE,SECURITY_TYPE_CODE",
-        "source": "WEB",
-        "client": "WEB",
-        "filter": f"(TRADE_DATE<='{end_date}')(TRADE_DATE>='{start_date}')",
-    }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page_num + 1), leave=False):
-        params.update(
-            {
-                "pageNumber": page,
-            }
-        )
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
-    big_df.reset_index(inplace=True)
-    big_df["index"] = big_df.index + 1
-    big_df.rename(
+_LHB_DETAIL_SCHEMA = register_report_schema(
+    "stock_lhb_detail_em",
+    ReportSchema(
         columns={
-            "index": "序号",
             "SECURITY_CODE": "代码",
-            "SECUCODE": "-",
             "SECURITY_NAME_ABBR": "名称",
             "TRADE_DATE": "上榜日",
             "EXPLAIN": "解读",
@@ -83,11 +40,7 @@ def stock_lhb_detail_em(
             "D5_CLOSE_ADJCHRATE": "上榜后5日",
             "D10_CLOSE_ADJCHRATE": "上榜后10日",
         },
-        inplace=True,
-    )
-
-    big_df = big_df[
-        [
+        output=[
             "序号",
             "代码",
             "名称",
@@ -109,28 +62,75 @@ def stock_lhb_detail_em(
             "上榜后2日",
             "上榜后5日",
             "上榜后10日",
-        ]
-    ]
-    big_df["上榜日"] = pd.to_datetime(big_df["上榜日"], errors="coerce").dt.date
-    big_df["收盘价"] = pd.to_numeric(big_df["收盘价"], errors="coerce")
-    big_df["涨跌幅"] = pd.to_numeric(big_df["涨跌幅"], errors="coerce")
-    big_df["龙虎榜净买额"] = pd.to_numeric(big_df["龙虎榜净买额"], errors="coerce")
-    big_df["龙虎榜买入额"] = pd.to_numeric(big_df["龙虎榜买入额"], errors="coerce")
-    big_df["龙虎榜卖出额"] = pd.to_numeric(big_df["龙虎榜卖出额"], errors="coerce")
-    big_df["龙虎榜成交额"] = pd.to_numeric(big_df["龙虎榜成交额"], errors="coerce")
-    big_df["市场总成交额"] = pd.to_numeric(big_df["市场总成交额"], errors="coerce")
-    big_df["净买额占总成交比"] = pd.to_numeric(
-        big_df["净买额占总成交比"], errors="coerce"
-    )
-    big_df["成交额占总成交比"] = pd.to_numeric(
-        big_df["成交额占总成交比"], errors="coerce"
-    )
-    big_df["换手率"] = pd.to_numeric(big_df["换手率"], errors="coerce")
-    big_df["流通市值"] = pd.to_numeric(big_df["流通市值"], errors="coerce")
-    big_df["上榜后1日"] = pd.to_numeric(big_df["上榜后1日"], errors="coerce")
-    big_df["上榜后2日"] = pd.to_numeric(big_df["上榜后2日"], errors="coerce")
-    big_df["上榜后5日"] = pd.to_numeric(big_df["上榜后5日"], errors="coerce")
-    big_df["上榜后10日"] = pd.to_numeric(big_df["上榜后10日"], errors="coerce")
+        ],
+        dtypes=[("上榜日", "date")]
+        + [
+            (name, "number")
+            for name in [
+                "收盘价",
+                "涨跌幅",
+                "龙虎榜净买额",
+                "龙虎榜买入额",
+                "龙虎榜卖出额",
+                "龙虎榜成交额",
+                "市场总成交额",
+                "净买额占总成交比",
+                "成交额占总成交比",
+                "换手率",
+                "流通市值",
+                "上榜后1日",
+                "上榜后2日",
+                "上榜后5日",
+                "上榜后10日",
+            ]
+        ],
+    ),
+)
+
+
+def _lhb_detail_params(start_date: str, end_date: str) -> dict:
+    """
+    东方财富网-数据中心-龙虎榜单-龙虎榜详情-请求参数
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :return: 请求参数
+    :rtype: dict
+    """
+    start_date = "-".join([start_date[:4], start_date[4:6], start_date[6:]])
+    end_date = "-".join([end_date[:4], end_date[4:6], end_date[6:]])
+    return {
+        "sortColumns": "SECURITY_CODE,TRADE_DATE",
+        "sortTypes": "1,-1",
+        "pageSize": "5000",
+        "pageNumber": "1",
+        "reportName": "RPT_DAILYBILLBOARD_DETAILSNEW",
+        "columns": "SECURITY_CODE,SECUCODE,SECURITY_NAME_ABBR,TRADE_DATE,EXPLAIN,CLOSE_PRICE,CHANGE_RATE,"
+        "BILLBOARD_NET_AMT,BILLBOARD_BUY_AMT,BILLBOARD_SELL_AMT,BILLBOARD_DEAL_AMT,ACCUM_AMOUNT,"
+        "DEAL_NET_RATIO,DEAL_AMOUNT_RATIO,TURNOVERRATE,FREE_MARKET_CAP,EXPLANATION,D1_CLOSE_ADJCHRATE,"
+        "D2_CLOSE_ADJCHRATE,D5_CLOSE_ADJCHRATE,D10_CLOSE_ADJCHRATE,SECURITY_TYPE_CODE",
+        "source": "WEB",
+        "client": "WEB",
+        "filter": f"(TRADE_DATE<='{end_date}')(TRADE_DATE>='{start_date}')",
+    }
+
+
+def stock_lhb_detail_em(
+    start_date: str = "20230403", end_date: str = "20230417"
+) -> pd.DataFrame:
+    """
+    东方财富网-数据中心-龙虎榜单-龙虎榜详情
+    https://data.eastmoney.com/stock/tradedetail.html
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :return: 龙虎榜详情
+    :rtype: pandas.DataFrame
+    """
+    params = _lhb_detail_params(start_date, end_date)
+    big_df = fetch_datacenter(params, schema=_LHB_DETAIL_SCHEMA)
     return big_df
 
 
@@ -161,7 +161,7 @@ def stock_lhb_stock_statistic_em(symbol: str = "近一月") -> pd.DataFrame:
         "client": "WEB",
         "filter": f'(STATISTICS_CYCLE="{symbol_map[symbol]}")',
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.reset_index(inplace=True)
@@ -238,7 +238,6 @@ def stock_lhb_jgmmtj_em(
     """
     start_date = "-".join([start_date[:4], start_date[4:6], start_date[6:]])
     end_date = "-".join([end_date[:4], end_date[4:6], end_date[6:]])
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     params = {
         "sortColumns": "NET_BUY_AMT,TRADE_DATE,SECURITY_CODE",
         "sortTypes": "-1,-1,1",
@@ -250,21 +249,7 @@ def stock_lhb_jgmmtj_em(
         "client": "WEB",
         "filter": f"(TRADE_DATE>='{start_date}')(TRADE_DATE<='{end_date}')",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update(
-            {
-                "pageNumber": page,
-            }
-        )
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = fetch_datacenter(params)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
     big_df.columns = [
@@ -347,7 +332,6 @@ def stock_lhb_jgstatistic_em(symbol: str = "近一月") -> pd.DataFrame:
         "近六月": "03",
         "近一年": "04",
     }
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     params = {
         "sortColumns": "ONLIST_TIMES,SECURITY_CODE",
         "sortTypes": "-1,1",
@@ -359,17 +343,7 @@ def stock_lhb_jgstatistic_em(symbol: str = "近一月") -> pd.DataFrame:
         "client": "WEB",
         "filter": f'(STATISTICSCYCLE="{symbol_map[symbol]}")',
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = fetch_datacenter(params)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
     big_df.rename(
@@ -445,7 +419,6 @@ def stock_lhb_hyyyb_em(
     """
     start_date = "-".join([start_date[:4], start_date[4:6], start_date[6:]])
     end_date = "-".join([end_date[:4], end_date[4:6], end_date[6:]])
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     params = {
         "sortColumns": "TOTAL_NETAMT,ONLIST_DATE,OPERATEDEPT_CODE",
         "sortTypes": "-1,-1,1",
@@ -457,17 +430,7 @@ def stock_lhb_hyyyb_em(
         "client": "WEB",
         "filter": f"(ONLIST_DATE>='{start_date}')(ONLIST_DATE<='{end_date}')",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = fetch_datacenter(params)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
     big_df.columns = [
@@ -524,7 +487,6 @@ def stock_lhb_yybph_em(symbol: str = "近一月") -> pd.DataFrame:
         "近六月": "03",
         "近一年": "04",
     }
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     params = {
         "sortColumns": "TOTAL_BUYER_SALESTIMES_1DAY,OPERATEDEPT_CODE",
         "sortTypes": "-1,1",
@@ -536,17 +498,7 @@ def stock_lhb_yybph_em(symbol: str = "近一月") -> pd.DataFrame:
         "client": "WEB",
         "filter": f'(STATISTICSCYCLE="{symbol_map[symbol]}")',
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = fetch_datacenter(params)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
     big_df.rename(
@@ -660,7 +612,6 @@ def stock_lhb_traderstatistic_em(symbol: str = "近一月") -> pd.DataFrame:
         "近六月": "03",
         "近一年": "04",
     }
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     params = {
         "sortColumns": "AMOUNT,OPERATEDEPT_CODE",
         "sortTypes": "-1,1",
@@ -672,17 +623,7 @@ def stock_lhb_traderstatistic_em(symbol: str = "近一月") -> pd.DataFrame:
         "client": "WEB",
         "filter": f'(STATISTICSCYCLE="{symbol_map[symbol]}")',
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = fetch_datacenter(params)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
     big_df.rename(
@@ -741,7 +682,7 @@ def stock_lhb_stock_detail_date_em(symbol: str = "600077") -> pd.DataFrame:
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.reset_index(inplace=True)
@@ -798,7 +739,7 @@ def stock_lhb_stock_detail_em(
         "source": "WEB",
         "client": "WEB",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.reset_index(inplace=True)
@@ -910,7 +851,6 @@ def stock_lhb_yyb_detail_em(symbol: str = "10188715") -> pd.DataFrame:
     :return: 营业部交易明细数据
     :rtype: pandas.DataFrame
     """
-    url = "https://datacenter-web.eastmoney.com/api/data/v1/get"
     params = {
         "sortColumns": "TRADE_DATE,SECURITY_CODE",
         "sortTypes": "-1,1",
@@ -922,17 +862,7 @@ def stock_lhb_yyb_detail_em(symbol: str = "10188715") -> pd.DataFrame:
         "client": "WEB",
         "filter": f'(OPERATEDEPT_CODE="{symbol}")',
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
-    total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
-    tqdm = get_tqdm()
-    for page in tqdm(range(1, total_page + 1), leave=False):
-        params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
-        data_json = r.json()
-        temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+    big_df = fetch_datacenter(params)
 
     # 检查DataFrame是否为空
     if big_df.empty:
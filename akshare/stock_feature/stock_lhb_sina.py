@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/5/10 00:00
+Date: 2026/10/18 15:00
 Desc: 新浪财经-龙虎榜
 https://vip.stock.finance.sina.com.cn/q/go.php/vInvestConsult/kind/lhb/index.phtml
 """
@@ -9,10 +9,11 @@ https://vip.stock.finance.sina.com.cn/q/go.php/vInvestConsult/kind/lhb/index.pht
 from io import StringIO
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def stock_lhb_detail_daily_sina(date: str = "20240222") -> pd.DataFrame:
@@ -27,17 +28,18 @@ def stock_lhb_detail_daily_sina(date: str = "20240222") -> pd.DataFrame:
     date = "-".join([date[:4], date[4:6], date[6:]])
     url = "https://vip.stock.finance.sina.com.cn/q/go.php/vInvestConsult/kind/lhb/index.phtml"
     params = {"tradedate": date}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     soup = BeautifulSoup(r.text, features="lxml")
     selected_html = soup.find(name="div", attrs={"class": "list"}).find_all(
         name="table", attrs={"class": "list_table"}
     )
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for table in selected_html:
         temp_df = pd.read_html(StringIO(table.prettify()), header=0, skiprows=1)[0]
         temp_symbol = pd.read_html(StringIO(table.prettify()))[0].iat[0, 0]
         temp_df["指标"] = temp_symbol
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["股票代码"] = big_df["股票代码"].astype(str).str.zfill(6)
     del big_df["查看详情"]
     big_df.columns = [
@@ -65,7 +67,7 @@ def _find_last_page(
         "last": recent_day,
         "p": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     soup = BeautifulSoup(r.text, "lxml")
     try:
         previous_page = int(soup.find_all(attrs={"class": "page"})[-2].text)
@@ -77,7 +79,7 @@ def _find_last_page(
                 "last": recent_day,
                 "p": previous_page,
             }
-            r = requests.get(url, params=params)
+            r = request_get(url, params=params)
             soup = BeautifulSoup(r.text, features="lxml")
             last_page = int(soup.find_all(attrs={"class": "page"})[-2].text)
             if last_page != previous_page:
@@ -101,16 +103,17 @@ def stock_lhb_ggtj_sina(symbol: str = "5") -> pd.DataFrame:
         "https://vip.stock.finance.sina.com.cn/q/go.php/vLHBData/kind/ggtj/index.phtml"
     )
     last_page_num = _find_last_page(url, symbol)
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, last_page_num + 1), leave=False):
         params = {
             "last": symbol,
             "p": page,
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         temp_df = pd.read_html(StringIO(r.text))[0].iloc[0:, :]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["股票代码"] = big_df["股票代码"].astype(str).str.zfill(6)
     big_df.columns = [
         "股票代码",
@@ -138,16 +141,17 @@ def stock_lhb_yytj_sina(symbol: str = "5") -> pd.DataFrame:
         "https://vip.stock.finance.sina.com.cn/q/go.php/vLHBData/kind/yytj/index.phtml"
     )
     last_page_num = _find_last_page(url, symbol)
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, last_page_num + 1), leave=False):
         params = {
             "last": "5",
             "p": page,
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         temp_df = pd.read_html(StringIO(r.text))[0].iloc[0:, :]
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "营业部名称",
         "上榜次数",
@@ -176,18 +180,19 @@ def stock_lhb_jgzz_sina(symbol: str = "5") -> pd.DataFrame:
         "https://vip.stock.finance.sina.com.cn/q/go.php/vLHBData/kind/jgzz/index.phtml"
     )
     last_page_num = _find_last_page(url, symbol)
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, last_page_num + 1), leave=False):
         params = {
             "last": symbol,
             "p": page,
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         temp_df = pd.read_html(StringIO(r.text))[0].iloc[0:, :]
         if temp_df.empty:
             continue
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["股票代码"] = big_df["股票代码"].astype(str).str.zfill(6)
     del big_df["当前价"]
     del big_df["涨跌幅"]
@@ -218,21 +223,22 @@ def stock_lhb_jgmx_sina() -> pd.DataFrame:
     params = {
         "p": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     soup = BeautifulSoup(r.text, features="lxml")
     try:
         last_page_num = int(soup.find_all(attrs={"class": "page"})[-2].text)
     except:  # noqa: E722
         last_page_num = 1
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, last_page_num + 1), leave=False):
         params = {
             "p": page,
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         temp_df = pd.read_html(StringIO(r.text))[0].iloc[0:, :]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df["股票代码"] = big_df["股票代码"].astype(str).str.zfill(6)
     big_df["交易日期"] = pd.to_datetime(big_df["交易日期"], errors="coerce").dt.date
     big_df.rename(
@@ -9,10 +9,10 @@ https://www.legulegu.com/stockdata/market-activity
 from io import StringIO
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
 from akshare.utils.cons import headers
+from akshare.utils.request import request_get
 
 
 def stock_market_activity_legu() -> pd.DataFrame:
@@ -23,7 +23,7 @@ def stock_market_activity_legu() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://legulegu.com/stockdata/market-activity"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     temp_df = pd.read_html(StringIO(r.text))[0]
     temp_df_one = temp_df.iloc[:, :2]
     temp_df_one.columns = ["item", "value"]
@@ -7,7 +7,8 @@ http://data.eastmoney.com/other/qsjy.html
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def stock_qsjy_em(date: str = "20200731") -> pd.DataFrame:
@@ -31,7 +32,7 @@ def stock_qsjy_em(date: str = "20200731") -> pd.DataFrame:
         "client": "WEB",
         "filter": f"(END_DATE='{'-'.join([date[:4], date[4:6], date[6:]])}')",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df.columns = [
@@ -1,16 +1,17 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/2/28 13:00
+Date: 2026/10/18 15:00
 Desc: 东方财富网-数据中心-研究报告-个股研报
 https://data.eastmoney.com/report/stock.jshtml
 """
 
 import datetime
 import pandas as pd
-import requests
 
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def stock_research_report_em(symbol: str = "000001") -> pd.DataFrame:
@@ -41,11 +42,11 @@ def stock_research_report_em(symbol: str = "000001") -> pd.DataFrame:
         "pageNum": "1",
         "pageNumber": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["TotalPage"]
     current_year = data_json["currentYear"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
@@ -56,10 +57,11 @@ def stock_research_report_em(symbol: str = "000001") -> pd.DataFrame:
                 "pageNumber": page,
             }
         )
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], axis=0, ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
     predict_this_year_eps_title = f"{current_year}-盈利预测-收益"
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/5/21 19:20
+Date: 2026/10/18 15:00
 Desc: 上证e互动-提问与回答
 https://sns.sseinfo.com/
 """
@@ -10,10 +10,11 @@ import warnings
 from functools import lru_cache
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_post
+from akshare.utils.func import ChunkAccumulator
 
 
 @lru_cache()
@@ -36,7 +37,7 @@ def _fetch_stock_uid() -> dict:
     tqdm = get_tqdm()
     for page in tqdm(range(1, 73), leave=False):
         data.update({"page": page})
-        r = requests.post(url, data=data)
+        r = request_post(url, data=data)
         data_json = r.json()
         soup = BeautifulSoup(data_json["content"], features="lxml")
         soup.find_all(name="a", attrs={"rel": "tag"})
@@ -71,17 +72,17 @@ def stock_sns_sseinfo(symbol: str = "603119") -> pd.DataFrame:
         "uid": code_uid_map[symbol],
         "page": "1",
     }
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     page = 1
     warnings.warn("正在下载中")
     while True:
         params.update({"page": page})
-        r = requests.post(url, params=params)
+        r = request_post(url, params=params)
         if len(r.text) < 300:
             break
         else:
             page += 1
-        r = requests.post(url, params=params)
+        r = request_post(url, params=params)
         soup = BeautifulSoup(r.text, features="lxml")
         content_list = [
             item.get_text().strip()
@@ -142,7 +143,8 @@ def stock_sns_sseinfo(symbol: str = "603119") -> pd.DataFrame:
             "回答来源",
             "用户名",
         ]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     return big_df
 
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/9/15 15:30
+Date: 2026/10/18 15:00
 Desc: 东方财富网-数据中心-特色数据-商誉
 东方财富网-数据中心-特色数据-商誉-A股商誉市场概况: https://data.eastmoney.com/sy/scgk.html
 东方财富网-数据中心-特色数据-商誉-商誉减值预期明细: https://data.eastmoney.com/sy/yqlist.html
@@ -11,9 +11,10 @@ Desc: 东方财富网-数据中心-特色数据-商誉
 """
 
 import pandas as pd
-import requests
 
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def stock_sy_profile_em() -> pd.DataFrame:
@@ -35,7 +36,7 @@ def stock_sy_profile_em() -> pd.DataFrame:
         "filter": """((GOODWILL_STATE="1")( | IMPAIRMENT_STATE="1"))(TRADE_BOARD="all")""",
     }
 
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     data_df = pd.DataFrame(data_json["result"]["data"])
     data_df.columns = [
@@ -101,17 +102,18 @@ def stock_sy_yq_em(date: str = "20240630") -> pd.DataFrame:
         "reportName": "RPT_GOODWILL_STOCKPREDICT",
         "filter": f"""(REPORT_DATE='{"-".join([date[:4], date[4:6], date[6:]])}')""",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     total_page = int(data_json["result"]["pages"])
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
     big_df.rename(
@@ -210,17 +212,18 @@ def stock_sy_jz_em(date: str = "20240630") -> pd.DataFrame:
         "reportName": "RPT_GOODWILL_STOCKDETAILS",
         "filter": f"""(REPORT_DATE='{"-".join([date[:4], date[4:6], date[6:]])}')""",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     total_page = int(data_json["result"]["pages"])
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
     big_df.rename(
@@ -311,17 +314,18 @@ def stock_sy_em(date: str = "20231231") -> pd.DataFrame:
         "reportName": "RPT_GOODWILL_STOCKDETAILS",
         "filter": f"""(REPORT_DATE='{"-".join([date[:4], date[4:6], date[6:]])}')""",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     total_page = int(data_json["result"]["pages"])
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
     big_df.rename(
@@ -403,17 +407,18 @@ def stock_sy_hy_em(date: str = "20240930") -> pd.DataFrame:
         "reportName": "RPT_GOODWILL_INDUSTATISTICS",
         "filter": f"""(REPORT_DATE='{"-".join([date[:4], date[4:6], date[6:]])}')""",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     total_page = int(data_json["result"]["pages"])
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.reset_index(inplace=True, drop=True)
     big_df.rename(
         columns={
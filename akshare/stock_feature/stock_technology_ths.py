@@ -1,7 +1,7 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2024/9/21 19:00
+Date: 2026/10/18 15:00
 Desc: 同花顺-数据中心-技术选股
 https://data.10jqka.com.cn/rank/cxg/
 """
@@ -9,12 +9,13 @@ https://data.10jqka.com.cn/rank/cxg/
 from io import StringIO
 
 import pandas as pd
-import py_mini_racer
-import requests
 from bs4 import BeautifulSoup
 
 from akshare.datasets import get_ths_js
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.js_pool import get_js_pool
+from akshare.utils.func import ChunkAccumulator
 
 
 def _get_file_content_ths(file: str = "ths.js") -> str:
@@ -46,9 +47,8 @@ def stock_rank_cxg_ths(symbol: str = "创月新高") -> pd.DataFrame:
         "一年新高": "2",
         "历史新高": "1",
     }
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -59,7 +59,7 @@ def stock_rank_cxg_ths(symbol: str = "创月新高") -> pd.DataFrame:
         f"http://data.10jqka.com.cn/rank/cxg/board/{symbol_map[symbol]}/field/"
         f"stockcode/order/asc/page/1/ajax/1/free/1/"
     )
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     try:
         total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
@@ -67,7 +67,7 @@ def stock_rank_cxg_ths(symbol: str = "创月新高") -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
         v_code = js_code.call("v")
@@ -80,9 +80,10 @@ def stock_rank_cxg_ths(symbol: str = "创月新高") -> pd.DataFrame:
             f"http://data.10jqka.com.cn/rank/cxg/board/{symbol_map[symbol]}/field/stockcode/"
             f"order/asc/page/{page}/ajax/1/free/1/"
         )
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0].iloc[:, :-1]  # 20260214 新增
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "序号",
         "股票代码",
@@ -121,9 +122,8 @@ def stock_rank_cxd_ths(symbol: str = "创月新低") -> pd.DataFrame:
         "一年新低": "2",
         "历史新低": "1",
     }
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -134,7 +134,7 @@ def stock_rank_cxd_ths(symbol: str = "创月新低") -> pd.DataFrame:
         f"http://data.10jqka.com.cn/rank/cxd/board/{symbol_map[symbol]}/field/"
         f"stockcode/order/asc/page/1/ajax/1/free/1/"
     )
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     try:
         total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
@@ -142,7 +142,7 @@ def stock_rank_cxd_ths(symbol: str = "创月新低") -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
         v_code = js_code.call("v")
@@ -155,9 +155,10 @@ def stock_rank_cxd_ths(symbol: str = "创月新低") -> pd.DataFrame:
             f"http://data.10jqka.com.cn/rank/cxd/board/{symbol_map[symbol]}/field/"
             f"stockcode/order/asc/page/{page}/ajax/1/free/1/"
         )
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0].iloc[:, :-1]  # 20260214 新增
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "序号",
         "股票代码",
@@ -188,9 +189,8 @@ def stock_rank_lxsz_ths() -> pd.DataFrame:
     :return: 连续上涨
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -198,7 +198,7 @@ def stock_rank_lxsz_ths() -> pd.DataFrame:
         "Cookie": f"v={v_code}",
     }
     url = "http://data.10jqka.com.cn/rank/lxsz/field/lxts/order/desc/page/1/ajax/1/free/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     try:
         total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
@@ -206,7 +206,7 @@ def stock_rank_lxsz_ths() -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
         v_code = js_code.call("v")
@@ -216,9 +216,10 @@ def stock_rank_lxsz_ths() -> pd.DataFrame:
             "Cookie": f"v={v_code}",
         }
         url = f"http://data.10jqka.com.cn/rank/lxsz/field/lxts/order/desc/page/{page}/ajax/1/free/1/"
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text), converters={"股票代码": str})[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "序号",
         "股票代码",
@@ -249,9 +250,8 @@ def stock_rank_lxxd_ths() -> pd.DataFrame:
     :return: 连续下跌
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -259,7 +259,7 @@ def stock_rank_lxxd_ths() -> pd.DataFrame:
         "Cookie": f"v={v_code}",
     }
     url = "http://data.10jqka.com.cn/rank/lxxd/field/lxts/order/desc/page/1/ajax/1/free/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     try:
         total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
@@ -267,7 +267,7 @@ def stock_rank_lxxd_ths() -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
         v_code = js_code.call("v")
@@ -277,9 +277,10 @@ def stock_rank_lxxd_ths() -> pd.DataFrame:
             "Cookie": f"v={v_code}",
         }
         url = f"http://data.10jqka.com.cn/rank/lxxd/field/lxts/order/desc/page/{page}/ajax/1/free/1/"
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text), converters={"股票代码": str})[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "序号",
         "股票代码",
@@ -310,9 +311,8 @@ def stock_rank_cxfl_ths() -> pd.DataFrame:
     :return: 持续放量
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -320,7 +320,7 @@ def stock_rank_cxfl_ths() -> pd.DataFrame:
         "Cookie": f"v={v_code}",
     }
     url = "http://data.10jqka.com.cn/rank/cxfl/field/count/order/desc/ajax/1/free/1/page/1/free/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     try:
         total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
@@ -328,7 +328,7 @@ def stock_rank_cxfl_ths() -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
         v_code = js_code.call("v")
@@ -338,7 +338,7 @@ def stock_rank_cxfl_ths() -> pd.DataFrame:
             "Cookie": f"v={v_code}",
         }
         url = f"http://data.10jqka.com.cn/rank/cxfl/field/count/order/desc/ajax/1/free/1/page/{page}/free/1/"
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         soup = BeautifulSoup(r.text, 'html.parser')
         table = soup.find('table', class_='m-table J-ajax-table')
         if not table:
@@ -366,7 +366,8 @@ def stock_rank_cxfl_ths() -> pd.DataFrame:
                 data.append(item)
 
         temp_df = pd.DataFrame(data)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "序号",
         "股票代码",
@@ -396,9 +397,8 @@ def stock_rank_cxsl_ths() -> pd.DataFrame:
     :return: 持续缩量
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -406,7 +406,7 @@ def stock_rank_cxsl_ths() -> pd.DataFrame:
         "Cookie": f"v={v_code}",
     }
     url = "http://data.10jqka.com.cn/rank/cxsl/field/count/order/desc/ajax/1/free/1/page/1/free/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     try:
         total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
@@ -414,7 +414,7 @@ def stock_rank_cxsl_ths() -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
         v_code = js_code.call("v")
@@ -424,7 +424,7 @@ def stock_rank_cxsl_ths() -> pd.DataFrame:
             "Cookie": f"v={v_code}",
         }
         url = f"http://data.10jqka.com.cn/rank/cxsl/field/count/order/desc/ajax/1/free/1/page/{page}/free/1/"
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         soup = BeautifulSoup(r.text, 'html.parser')
         table = soup.find('table', class_='m-table J-ajax-table')
         if not table:
@@ -452,7 +452,8 @@ def stock_rank_cxsl_ths() -> pd.DataFrame:
                 data.append(item)
 
         temp_df = pd.DataFrame(data)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "序号",
         "股票代码",
@@ -494,9 +495,8 @@ def stock_rank_xstp_ths(symbol: str = "500日均线") -> pd.DataFrame:
         "250日均线": 250,
         "500日均线": 500,
     }
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -504,7 +504,7 @@ def stock_rank_xstp_ths(symbol: str = "500日均线") -> pd.DataFrame:
         "Cookie": f"v={v_code}",
     }
     url = f"http://data.10jqka.com.cn/rank/xstp/board/{symbol_map[symbol]}/order/asc/ajax/1/free/1/page/1/free/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     try:
         total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
@@ -512,7 +512,7 @@ def stock_rank_xstp_ths(symbol: str = "500日均线") -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
         v_code = js_code.call("v")
@@ -525,7 +525,7 @@ def stock_rank_xstp_ths(symbol: str = "500日均线") -> pd.DataFrame:
             f"http://data.10jqka.com.cn/rank/xstp/board/{symbol_map[symbol]}/order/"
             f"asc/ajax/1/free/1/page/{page}/free/1/"
         )
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         pd.read_html(StringIO(r.text))
         soup = BeautifulSoup(r.text, 'html.parser')
         table = soup.find('table', class_='m-table J-ajax-table')
@@ -552,7 +552,8 @@ def stock_rank_xstp_ths(symbol: str = "500日均线") -> pd.DataFrame:
                 data.append(item)
 
         temp_df = pd.DataFrame(data)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "序号",
         "股票代码",
@@ -591,9 +592,8 @@ def stock_rank_xxtp_ths(symbol: str = "500日均线") -> pd.DataFrame:
         "250日均线": 250,
         "500日均线": 500,
     }
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -601,7 +601,7 @@ def stock_rank_xxtp_ths(symbol: str = "500日均线") -> pd.DataFrame:
         "Cookie": f"v={v_code}",
     }
     url = f"http://data.10jqka.com.cn/rank/xxtp/board/{symbol_map[symbol]}/order/asc/ajax/1/free/1/page/1/free/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     try:
         total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
@@ -609,7 +609,7 @@ def stock_rank_xxtp_ths(symbol: str = "500日均线") -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
         v_code = js_code.call("v")
@@ -622,7 +622,7 @@ def stock_rank_xxtp_ths(symbol: str = "500日均线") -> pd.DataFrame:
             f"http://data.10jqka.com.cn/rank/xxtp/board/{symbol_map[symbol]}/order/"
             f"asc/ajax/1/free/1/page/{page}/free/1/"
         )
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         soup = BeautifulSoup(r.text, 'html.parser')
         table = soup.find('table', class_='m-table J-ajax-table')
         if not table:
@@ -648,7 +648,8 @@ def stock_rank_xxtp_ths(symbol: str = "500日均线") -> pd.DataFrame:
                 data.append(item)
 
         temp_df = pd.DataFrame(data)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "序号",
         "股票代码",
@@ -675,9 +676,8 @@ def stock_rank_ljqs_ths() -> pd.DataFrame:
     :return: 量价齐升
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -685,7 +685,7 @@ def stock_rank_ljqs_ths() -> pd.DataFrame:
         "Cookie": f"v={v_code}",
     }
     url = "http://data.10jqka.com.cn/rank/ljqs/field/count/order/desc/ajax/1/free/1/page/1/free/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     try:
         total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
@@ -693,7 +693,7 @@ def stock_rank_ljqs_ths() -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
         v_code = js_code.call("v")
@@ -703,7 +703,7 @@ def stock_rank_ljqs_ths() -> pd.DataFrame:
             "Cookie": f"v={v_code}",
         }
         url = f"http://data.10jqka.com.cn/rank/ljqs/field/count/order/desc/ajax/1/free/1/page/{page}/free/1/"
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         soup = BeautifulSoup(r.text, 'html.parser')
         table = soup.find('table', class_='m-table J-ajax-table')
         if not table:
@@ -729,7 +729,8 @@ def stock_rank_ljqs_ths() -> pd.DataFrame:
                 data.append(item)
 
         temp_df = pd.DataFrame(data)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "序号",
         "股票代码",
@@ -757,9 +758,8 @@ def stock_rank_ljqd_ths() -> pd.DataFrame:
     :return: 量价齐跌
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     v_code = js_code.call("v")
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -767,7 +767,7 @@ def stock_rank_ljqd_ths() -> pd.DataFrame:
         "Cookie": f"v={v_code}",
     }
     url = "http://data.10jqka.com.cn/rank/ljqd/field/count/order/desc/ajax/1/free/1/page/1/free/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     try:
         total_page = soup.find(name="span", attrs={"class": "page_info"}).text.split(
@@ -775,7 +775,7 @@ def stock_rank_ljqd_ths() -> pd.DataFrame:
         )[1]
     except AttributeError:
         total_page = 1
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
         v_code = js_code.call("v")
@@ -785,7 +785,7 @@ def stock_rank_ljqd_ths() -> pd.DataFrame:
             "Cookie": f"v={v_code}",
         }
         url = f"http://data.10jqka.com.cn/rank/ljqd/field/count/order/desc/ajax/1/free/1/page/{page}/free/1/"
-        r = requests.get(url, headers=headers)
+        r = request_get(url, headers=headers)
         soup = BeautifulSoup(r.text, 'html.parser')
         table = soup.find('table', class_='m-table J-ajax-table')
         if not table:
@@ -811,7 +811,8 @@ def stock_rank_ljqd_ths() -> pd.DataFrame:
                 data.append(item)
 
         temp_df = pd.DataFrame(data)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
     big_df.columns = [
         "序号",
         "股票代码",
@@ -839,9 +840,8 @@ def stock_rank_xzjp_ths() -> pd.DataFrame:
     :return: 险资举牌
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
     js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
+    js_code = get_js_pool(js_content)
     big_df = pd.DataFrame()
     v_code = js_code.call("v")
     headers = {
@@ -850,7 +850,7 @@ def stock_rank_xzjp_ths() -> pd.DataFrame:
         "Cookie": f"v={v_code}",
     }
     url = "http://data.10jqka.com.cn/ajax/xzjp/field/DECLAREDATE/order/desc/ajax/1/free/1/"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, 'html.parser')
     table = soup.find('table', class_='m-table J-ajax-table')
     if not table:
@@ -1,17 +1,18 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2025/5/8 20:00
+Date: 2026/10/18 15:00
 Desc: 东方财富-股票-财务分析
 """
 
 from functools import lru_cache
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
+from akshare.utils.func import ChunkAccumulator
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
 
 
 @lru_cache()
@@ -26,7 +27,7 @@ def _stock_balance_sheet_by_report_ctype_em(symbol: str = "SH600519") -> str:
     """
     url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/Index"
     params = {"type": "web", "code": symbol.lower()}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     soup = BeautifulSoup(r.text, features="lxml")
     company_type = soup.find(attrs={"id": "hidctype"})["value"]
     return company_type
@@ -48,14 +49,14 @@ def stock_balance_sheet_by_report_em(symbol: str = "SH600519") -> pd.DataFrame:
         "reportDateType": "0",
         "code": symbol,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df["REPORT_DATE"] = pd.to_datetime(temp_df["REPORT_DATE"]).dt.date
     temp_df["REPORT_DATE"] = temp_df["REPORT_DATE"].astype(str)
     need_date = temp_df["REPORT_DATE"].tolist()
     sep_list = [",".join(need_date[i : i + 5]) for i in range(0, len(need_date), 5)]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for item in tqdm(sep_list, leave=False):
         url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/zcfzbAjaxNew"
@@ -66,7 +67,7 @@ def stock_balance_sheet_by_report_em(symbol: str = "SH600519") -> pd.DataFrame:
             "dates": item,
             "code": symbol,
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         if "data" not in data_json.keys():
             break
@@ -74,11 +75,8 @@ def stock_balance_sheet_by_report_em(symbol: str = "SH600519") -> pd.DataFrame:
         for col in temp_df.columns:
             if temp_df[col].isnull().all():  # 检查列是否包含 None 或 NaN
                 temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
-        if big_df.empty:
-            big_df = temp_df
-        else:
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    return big_df
+        big_chunks.append(temp_df)
+    return big_chunks.to_frame()
 
 
 def stock_balance_sheet_by_yearly_em(symbol: str = "SH600036") -> pd.DataFrame:
@@ -97,14 +95,14 @@ def stock_balance_sheet_by_yearly_em(symbol: str = "SH600036") -> pd.DataFrame:
         "reportDateType": "1",
         "code": symbol,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     try:
         temp_df = pd.DataFrame(data_json["data"])
     except:  # noqa: E722
         company_type = "3"
         params.update({"companyType": company_type})
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"])
     temp_df["REPORT_DATE"] = pd.to_datetime(
@@ -113,7 +111,7 @@ def stock_balance_sheet_by_yearly_em(symbol: str = "SH600036") -> pd.DataFrame:
     temp_df["REPORT_DATE"] = temp_df["REPORT_DATE"].astype(str)
     need_date = temp_df["REPORT_DATE"].tolist()
     sep_list = [",".join(need_date[i : i + 5]) for i in range(0, len(need_date), 5)]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for item in tqdm(sep_list, leave=False):
         url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/zcfzbAjaxNew"
@@ -124,7 +122,7 @@ def stock_balance_sheet_by_yearly_em(symbol: str = "SH600036") -> pd.DataFrame:
             "dates": item,
             "code": symbol,
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         if "data" not in data_json.keys():
             break
@@ -132,11 +130,8 @@ def stock_balance_sheet_by_yearly_em(symbol: str = "SH600036") -> pd.DataFrame:
         for col in temp_df.columns:
             if temp_df[col].isnull().all():  # 检查列是否包含 None 或 NaN
                 temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
-        if big_df.empty:
-            big_df = temp_df
-        else:
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    return big_df
+        big_chunks.append(temp_df)
+    return big_chunks.to_frame()
 
 
 def stock_profit_sheet_by_report_em(symbol: str = "SH600519") -> pd.DataFrame:
@@ -155,14 +150,14 @@ def stock_profit_sheet_by_report_em(symbol: str = "SH600519") -> pd.DataFrame:
         "reportDateType": "0",
         "code": symbol,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df["REPORT_DATE"] = pd.to_datetime(temp_df["REPORT_DATE"]).dt.date
     temp_df["REPORT_DATE"] = temp_df["REPORT_DATE"].astype(str)
     need_date = temp_df["REPORT_DATE"].tolist()
     sep_list = [",".join(need_date[i : i + 5]) for i in range(0, len(need_date), 5)]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for item in tqdm(sep_list, leave=False):
         url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/lrbAjaxNew"
@@ -173,7 +168,7 @@ def stock_profit_sheet_by_report_em(symbol: str = "SH600519") -> pd.DataFrame:
             "code": symbol,
             "dates": item,
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         if "data" not in data_json.keys():
             break
@@ -181,11 +176,8 @@ def stock_profit_sheet_by_report_em(symbol: str = "SH600519") -> pd.DataFrame:
         for col in temp_df.columns:
             if temp_df[col].isnull().all():  # 检查列是否包含 None 或 NaN
                 temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
-        if big_df.empty:
-            big_df = temp_df
-        else:
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    return big_df
+        big_chunks.append(temp_df)
+    return big_chunks.to_frame()
 
 
 def stock_profit_sheet_by_yearly_em(symbol: str = "SH600519") -> pd.DataFrame:
@@ -204,14 +196,14 @@ def stock_profit_sheet_by_yearly_em(symbol: str = "SH600519") -> pd.DataFrame:
         "reportDateType": "1",
         "code": symbol,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df["REPORT_DATE"] = pd.to_datetime(temp_df["REPORT_DATE"]).dt.date
     temp_df["REPORT_DATE"] = temp_df["REPORT_DATE"].astype(str)
     need_date = temp_df["REPORT_DATE"].tolist()
     sep_list = [",".join(need_date[i : i + 5]) for i in range(0, len(need_date), 5)]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for item in tqdm(sep_list, leave=False):
         url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/lrbAjaxNew"
@@ -222,7 +214,7 @@ def stock_profit_sheet_by_yearly_em(symbol: str = "SH600519") -> pd.DataFrame:
             "dates": item,
             "code": symbol,
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         if "data" not in data_json.keys():
             break
@@ -230,11 +222,8 @@ def stock_profit_sheet_by_yearly_em(symbol: str = "SH600519") -> pd.DataFrame:
         for col in temp_df.columns:
             if temp_df[col].isnull().all():  # 检查列是否包含 None 或 NaN
                 temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
-        if big_df.empty:
-            big_df = temp_df
-        else:
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    return big_df
+        big_chunks.append(temp_df)
+    return big_chunks.to_frame()
 
 
 def stock_profit_sheet_by_quarterly_em(
@@ -255,14 +244,14 @@ def stock_profit_sheet_by_quarterly_em(
         "reportDateType": "2",
         "code": symbol,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df["REPORT_DATE"] = pd.to_datetime(temp_df["REPORT_DATE"]).dt.date
     temp_df["REPORT_DATE"] = temp_df["REPORT_DATE"].astype(str)
     need_date = temp_df["REPORT_DATE"].tolist()
     sep_list = [",".join(need_date[i : i + 5]) for i in range(0, len(need_date), 5)]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for item in tqdm(sep_list, leave=False):
         url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/lrbAjaxNew"
@@ -273,7 +262,7 @@ def stock_profit_sheet_by_quarterly_em(
             "dates": item,
             "code": symbol,
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         if "data" not in data_json.keys():
             break
@@ -281,11 +270,8 @@ def stock_profit_sheet_by_quarterly_em(
         for col in temp_df.columns:
             if temp_df[col].isnull().all():  # 检查列是否包含 None 或 NaN
                 temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
-        if big_df.empty:
-            big_df = temp_df
-        else:
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    return big_df
+        big_chunks.append(temp_df)
+    return big_chunks.to_frame()
 
 
 def stock_cash_flow_sheet_by_report_em(
@@ -306,14 +292,14 @@ def stock_cash_flow_sheet_by_report_em(
         "reportDateType": "0",
         "code": symbol,
     }
-    r = requests.get(url, params=params, timeout=10)
+    r = request_get(url, params=params, timeout=10)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df["REPORT_DATE"] = pd.to_datetime(temp_df["REPORT_DATE"]).dt.date
     temp_df["REPORT_DATE"] = temp_df["REPORT_DATE"].astype(str)
     need_date = temp_df["REPORT_DATE"].tolist()
     sep_list = [",".join(need_date[i : i + 5]) for i in range(0, len(need_date), 5)]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for item in tqdm(sep_list, leave=False):
         url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/xjllbAjaxNew"
@@ -324,7 +310,7 @@ def stock_cash_flow_sheet_by_report_em(
             "dates": item,
             "code": symbol,
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         if "data" not in data_json.keys():
             break
@@ -332,11 +318,8 @@ def stock_cash_flow_sheet_by_report_em(
         for col in temp_df.columns:
             if temp_df[col].isnull().all():  # 检查列是否包含 None 或 NaN
                 temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
-        if big_df.empty:
-            big_df = temp_df
-        else:
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    return big_df
+        big_chunks.append(temp_df)
+    return big_chunks.to_frame()
 
 
 def stock_cash_flow_sheet_by_yearly_em(
@@ -357,14 +340,14 @@ def stock_cash_flow_sheet_by_yearly_em(
         "reportDateType": "1",
         "code": symbol,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df["REPORT_DATE"] = pd.to_datetime(temp_df["REPORT_DATE"]).dt.date
     temp_df["REPORT_DATE"] = temp_df["REPORT_DATE"].astype(str)
     need_date = temp_df["REPORT_DATE"].tolist()
     sep_list = [",".join(need_date[i : i + 5]) for i in range(0, len(need_date), 5)]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for item in tqdm(sep_list, leave=False):
         url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/xjllbAjaxNew"
@@ -375,7 +358,7 @@ def stock_cash_flow_sheet_by_yearly_em(
             "dates": item,
             "code": symbol,
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         if "data" not in data_json.keys():
             break
@@ -383,11 +366,8 @@ def stock_cash_flow_sheet_by_yearly_em(
         for col in temp_df.columns:
             if temp_df[col].isnull().all():  # 检查列是否包含 None 或 NaN
                 temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
-        if big_df.empty:
-            big_df = temp_df
-        else:
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    return big_df
+        big_chunks.append(temp_df)
+    return big_chunks.to_frame()
 
 
 def stock_cash_flow_sheet_by_quarterly_em(
@@ -408,14 +388,14 @@ def stock_cash_flow_sheet_by_quarterly_em(
         "reportDateType": "2",
         "code": symbol,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df["REPORT_DATE"] = pd.to_datetime(temp_df["REPORT_DATE"]).dt.date
     temp_df["REPORT_DATE"] = temp_df["REPORT_DATE"].astype(str)
     need_date = temp_df["REPORT_DATE"].tolist()
     sep_list = [",".join(need_date[i : i + 5]) for i in range(0, len(need_date), 5)]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for item in tqdm(sep_list, leave=False):
         url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/xjllbAjaxNew"
@@ -426,7 +406,7 @@ def stock_cash_flow_sheet_by_quarterly_em(
             "dates": item,
             "code": symbol,
         }
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         if "data" not in data_json.keys():
             break
@@ -434,11 +414,8 @@ def stock_cash_flow_sheet_by_quarterly_em(
         for col in temp_df.columns:
             if temp_df[col].isnull().all():  # 检查列是否包含 None 或 NaN
                 temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
-        if big_df.empty:
-            big_df = temp_df
-        else:
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
-    return big_df
+        big_chunks.append(temp_df)
+    return big_chunks.to_frame()
 
 
 def __get_report_date_list_delisted_em(symbol: str = "SZ000013") -> list:
@@ -463,7 +440,7 @@ def __get_report_date_list_delisted_em(symbol: str = "SZ000013") -> list:
         "client": "PC",
         "v": "07306678536291241",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     report_date_list = [item[0] for item in temp_df["REPORT_DATE"].str.split(" ")]
@@ -494,7 +471,7 @@ def stock_balance_sheet_by_report_delisted_em(symbol: str = "SZ000013") -> pd.Da
         "client": "PC",
         "v": "05767841728614413",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df["REPORT_DATE"] = pd.to_datetime(temp_df["REPORT_DATE"]).dt.date
@@ -527,7 +504,7 @@ def stock_profit_sheet_by_report_delisted_em(symbol: str = "SZ000013") -> pd.Dat
         "client": "PC",
         "v": "05767841728614413",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df["REPORT_DATE"] = pd.to_datetime(temp_df["REPORT_DATE"]).dt.date
@@ -562,7 +539,7 @@ def stock_cash_flow_sheet_by_report_delisted_em(
         "client": "PC",
         "v": "05767841728614413",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_df["REPORT_DATE"] = pd.to_datetime(temp_df["REPORT_DATE"]).dt.date
@@ -7,7 +7,8 @@ http://www.cninfo.com.cn/new/commonUrl?url=data/yypl
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_post
 
 
 def stock_report_disclosure(
@@ -53,7 +54,7 @@ def stock_report_disclosure(
         "pagesize": "10000",
         "pagenum": "1",
     }
-    r = requests.post(url, params=params)
+    r = request_post(url, params=params)
     text_json = r.json()
     temp_df = pd.DataFrame(text_json["prbookinfos"])
     temp_df.columns = [
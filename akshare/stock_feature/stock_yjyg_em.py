@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/4/4 18:10
+Date: 2026/10/18 15:00
 Desc: 东方财富-数据中心-年报季报
 东方财富-数据中心-年报季报-业绩预告
 https://data.eastmoney.com/bbsj/202003/yjyg.html
@@ -10,9 +10,11 @@ https://data.eastmoney.com/bbsj/202003/yysj.html
 """
 
 import pandas as pd
-import requests
 from tqdm import tqdm
 
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
+
 
 def stock_yjkb_em(date: str = "20211231") -> pd.DataFrame:
     """
@@ -34,9 +36,9 @@ def stock_yjkb_em(date: str = "20211231") -> pd.DataFrame:
         "filter": f"""(SECURITY_TYPE_CODE in ("058001001","058001008"))(TRADE_MARKET_CODE!="069001017")
         (REPORT_DATE='{"-".join([date[:4], date[4:6], date[6:]])}')""",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     total_page = data_json["result"]["pages"]
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
@@ -44,10 +46,11 @@ def stock_yjkb_em(date: str = "20211231") -> pd.DataFrame:
                 "pageNumber": page,
             }
         )
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.reset_index(inplace=True)
     big_df["index"] = range(1, len(big_df) + 1)
@@ -151,9 +154,9 @@ def stock_yjyg_em(date: str = "20200331") -> pd.DataFrame:
         "columns": "ALL",
         "filter": f" (REPORT_DATE='{'-'.join([date[:4], date[4:6], date[6:]])}')",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     total_page = data_json["result"]["pages"]
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
@@ -161,10 +164,11 @@ def stock_yjyg_em(date: str = "20200331") -> pd.DataFrame:
                 "pageNumber": page,
             }
         )
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.reset_index(inplace=True)
     big_df["index"] = range(1, len(big_df) + 1)
@@ -286,20 +290,21 @@ def stock_yysj_em(symbol: str = "沪深A股", date: str = "20200331") -> pd.Data
                 (REPORT_DATE='{"-".join([date[:4], date[4:6], date[6:]])}')"""
             }
         )
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
             {
                 "pageNumber": page,
             }
         )
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.reset_index(inplace=True)
     big_df["index"] = range(1, len(big_df) + 1)
@@ -1,16 +1,17 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2022/4/27 19:18
+Date: 2026/10/18 15:00
 Desc: 东方财富网-数据中心-特色数据-一致行动人
 https://data.eastmoney.com/yzxdr/
 """
 
 import pandas as pd
-import requests
 from akshare.utils.tqdm import get_tqdm
 
 from akshare.utils import demjson
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
 
 
 def stock_yzxdr_em(date: str = "20240930") -> pd.DataFrame:
@@ -39,11 +40,11 @@ def stock_yzxdr_em(date: str = "20240930") -> pd.DataFrame:
         "filter": f"(enddate='{date}')",
         "rt": "53575609",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_text = r.text
     data_json = demjson.decode(data_text[data_text.find("{") : -1])
     total_pages = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_pages + 1), leave=False):
         params.update(
@@ -52,11 +53,12 @@ def stock_yzxdr_em(date: str = "20240930") -> pd.DataFrame:
                 "filter": f"(enddate='{date}')",
             }
         )
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_text = r.text
         data_json = demjson.decode(data_text[data_text.find("{") : -1])
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.reset_index(inplace=True)
     big_df["index"] = range(1, len(big_df) + 1)
@@ -18,7 +18,8 @@ https://quote.eastmoney.com/ztb/detail#type=ztgc
 from datetime import datetime, timedelta
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def stock_zt_pool_em(date: str = "20241008") -> pd.DataFrame:
@@ -39,7 +40,7 @@ def stock_zt_pool_em(date: str = "20241008") -> pd.DataFrame:
         "sort": "fbt:asc",
         "date": date,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     if data_json["data"] is None:
         return pd.DataFrame()
@@ -125,7 +126,7 @@ def stock_zt_pool_previous_em(date: str = "20240415") -> pd.DataFrame:
         "sort": "zs:desc",
         "date": date,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     if data_json["data"] is None:
         return pd.DataFrame()
@@ -202,7 +203,7 @@ def stock_zt_pool_strong_em(date: str = "20241231") -> pd.DataFrame:
         "sort": "zdp:desc",
         "date": date,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     if data_json["data"] is None:
         return pd.DataFrame()
@@ -291,7 +292,7 @@ def stock_zt_pool_sub_new_em(date: str = "20241231") -> pd.DataFrame:
         "sort": "ods:asc",
         "date": date,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     if len(data_json["data"]["pool"]) == 0:
         return pd.DataFrame()
@@ -377,7 +378,7 @@ def stock_zt_pool_zbgc_em(date: str = "20241011") -> pd.DataFrame:
         "sort": "fbt:asc",
         "date": date,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     if data_json["data"] is None:
         return pd.DataFrame()
@@ -459,7 +460,7 @@ def stock_zt_pool_dtgc_em(date: str = "20241011") -> pd.DataFrame:
         "sort": "fund:asc",
         "date": date,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     if len(data_json["data"]["pool"]) == 0:
         return pd.DataFrame()
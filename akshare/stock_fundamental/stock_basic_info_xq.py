@@ -7,9 +7,9 @@ https://xueqiu.com/snowman/S/SH601127/detail#/GSJJ
 """
 
 import pandas as pd
-import requests
 
 from akshare.utils.cons import headers
+from akshare.utils.request import request_get
 
 
 def stock_individual_basic_info_xq(
@@ -35,7 +35,7 @@ def stock_individual_basic_info_xq(
         "symbol": symbol,
     }
     headers.update({"cookie": f"xq_a_token={xq_a_token};"})
-    r = requests.get(url, params=params, headers=headers, timeout=timeout)
+    r = request_get(url, params=params, headers=headers, timeout=timeout)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.reset_index(inplace=True)
@@ -66,7 +66,7 @@ def stock_individual_basic_info_us_xq(
         "symbol": symbol,
     }
     headers.update({"cookie": f"xq_a_token={xq_a_token};"})
-    r = requests.get(url, params=params, headers=headers, timeout=timeout)
+    r = request_get(url, params=params, headers=headers, timeout=timeout)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.reset_index(inplace=True)
@@ -97,7 +97,7 @@ def stock_individual_basic_info_hk_xq(
         "symbol": symbol,
     }
     headers.update({"cookie": f"xq_a_token={xq_a_token};"})
-    r = requests.get(url, params=params, headers=headers, timeout=timeout)
+    r = request_get(url, params=params, headers=headers, timeout=timeout)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     temp_df.reset_index(inplace=True)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/10/2 9:00
+Date: 2026/10/18 15:00
 Desc: 股票基本面数据
 新浪财经-财务报表-财务摘要
 https://vip.stock.finance.sina.com.cn/corp/go.php/vFD_FinanceSummary/stockid/600004.phtml
@@ -15,10 +15,11 @@ from datetime import datetime
 from io import StringIO
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def stock_financial_report_sina(
@@ -43,7 +44,7 @@ def stock_financial_report_sina(
         "page": "1",
         "num": "1000",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     df_columns = [
         item["date_value"] for item in data_json["result"]["data"]["report_date"]
@@ -108,7 +109,7 @@ def stock_financial_abstract(symbol: str = "600004") -> pd.DataFrame:
         "page": "1",
         "num": "1000",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     key_list = list(data_json["result"]["data"]["report_list"].keys())
     temp_df = pd.DataFrame(
@@ -219,7 +220,7 @@ def stock_financial_analysis_indicator_em(
             "source": "HSF10",
             "client": "PC",
         }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     return temp_df
@@ -242,7 +243,7 @@ def stock_financial_analysis_indicator(
         f"https://money.finance.sina.com.cn/corp/go.php/vFD_FinancialGuideLine/"
         f"stockid/{symbol}/ctrl/2020/displaytype/4.phtml"
     )
-    r = requests.get(url)
+    r = request_get(url)
     soup = BeautifulSoup(r.text, features="lxml")
     year_context = soup.find(attrs={"id": "con02-1"}).find("table").find_all("a")
     year_list = [item.text for item in year_context]
@@ -250,14 +251,14 @@ def stock_financial_analysis_indicator(
         year_list = year_list[: year_list.index(start_year) + 1]
     else:
         return pd.DataFrame()
-    out_df = pd.DataFrame()
+    out_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for year_item in tqdm(year_list, leave=False):
         url = (
             f"https://money.finance.sina.com.cn/corp/go.php/vFD_FinancialGuideLine/"
             f"stockid/{symbol}/ctrl/{year_item}/displaytype/4.phtml"
         )
-        r = requests.get(url)
+        r = request_get(url)
         temp_df = pd.read_html(StringIO(r.text))[12].iloc[:, :-1]
         temp_df.columns = temp_df.iloc[0, :]
         temp_df = temp_df.iloc[1:, :]
@@ -292,7 +293,8 @@ def stock_financial_analysis_indicator(
         big_df.columns = big_df.iloc[0, :].tolist()
         big_df = big_df.iloc[1:, :]
         big_df.index = temp_df.columns.tolist()[1:]
-        out_df = pd.concat(objs=[out_df, big_df])
+        out_chunks.append(big_df)
+    out_df = out_chunks.to_frame(ignore_index=False)
 
     out_df.dropna(inplace=True)
     out_df.reset_index(inplace=True)
@@ -313,7 +315,7 @@ def stock_history_dividend() -> pd.DataFrame:
     """
     url = "https://vip.stock.finance.sina.com.cn/q/go.php/vInvestConsult/kind/lsfh/index.phtml"
     params = {"p": "1", "num": "50000"}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     temp_df = pd.read_html(StringIO(r.text))[0]
     temp_df["代码"] = temp_df["代码"].astype(str).str.zfill(6)
     temp_df.columns = [
@@ -354,7 +356,7 @@ def stock_history_dividend_detail(
     """
     if indicator == "分红":
         url = f"https://vip.stock.finance.sina.com.cn/corp/go.php/vISSUE_ShareBonus/stockid/{symbol}.phtml"
-        r = requests.get(url)
+        r = request_get(url)
         temp_df = pd.read_html(StringIO(r.text))[12]
         temp_df.columns = [item[2] for item in temp_df.columns.tolist()]
         temp_df.columns = [
@@ -393,7 +395,7 @@ def stock_history_dividend_detail(
                 "type": "1",
                 "end_date": date,
             }
-            r = requests.get(url, params=params)
+            r = request_get(url, params=params)
             temp_df = pd.read_html(StringIO(r.text))[12]
             temp_df.columns = ["item", "value"]
             return temp_df
@@ -401,7 +403,7 @@ def stock_history_dividend_detail(
             return temp_df
     else:
         url = f"https://vip.stock.finance.sina.com.cn/corp/go.php/vISSUE_ShareBonus/stockid/{symbol}.phtml"
-        r = requests.get(url)
+        r = request_get(url)
         temp_df = pd.read_html(StringIO(r.text))[13]
         temp_df.columns = [item[1] for item in temp_df.columns.tolist()]
         temp_df.columns = [
@@ -452,7 +454,7 @@ def stock_history_dividend_detail(
                 "type": "1",
                 "end_date": date,
             }
-            r = requests.get(url, params=params)
+            r = request_get(url, params=params)
             temp_df = pd.read_html(StringIO(r.text))[12]
             temp_df.columns = ["item", "value"]
             return temp_df
@@ -470,7 +472,7 @@ def stock_ipo_info(stock: str = "600004") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = f"https://vip.stock.finance.sina.com.cn/corp/go.php/vISSUE_NewStock/stockid/{stock}.phtml"
-    r = requests.get(url)
+    r = request_get(url)
     temp_df = pd.read_html(StringIO(r.text))[12]
     temp_df.columns = ["item", "value"]
     return temp_df
@@ -486,7 +488,7 @@ def stock_add_stock(symbol: str = "688166") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = f"https://vip.stock.finance.sina.com.cn/corp/go.php/vISSUE_AddStock/stockid/{symbol}.phtml"
-    r = requests.get(url)
+    r = request_get(url)
     temp_df = pd.read_html(StringIO(r.text))[12]
     if temp_df.at[0, 0] == "对不起，暂时没有相关增发记录":
         raise f"股票 {symbol} 无增发记录"
@@ -518,7 +520,7 @@ def stock_restricted_release_queue_sina(symbol: str = "600000") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = f"https://vip.stock.finance.sina.com.cn/q/go.php/vInvestConsult/kind/xsjj/index.phtml?symbol={symbol}"
-    r = requests.get(url)
+    r = request_get(url)
     temp_df = pd.read_html(StringIO(r.text))[0]
     temp_df.columns = [
         "代码",
@@ -552,10 +554,10 @@ def stock_circulate_stock_holder(symbol: str = "600000") -> pd.DataFrame:
     """
     pd.set_option("future.no_silent_downcasting", True)
     url = f"https://vip.stock.finance.sina.com.cn/corp/go.php/vCI_CirculateStockHolder/stockid/{symbol}.phtml"
-    r = requests.get(url)
+    r = request_get(url)
     temp_df = pd.read_html(StringIO(r.text))[13].iloc[:, :5]
     temp_df.columns = [*range(5)]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     need_range = temp_df[
         temp_df.iloc[:, 0].str.find("截止日期") == 0
     ].index.tolist() + [len(temp_df)]
@@ -583,7 +585,8 @@ def stock_circulate_stock_holder(symbol: str = "600000") -> pd.DataFrame:
             except Exception as e:
                 print("Error:", e)
 
-        big_df = pd.concat(objs=[big_df, concat_df], axis=0, ignore_index=True)
+        big_chunks.append(concat_df)
+    big_df = big_chunks.to_frame()
 
     big_df = big_df[
         [
@@ -625,10 +628,10 @@ def stock_fund_stock_holder(symbol: str = "600004") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = f"https://vip.stock.finance.sina.com.cn/corp/go.php/vCI_FundStockHolder/stockid/{symbol}.phtml"
-    r = requests.get(url)
+    r = request_get(url)
     temp_df = pd.read_html(StringIO(r.text))[13].iloc[:, :6]
     temp_df.columns = [*range(6)]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     need_range = temp_df[
         temp_df.iloc[:, 0].str.find("截止日期") == 0
     ].index.tolist() + [len(temp_df)]
@@ -653,7 +656,8 @@ def stock_fund_stock_holder(symbol: str = "600004") -> pd.DataFrame:
             except Exception as e:
                 print("Error:", e)
 
-        big_df = pd.concat(objs=[big_df, concat_df], axis=0, ignore_index=True)
+        big_chunks.append(concat_df)
+    big_df = big_chunks.to_frame()
     big_df.dropna(inplace=True)
     big_df.reset_index(inplace=True, drop=True)
     big_df.columns = [
@@ -684,10 +688,10 @@ def stock_main_stock_holder(stock: str = "600004") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = f"https://vip.stock.finance.sina.com.cn/corp/go.php/vCI_StockHolder/stockid/{stock}.phtml"
-    r = requests.get(url)
+    r = request_get(url)
     temp_df = pd.read_html(StringIO(r.text))[13].iloc[:, :5]
     temp_df.columns = [*range(5)]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     need_range = temp_df[
         temp_df.iloc[:, 0].str.find("截至日期") == 0
     ].index.tolist() + [len(temp_df)]
@@ -729,7 +733,8 @@ def stock_main_stock_holder(stock: str = "600004") -> pd.DataFrame:
         concat_df["平均持股数"] = concat_df["平均持股数"].str.strip(
             "(按总股本计算) 查看变化趋势"
         )
-        big_df = pd.concat(objs=[big_df, concat_df], axis=0, ignore_index=True)
+        big_chunks.append(concat_df)
+    big_df = big_chunks.to_frame()
     big_df.dropna(inplace=True, how="all")
     big_df.reset_index(inplace=True, drop=True)
     big_df.rename(
@@ -9,10 +9,10 @@ https://basic.10jqka.com.cn/new/000063/finance.html
 import json
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
 from akshare.utils.cons import headers
+from akshare.utils.request import request_get
 
 
 def stock_financial_abstract_ths(
@@ -29,7 +29,7 @@ def stock_financial_abstract_ths(
     :rtype: pandas.DataFrame
     """
     url = f"https://basic.10jqka.com.cn/new/{symbol}/finance.html"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     data_text = soup.find(name="p", attrs={"id": "main"}).string
     data_json = json.loads(data_text)
@@ -70,7 +70,7 @@ def stock_financial_debt_ths(
     :rtype: pandas.DataFrame
     """
     url = f"https://basic.10jqka.com.cn/api/stock/finance/{symbol}_debt.json"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     data_json = json.loads(json.loads(r.text)["flashData"])
     df_index = [
         item[0] if isinstance(item, list) else item for item in data_json["title"]
@@ -104,7 +104,7 @@ def stock_financial_benefit_ths(
     :rtype: pandas.DataFrame
     """
     url = f"https://basic.10jqka.com.cn/api/stock/finance/{symbol}_benefit.json"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     data_json = json.loads(json.loads(r.text)["flashData"])
     df_index = [
         item[0] if isinstance(item, list) else item for item in data_json["title"]
@@ -142,7 +142,7 @@ def stock_financial_cash_ths(
     :rtype: pandas.DataFrame
     """
     url = f"https://basic.10jqka.com.cn/api/stock/finance/{symbol}_cash.json"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     data_json = json.loads(json.loads(r.text)["flashData"])
     df_index = [
         item[0] if isinstance(item, list) else item for item in data_json["title"]
@@ -226,7 +226,7 @@ def stock_financial_abstract_new_ths(
         "size": "50",
         "period": period,
     }
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     # 提取财务数据
     financial_data = data_json["data"]["data"]
@@ -315,7 +315,7 @@ def stock_financial_debt_new_ths(
         "size": "50",
         "period": period,
     }
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     # 提取财务数据
     financial_data = data_json["data"]["data"]
@@ -412,7 +412,7 @@ def stock_financial_benefit_new_ths(
         "size": "50",
         "period": period,
     }
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     # 提取财务数据
     financial_data = data_json["data"]["data"]
@@ -509,7 +509,7 @@ def stock_financial_cash_new_ths(
         "size": "50",
         "period": period,
     }
-    r = requests.get(url, headers=headers, params=params)
+    r = request_get(url, headers=headers, params=params)
     data_json = r.json()
     # 提取财务数据
     financial_data = data_json["data"]["data"]
@@ -581,7 +581,7 @@ def stock_management_change_ths(symbol: str = "688981") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = f"https://basic.10jqka.com.cn/new/{symbol}/event.html"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     r.encoding = "gb2312"
     soup = BeautifulSoup(r.text, features="lxml")
     soup_find = soup.find(name="table", attrs={"class": "data_table_1 m_table m_hl"})
@@ -629,7 +629,7 @@ def stock_shareholder_change_ths(symbol: str = "688981") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = f"https://basic.10jqka.com.cn/new/{symbol}/event.html"
-    r = requests.get(url, headers=headers)
+    r = request_get(url, headers=headers)
     r.encoding = "gb2312"
     soup = BeautifulSoup(r.text, features="lxml")
     soup_find = soup.find(name="table", attrs={"class": "m_table data_table_1 m_hl"})
@@ -7,9 +7,9 @@ https://emweb.eastmoney.com/PC_USF10/pages/index.html?code=TSLA&type=web&color=w
 """
 
 import pandas as pd
-import requests
 
 from akshare.utils.cons import headers
+from akshare.utils.request import request_get
 
 
 def __stock_financial_us_report_query_market_em(symbol: str = "TSLA") -> str:
@@ -36,7 +36,7 @@ def __stock_financial_us_report_query_market_em(symbol: str = "TSLA") -> str:
         "client": "PC",
         "v": "04406064331266868",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     stock_code = data_json["result"]["data"][0]["SECUCODE"]
     return stock_code
@@ -81,7 +81,7 @@ def __stock_financial_us_report_em(
         "client": "PC",
         "v": "09583551779242467",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     temp_tuple = tuple(set(temp_df["REPORT"].tolist()))
@@ -149,7 +149,7 @@ def stock_financial_us_report_em(
         "client": "PC",
         "v": "09583551779242467",
     }
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     return temp_df
@@ -206,7 +206,7 @@ def stock_financial_us_analysis_indicator_em(
         )
     else:
         raise ValueError("请输入正确的 indicator 参数")
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["result"]["data"])
     return temp_df
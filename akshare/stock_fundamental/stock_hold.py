@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/2/21 11:00
+Date: 2026/10/18 15:00
 Desc: 新浪财经-股票-机构持股
 https://vip.stock.finance.sina.com.cn/q/go.php/vComStockHold/kind/jgcg/index.phtml
 """
@@ -9,9 +9,10 @@ https://vip.stock.finance.sina.com.cn/q/go.php/vComStockHold/kind/jgcg/index.pht
 from io import StringIO
 
 import pandas as pd
-import requests
 
 from akshare.utils import demjson
+from akshare.utils.func import ChunkAccumulator
+from akshare.utils.request import request_get
 
 
 def stock_institute_hold(symbol: str = "20051") -> pd.DataFrame:
@@ -30,7 +31,7 @@ def stock_institute_hold(symbol: str = "20051") -> pd.DataFrame:
         "reportdate": symbol[:-1],
         "quarter": symbol[-1],
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     temp_df = pd.read_html(StringIO(r.text))[0]
     temp_df["证券代码"] = temp_df["证券代码"].astype(str).str.zfill(6)
     del temp_df["明细"]
@@ -73,14 +74,15 @@ def stock_institute_hold_detail(
         "symbol": stock,
         "quarter": quarter,
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     text_data = r.text
     json_data = demjson.decode(text_data[text_data.find("{") : -2])
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     for item in json_data["data"].keys():
         inner_temp_df = pd.DataFrame(json_data["data"][item]).T.iloc[:-1, :]
         inner_temp_df.reset_index(inplace=True)
-        big_df = pd.concat(objs=[big_df, inner_temp_df], ignore_index=True)
+        big_chunks.append(inner_temp_df)
+    big_df = big_chunks.to_frame()
     if not big_df.empty:
         big_df["index"] = big_df["index"].str.split("_", expand=True)[0]
         big_df.rename(columns={"index": "institute"}, inplace=True)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/12/25 16:46
+Date: 2026/10/18 15:00
 Desc: 东方财富网-数据中心-新股申购-过会企业信息
 https://data.eastmoney.com/xg/gh/default.html
 """
@@ -9,10 +9,11 @@ https://data.eastmoney.com/xg/gh/default.html
 import json
 
 import pandas as pd
-import requests
 
 from akshare.utils.cons import headers
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def stock_ipo_review_em() -> pd.DataFrame:
@@ -44,7 +45,7 @@ def stock_ipo_review_em() -> pd.DataFrame:
         return json.loads(json_str)
 
     # 首次请求获取总页数
-    r = requests.get(url, params=params, headers=headers)
+    r = request_get(url, params=params, headers=headers)
     r.raise_for_status()
     data_json = parse_jsonp(r.text)
 
@@ -52,20 +53,21 @@ def stock_ipo_review_em() -> pd.DataFrame:
         raise ValueError("响应格式异常，未找到 result.pages")
 
     page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
 
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         params["pageNumber"] = str(page)
-        r = requests.get(url, params=params, headers=headers)
+        r = request_get(url, params=params, headers=headers)
         r.raise_for_status()
         try:
             data_json = parse_jsonp(r.text)
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat([big_df, temp_df], ignore_index=True)
+            big_chunks.append(temp_df)
         except Exception as e:
             print(f"第 {page} 页解析失败: {e}")
             continue
+    big_df = big_chunks.to_frame()
 
     big_df.reset_index(drop=True, inplace=True)
     big_df.insert(0, "序号", big_df.index + 1)
@@ -5,9 +5,10 @@ Date: 2022/4/7 17:36
 Desc: http://kcb.sse.com.cn/renewal/#
 """
 
-import requests
 import pandas as pd
 
+from akshare.utils.request import request_get
+
 # TODO
 
 
@@ -48,7 +49,7 @@ def stock_kcb_renewal():
                 "pageHelp.endPage": page,
             }
         )
-        r = requests.get(url, params=params, headers=headers)
+        r = request_get(url, params=params, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"])
         # 处理下 temp_df 里面的字段就可以了
@@ -1,7 +1,7 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2024/6/13 13:00
+Date: 2026/10/18 15:00
 Desc: 东方财富网-数据中心-公告大全-沪深 A 股公告
 https://data.eastmoney.com/notices/hsa/5.html
 """
@@ -9,9 +9,10 @@ https://data.eastmoney.com/notices/hsa/5.html
 import math
 
 import pandas as pd
-import requests
 
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def stock_notice_report(symbol: str = "全部", date: str = "20220511") -> pd.DataFrame:
@@ -47,10 +48,10 @@ def stock_notice_report(symbol: str = "全部", date: str = "20220511") -> pd.Da
         "begin_time": "-".join([date[:4], date[4:6], date[6:]]),
         "end_time": "-".join([date[:4], date[4:6], date[6:]]),
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     total_page = math.ceil(data_json["data"]["total_hits"] / 100)
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
         params.update(
@@ -58,7 +59,7 @@ def stock_notice_report(symbol: str = "全部", date: str = "20220511") -> pd.Da
                 "page_index": page,
             }
         )
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["list"])
 
@@ -82,7 +83,8 @@ def stock_notice_report(symbol: str = "全部", date: str = "20220511") -> pd.Da
         del temp_df["codes"]
         del temp_df["columns"]
         temp_df = pd.concat(objs=[temp_df, temp_columns_df, temp_codes_df], axis=1)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.rename(
         columns={
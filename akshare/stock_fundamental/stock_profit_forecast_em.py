@@ -1,15 +1,16 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2024/1/6 15:00
+Date: 2026/10/18 15:00
 Desc: 东方财富网-数据中心-研究报告-盈利预测
 https://data.eastmoney.com/report/profitforecast.jshtml
 """
 
 import pandas as pd
-import requests
 
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.request import request_get
+from akshare.utils.func import ChunkAccumulator
 
 
 def stock_profit_forecast_em(symbol: str = "") -> pd.DataFrame:
@@ -36,10 +37,10 @@ def stock_profit_forecast_em(symbol: str = "") -> pd.DataFrame:
     }
     if symbol:
         params.update({"filter": f'(INDUSTRY_BOARD="{symbol}")'})
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     page_num = int(data_json["result"]["pages"])
-    big_df = pd.DataFrame()
+    big_chunks = ChunkAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         params.update(
@@ -50,10 +51,11 @@ def stock_profit_forecast_em(symbol: str = "") -> pd.DataFrame:
                 "pageNum": page,
             }
         )
-        r = requests.get(url, params=params)
+        r = request_get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        big_chunks.append(temp_df)
+    big_df = big_chunks.to_frame()
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
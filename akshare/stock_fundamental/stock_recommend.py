@@ -7,9 +7,10 @@ http://stock.finance.sina.com.cn/stock/go.php/vIR_RatingNewest/index.phtml
 """
 
 import pandas as pd
-import requests
 from bs4 import BeautifulSoup
 
+from akshare.utils.request import request_get
+
 
 def stock_institute_recommend(symbol: str = "投资评级选股") -> pd.DataFrame:
     """
@@ -25,7 +26,7 @@ def stock_institute_recommend(symbol: str = "投资评级选股") -> pd.DataFram
         "num": "40",
         "p": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     soup = BeautifulSoup(r.text, "lxml")
     indicator_map = {
         item.find("a").text: item.find("a")["href"]
@@ -36,7 +37,7 @@ def stock_institute_recommend(symbol: str = "投资评级选股") -> pd.DataFram
         "num": "10000",
         "p": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     if symbol == "股票综合评级":
         temp_df = pd.read_html(r.text, header=0)[0].iloc[:, :9]
         temp_df["股票代码"] = temp_df["股票代码"].astype(str).str.zfill(6)
@@ -87,7 +88,7 @@ def stock_institute_recommend_detail(symbol: str = "000001") -> pd.DataFrame:
         "num": "5000",
         "p": "1",
     }
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     temp_df = pd.read_html(r.text, header=0)[0].iloc[:, :8]
     temp_df["股票代码"] = temp_df["股票代码"].astype(str).str.zfill(6)
     temp_df = temp_df.rename(columns={"评级日期↓": "评级日期"})
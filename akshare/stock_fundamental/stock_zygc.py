@@ -7,7 +7,8 @@ https://emweb.securities.eastmoney.com/PC_HSF10/BusinessAnalysis/Index?type=web&
 """
 
 import pandas as pd
-import requests
+
+from akshare.utils.request import request_get
 
 
 def stock_zygc_em(symbol: str = "SH688041") -> pd.DataFrame:
@@ -21,7 +22,7 @@ def stock_zygc_em(symbol: str = "SH688041") -> pd.DataFrame:
     """
     url = "https://emweb.securities.eastmoney.com/PC_HSF10/BusinessAnalysis/PageAjax"
     params = {"code": symbol}
-    r = requests.get(url, params=params)
+    r = request_get(url, params=params)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["zygcfx"])
     temp_df.rename(
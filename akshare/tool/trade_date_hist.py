@@ -10,10 +10,9 @@ https://finance.sina.com.cn/realstock/company/klc_td_sh.txt
 import datetime
 
 import pandas as pd
-import requests
-import py_mini_racer
 
-from akshare.stock.cons import hk_js_decode
+from akshare.utils.request import request_get
+from akshare.utils.sina_decode import decode_sina
 
 
 def tool_trade_date_hist_sina() -> pd.DataFrame:
@@ -24,11 +23,10 @@ def tool_trade_date_hist_sina() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "https://finance.sina.com.cn/realstock/company/klc_td_sh.txt"
-    r = requests.get(url)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call("d", r.text.split("=")[1].split(";")[0].replace('"', ""))
-    temp_df = pd.DataFrame(dict_list)
+    r = request_get(url)
+    temp_df = pd.DataFrame(
+        decode_sina(r.text.split("=")[1].split(";")[0].replace('"', ""))
+    )
     temp_df.columns = ["trade_date"]
     temp_df["trade_date"] = pd.to_datetime(temp_df["trade_date"]).dt.date
     temp_list = temp_df["trade_date"].to_list()
@@ -0,0 +1,89 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 复权计算
+复权因子是一串按日期排列的除权除息事件, 每个因子从事件日起生效直到下一个事件;
+对每个交易日用二分查找定位生效的因子, 一次向量运算得到复权价格:
+后复权价格 = 不复权价格 * 后复权因子
+前复权价格 = 不复权价格 * 后复权因子 / 基准日的后复权因子, 基准日默认为最新的事件, 即当前价格不变
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+PRICE_COLUMNS = ["open", "high", "low", "close"]
+
+
+def asof_factor(dates, event_dates, factors) -> np.ndarray:
+    """
+    每个日期生效的复权因子, 早于第一个事件的日期为 NaN
+    :param dates: 交易日
+    :type dates: array-like
+    :param event_dates: 除权除息日, 升序或乱序均可
+    :type event_dates: array-like
+    :param factors: 与 event_dates 对应的复权因子
+    :type factors: array-like
+    :return: 与 dates 等长的复权因子
+    :rtype: numpy.ndarray
+    """
+    dates = np.asarray(pd.to_datetime(dates), dtype="datetime64[D]")
+    event_dates = np.asarray(pd.to_datetime(event_dates), dtype="datetime64[D]")
+    factors = np.asarray(factors, dtype=float)
+    order = np.argsort(event_dates, kind="stable")
+    event_dates = event_dates[order]
+    factors = factors[order]
+    pos = np.searchsorted(event_dates, dates, side="right") - 1
+    result = np.full(len(dates), np.nan)
+    valid = pos >= 0
+    result[valid] = factors[pos[valid]]
+    return result
+
+
+def adjust_prices(
+    df: pd.DataFrame,
+    event_dates,
+    hfq_factors,
+    adjust: str = "qfq",
+    anchor_date: Optional[str] = None,
+    date_column: str = "date",
+    price_columns: Sequence[str] = PRICE_COLUMNS,
+) -> pd.DataFrame:
+    """
+    由不复权行情和后复权因子计算复权行情
+    :param df: 不复权行情, 日期为 date_column 列或索引
+    :type df: pandas.DataFrame
+    :param event_dates: 除权除息日
+    :type event_dates: array-like
+    :param hfq_factors: 后复权因子
+    :type hfq_factors: array-like
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param anchor_date: 前复权的基准日, 该日的价格与不复权价格相同; 默认为最新的事件
+    :type anchor_date: str
+    :param date_column: 日期列名, 不存在时使用索引
+    :type date_column: str
+    :param price_columns: 需要复权的价格列
+    :type price_columns: list
+    :return: 复权行情
+    :rtype: pandas.DataFrame
+    """
+    if adjust not in ("qfq", "hfq", ""):
+        raise ValueError(f"不支持的复权方式: {adjust}")
+    temp_df = df.copy()
+    if adjust == "" or temp_df.empty:
+        return temp_df
+    dates = temp_df[date_column] if date_column in temp_df.columns else temp_df.index
+    factor = asof_factor(dates, event_dates, hfq_factors)
+    if adjust == "qfq":
+        if anchor_date is None:
+            anchor = np.asarray(hfq_factors, dtype=float)[
+                np.argmax(pd.to_datetime(event_dates).to_numpy())
+            ]
+        else:
+            anchor = asof_factor([anchor_date], event_dates, hfq_factors)[0]
+        factor = factor / anchor
+    columns = list(price_columns)
+    temp_df[columns] = temp_df[columns].to_numpy(dtype=float) * factor[:, None]
+    return temp_df
@@ -0,0 +1,141 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 多代码批量获取历史行情
+将单个 symbol 的接口(如 stock_zh_a_hist, stock_hk_hist, fund_etf_hist_em)并发调用,
+同一主机的并发请求数由共享请求层限制; 单个代码失败时重试, 仍失败则记录错误而不中断整个批次
+"""
+
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Union
+
+import pandas as pd
+
+from akshare.utils.tqdm import get_tqdm
+
+
+def _call_with_retry(
+    func: Callable, retries: int, retry_delay: float, **kwargs
+) -> pd.DataFrame:
+    """
+    调用接口, 失败时按指数退避重试
+    :param func: 接口函数
+    :type func: callable
+    :param retries: 失败后的重试次数
+    :type retries: int
+    :param retry_delay: 首次重试前的等待时间（秒）
+    :type retry_delay: float
+    :return: 接口返回的数据
+    :rtype: pandas.DataFrame
+    """
+    for attempt in range(retries + 1):
+        try:
+            return func(**kwargs)
+        except Exception:
+            if attempt == retries:
+                raise
+            time.sleep(retry_delay * (2**attempt))
+
+
+def batch(
+    func: Callable,
+    symbols: Iterable[str],
+    max_workers: int = 8,
+    retries: int = 2,
+    retry_delay: float = 1.0,
+    as_dict: bool = False,
+    symbol_param: str = "symbol",
+    symbol_column: str = "symbol",
+    **kwargs,
+) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """
+    批量获取多个代码的数据
+    返回长格式数据时, 失败的代码及异常保存在 attrs["errors"] 中; 返回字典时, 失败代码对应的值为异常对象
+    :param func: 接受 symbol 参数的接口函数, 如 ak.stock_zh_a_hist
+    :type func: callable
+    :param symbols: 代码列表
+    :type symbols: list
+    :param max_workers: 线程数
+    :type max_workers: int
+    :param retries: 单个代码失败后的重试次数
+    :type retries: int
+    :param retry_delay: 首次重试前的等待时间（秒）
+    :type retry_delay: float
+    :param as_dict: True 返回 {代码: 数据} 字典, False 返回合并后的长格式数据
+    :type as_dict: bool
+    :param symbol_param: 接口中代码参数的名称
+    :type symbol_param: str
+    :param symbol_column: 长格式数据中代码列的名称
+    :type symbol_column: str
+    :param kwargs: 传给接口的其他参数, 如 start_date, end_date, adjust; 不能包含 symbol_param
+    :return: 长格式数据或字典
+    :rtype: pandas.DataFrame or dict
+    """
+    if symbol_param in kwargs:
+        raise ValueError(
+            f"{symbol_param} 由 symbols 逐个传入, 不能同时在 kwargs 中指定"
+        )
+    symbols = list(dict.fromkeys(symbols))
+    result_dict = {}
+    error_dict = {}
+    tqdm = get_tqdm()
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        future_to_symbol = {
+            executor.submit(
+                _call_with_retry,
+                func,
+                retries,
+                retry_delay,
+                **{symbol_param: symbol},
+                **kwargs,
+            ): symbol
+            for symbol in symbols
+        }
+        for future in tqdm(
+            as_completed(future_to_symbol), total=len(future_to_symbol), leave=False
+        ):
+            symbol = future_to_symbol[future]
+            try:
+                result_dict[symbol] = future.result()
+            except Exception as e:
+                error_dict[symbol] = e
+    if error_dict:
+        warnings.warn(
+            f"{len(error_dict)} of {len(symbols)} symbols failed: "
+            f"{', '.join(list(error_dict)[:10])}"
+        )
+    if as_dict:
+        return {
+            symbol: result_dict[symbol] if symbol in result_dict else error_dict[symbol]
+            for symbol in symbols
+        }
+    frame_list = []
+    for symbol in symbols:
+        temp_df = result_dict.get(symbol)
+        if temp_df is None or temp_df.empty:
+            continue
+        temp_df = temp_df.copy()
+        if symbol_column in temp_df.columns:
+            temp_df[symbol_column] = symbol
+        else:
+            temp_df.insert(0, symbol_column, symbol)
+        frame_list.append(temp_df)
+    big_df = pd.concat(frame_list, ignore_index=True) if frame_list else pd.DataFrame()
+    big_df.attrs["errors"] = error_dict
+    return big_df
+
+
+if __name__ == "__main__":
+    from akshare.stock_feature.stock_hist_em import stock_zh_a_hist
+
+    batch_df = batch(
+        stock_zh_a_hist,
+        symbols=["000001", "600000", "000002"],
+        start_date="20240101",
+        end_date="20240301",
+        adjust="qfq",
+    )
+    print(batch_df)
+    print(batch_df.attrs["errors"])
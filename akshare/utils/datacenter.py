@@ -0,0 +1,201 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 东方财富-数据中心通用客户端
+https://datacenter-web.eastmoney.com/api/data/v1/get
+第一页返回 result.pages 后, 剩余页面由线程池并发请求, 请求频率由按主机共享的令牌桶控制;
+全部页面下载完成后一次性构造数据框, 再按报表的字段定义(ReportSchema)重命名, 选择字段和转换类型
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from akshare.utils import trace
+from akshare.utils.em_parse import coerce_columns
+from akshare.utils.request import request_get
+from akshare.utils.tqdm import get_tqdm
+
+DATACENTER_URL = "https://datacenter-web.eastmoney.com/api/data/v1/get"
+
+
+class ReportSchema(NamedTuple):
+    """
+    数据中心报表的字段定义
+    columns: 字典为 {接口字段: 输出字段}; 列表为按接口返回顺序依次命名, 与原有的 df.columns = [...] 写法一致
+    output: 输出字段及顺序, 包含 "序号" 时自动添加从 1 开始的序号
+    dtypes: (字段名, 字段类型), 字段类型见 akshare.utils.em_parse
+    """
+
+    columns: Union[Dict[str, str], List[str]]
+    output: List[str]
+    dtypes: Sequence[Tuple[str, str]] = ()
+
+
+_REPORT_SCHEMAS: Dict[str, ReportSchema] = {}
+
+
+def register_report_schema(name: str, schema: ReportSchema) -> ReportSchema:
+    """
+    登记报表的字段定义, 通常以接口函数名为 name
+    :param name: 名称
+    :type name: str
+    :param schema: 字段定义
+    :type schema: ReportSchema
+    :return: 字段定义
+    :rtype: ReportSchema
+    """
+    _REPORT_SCHEMAS[name] = schema
+    return schema
+
+
+def get_report_schema(name: str) -> ReportSchema:
+    """
+    获取已登记的报表字段定义
+    :param name: 名称
+    :type name: str
+    :return: 字段定义
+    :rtype: ReportSchema
+    """
+    return _REPORT_SCHEMAS[name]
+
+
+def _fetch_page(url: str, params: Dict, timeout: Optional[float]) -> Dict:
+    """
+    东方财富-数据中心-获取单页数据
+    :param url: 请求地址
+    :type url: str
+    :param params: 请求参数
+    :type params: dict
+    :param timeout: 请求超时时间
+    :type timeout: float
+    :return: 接口返回的 result 字段
+    :rtype: dict
+    """
+    r = request_get(url, params=params, timeout=timeout)
+    with trace.span("json"):
+        return r.json()["result"]
+
+
+def page_params(params: Dict, page_keys: Sequence[str], page: int) -> Dict:
+    """
+    设置页码后的请求参数
+    :param params: 请求参数
+    :type params: dict
+    :param page_keys: 表示页码的参数名
+    :type page_keys: tuple
+    :param page: 页码
+    :type page: int
+    :return: 请求参数
+    :rtype: dict
+    """
+    return {**params, **{key: page for key in page_keys}}
+
+
+def fetch_datacenter_pages(
+    params: Dict,
+    url: str = DATACENTER_URL,
+    page_keys: Sequence[str] = ("pageNumber",),
+    timeout: Optional[float] = None,
+    max_workers: int = 4,
+) -> List[Dict]:
+    """
+    东方财富-数据中心-获取全部页面的原始数据
+    :param params: 请求参数, 包括 reportName, columns, filter 等
+    :type params: dict
+    :param url: 请求地址
+    :type url: str
+    :param page_keys: 表示页码的参数名, 个别报表需要同时设置 p, pageNo 等
+    :type page_keys: tuple
+    :param timeout: 请求超时时间
+    :type timeout: float
+    :param max_workers: 并发请求剩余页面的线程数, 为 1 时顺序请求
+    :type max_workers: int
+    :return: 按页码顺序合并的数据
+    :rtype: list
+    """
+    params = page_params(params, page_keys, 1)
+    result = _fetch_page(url, params, timeout)
+    if not result:
+        return []
+    total_page = int(result.get("pages") or 1)
+    page_list = [result["data"]] + [None] * (total_page - 1)
+    tqdm = get_tqdm()
+    fetch_page = trace.bind(_fetch_page)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {
+            page: executor.submit(
+                fetch_page,
+                url,
+                page_params(params, page_keys, page),
+                timeout,
+            )
+            for page in range(2, total_page + 1)
+        }
+        for page, future in tqdm(futures.items(), total=len(futures), leave=False):
+            page_result = future.result()
+            page_list[page - 1] = page_result["data"] if page_result else []
+    return [item for page in page_list for item in page or []]
+
+
+def apply_report_schema(df: pd.DataFrame, schema: ReportSchema) -> pd.DataFrame:
+    """
+    按字段定义重命名, 选择字段和转换类型
+    :param df: 数据中心返回的原始数据
+    :type df: pandas.DataFrame
+    :param schema: 字段定义
+    :type schema: ReportSchema
+    :return: 整理后的数据
+    :rtype: pandas.DataFrame
+    """
+    if df.empty:
+        return pd.DataFrame(columns=schema.output)
+    if isinstance(schema.columns, dict):
+        df = df.rename(columns=schema.columns)
+    else:
+        df.columns = schema.columns
+    if "序号" in schema.output:
+        df["序号"] = range(1, len(df) + 1)
+    df = df[schema.output].copy()
+    return coerce_columns(df, schema.dtypes)
+
+
+def fetch_datacenter(
+    params: Dict,
+    schema: Optional[ReportSchema] = None,
+    url: str = DATACENTER_URL,
+    page_keys: Sequence[str] = ("pageNumber",),
+    timeout: Optional[float] = None,
+    max_workers: int = 4,
+) -> pd.DataFrame:
+    """
+    东方财富-数据中心-获取报表的全部数据
+    https://data.eastmoney.com/center/
+    :param params: 请求参数, 包括 reportName, columns, filter 等
+    :type params: dict
+    :param schema: 字段定义, 为 None 时返回原始字段
+    :type schema: ReportSchema
+    :param url: 请求地址
+    :type url: str
+    :param page_keys: 表示页码的参数名
+    :type page_keys: tuple
+    :param timeout: 请求超时时间
+    :type timeout: float
+    :param max_workers: 并发请求剩余页面的线程数, 为 1 时顺序请求
+    :type max_workers: int
+    :return: 报表数据
+    :rtype: pandas.DataFrame
+    """
+    temp_df = pd.DataFrame(
+        fetch_datacenter_pages(
+            params=params,
+            url=url,
+            page_keys=page_keys,
+            timeout=timeout,
+            max_workers=max_workers,
+        )
+    )
+    if schema is None:
+        return temp_df
+    return apply_report_schema(temp_df, schema)
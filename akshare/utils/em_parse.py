@@ -0,0 +1,118 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 东方财富-按字段定义解析行情数据
+每个接口声明 (字段名, 类型) 组成的 schema, klines/trends 一次性交给 C 实现的 CSV 解析器转换为带类型的列,
+diff 数据中的对象列整体转换为浮点数, 代替逐列调用 pd.to_numeric(..., errors="coerce")
+字段类型:
+number: 与 pd.to_numeric(errors="coerce") 一致, 全为整数时为 int64, 否则为 float64
+float: float64
+str: 原样保留的字符串
+date: datetime.date, 与 pd.to_datetime(errors="coerce").dt.date 一致
+"""
+
+import io
+from typing import List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from akshare.utils import trace
+
+# 东方财富用 "-" 表示缺失值
+NA_VALUES = ["-", ""]
+
+Schema = Sequence[Tuple[str, str]]
+
+
+def _finish_column(series: pd.Series, kind: str) -> pd.Series:
+    """
+    按字段类型整理已解析的列
+    :param series: 已解析的列
+    :type series: pandas.Series
+    :param kind: choice of {"number", "float", "str", "date"}
+    :type kind: str
+    :return: 整理后的列
+    :rtype: pandas.Series
+    """
+    if kind == "date":
+        return pd.to_datetime(series, errors="coerce").dt.date
+    if kind in ("number", "float"):
+        if not pd.api.types.is_numeric_dtype(series):
+            # 出现 "-" 以外的非数字内容时才逐列转换
+            series = pd.to_numeric(series, errors="coerce")
+        if kind == "float":
+            series = series.astype("float64")
+        return series
+    if kind == "str":
+        return series
+    raise ValueError(f"不支持的字段类型: {kind}")
+
+
+@trace.traced("em_parse")
+def parse_klines(lines: List[str], schema: Schema) -> pd.DataFrame:
+    """
+    东方财富-将逗号分隔的 klines/trends 数据按 schema 解析为数据框
+    :param lines: 形如 "2024-01-02,9.39,9.21,..." 的字符串列表
+    :type lines: list
+    :param schema: 按顺序排列的 (字段名, 字段类型)
+    :type schema: list
+    :return: 按 schema 命名和转换类型后的数据
+    :rtype: pandas.DataFrame
+    """
+    names = [name for name, _ in schema]
+    if not lines:
+        return pd.DataFrame(columns=names)
+    temp_df = pd.read_csv(
+        io.StringIO("\n".join(lines)),
+        header=None,
+        names=names,
+        # 只解析 schema 中声明的列, 接口新增的尾部字段被忽略
+        usecols=range(len(names)),
+        dtype={name: str for name, kind in schema if kind in ("str", "date")},
+        na_values=NA_VALUES,
+        keep_default_na=False,
+        engine="c",
+    )
+    for name, kind in schema:
+        if kind != "str":
+            temp_df[name] = _finish_column(temp_df[name], kind)
+    return temp_df
+
+
+@trace.traced("em_parse")
+def coerce_columns(df: pd.DataFrame, schema: Schema) -> pd.DataFrame:
+    """
+    东方财富-按 schema 转换 diff 数据框的字段类型
+    数值字段中仍为对象类型的列(含 "-" 等缺失标记)作为一个整体转换为 float64, 已是数值类型的列保持不变
+    :param df: 由 diff 数据构造的数据框
+    :type df: pandas.DataFrame
+    :param schema: (字段名, 字段类型), 未列出的字段保持不变
+    :type schema: list
+    :return: 转换类型后的数据
+    :rtype: pandas.DataFrame
+    """
+    number_columns = [
+        name
+        for name, kind in schema
+        if kind in ("number", "float") and not pd.api.types.is_numeric_dtype(df[name])
+    ]
+    if number_columns:
+        values = df[number_columns].to_numpy(dtype=object, copy=True)
+        for marker in NA_VALUES:
+            values[values == marker] = np.nan
+        try:
+            converted = values.astype("float64")
+        except (TypeError, ValueError):
+            converted = None
+        if converted is None:
+            for name in number_columns:
+                df[name] = pd.to_numeric(df[name], errors="coerce")
+        else:
+            df[number_columns] = converted
+    for name, kind in schema:
+        if kind == "float" and df[name].dtype != "float64":
+            df[name] = df[name].astype("float64")
+        elif kind == "date":
+            df[name] = _finish_column(df[name], kind)
+    return df
@@ -1,21 +1,41 @@
 # !/usr/bin/env python
 """
-Date: 2025/3/10 18:00
+Date: 2026/10/18 15:00
 Desc: 通用帮助函数
 """
 
 import math
-import random
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict
 
 import pandas as pd
 
+from akshare.utils import trace
 from akshare.utils.request import request_with_retry
 from akshare.utils.tqdm import get_tqdm
 
 
-def fetch_paginated_data(url: str, base_params: Dict, timeout: int = 15):
+def _fetch_page(url: str, params: Dict, timeout: int) -> List[Dict]:
+    """
+    东方财富-获取单页数据
+    :param url: 请求地址
+    :type url: str
+    :param params: 请求参数
+    :type params: dict
+    :param timeout: 请求超时时间
+    :type timeout: int
+    :return: 单页数据
+    :rtype: list
+    """
+    r = request_with_retry(url, params=params, timeout=timeout)
+    with trace.span("json"):
+        data_json = r.json()
+    return data_json["data"]["diff"]
+
+
+def fetch_paginated_data(
+    url: str, base_params: Dict, timeout: int = 15, max_workers: int = 4
+):
     """
     东方财富-分页获取数据并合并结果
     https://quote.eastmoney.com/f1.html?newcode=0.000001
@@ -25,6 +45,8 @@ def fetch_paginated_data(url: str, base_params: Dict, timeout: int = 15):
     :type base_params: dict
     :param timeout: 请求超时时间
     :type timeout: str
+    :param max_workers: 并发请求剩余页面的线程数, 为 1 时顺序请求
+    :type max_workers: int
     :return: 合并后的数据
     :rtype: pandas.DataFrame
     """
@@ -32,27 +54,39 @@ def fetch_paginated_data(url: str, base_params: Dict, timeout: int = 15):
     params = base_params.copy()
     # 获取第一页数据，用于确定分页信息
     r = request_with_retry(url, params=params, timeout=timeout)
-    data_json = r.json()
+    with trace.span("json"):
+        data_json = r.json()
     # 计算分页信息
     per_page_num = len(data_json["data"]["diff"])
     total_page = math.ceil(data_json["data"]["total"] / per_page_num)
-    # 存储所有页面数据
-    temp_list = []
-    # 添加第一页数据
-    temp_list.append(pd.DataFrame(data_json["data"]["diff"]))
+    # 存储所有页面数据, 按页码顺序排列
+    page_list = [data_json["data"]["diff"]] + [None] * (total_page - 1)
     # 获取进度条
     tqdm = get_tqdm()
-    # 获取剩余页面数据
-    for page in tqdm(range(2, total_page + 1), leave=False):
-        params.update({"pn": page})
-        # 添加随机延迟，避免请求过于频繁
-        time.sleep(random.uniform(0.5, 1.5))
-        r = request_with_retry(url, params=params, timeout=timeout)
-        data_json = r.json()
-        inner_temp_df = pd.DataFrame(data_json["data"]["diff"])
-        temp_list.append(inner_temp_df)
-    # 合并所有数据
-    temp_df = pd.concat(temp_list, ignore_index=True)
+    # 获取剩余页面数据, 由按主机共享的令牌桶控制请求频率
+    fetch_page = trace.bind(_fetch_page)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        future_to_page = {
+            executor.submit(fetch_page, url, {**params, "pn": page}, timeout): page
+            for page in range(2, total_page + 1)
+        }
+        for future in tqdm(
+            as_completed(future_to_page), total=len(future_to_page), leave=False
+        ):
+            page_list[future_to_page[future] - 1] = future.result()
+    return paginated_frame(page_list)
+
+
+@trace.traced("paginated_frame")
+def paginated_frame(page_list: List[List[Dict]]) -> pd.DataFrame:
+    """
+    东方财富-合并各页数据, 按涨跌幅排序并添加序号
+    :param page_list: 按页码顺序排列的各页数据
+    :type page_list: list
+    :return: 合并后的数据
+    :rtype: pandas.DataFrame
+    """
+    temp_df = pd.DataFrame([item for page in page_list for item in page])
     temp_df["f3"] = pd.to_numeric(temp_df["f3"], errors="coerce")
     temp_df.sort_values(by=["f3"], ascending=False, inplace=True, ignore_index=True)
     temp_df.reset_index(inplace=True)
@@ -75,3 +109,53 @@ def set_df_columns(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
     else:
         df.columns = cols
         return df
+
+
+class ChunkAccumulator:
+    """
+    分块收集数据, 最后一次性合并为数据框
+    代替循环中的 big_df = pd.concat([big_df, temp_df]), 后者每次都复制已有的全部数据, 总耗时随行数平方增长;
+    每块可以是 pandas.DataFrame, 记录列表(list of dict / list of list) 或 {字段: 数组} 字典
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._rows = 0
+
+    def append(self, chunk) -> None:
+        """
+        添加一块数据
+        :param chunk: 数据
+        :type chunk: pandas.DataFrame or list or dict
+        :return: None
+        :rtype: None
+        """
+        if chunk is None:
+            return
+        self._chunks.append(chunk)
+        if isinstance(chunk, dict):
+            self._rows += len(next(iter(chunk.values()), ()))
+        else:
+            self._rows += len(chunk)
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def to_frame(self, ignore_index: bool = True) -> pd.DataFrame:
+        """
+        合并全部数据
+        :param ignore_index: 是否重新生成从 0 开始的索引
+        :type ignore_index: bool
+        :return: 合并后的数据
+        :rtype: pandas.DataFrame
+        """
+        if not self._chunks:
+            return pd.DataFrame()
+        if all(isinstance(chunk, list) for chunk in self._chunks):
+            # 全部是记录时先拼接记录, 只构造一次数据框
+            return pd.DataFrame([row for chunk in self._chunks for row in chunk])
+        frames = [
+            chunk if isinstance(chunk, pd.DataFrame) else pd.DataFrame(chunk)
+            for chunk in self._chunks
+        ]
+        return pd.concat(frames, ignore_index=ignore_index)
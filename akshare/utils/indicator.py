@@ -0,0 +1,265 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 均线, 均线斜率, 乖离率等滚动指标
+批量计算: rolling_indicators 对 (交易日, 标的) 矩阵用累加和一次算出所有窗口的指标;
+增量计算: IndicatorState 保存环形缓冲区和累加和, 每追加一根 K 线以 O(1) 更新所有指标;
+均线斜率 MA(t) - MA(t-1) 按 (close(t) - close(t-w)) / w 计算, 两种方式得到的斜率和信号完全相同
+"""
+
+from typing import Dict, Iterable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_WINDOWS = (20, 60, 120)
+
+
+def _as_2d(values) -> np.ndarray:
+    values = np.asarray(values, dtype=float)
+    return values[:, None] if values.ndim == 1 else values
+
+
+def _wrap(array: np.ndarray, like):
+    """
+    按输入的类型返回: Series / DataFrame 保留索引和列名, 一维数组返回一维
+    """
+    if isinstance(like, pd.DataFrame):
+        return pd.DataFrame(array, index=like.index, columns=like.columns)
+    if isinstance(like, pd.Series):
+        return pd.Series(array[:, 0], index=like.index, name=like.name)
+    if np.ndim(like) == 1:
+        return array[:, 0]
+    return array
+
+
+def _rolling_sum(values: np.ndarray, window: int):
+    """
+    沿第 0 维的滚动和与窗口内有效值个数, 缺失值不参与求和
+    """
+    valid = np.isfinite(values)
+    zeros = np.zeros((1,) + values.shape[1:])
+    cum_sum = np.concatenate([zeros, np.cumsum(np.where(valid, values, 0.0), axis=0)])
+    cum_cnt = np.concatenate([zeros, np.cumsum(valid, axis=0)])
+    return cum_sum[window:] - cum_sum[:-window], cum_cnt[window:] - cum_cnt[:-window]
+
+
+def rolling_mean(values, window: int = 20):
+    """
+    滚动均值, 窗口内有缺失值或不足 window 个时为 NaN, 与 pandas 的 rolling(window).mean() 一致
+    :param values: 一维或 (交易日, 标的) 二维数据
+    :type values: numpy.ndarray or pandas.Series or pandas.DataFrame
+    :param window: 窗口
+    :type window: int
+    :return: 与 values 同形状的均值
+    :rtype: numpy.ndarray or pandas.Series or pandas.DataFrame
+    """
+    data = _as_2d(values)
+    result = np.full(data.shape, np.nan)
+    if window <= data.shape[0]:
+        total, count = _rolling_sum(data, window)
+        result[window - 1 :] = np.where(count == window, total / window, np.nan)
+    return _wrap(result, values)
+
+
+def ma_slope(values, window: int = 20):
+    """
+    均线斜率 MA(t) - MA(t-1) = (close(t) - close(t-window)) / window
+    :param values: 一维或 (交易日, 标的) 二维收盘价
+    :type values: numpy.ndarray or pandas.Series or pandas.DataFrame
+    :param window: 均线窗口
+    :type window: int
+    :return: 与 values 同形状的斜率, 前 window 行为 NaN
+    :rtype: numpy.ndarray or pandas.Series or pandas.DataFrame
+    """
+    data = _as_2d(values)
+    result = np.full(data.shape, np.nan)
+    result[window:] = (data[window:] - data[:-window]) / window
+    # 与 rolling(window).mean().diff() 一致: 两个相邻均线都完整时才有斜率
+    if window <= data.shape[0]:
+        _, count = _rolling_sum(data, window)
+        complete = count == window
+        result[window:][~(complete[1:] & complete[:-1])] = np.nan
+    return _wrap(result, values)
+
+
+def _confirm(slope: np.ndarray, confirm_days: int) -> np.ndarray:
+    """
+    斜率连续 confirm_days 天 > 0
+    """
+    positive = slope > 0
+    if confirm_days <= 1:
+        return positive
+    confirmed = np.zeros(slope.shape, dtype=bool)
+    if confirm_days <= slope.shape[0]:
+        count = _rolling_sum(positive.astype(float), confirm_days)[0]
+        confirmed[confirm_days - 1 :] = count == confirm_days
+    return confirmed
+
+
+def rolling_indicators(
+    close,
+    windows: Sequence[int] = DEFAULT_WINDOWS,
+    slope_window: int = 20,
+    confirm_days: int = 2,
+) -> Dict:
+    """
+    批量计算均线, 乖离率, 均线斜率和买卖信号
+    买入信号: slope_window 均线斜率连续 confirm_days 天 > 0; 卖出信号: 斜率 < 0
+    :param close: 一维或 (交易日, 标的) 二维收盘价
+    :type close: numpy.ndarray or pandas.Series or pandas.DataFrame
+    :param windows: 均线窗口
+    :type windows: list
+    :param slope_window: 计算斜率和信号的均线窗口
+    :type slope_window: int
+    :param confirm_days: 买入信号的确认天数
+    :type confirm_days: int
+    :return: MA{w}, BIAS{w}, MA_Slope, Slope_Prev, Signal (1 买入, -1 卖出, 0 无), 与 close 同形状
+    :rtype: dict
+    """
+    data = _as_2d(close)
+    result = {}
+    for window in sorted(set(windows) | {slope_window}):
+        ma = rolling_mean(data, window)
+        result[f"MA{window}"] = ma
+        result[f"BIAS{window}"] = (data - ma) / ma * 100
+    slope = ma_slope(data, slope_window)
+    slope_prev = np.full(data.shape, np.nan)
+    slope_prev[1:] = slope[:-1]
+    signal = np.zeros(data.shape, dtype=np.int8)
+    signal[_confirm(slope, confirm_days)] = 1
+    signal[slope < 0] = -1
+    result["MA_Slope"] = slope
+    result["Slope_Prev"] = slope_prev
+    result["Signal"] = signal
+    return {key: _wrap(value, close) for key, value in result.items()}
+
+
+class RollingMean:
+    """
+    滚动均值的增量计算: 环形缓冲区保存最近 window 个值, 并维护窗口内的和;
+    每 window 次更新重新求和一次, 避免累加误差, 摊还后每次更新 O(1)
+    """
+
+    def __init__(self, window: int = 20):
+        self.window = window
+        self._buffer = np.full(window, np.nan)
+        self._pos = 0
+        self._sum = 0.0
+        self._valid = 0
+        self._updates = 0
+
+    def update(self, value: float) -> float:
+        """
+        追加一个值
+        :param value: 新值
+        :type value: float
+        :return: 追加后的均值, 窗口未满或含缺失值时为 NaN
+        :rtype: float
+        """
+        old = self._buffer[self._pos]
+        if np.isfinite(old):
+            self._sum -= old
+            self._valid -= 1
+        value = float(value)
+        self._buffer[self._pos] = value
+        if np.isfinite(value):
+            self._sum += value
+            self._valid += 1
+        self._pos = (self._pos + 1) % self.window
+        self._updates += 1
+        if self._updates % self.window == 0:
+            self._sum = float(np.nansum(self._buffer))
+        return self.value
+
+    @property
+    def value(self) -> float:
+        return self._sum / self.window if self._valid == self.window else np.nan
+
+    @property
+    def oldest(self) -> float:
+        """
+        窗口中最早的值, 即下一次 update 时移出的值
+        """
+        return self._buffer[self._pos]
+
+
+class IndicatorState:
+    """
+    单个标的的指标状态, 每追加一根 K 线以 O(1) 更新所有均线, 乖离率, 斜率和确认计数,
+    结果与 rolling_indicators 对同一序列的计算结果一致 (均线在浮点误差内一致, 斜率和信号完全相同)
+    """
+
+    def __init__(
+        self,
+        windows: Sequence[int] = DEFAULT_WINDOWS,
+        slope_window: int = 20,
+        confirm_days: int = 2,
+    ):
+        self.windows = sorted(set(windows) | {slope_window})
+        self.slope_window = slope_window
+        self.confirm_days = confirm_days
+        self._means = {window: RollingMean(window) for window in self.windows}
+        # 保存 slope_window + 1 个收盘价, 用于计算 close(t - slope_window)
+        self._closes = RollingMean(slope_window + 1)
+        self._prev_ma = np.nan
+        self._slope = np.nan
+        self._positive_days = 0
+        self.last: Optional[Dict] = None
+
+    @classmethod
+    def from_history(cls, closes: Iterable[float], **kwargs) -> "IndicatorState":
+        """
+        用历史收盘价预热; 只需要最近 max(windows) + 1 根即可得到与完整历史相同的状态
+        :param closes: 按日期升序的收盘价
+        :type closes: list or numpy.ndarray or pandas.Series
+        :return: 指标状态
+        :rtype: IndicatorState
+        """
+        state = cls(**kwargs)
+        for close in closes:
+            state.update(close)
+        return state
+
+    def update(self, close: float) -> Dict:
+        """
+        追加一根 K 线
+        :param close: 收盘价
+        :type close: float
+        :return: MA{w}, BIAS{w}, MA_Slope, Slope_Prev, Signal
+        :rtype: dict
+        """
+        close = float(close)
+        result = {}
+        for window in self.windows:
+            ma = self._means[window].update(close)
+            result[f"MA{window}"] = ma
+            result[f"BIAS{window}"] = (close - ma) / ma * 100 if ma == ma else np.nan
+        self._closes.update(close)
+        ma = result[f"MA{self.slope_window}"]
+        slope_prev = self._slope
+        if ma == ma and self._prev_ma == self._prev_ma:
+            self._slope = (close - self._closes.oldest) / self.slope_window
+        else:
+            self._slope = np.nan
+        self._prev_ma = ma
+        self._positive_days = self._positive_days + 1 if self._slope > 0 else 0
+        confirmed = self._positive_days >= max(self.confirm_days, 1)
+        result["MA_Slope"] = self._slope
+        result["Slope_Prev"] = slope_prev
+        result["Signal"] = -1 if self._slope < 0 else int(confirmed)
+        self.last = result
+        return result
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    close_df = pd.DataFrame(
+        3000 * np.exp(np.cumsum(rng.normal(0, 0.01, (5000, 500)), axis=0)),
+        index=pd.bdate_range("2005-01-03", periods=5000),
+    )
+    indicator_dict = rolling_indicators(close_df)
+    print(indicator_dict["MA20"].iloc[-5:, :5])
+
+    indicator_state = IndicatorState.from_history(close_df[0].iloc[:-1])
+    print(indicator_state.update(close_df[0].iloc[-1]))
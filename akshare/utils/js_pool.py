@@ -0,0 +1,105 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 预热的 JS 执行环境池
+同一段 JS 代码(如 hk_js_decode, ths.js, cninfo.js)只编译一次, 多线程复用已加载该代码的 MiniRacer 实例;
+每个实例同一时刻只被一个线程使用, 实例数量按需增长到 max_size 为止
+之前的多进程方案(utils/multi_decrypt.py)每次调用都要启动进程并重新编译代码, 已废弃
+"""
+
+import hashlib
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Dict
+
+import py_mini_racer
+
+from akshare.utils import trace
+
+DEFAULT_POOL_SIZE = 4
+
+
+class JSContextPool:
+    """
+    加载了同一段 JS 代码的 MiniRacer 实例池, 接口与 MiniRacer 的 call/eval/execute 一致
+    """
+
+    def __init__(self, script: str, max_size: int = DEFAULT_POOL_SIZE):
+        self.script = script
+        self.max_size = max_size
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _create(self) -> py_mini_racer.MiniRacer:
+        ctx = py_mini_racer.MiniRacer()
+        ctx.eval(self.script)
+        return ctx
+
+    @contextmanager
+    def context(self):
+        """
+        独占一个已加载代码的 MiniRacer 实例, 正常退出时归还到池中;
+        执行出错的实例可能停留在不一致的状态(如改了一半的全局变量), 直接丢弃, 由下一个使用者重新创建
+        :return: MiniRacer 实例
+        :rtype: py_mini_racer.MiniRacer
+        """
+        # 队列中的 None 表示一个空出的名额, 取到时需要新建实例
+        try:
+            ctx = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._created < self.max_size
+                if create:
+                    self._created += 1
+            ctx = None if create else self._idle.get()
+        if ctx is None:
+            try:
+                ctx = self._create()
+            except BaseException:
+                self._idle.put(None)
+                raise
+        try:
+            yield ctx
+        except BaseException:
+            self._idle.put(None)
+            raise
+        self._idle.put(ctx)
+
+    def call(self, func_name: str, *args):
+        with trace.span("v8", func=func_name), self.context() as ctx:
+            return ctx.call(func_name, *args)
+
+    def eval(self, code: str):
+        with trace.span("v8"), self.context() as ctx:
+            return ctx.eval(code)
+
+    def execute(self, code: str):
+        with trace.span("v8"), self.context() as ctx:
+            return ctx.execute(code)
+
+
+_pools: Dict[str, JSContextPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_js_pool(script: str, max_size: int = DEFAULT_POOL_SIZE) -> JSContextPool:
+    """
+    获取加载了指定 JS 代码的实例池, 相同代码共享同一个池
+    :param script: JS 代码
+    :type script: str
+    :param max_size: 池中 MiniRacer 实例的最大数量
+    :type max_size: int
+    :return: 实例池
+    :rtype: JSContextPool
+    """
+    key = hashlib.sha1(script.encode("utf-8")).hexdigest()
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = JSContextPool(script=script, max_size=max_size)
+                _pools[key] = pool
+    return pool
@@ -0,0 +1,115 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 宽松 JSON 与 JSONP 解析
+新浪财经, 腾讯财经等接口返回的是 JavaScript 字面量: 键没有引号, 字符串使用单引号, 数组和对象末尾多逗号,
+外层包裹 var x = ...; 或 callback(...);
+依次尝试: 标准库 json 的 C 解析器; 用预编译正则将宽松写法转换为标准 JSON 后再解析; 最后才使用纯 Python 的 demjson,
+代替逐字符解析的 demjson.decode 和不安全的 eval
+"""
+
+import json
+import re
+from typing import Any
+
+from akshare.utils import demjson
+
+_DECODER = json.JSONDecoder()
+
+# 按出现顺序匹配: 字符串整体跳过, 因此字符串中的冒号, 逗号和注释不会被改写
+_LOOSE_TOKEN = re.compile(
+    r'"(?:[^"\\]|\\.)*"'
+    r"|'((?:[^'\\]|\\.)*)'"
+    r"|/\*.*?\*/"
+    r"|,(?=(?:\s|/\*.*?\*/)*[\]}])"
+    r"|(?<![\w$.])([A-Za-z_$][\w$]*)(?=\s*:)"
+    r"|\bundefined\b",
+    re.S,
+)
+
+# var x = / x.y['z'] = / callback( 及值外层的括号, 以及前面的块注释, 如新浪的 /*<script>...</script>*/
+_JSONP_PREFIX = re.compile(
+    r"\s*(?:/\*.*?\*/\s*)*"
+    r"(?:(?:var\s+|let\s+|const\s+)?[A-Za-z_$][\w$.\[\]'\"]*\s*=\s*"
+    r"|[A-Za-z_$][\w$.\[\]'\"]*\s*\()?"
+    r"[\s(]*",
+    re.S,
+)
+
+_CLOSER = {"{": "}", "[": "]"}
+
+
+def _normalize_token(match: re.Match) -> str:
+    token = match.group(0)
+    if token[0] == '"':
+        return token
+    if match.group(1) is not None:
+        body = match.group(1).replace("\\'", "'").replace('\\"', '"')
+        return '"' + body.replace('"', '\\"') + '"'
+    if match.group(2) is not None:
+        return f'"{match.group(2)}"'
+    if token == "undefined":
+        return "null"
+    # 注释和末尾多余的逗号
+    return ""
+
+
+def normalize_loose_json(text: str) -> str:
+    """
+    将 JavaScript 字面量转换为标准 JSON: 键加双引号, 单引号字符串改为双引号, 删除末尾多余的逗号和块注释,
+    undefined 改为 null
+    :param text: JavaScript 字面量
+    :type text: str
+    :return: 标准 JSON
+    :rtype: str
+    """
+    return _LOOSE_TOKEN.sub(_normalize_token, text)
+
+
+def loads(text: str) -> Any:
+    """
+    解析宽松 JSON
+    :param text: JSON 或 JavaScript 字面量
+    :type text: str
+    :return: 解析结果
+    :rtype: dict or list
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    try:
+        return json.loads(normalize_loose_json(text))
+    except ValueError:
+        pass
+    return demjson.decode(text)
+
+
+def loads_jsonp(text: str) -> Any:
+    """
+    解析 JSONP 或 JavaScript 赋值语句中的第一个值, 之后的内容(如结尾的 ); 和注释)被忽略
+    :param text: 形如 var x = {...}; 或 callback({...}); 的文本, 也可以是 JSON 本身
+    :type text: str
+    :return: 解析结果
+    :rtype: dict or list
+    """
+    payload = text[_JSONP_PREFIX.match(text).end() :].rstrip()
+    try:
+        return _DECODER.raw_decode(payload)[0]
+    except ValueError:
+        pass
+    try:
+        return _DECODER.raw_decode(normalize_loose_json(payload))[0]
+    except ValueError:
+        pass
+    closer = _CLOSER.get(payload[:1])
+    if closer is not None and payload.rfind(closer) > 0:
+        payload = payload[: payload.rfind(closer) + 1]
+    else:
+        payload = payload.rstrip(";)")
+    return demjson.decode(payload)
+
+
+if __name__ == "__main__":
+    print(loads_jsonp("var hq = {symbol:'sh600000', price:10.5, list:[1,2,],};"))
+    print(loads_jsonp('jQuery1124_1700000000000({"rc":0,"data":{"total":1}});'))
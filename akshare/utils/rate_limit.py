@@ -0,0 +1,469 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 按主机限速的令牌桶, 并发数限制和熔断器
+多线程共享同一主机的令牌桶, 信号量和熔断器, 取代请求之间的固定随机延迟;
+akshare.utils.request.request 在每次请求前统一获取令牌并检查熔断状态.
+限速按数据源配置: DEFAULT_RATE_LIMITS 中的主机及其子域名共享一个令牌桶,
+没有配置的主机不限速, 只受并发数和熔断器的限制
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+from akshare.exceptions import CircuitOpenError
+
+# 各数据源的默认限速 {主机: (每秒请求数, 允许的突发请求数)}, 同时适用于其子域名, 如 70.push2.eastmoney.com;
+# 可以用 set_rate_limit 覆盖, 表中没有的主机不限速
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[float, float]] = {
+    "push2.eastmoney.com": (20.0, 40.0),
+    "push2his.eastmoney.com": (20.0, 40.0),
+    "datacenter-web.eastmoney.com": (10.0, 20.0),
+    "hq.sinajs.cn": (10.0, 20.0),
+    "finance.sina.com.cn": (5.0, 10.0),
+    "qt.gtimg.cn": (10.0, 20.0),
+    "sse.com.cn": (2.0, 5.0),
+    "szse.cn": (2.0, 5.0),
+    "bse.cn": (2.0, 5.0),
+    "shfe.com.cn": (2.0, 5.0),
+    "ine.cn": (2.0, 5.0),
+    "dce.com.cn": (2.0, 5.0),
+    "czce.com.cn": (2.0, 5.0),
+    "cffex.com.cn": (2.0, 5.0),
+    "gfex.com.cn": (2.0, 5.0),
+}
+
+
+class TokenBucket:
+    """
+    线程安全的令牌桶, 以 rate 个/秒的速度补充令牌, 最多积累 capacity 个
+    """
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        尝试获取令牌, 不阻塞
+        :param tokens: 需要的令牌数量
+        :type tokens: float
+        :return: 是否获取成功
+        :rtype: bool
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """
+        获取令牌, 令牌不足时阻塞等待
+        :param tokens: 需要的令牌数量
+        :type tokens: float
+        :return: None
+        :rtype: None
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        """
+        获取令牌, 令牌不足时在事件循环中等待, 不阻塞其他协程
+        :param tokens: 需要的令牌数量
+        :type tokens: float
+        :return: None
+        :rtype: None
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            await asyncio.sleep(wait)
+
+
+class NoLimit:
+    """
+    不限速, 接口与 TokenBucket 一致, 用于没有配置限速的主机
+    """
+
+    rate = float("inf")
+    capacity = float("inf")
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        return True
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        return None
+
+    async def acquire_async(self, tokens: float = 1.0) -> None:
+        return None
+
+
+NO_LIMIT = NoLimit()
+
+_limiters: Dict[str, TokenBucket] = {}
+_limit_config: Dict[str, tuple] = {}
+_limiters_lock = threading.Lock()
+
+
+def _get_host(url: str) -> str:
+    """
+    从 URL 中解析主机名, 传入的已经是主机名时原样返回
+    :param url: URL 或主机名
+    :type url: str
+    :return: 主机名
+    :rtype: str
+    """
+    if "//" not in url:
+        return url
+    return urlsplit(url).hostname or url
+
+
+def _match_host(host: str, hosts: Mapping) -> Optional[str]:
+    """
+    在配置中查找主机本身或最近的上级域名
+    :param host: 主机名
+    :type host: str
+    :param hosts: 以主机名为键的配置
+    :type hosts: dict
+    :return: 匹配的主机名, 没有匹配时为 None
+    :rtype: str
+    """
+    while host not in hosts:
+        if "." not in host:
+            return None
+        host = host.split(".", 1)[1]
+    return host
+
+
+def set_rate_limit(host: str, rate: Optional[float], capacity: float = None) -> None:
+    """
+    设置指定主机及其子域名的限速, 覆盖 DEFAULT_RATE_LIMITS 中的默认值
+    :param host: 主机名或 URL
+    :type host: str
+    :param rate: 每秒请求数, 为 None 时不限速
+    :type rate: float
+    :param capacity: 允许的突发请求数
+    :type capacity: float
+    :return: None
+    :rtype: None
+    """
+    host = _get_host(host)
+    with _limiters_lock:
+        _limit_config[host] = (rate, capacity)
+        _limiters.pop(host, None)
+
+
+def get_rate_limiter(url: str):
+    """
+    获取 URL 所在数据源共享的令牌桶; 按 set_rate_limit 的设置, DEFAULT_RATE_LIMITS 的顺序
+    匹配主机本身或最近的上级域名, 都没有匹配时不限速
+    :param url: URL 或主机名
+    :type url: str
+    :return: 令牌桶, 不限速时为 NO_LIMIT
+    :rtype: TokenBucket
+    """
+    host = _get_host(url)
+    key = _match_host(host, _limit_config)
+    if key is not None:
+        rate, capacity = _limit_config[key]
+    else:
+        key = _match_host(host, DEFAULT_RATE_LIMITS)
+        if key is None:
+            return NO_LIMIT
+        rate, capacity = DEFAULT_RATE_LIMITS[key]
+    if rate is None:
+        return NO_LIMIT
+    limiter = _limiters.get(key)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(key)
+            if limiter is None:
+                limiter = TokenBucket(rate=rate, capacity=capacity)
+                _limiters[key] = limiter
+    return limiter
+
+
+DEFAULT_HOST_CONCURRENCY = 8
+
+_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_concurrency_config: Dict[str, int] = {}
+
+
+def set_host_concurrency(host: str, max_concurrency: int) -> None:
+    """
+    设置指定主机同时进行的最大请求数
+    :param host: 主机名或 URL
+    :type host: str
+    :param max_concurrency: 最大并发请求数
+    :type max_concurrency: int
+    :return: None
+    :rtype: None
+    """
+    host = _get_host(host)
+    with _limiters_lock:
+        _concurrency_config[host] = max_concurrency
+        _semaphores.pop(host, None)
+
+
+def get_host_concurrency(url: str) -> int:
+    """
+    获取 URL 所在主机允许同时进行的最大请求数
+    :param url: URL 或主机名
+    :type url: str
+    :return: 最大并发请求数
+    :rtype: int
+    """
+    return _concurrency_config.get(_get_host(url), DEFAULT_HOST_CONCURRENCY)
+
+
+def get_host_semaphore(url: str) -> threading.BoundedSemaphore:
+    """
+    获取 URL 所在主机共享的并发信号量, 限制多线程对同一主机的同时请求数
+    :param url: URL 或主机名
+    :type url: str
+    :return: 信号量
+    :rtype: threading.BoundedSemaphore
+    """
+    host = _get_host(url)
+    semaphore = _semaphores.get(host)
+    if semaphore is None:
+        with _limiters_lock:
+            semaphore = _semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(
+                    _concurrency_config.get(host, DEFAULT_HOST_CONCURRENCY)
+                )
+                _semaphores[host] = semaphore
+    return semaphore
+
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RECOVERY_TIMEOUT = 30.0
+DEFAULT_MAX_RECOVERY_TIMEOUT = 600.0
+# 服务端限流或封禁时返回的状态码, 计入熔断器的失败次数
+TRIP_STATUS_CODES = frozenset({403, 429})
+
+
+def parse_retry_after(headers: Optional[Mapping]) -> Optional[float]:
+    """
+    解析响应头中以秒为单位的 Retry-After
+    :param headers: 响应头
+    :type headers: dict
+    :return: 秒数, 没有或无法解析时为 None
+    :rtype: float
+    """
+    if not headers:
+        return None
+    try:
+        return max(float(headers.get("Retry-After")), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """
+    线程安全的熔断器
+    closed: 正常放行, 连续 failure_threshold 次失败 (403, 429, 连接被重置) 后进入 open;
+    open: 拒绝所有请求, recovery_timeout 秒后进入 half_open;
+    half_open: 只放行一个探测请求, 成功则回到 closed, 失败则重新 open 且等待时间加倍, 最长 max_recovery_timeout 秒
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+        max_recovery_timeout: float = DEFAULT_MAX_RECOVERY_TIMEOUT,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.max_recovery_timeout = max_recovery_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._open_timeout = recovery_timeout
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def _open(self, timeout: float) -> None:
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._open_timeout = timeout
+        self._probing = False
+
+    def retry_after(self) -> float:
+        """
+        距离下一次允许探测的秒数
+        :return: 秒数, 非 open 状态时为 0
+        :rtype: float
+        """
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(self._opened_at + self._open_timeout - time.monotonic(), 0.0)
+
+    def allow_request(self) -> bool:
+        """
+        是否放行本次请求; half_open 状态下同一时间只放行一个探测请求
+        :return: 是否放行
+        :rtype: bool
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self._open_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def before_request(self, host: str = "") -> None:
+        """
+        请求前检查熔断状态
+        :param host: 主机名, 用于异常信息
+        :type host: str
+        :return: None
+        :rtype: None
+        :raises: CircuitOpenError 熔断中
+        """
+        if not self.allow_request():
+            raise CircuitOpenError(host, self.retry_after())
+
+    def record_success(self) -> None:
+        """
+        记录一次成功的请求, 清零失败次数并关闭熔断器
+        :return: None
+        :rtype: None
+        """
+        with self._lock:
+            self.state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self, retry_after: float = None) -> None:
+        """
+        记录一次被限流或连接被重置的请求
+        :param retry_after: 服务端要求的等待秒数, 熔断时至少等待这么久
+        :type retry_after: float
+        :return: None
+        :rtype: None
+        """
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN:
+                timeout = min(self._open_timeout * 2, self.max_recovery_timeout)
+            elif self._failures >= self.failure_threshold or retry_after is not None:
+                timeout = self.recovery_timeout
+            else:
+                return
+            self._open(max(timeout, retry_after or 0.0))
+
+    def release(self) -> None:
+        """
+        请求结束但结果不计入成败 (如超时, 服务端 5xx) 时释放探测名额
+        :return: None
+        :rtype: None
+        """
+        with self._lock:
+            self._probing = False
+
+    def record_response(self, status_code: int, headers: Mapping = None) -> None:
+        """
+        按响应状态码记录请求结果
+        :param status_code: HTTP 状态码
+        :type status_code: int
+        :param headers: 响应头
+        :type headers: dict
+        :return: None
+        :rtype: None
+        """
+        if status_code in TRIP_STATUS_CODES:
+            self.record_failure(parse_retry_after(headers))
+        elif status_code < 500:
+            self.record_success()
+        else:
+            self.release()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breaker_config: Dict[str, dict] = {}
+
+
+def set_circuit_breaker(
+    host: str,
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+    recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+    max_recovery_timeout: float = DEFAULT_MAX_RECOVERY_TIMEOUT,
+) -> None:
+    """
+    设置指定主机的熔断参数
+    :param host: 主机名或 URL
+    :type host: str
+    :param failure_threshold: 连续失败多少次后熔断
+    :type failure_threshold: int
+    :param recovery_timeout: 熔断后等待多少秒再探测
+    :type recovery_timeout: float
+    :param max_recovery_timeout: 探测失败后等待时间加倍的上限 (秒)
+    :type max_recovery_timeout: float
+    :return: None
+    :rtype: None
+    """
+    host = _get_host(host)
+    with _limiters_lock:
+        _breaker_config[host] = dict(
+            failure_threshold=failure_threshold,
+            recovery_timeout=recovery_timeout,
+            max_recovery_timeout=max_recovery_timeout,
+        )
+        _breakers.pop(host, None)
+
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    """
+    获取 URL 所在主机共享的熔断器
+    :param url: URL 或主机名
+    :type url: str
+    :return: 熔断器
+    :rtype: CircuitBreaker
+    """
+    host = _get_host(url)
+    breaker = _breakers.get(host)
+    if breaker is None:
+        with _limiters_lock:
+            breaker = _breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(**_breaker_config.get(host, {}))
+                _breakers[host] = breaker
+    return breaker
@@ -1,16 +1,192 @@
 # !/usr/bin/env python
 """
-Date: 2025/12/31
+Date: 2026/10/18 15:00
 Desc: HTTP 请求工具函数
+所有接口共用一个进程级的连接池会话, 按主机复用 TCP/TLS 连接;
+每次请求前按主机获取令牌并检查熔断器, 所有线程共享同一主机的限速和熔断状态;
+请求的耗时和流量通过 akshare.utils.trace 的回调输出
 """
 
+import os
 import random
+import threading
 import time
-from typing import Dict, Tuple
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Optional, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
 
+from akshare.utils import trace
+from akshare.utils.context import config
+from akshare.utils.rate_limit import (
+    _get_host,
+    get_circuit_breaker,
+    get_host_semaphore,
+    get_rate_limiter,
+)
+
+_session_config = {
+    "pool_connections": 32,
+    "pool_maxsize": 32,
+    "pool_block": False,
+    "keep_alive": True,
+    "timeout": None,
+}
+_session = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    """
+    创建连接池会话
+    会话不保存服务端下发的 cookies, 以保持与 requests.get 一致的无状态行为
+    :return: 会话对象
+    :rtype: requests.Session
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(
+        pool_connections=_session_config["pool_connections"],
+        pool_maxsize=_session_config["pool_maxsize"],
+        pool_block=_session_config["pool_block"],
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if not _session_config["keep_alive"]:
+        session.headers["Connection"] = "close"
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    获取进程级共享的连接池会话
+    :return: 会话对象
+    :rtype: requests.Session
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def reset_session() -> None:
+    """
+    关闭并丢弃当前的共享会话, 下次请求时重新创建
+    :return: None
+    :rtype: None
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+def set_session_config(
+    pool_connections: int = None,
+    pool_maxsize: int = None,
+    pool_block: bool = None,
+    keep_alive: bool = None,
+    timeout: float = None,
+) -> None:
+    """
+    设置共享会话的连接池参数
+    :param pool_connections: 缓存的主机连接池数量
+    :type pool_connections: int
+    :param pool_maxsize: 每个主机保留的最大连接数
+    :type pool_maxsize: int
+    :param pool_block: 连接池满时是否阻塞等待
+    :type pool_block: bool
+    :param keep_alive: 是否复用连接
+    :type keep_alive: bool
+    :param timeout: 调用方未指定 timeout 时使用的默认超时时间（秒）
+    :type timeout: float
+    :return: None
+    :rtype: None
+    """
+    for key, value in (
+        ("pool_connections", pool_connections),
+        ("pool_maxsize", pool_maxsize),
+        ("pool_block", pool_block),
+        ("keep_alive", keep_alive),
+        ("timeout", timeout),
+    ):
+        if value is not None:
+            _session_config[key] = value
+    reset_session()
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """
+    通过共享会话发送 HTTP 请求, 参数与 requests.request 一致
+    未指定 proxies 时使用 akshare.utils.context.config 中的代理设置;
+    同一主机的请求频率, 并发数和熔断参数分别由 akshare.utils.rate_limit 中的
+    set_rate_limit, set_host_concurrency 和 set_circuit_breaker 设置;
+    注册了 akshare.utils.trace 的回调时记录每次请求的主机, 状态码, 字节数和耗时
+    :param method: 请求方法
+    :type method: str
+    :param url: 请求 URL
+    :type url: str
+    :return: Response 对象
+    :rtype: requests.Response
+    :raises: akshare.exceptions.CircuitOpenError 主机熔断中, 请求未发出
+    """
+    if kwargs.get("proxies") is None and config.proxies is not None:
+        kwargs["proxies"] = config.proxies
+    if "timeout" not in kwargs:
+        kwargs["timeout"] = _session_config["timeout"]
+    breaker = get_circuit_breaker(url)
+    with trace.request_span(method, url, stream=kwargs.get("stream")) as span:
+        # 熔断拒绝的请求同样记录为出错的请求
+        breaker.before_request(_get_host(url))
+        try:
+            get_rate_limiter(url).acquire()
+            with get_host_semaphore(url):
+                span.mark_sent()
+                response = get_session().request(method, url, **kwargs)
+        except requests.ConnectionError:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_response(response.status_code, response.headers)
+        span.set_response(response)
+    return response
+
+
+def request_get(url: str, params: Dict = None, **kwargs) -> requests.Response:
+    """
+    通过共享会话发送 HTTP GET 请求, 参数与 requests.get 一致
+    :param url: 请求 URL
+    :type url: str
+    :param params: 请求参数
+    :type params: dict
+    :return: Response 对象
+    :rtype: requests.Response
+    """
+    return request("GET", url, params=params, **kwargs)
+
+
+def request_post(
+    url: str, data=None, json: Optional[Dict] = None, **kwargs
+) -> requests.Response:
+    """
+    通过共享会话发送 HTTP POST 请求, 参数与 requests.post 一致
+    :param url: 请求 URL
+    :type url: str
+    :param data: 请求体
+    :type data: dict or str
+    :param json: JSON 请求体
+    :type json: dict
+    :return: Response 对象
+    :rtype: requests.Response
+    """
+    return request("POST", url, data=data, json=json, **kwargs)
+
 
 def request_with_retry(
     url: str,
@@ -36,29 +212,38 @@ def request_with_retry(
     :type random_delay_range: tuple
     :return: Response 对象
     :rtype: requests.Response
-    :raises: 最后一次请求的异常
+    :raises: 最后一次请求的异常; 主机熔断时立即抛出 CircuitOpenError, 不再重试
     """
     last_exception = None
 
     for attempt in range(max_retries):
         try:
-            # 每次请求创建新的 Session，避免复用连接
-            with requests.Session() as session:
-                # 禁用连接池复用
-                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
-                session.mount("http://", adapter)
-                session.mount("https://", adapter)
-
-                response = session.get(url, params=params, timeout=timeout)
-                response.raise_for_status()
-                return response
+            with trace.attempt(attempt):
+                response = request_get(url, params=params, timeout=timeout)
+            response.raise_for_status()
+            return response
 
         except (requests.RequestException, ValueError) as e:
             last_exception = e
 
             if attempt < max_retries - 1:
-                # 指数退避 + 随机抖动
+                # 指数退避 + 随机抖动; 请求频率由令牌桶控制, 这里只处理偶发失败
                 delay = base_delay * (2**attempt) + random.uniform(*random_delay_range)
                 time.sleep(delay)
 
     raise last_exception
+
+
+def _reset_after_fork() -> None:
+    """
+    子进程(如 gunicorn worker)不能复用父进程的套接字, 需要重新建立会话
+    :return: None
+    :rtype: None
+    """
+    global _session, _session_lock
+    _session = None
+    _session_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
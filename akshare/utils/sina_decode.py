@@ -0,0 +1,968 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 新浪财经历史行情压缩数据的解码
+akshare.stock.cons.hk_js_decode 中 d 函数的 Python 实现, 直接输出按列存放的 numpy 数组;
+原来的做法是交给 V8 执行 JS 代码, 返回 list of dict 后再构造 DataFrame
+数据是 6 位一组的 base64 字符, 按低位在前的顺序组成比特流, 前 18 位的头部决定了具体的编码格式
+"""
+
+import math
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from akshare.stock.cons import hk_js_decode
+from akshare.utils import trace
+from akshare.utils.js_pool import get_js_pool
+
+DECODE_ENGINE = "python"
+
+_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+_CHAR_TABLE = np.full(128, 63, dtype=np.uint8)
+_CHAR_TABLE[[ord(char) for char in _ALPHABET]] = np.arange(64, dtype=np.uint8)
+_BIT_SHIFT = np.arange(6, dtype=np.uint8)
+_DAY_OFFSET = 7657
+_TWO_POW_30 = float(1 << 30)
+_NAN = float("nan")
+_MAX_SAFE_INTEGER = 2**53
+_MIN_BATCH_ROWS = 8
+_POW10 = [float(10**exponent) for exponent in range(23)]
+_JS_NUMBER_RE = re.compile(r"^[+-]?(Infinity|(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?)$")
+
+
+def set_decode_engine(engine: str = "python") -> None:
+    """
+    设置默认的解码方式
+    :param engine: choice of {"python", "js"}
+    :type engine: str
+    :return: None
+    :rtype: None
+    """
+    global DECODE_ENGINE
+    if engine not in ("python", "js"):
+        raise ValueError("engine must be 'python' or 'js'")
+    DECODE_ENGINE = engine
+
+
+def _js_int32(value) -> int:
+    """
+    JS 位运算前的 ToInt32 转换
+    """
+    if isinstance(value, float):
+        if value != value or value in (math.inf, -math.inf):
+            return 0
+        value = int(value)
+    value &= 0xFFFFFFFF
+    return value - 0x100000000 if value & 0x80000000 else value
+
+
+def _js_mod(value, divisor):
+    """
+    JS 的取余运算, 结果符号与被除数相同
+    """
+    if isinstance(value, float):
+        return math.fmod(value, divisor)
+    return -(-value % divisor) if value < 0 else value % divisor
+
+
+def _js_floor(value):
+    if value != value or value in (math.inf, -math.inf):
+        return value
+    return math.floor(value)
+
+
+def _js_truthy(value) -> bool:
+    return value is not None and value == value and bool(value)
+
+
+def _js_str(value) -> str:
+    """
+    JS 的 Number.prototype.toString
+    """
+    if value is None:
+        return "undefined"
+    value = float(value)
+    if value != value:
+        return "NaN"
+    if value in (math.inf, -math.inf):
+        return "Infinity" if value > 0 else "-Infinity"
+    if value == 0:
+        return "0"
+    if value.is_integer() and abs(value) < _MAX_SAFE_INTEGER:
+        return str(int(value))
+    sign = "-" if value < 0 else ""
+    text = repr(abs(value))
+    mantissa, _, exponent = text.partition("e")
+    integer, _, fraction = mantissa.partition(".")
+    digits = (integer + fraction).lstrip("0")
+    point = len(integer) + (int(exponent) if exponent else 0)
+    point -= len(integer + fraction) - len((integer + fraction).lstrip("0"))
+    digits = digits.rstrip("0") or "0"
+    k = len(digits)
+    if k <= point <= 21:
+        return sign + digits + "0" * (point - k)
+    if 0 < point <= 21:
+        return sign + digits[:point] + "." + digits[point:]
+    if -6 < point <= 0:
+        return sign + "0." + "0" * (-point) + digits
+    exponent = point - 1
+    exponent_text = ("+" if exponent >= 0 else "-") + str(abs(exponent))
+    if k == 1:
+        return sign + digits + "e" + exponent_text
+    return sign + digits[0] + "." + digits[1:] + "e" + exponent_text
+
+
+def _pow10(exponent) -> float:
+    """
+    JS 中的 Math.pow(10, exponent), 指数不超过 22 时两者完全一致
+    """
+    return float(10**exponent) if exponent == exponent else _NAN
+
+
+def _js_number(text: str) -> float:
+    """
+    JS 中字符串转数字(如 "12" - 0)
+    """
+    text = text.strip()
+    if not text:
+        return 0.0
+    if not _JS_NUMBER_RE.match(text):
+        return _NAN
+    return float(text.replace("Infinity", "inf"))
+
+
+@lru_cache(maxsize=None)
+def _t(value) -> Tuple[int, int]:
+    if not _js_truthy(value):
+        return 0, 0
+    if value < 0:
+        result = _t(-value)
+        return -result[0], -result[1]
+    remainder = value % 3
+    base = (value - remainder) // 3
+    if remainder == 1:
+        return base + 1, base
+    if remainder == 2:
+        return base, base + 1
+    return base, base
+
+
+@lru_cache(maxsize=None)
+def _p_factor(scale: Tuple[int, int], target_scale: Tuple[int, int]):
+    """
+    P 函数中先乘以 2 或 5 的幂, 再移动小数点的位数
+    """
+    diff = [target_scale[0] - scale[0], target_scale[1] - scale[1]]
+    factor = 1
+    while diff[0] < diff[1]:
+        factor *= 5
+        diff[1] -= 1
+    while diff[1] < diff[0]:
+        factor *= 2
+        diff[0] -= 1
+    return factor, diff[0]
+
+
+def _e(value) -> str:
+    text = _js_str(value if _js_truthy(value) else 0)
+    index = text.lower().find("e")
+    if index > 0:
+        return "0" * max(int(_js_number(text[index + 1 :])) + 1, 0)
+    return text
+
+
+def _is_safe_integer(value) -> bool:
+    return value % 1 == 0 and -_MAX_SAFE_INTEGER < value < _MAX_SAFE_INTEGER
+
+
+def _p(value, precision, target=None):
+    """
+    按十进制字符串移动小数点, 对应 JS 代码中的 P 函数
+    """
+    scale = precision if isinstance(precision, tuple) else _t(precision)
+    factor, shift = _p_factor(scale, _t(target))
+    if factor > 1:
+        value = value * factor if value is not None else _NAN
+    if target is None and _is_safe_integer(value):
+        # 整数在 JS 中的字符串形式就是其全部数字, 移动小数点后再解析得到的是正确舍入的十进制值;
+        # 整数与不超过 1e22 的 10 的幂都能用 double 精确表示, 一次乘除法的舍入结果与之相同
+        if 0 <= shift <= 22:
+            return float(value) * _POW10[shift]
+        if -22 <= shift < 0:
+            divisor = _POW10[-shift]
+            if value >= 0 or value <= -divisor:
+                return float(value) / divisor
+    text = _e(value)
+    if shift < 0:
+        while len(text) + shift <= 0:
+            text = "0" + text
+        shift += len(text)
+        result = _js_number(text[:shift])
+        if target is None:
+            return _js_number(_js_str(result) + "." + text[shift:])
+        digit = _js_number(text[shift : shift + 1])
+        if digit > 5:
+            result += 1
+        elif digit == 5:
+            if _js_number(text[shift + 1 :]) > 0:
+                result += 1
+            else:
+                result += 1 & _js_int32(result)
+        return result
+    return _js_number(text + "0" * shift)
+
+
+def _p_array(values: np.ndarray, precision) -> Optional[np.ndarray]:
+    """
+    P 函数(不指定目标精度)的向量化版本, values 为安全整数
+    """
+    factor, shift = _p_factor(_t(precision), (0, 0))
+    if abs(shift) > 22 or float(np.abs(values).max()) * factor >= _MAX_SAFE_INTEGER:
+        return None
+    values = values * factor
+    if shift >= 0:
+        return values.astype(float) * _POW10[shift]
+    divisor = _POW10[-shift]
+    result = values.astype(float) / divisor
+    # JS 代码对绝对值小于 1 的负数补零后得到 "0-5" 之类的字符串, 结果为 NaN
+    result[(values < 0) & (values > -divisor)] = np.nan
+    return result
+
+
+def _p_round_array(values: np.ndarray, scale: Tuple[int, int], target):
+    """
+    P 函数(指定目标精度, 按十进制字符串四舍六入五成双)的向量化版本, 仅处理非负的安全整数
+    """
+    factor, shift = _p_factor(scale, _t(target))
+    values = values * factor
+    if not (np.all(values >= 0) and values.max() < _MAX_SAFE_INTEGER):
+        return None
+    if shift >= 0:
+        return values * _POW10[shift] if shift <= 22 else None
+    if shift < -18:
+        return None
+    values = values.astype(np.int64)
+    quotient, remainder = np.divmod(values, 10 ** (-shift))
+    lead, rest = np.divmod(remainder, 10 ** (-shift - 1))
+    quotient += (lead > 5) | ((lead == 5) & ((rest > 0) | (quotient & 1 == 1)))
+    return quotient.astype(float)
+
+
+class _SinaDecoder:
+    """
+    比特流解码器, 方法名与 JS 代码中的函数一一对应
+    """
+
+    def __init__(self, payload: str):
+        codes = np.frombuffer(payload.encode("utf-32-le"), dtype=np.uint32)
+        values = np.full(codes.shape, 63, dtype=np.uint8)
+        ascii_mask = codes < 128
+        values[ascii_mask] = _CHAR_TABLE[codes[ascii_mask]]
+        bits = ((values[:, None] >> _BIT_SHIFT) & 1).astype(np.uint8).ravel()
+        self.bits = np.concatenate([bits, np.zeros(128, dtype=np.uint8)])
+        packed = np.packbits(bits, bitorder="little")
+        packed = np.concatenate(
+            [packed, np.zeros(16 + (-len(packed)) % 8, dtype=np.uint8)]
+        )
+        self.words = packed.view("<u8").tolist()
+        self.total = 6 * len(codes)
+        self.pos = 0
+        self.r = {}
+        self.chunked = False
+        self.batch_end = 0
+
+    def _bits(self, count: int) -> int:
+        pos = self.pos
+        index = pos >> 6
+        offset = pos & 63
+        value = self.words[index] >> offset
+        if offset + count > 64:
+            value |= self.words[index + 1] << (64 - offset)
+        self.pos = pos + count
+        return value & ((1 << count) - 1)
+
+    def y(self) -> int:
+        if self.pos >= self.total:
+            return 0
+        pos = self.pos
+        self.pos = pos + 1
+        return (self.words[pos >> 6] >> (pos & 63)) & 1
+
+    def w(self, sizes, signed=None, raw=None) -> list:
+        result = []
+        for index, size in enumerate(sizes):
+            if not _js_truthy(size):
+                result.append(0)
+                continue
+            if self.pos >= self.total:
+                return result
+            if size <= 0:
+                value = 0
+            elif size <= 30:
+                value = self._bits(size)
+                if signed and signed[index] and value >= 1 << (size - 1):
+                    value -= 1 << size
+            else:
+                value = self.w([30, size - 30], [0, signed[index] if signed else 0])
+                value += [_NAN] * (2 - len(value))
+                if not (raw and raw[index]):
+                    value = value[0] + value[1] * _TWO_POW_30
+            result.append(value)
+        return result
+
+    def w1(self, size: int, signed: int = 0):
+        """
+        读取单个整数, 数据已经读完时与 JS 一样得到 NaN
+        """
+        if 0 < size <= 30 and self.pos < self.total:
+            value = self._bits(size)
+            if signed and value >= 1 << (size - 1):
+                value -= 1 << size
+            return value
+        result = self.w([size], [signed])
+        return result[0] if result else _NAN
+
+    def wn(self, sizes) -> list:
+        result = self.w(sizes)
+        return result + [_NAN] * (len(sizes) - len(result))
+
+    def n(self) -> int:
+        sign = self.y()
+        count = 1
+        while True:
+            if not self.y():
+                return count * (2 * sign - 1)
+            count += 1
+
+    def x(self):
+        value = self.w1(3)
+        if value == 1:
+            self.r["d"] = self.w1(18, 1)
+            value = 0
+        elif not _js_truthy(value):
+            value = self.w1(6)
+        return value
+
+    def s(self, count):
+        r = self.r
+        for _ in range(count if _js_truthy(count) and count > 0 else 0):
+            r["d"] += 1
+            remainder = _js_mod(r["d"], 7)
+            if remainder in (3, 4):
+                r["d"] += 5 - remainder
+        return _DAY_OFFSET + r["d"]
+
+    def k(self, count):
+        r = self.r
+        mask = _js_int32(r["wd"]) if _js_truthy(r.get("wd")) else 62
+        for _ in range(count if _js_truthy(count) and count > 0 else 0):
+            while True:
+                r["d"] += 1
+                if mask & (1 << _js_int32((_js_mod(r["d"], 7) + 10) % 7)):
+                    break
+        return _DAY_OFFSET + r["d"]
+
+    def decode(self):
+        header = self.w([12, 6])
+        self.style = 63 ^ header[1] if len(header) > 1 else 63
+        handler = {
+            1479: self.decode_d,
+            136: self.decode_intraday,
+            200: self.decode_c,
+            139: self.decode_r,
+            197: self.decode_a,
+            3466: self.decode_o,
+        }.get(header[0] if header else None)
+        if handler is None:
+            return []
+        try:
+            return handler()
+        except (IndexError, KeyError, TypeError) as e:
+            raise ValueError("新浪财经数据解码失败") from e
+
+    def decode_c(self):
+        """
+        收盘价序列
+        """
+        r = self.r
+        if self.style >= 1:
+            return []
+        r["d"] = self.w1(18, 1) - 1
+        header = self.wn([3, 3, 30, 6])
+        r["p"], r["ld"], r["cd"], r["c"] = header
+        r["m"] = _pow10(r["p"])
+        r["cd"] = float(r["cd"])
+        r["pc"] = r["cd"] / r["m"]
+        rows = []
+        t = 0
+        while True:
+            day_step = 1
+            if self.y():
+                flag = self.w1(3)
+                if flag == 0:
+                    day_step = self.w1(6)
+                elif flag == 1:
+                    r["d"] = self.w1(18)
+                    day_step = 0
+                else:
+                    day_step = flag
+            row = {"date": self.s(day_step)}
+            if self.y():
+                r["ld"] += self.n()
+            r["cd"] += self.w1(3 * r["ld"], 1)
+            row["close"] = r["cd"] / r["m"]
+            rows.append(row)
+            if self.pos >= self.total or (
+                self.pos // 6 == self.total // 6 - 1
+                and not 63 & (_js_int32(r["c"]) ^ (t + 1))
+            ):
+                break
+            t += 1
+        rows[0]["prevclose"] = r["pc"]
+        return rows
+
+    def decode_intraday(self):
+        """
+        分时数据
+        """
+        r = self.r
+        style = self.style
+        if style > 2:
+            return []
+        rows = []
+        names = {"v": "volume", "p": "price", "a": "avg_price"}
+        r["d"] = self.w1(18, 1) - 1
+        first_date = self.s(1)
+        values = self.wn([3, 3, 4, 1, 1, 1, 5] if 1 > style else [4, 4, 4, 1, 1, 1, 3])
+        for key, value in zip(["la", "lp", "lv", "tv", "rv", "zv", "pp"], values):
+            r[key] = value
+        r["m"] = _pow10(r["pp"])
+        if style >= 1:
+            values = self.wn([3, 3])
+            r["c"] = values[0]
+            size = values[1]
+        else:
+            size = 5
+            r["c"] = 2
+        r["pc"] = self.w1(6 * size)
+        prevclose = r["pc"] / r["m"]
+        r["cp"] = float(r["pc"])
+        r["da"] = 0.0
+        r["sa"] = r["sv"] = 0.0
+        t = 0
+        while not (
+            self.pos >= self.total
+            or (
+                self.pos // 6 == self.total // 6 - 1 and not 7 & (_js_int32(r["c"]) ^ t)
+            )
+        ):
+            row = {}
+            delta = {}
+            flag = self.y() if r["tv"] else 1
+            for i, key in enumerate("vpa"):
+                if self.y() if flag else 0:
+                    r["l" + key] += self.n()
+                unit = self.y() if key == "v" and r["rv"] else 1
+                value = self.w1(
+                    3 * r["l" + key] + (7 * unit if key == "v" else 0), bool(i)
+                ) * (1 if unit else 100)
+                delta[key] = value
+                if key == "v":
+                    row[names[key]] = value
+                    if (
+                        not _js_truthy(value)
+                        and (style > 1 or 241 > t)
+                        and (not self.y() if r["zv"] else 1)
+                    ):
+                        delta["p"] = 0
+                        break
+                elif key == "a":
+                    r["da"] = (0 if 1 > style else r["da"]) + delta["a"]
+            r["sv"] += delta["v"]
+            r["cp"] += delta["p"]
+            row[names["p"]] = r["cp"] / r["m"]
+            r["sa"] += delta["v"] * r["cp"]
+            if "a" not in delta:
+                row[names["a"]] = rows[t - 1][names["a"]] if t else row[names["p"]]
+            elif _js_truthy(r["sv"]):
+                row[names["a"]] = (
+                    (
+                        _js_int32(
+                            _js_floor((r["sa"] * (2e3 / r["m"]) + r["sv"]) / r["sv"])
+                        )
+                        >> 1
+                    )
+                    + r["da"]
+                ) / 1e3
+            else:
+                row[names["a"]] = row[names["p"]] + r["da"] / 1e3
+            rows.append(row)
+            t += 1
+        rows[0]["date"] = first_date
+        rows[0]["prevclose"] = prevclose
+        return rows
+
+    def decode_d(self):
+        """
+        日线数据(旧格式)
+        JS 代码中该格式的循环条件在读完第一根 K 线后不再更新, 只有头部之后没有数据时才会正常返回,
+        其余情况 JS 代码会抛出异常或者死循环, 这里统一视为数据错误
+        """
+        if self.style >= 1:
+            return []
+        self.w([6, 18, 3, 3], [0, 1])
+        if self.w([6]):
+            raise ValueError("新浪财经数据解码失败: 不支持的日线数据格式")
+        return []
+
+    def decode_r(self):
+        """
+        交易日历
+        """
+        r = self.r
+        if self.style > 1:
+            return []
+        r["l"] = 0
+        remain = -1
+        r["d"] = self.w1(18) - 1
+        last = self.w1(18)
+        dates = None
+        while r["d"] < last:
+            day = self.s(1)
+            if 0 >= remain:
+                if self.y():
+                    r["l"] += self.n()
+                remain = self.w1(3 * r["l"]) + 1
+                if dates is None:
+                    dates = [day]
+                    remain -= 1
+            else:
+                dates.append(day)
+            remain -= 1
+        return dates
+
+    def decode_a(self):
+        """
+        多列整数序列
+        """
+        r = self.r
+        if self.style >= 1:
+            return []
+        r["f"] = self.w1(6)
+        r["c"] = self.w1(6)
+        if not _js_truthy(r["f"]):
+            raise ValueError("新浪财经数据解码失败: 数据列数为 0")
+        rows = []
+        r["dv"] = [0.0] * r["f"]
+        r["dl"] = [0] * r["f"]
+        t = 0
+        while not (
+            self.pos >= self.total
+            or (
+                self.pos // 6 == self.total // 6 - 1 and not 7 & (_js_int32(r["c"]) ^ t)
+            )
+        ):
+            row = []
+            for i in range(r["f"]):
+                if self.y():
+                    r["dl"][i] += self.n()
+                r["dv"][i] += self.w1(3 * r["dl"][i], 1)
+                row.append(r["dv"][i])
+            rows.append(row)
+            t += 1
+        return rows
+
+    def decode_o(self):
+        """
+        日线数据, 新浪历史行情和交易日历使用的格式
+        """
+        r = self.r = {
+            "b_avp": 1,
+            "b_ph": 0,
+            "b_phx": 0,
+            "b_sep": 0,
+            "p_p": 6,
+            "p_v": 0,
+            "p_a": 0,
+            "p_e": 0,
+            "p_t": 0,
+            "l_o": 3,
+            "l_h": 3,
+            "l_l": 3,
+            "l_c": 3,
+            "l_v": 5,
+            "l_a": 5,
+            "l_e": 3,
+            "l_t": 0,
+            "u_p": 0.0,
+            "u_v": 0.0,
+            "u_a": 0.0,
+            "wd": 62,
+            "d": 0,
+        }
+        for key in ("u_o", "u_h", "u_l", "u_c", "u_e", "u_t"):
+            r[key] = _NAN
+        if self.style > 0:
+            return []
+        self.chunked = True
+        y = self.y
+        n = self.n
+        chunks = []
+        rows = []
+        last_amount = 0
+        while True:
+            if self.pos >= self.total:
+                return None
+            if (
+                self.pos >= self.batch_end
+                and not r["b_sep"]
+                and r["b_avp"]
+                and not r["b_ph"]
+            ):
+                chunk = self._plain_rows_o()
+                if chunk is not None:
+                    if rows:
+                        chunks.append(rows)
+                        rows = []
+                    chunks.append(chunk)
+                    last_amount = chunk["amount"][-1]
+                    continue
+            a = {"d": 1, "c": 0}
+            if y():
+                if y():
+                    if y():
+                        a["c"] += 1
+                        a["a"] = r["b_avp"]
+                        if y():
+                            r["b_avp"] ^= y()
+                            r["b_ph"] ^= y()
+                            r["b_phx"] ^= y()
+                            a["s"] = r["b_sep"]
+                            r["b_sep"] ^= y()
+                            if y():
+                                r["wd"] = self.w1(7)
+                            if a["s"] ^ r["b_sep"]:
+                                if a["s"]:
+                                    r["u_p"] = r["u_c"]
+                                else:
+                                    r["u_o"] = r["u_h"] = r["u_l"] = r["u_c"] = r["u_p"]
+                        for u in range(3 + 2 * r["b_ph"]):
+                            if y():
+                                key = "pvaet"[u]
+                                old = r["p_" + key]
+                                r["p_" + key] += n()
+                                r["u_" + key] = _p(r["u_" + key], old, r["p_" + key])
+                                if r["b_sep"] and not u:
+                                    for price_key in "ohlc":
+                                        r["u_" + price_key] = _p(
+                                            r["u_" + price_key], old, r["p_p"]
+                                        )
+                        if not r["b_avp"] and a["a"]:
+                            r["u_a"] = _p(
+                                last_amount if _js_truthy(last_amount) else 0,
+                                0,
+                                r["p_a"],
+                            )
+                    if y():
+                        a["c"] += 1
+                        for u in range(7 + r["b_ph"] + r["b_phx"]):
+                            if y():
+                                if u == 6:
+                                    a["d"] = self.x()
+                                else:
+                                    r["l_" + "ohlcva*et"[u]] += n()
+                    if y():
+                        a["c"] += 1
+                        size = r["l_o"] + (n() if y() else 0)
+                        value = self.w1(3 * size, 1)
+                        if r["b_sep"]:
+                            a["p"] = r["u_c"] + value
+                        else:
+                            r["u_p"] += value
+                            a["p"] = r["u_p"]
+                    if not a["c"]:
+                        break
+                elif y():
+                    if y():
+                        if y():
+                            a["d"] = self.x()
+                        else:
+                            r["l_v"] += n()
+                    elif r["b_ph"] and y():
+                        r["l_" + "et"[1 if r["b_phx"] and y() else 0]] += n()
+                    else:
+                        r["l_a"] += n()
+                else:
+                    index = self.w1(2)
+                    if index == index:
+                        r["l_" + "ohlc"[index]] += n()
+                    else:
+                        n()
+            for u in range(6 + r["b_ph"] + r["b_phx"]):
+                key = "ohlcvaet"[u]
+                sign = ((191 if r["b_sep"] else 185) >> u) & 1
+                a["v_" + key] = self.w1(3 * r["l_" + key], sign)
+            row = {"date": self.k(a["d"])}
+            if _js_truthy(a.get("p")):
+                row["prevclose"] = _p(a["p"], r["p_p"])
+            if r["b_sep"]:
+                r["u_o"] += a["v_o"]
+                row["open"] = _p(r["u_o"], r["p_p"])
+                r["u_h"] += a["v_h"]
+                row["high"] = _p(r["u_h"], r["p_p"])
+                r["u_l"] += a["v_l"]
+                row["low"] = _p(r["u_l"], r["p_p"])
+                r["u_c"] += a["v_c"]
+                row["close"] = _p(r["u_c"], r["p_p"])
+            else:
+                a["o"] = r["u_p"] + a["v_o"]
+                row["open"] = _p(a["o"], r["p_p"])
+                row["high"] = _p(a["o"] + a["v_h"], r["p_p"])
+                row["low"] = _p(a["o"] - a["v_l"], r["p_p"])
+                r["u_p"] = a["o"] + a["v_c"]
+                row["close"] = _p(r["u_p"], r["p_p"])
+            r["u_v"] += a["v_v"]
+            row["volume"] = _p(r["u_v"], r["p_v"])
+            if r["b_avp"]:
+                price_scale = _t(r["p_p"])
+                volume_scale = _t(r["p_v"])
+                if r["b_sep"]:
+                    average = (r["u_o"] + r["u_h"] + r["u_l"] + r["u_c"]) / 4
+                else:
+                    average = a["o"] + (a["v_h"] - a["v_l"] + a["v_c"]) / 4
+                row["amount"] = _p(
+                    _p(
+                        _js_floor(average * r["u_v"] + 0.5),
+                        (
+                            price_scale[0] + volume_scale[0],
+                            price_scale[1] + volume_scale[1],
+                        ),
+                        r["p_a"],
+                    )
+                    + a["v_a"],
+                    r["p_a"],
+                )
+            else:
+                r["u_a"] += a["v_a"]
+                row["amount"] = _p(r["u_a"], r["p_a"])
+            if r["b_ph"]:
+                row["postVol"] = _p(a["v_e"], r["p_e"])
+                row["postAmt"] = _p(
+                    _js_floor(
+                        row["postVol"] * row["close"]
+                        + (_p(a["v_t"], r["p_t"]) if r["b_phx"] else 0)
+                        + 0.5
+                    ),
+                    0,
+                )
+            rows.append(row)
+            last_amount = row["amount"]
+        if rows or not chunks:
+            chunks.append(rows)
+        return chunks
+
+    def _plain_rows_o(self) -> Optional[Dict[str, np.ndarray]]:
+        """
+        按列解码连续的普通 K 线
+        不含控制位的 K 线首位为 0, 各字段位宽只由控制位改变, 因此一段连续的普通 K 线可以整体读取;
+        所有中间结果都是安全整数时, numpy 的运算与 JS 的 double 运算结果完全一致, 否则返回 None 逐行解码
+        """
+        r = self.r
+        widths = [3 * r["l_" + key] for key in "ohlcva"]
+        if not all(0 <= width <= 30 for width in widths):
+            return None
+        row_width = 1 + sum(widths)
+        count = (self.total - self.pos) // row_width
+        if count < _MIN_BATCH_ROWS:
+            return None
+        starts = self.pos + row_width * np.arange(count)
+        flags = self.bits[starts]
+        if flags.any():
+            count = int(flags.argmax())
+            if count < _MIN_BATCH_ROWS:
+                return None
+            starts = starts[:count]
+        # 无法按列解码时, 这一段 K 线全部逐行解码, 避免每一行都重新检查
+        self.batch_end = int(starts[-1]) + row_width
+        fields = []
+        offset = 1
+        for width, signed in zip(widths, (1, 0, 0, 1, 1, 1)):
+            values = np.zeros(count, dtype=np.int64)
+            for bit in range(width):
+                values |= self.bits[starts + (offset + bit)].astype(np.int64) << bit
+            if signed and width:
+                values[values >= 1 << (width - 1)] -= 1 << width
+            fields.append(values)
+            offset += width
+        v_o, v_h, v_l, v_c, v_v, v_a = fields
+        if not (_is_safe_integer(r["u_p"]) and _is_safe_integer(r["u_v"])):
+            return None
+        close = int(r["u_p"]) + np.cumsum(v_o + v_c)
+        open_ = close - v_c
+        high = open_ + v_h
+        low = open_ - v_l
+        volume = int(r["u_v"]) + np.cumsum(v_v)
+        for values in (close, open_, high, low, volume):
+            if np.abs(values).max() >= _MAX_SAFE_INTEGER:
+                return None
+        price_scale = _t(r["p_p"])
+        volume_scale = _t(r["p_v"])
+        average = open_ + (v_h - v_l + v_c) / 4
+        inner = _p_round_array(
+            np.floor(average * volume.astype(float) + 0.5),
+            (price_scale[0] + volume_scale[0], price_scale[1] + volume_scale[1]),
+            r["p_a"],
+        )
+        if inner is None:
+            return None
+        columns = {
+            "open": _p_array(open_, r["p_p"]),
+            "high": _p_array(high, r["p_p"]),
+            "low": _p_array(low, r["p_p"]),
+            "close": _p_array(close, r["p_p"]),
+            "volume": _p_array(volume, r["p_v"]),
+            "amount": _p_array(inner + v_a, r["p_a"]),
+        }
+        if any(values is None for values in columns.values()):
+            return None
+        d = r["d"]
+        if not isinstance(d, int):
+            return None
+        mask = _js_int32(r["wd"]) if _js_truthy(r.get("wd")) else 62
+        valid = np.array(
+            [bool(mask & (1 << (residue + 10) % 7)) for residue in range(7)]
+        )
+        candidates = np.arange(d + 1, d + 8 + 7 * count)
+        days = candidates[valid[candidates % 7]][:count]
+        r["d"] = int(days[-1])
+        r["u_p"] = float(close[-1])
+        r["u_v"] = float(volume[-1])
+        self.pos = int(starts[-1]) + row_width
+        return {"date": days + _DAY_OFFSET, **columns}
+
+
+def _chunks_to_columns(chunks: list, date_parser) -> Dict[str, np.ndarray]:
+    """
+    合并分段的解码结果, 每段为 list of dict 或者按列存放的数据, 列的顺序与 pandas.DataFrame(rows) 一致
+    :param chunks: 分段的解码结果
+    :type chunks: list
+    :param date_parser: 日期列的转换函数
+    :type date_parser: callable
+    :return: 按列存放的数据
+    :rtype: dict
+    """
+    keys = {}
+    for chunk in chunks:
+        for row in [chunk] if isinstance(chunk, dict) else chunk:
+            for key in row:
+                keys.setdefault(key, None)
+    columns = {}
+    for key in keys:
+        parts = []
+        for chunk in chunks:
+            if isinstance(chunk, dict):
+                values = chunk.get(key)
+                if values is None:
+                    values = np.full(len(chunk["date"]), np.nan)
+                parts.append(date_parser(values) if key == "date" else values)
+            else:
+                values = [row.get(key) for row in chunk]
+                parts.append(
+                    date_parser(values)
+                    if key == "date"
+                    else np.array(
+                        [np.nan if value is None else value for value in values],
+                        dtype=float,
+                    )
+                )
+        columns[key] = np.concatenate(parts)
+    return columns
+
+
+def _rows_to_columns(rows, date_parser) -> Optional[Dict[str, np.ndarray]]:
+    """
+    将 JS 代码形式的解码结果转换为按列存放的数组
+    :param rows: list of dict(行情), list of list(多列整数序列) 或者日期列表(交易日历)
+    :type rows: list
+    :param date_parser: 日期列的转换函数
+    :type date_parser: callable
+    :return: 按列存放的数据
+    :rtype: dict
+    """
+    if rows is None:
+        return None
+    if not rows or isinstance(rows[0], dict):
+        return _chunks_to_columns([rows], date_parser)
+    if isinstance(rows[0], list):
+        width = max(len(row) for row in rows)
+        matrix = np.array(
+            [
+                [np.nan if value is None else value for value in row]
+                + [np.nan] * (width - len(row))
+                for row in rows
+            ],
+            dtype=float,
+        )
+        return {index: matrix[:, index] for index in range(width)}
+    return {"date": date_parser(rows)}
+
+
+def _days_to_datetime64(values) -> np.ndarray:
+    days = np.array([np.nan if x is None else x for x in values], dtype=float)
+    result = np.full(days.shape, np.datetime64("NaT"), dtype="datetime64[D]")
+    mask = ~np.isnan(days)
+    result[mask] = days[mask].astype(np.int64).astype("datetime64[D]")
+    return result
+
+
+def _iso_to_datetime64(values: list) -> np.ndarray:
+    return np.array(
+        [np.datetime64("NaT") if day is None else day[:10] for day in values],
+        dtype="datetime64[D]",
+    )
+
+
+def decode_sina_python(payload: str) -> Optional[Dict[str, np.ndarray]]:
+    """
+    新浪财经压缩数据解码-Python 实现
+    :param payload: 压缩数据, 即 JS 代码中 d 函数的参数
+    :type payload: str
+    :return: 按列存放的数据, 日期列为 datetime64[D]
+    :rtype: dict
+    """
+    decoder = _SinaDecoder(payload)
+    rows = decoder.decode()
+    if decoder.chunked and rows is not None:
+        return _chunks_to_columns(rows, date_parser=_days_to_datetime64)
+    return _rows_to_columns(rows, date_parser=_days_to_datetime64)
+
+
+def decode_sina_js(payload: str) -> Optional[Dict[str, np.ndarray]]:
+    """
+    新浪财经压缩数据解码-执行原始的 JS 代码
+    :param payload: 压缩数据, 即 JS 代码中 d 函数的参数
+    :type payload: str
+    :return: 按列存放的数据, 日期列为 datetime64[D]
+    :rtype: dict
+    """
+    rows = get_js_pool(hk_js_decode).call("d", payload)
+    return _rows_to_columns(rows, date_parser=_iso_to_datetime64)
+
+
+@trace.traced("sina_decode")
+def decode_sina(payload: str, engine: str = None) -> Optional[Dict[str, np.ndarray]]:
+    """
+    新浪财经压缩数据解码
+    :param payload: 压缩数据, 即 JS 代码中 d 函数的参数
+    :type payload: str
+    :param engine: choice of {"python", "js"}, 默认使用 set_decode_engine 设置的方式
+    :type engine: str
+    :return: 按列存放的数据, 可以直接传给 pandas.DataFrame
+    :rtype: dict
+    """
+    if (engine or DECODE_ENGINE) == "js":
+        return decode_sina_js(payload)
+    return decode_sina_python(payload)
@@ -0,0 +1,346 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 新浪财经-实时行情订阅
+https://hq.sinajs.cn/list=nf_V2309,sh600000,sz000001,hk00700,gb_aapl
+多个代码按 URL 长度分批请求, 通过共享连接池会话按固定间隔轮询;
+返回的字段写入预先分配的缓冲区, 每次轮询只输出发生变化的代码
+"""
+
+import asyncio
+import random
+import re
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from akshare.utils import trace
+from akshare.utils.rate_limit import get_circuit_breaker
+from akshare.utils.request import request_get
+
+HQ_URL = "https://hq.sinajs.cn/"
+
+HQ_HEADERS = {
+    "Accept": "*/*",
+    "Accept-Encoding": "gzip, deflate",
+    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+    "Cache-Control": "no-cache",
+    "Pragma": "no-cache",
+    "Referer": "https://finance.sina.com.cn/",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/97.0.4692.71 Safari/537.36",
+}
+
+# 服务端对过长的 URL 直接返回错误, 单个请求的 URL 保持在此长度以内
+MAX_URL_LENGTH = 2000
+
+# 后台轮询失败且没有 on_error 时, 两次警告之间的最短间隔(秒)
+ERROR_WARN_INTERVAL = 60
+
+_HQ_LINE_PATTERN = re.compile(r'var hq_str_([^=\s]+)="([^"]*)"')
+
+
+def random_rn() -> str:
+    """
+    生成请求参数 rn, 与页面中的 Math.round(Math.random() * 2147483648).toString(16) 一致
+    :return: 十六进制随机数
+    :rtype: str
+    """
+    return format(random.randrange(2147483648), "x")
+
+
+def batch_symbols(
+    symbols: Iterable[str], max_url_length: int = MAX_URL_LENGTH
+) -> List[List[str]]:
+    """
+    按 URL 长度将代码分批
+    :param symbols: 带市场前缀的代码, 如 nf_V2309, sh600000, hk00700, gb_aapl
+    :type symbols: iterable
+    :param max_url_length: 单个请求 URL 的最大长度
+    :type max_url_length: int
+    :return: 分批后的代码
+    :rtype: list
+    """
+    base_length = len(f"{HQ_URL}rn=7fffffff&list=")
+    batches = []
+    batch = []
+    length = base_length
+    for symbol in symbols:
+        extra = len(symbol) + (1 if batch else 0)
+        if batch and length + extra > max_url_length:
+            batches.append(batch)
+            batch = []
+            length = base_length
+            extra = len(symbol)
+        batch.append(symbol)
+        length += extra
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+@trace.traced("sina_hq")
+def parse_hq_text(text: str) -> Dict[str, List[str]]:
+    """
+    解析 hq.sinajs.cn 返回的文本
+    :param text: 形如 var hq_str_sh600000="浦发银行,10.000,...";
+    :type text: str
+    :return: {代码: 字段列表}, 无数据的代码对应空列表
+    :rtype: dict
+    """
+    return {
+        symbol: value.split(",") if value else []
+        for symbol, value in _HQ_LINE_PATTERN.findall(text)
+    }
+
+
+def _fetch_batch(batch: List[str], timeout: Optional[float]) -> Dict[str, List[str]]:
+    """
+    获取一批代码的行情
+    :param batch: 代码
+    :type batch: list
+    :param timeout: 请求超时时间
+    :type timeout: float
+    :return: {代码: 字段列表}
+    :rtype: dict
+    """
+    url = f"{HQ_URL}rn={random_rn()}&list={','.join(batch)}"
+    r = request_get(url, headers=HQ_HEADERS, timeout=timeout)
+    r.encoding = "gbk"
+    return parse_hq_text(r.text)
+
+
+def fetch_hq(
+    symbols: Iterable[str],
+    max_url_length: int = MAX_URL_LENGTH,
+    timeout: Optional[float] = 10,
+    max_workers: int = 4,
+) -> Dict[str, List[str]]:
+    """
+    新浪财经-获取多个代码的实时行情原始字段
+    :param symbols: 带市场前缀的代码
+    :type symbols: iterable
+    :param max_url_length: 单个请求 URL 的最大长度
+    :type max_url_length: int
+    :param timeout: 请求超时时间
+    :type timeout: float
+    :param max_workers: 并发请求的线程数, 为 1 时顺序请求
+    :type max_workers: int
+    :return: {代码: 字段列表}, 按请求的代码顺序
+    :rtype: dict
+    """
+    batches = batch_symbols(symbols, max_url_length=max_url_length)
+    if len(batches) <= 1 or max_workers <= 1:
+        results = [_fetch_batch(batch, timeout) for batch in batches]
+    else:
+        fetch_batch = trace.bind(_fetch_batch)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(lambda batch: fetch_batch(batch, timeout), batches)
+            )
+    quotes = {}
+    for result in results:
+        quotes.update(result)
+    return quotes
+
+
+class SinaHqSubscription:
+    """
+    新浪财经-实时行情订阅
+    每次轮询按 URL 长度分批请求全部代码, 将字段写入预先分配的 (代码数, 字段数) 缓冲区,
+    只输出字段发生变化的代码; 输出的数据框以代码为索引, 列为字段位置 0, 1, 2, ..., 字段含义与各市场的接口一致
+    可以通过 callback 在后台线程中接收变化, 也可以使用 async for 迭代;
+    后台轮询失败时调用 on_error, 未设置时按 ERROR_WARN_INTERVAL 限频发出警告, 熔断期间暂停轮询
+    """
+
+    def __init__(
+        self,
+        symbols: Iterable[str],
+        interval: float = 3.0,
+        callback: Optional[Callable[[pd.DataFrame], None]] = None,
+        max_url_length: int = MAX_URL_LENGTH,
+        timeout: Optional[float] = 10,
+        max_workers: int = 4,
+        width: int = 48,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ):
+        """
+        :param symbols: 带市场前缀的代码, 如 nf_V2309, sh600000, sz000001, hk00700, gb_aapl
+        :type symbols: iterable
+        :param interval: 轮询间隔（秒）
+        :type interval: float
+        :param callback: 有变化时调用, 参数为发生变化的行
+        :type callback: callable
+        :param max_url_length: 单个请求 URL 的最大长度
+        :type max_url_length: int
+        :param timeout: 请求超时时间
+        :type timeout: float
+        :param max_workers: 并发请求的线程数
+        :type max_workers: int
+        :param width: 缓冲区预留的字段数, 不足时自动扩展
+        :type width: int
+        :param on_error: 后台轮询失败时调用, 参数为异常
+        :type on_error: callable
+        """
+        self.symbols = list(dict.fromkeys(symbols))
+        self.interval = interval
+        self.callback = callback
+        self.on_error = on_error
+        self.error_count = 0
+        self.last_error = None
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.max_url_length = max_url_length
+        self._index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self._buffer = np.full((len(self.symbols), width), "", dtype=object)
+        self._widths = np.zeros(len(self.symbols), dtype=np.int64)
+        self._received = np.zeros(len(self.symbols), dtype=bool)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._warned_at = None
+
+    def _frame(self, rows: np.ndarray) -> pd.DataFrame:
+        width = int(self._widths[rows].max()) if len(rows) else 0
+        return pd.DataFrame(
+            self._buffer[rows, :width],
+            index=pd.Index([self.symbols[row] for row in rows], name="symbol"),
+        )
+
+    def update(self, quotes: Dict[str, List[str]]) -> pd.DataFrame:
+        """
+        将一次轮询的结果写入缓冲区
+        :param quotes: {代码: 字段列表}
+        :type quotes: dict
+        :return: 发生变化的行
+        :rtype: pandas.DataFrame
+        """
+        changed = []
+        with self._lock:
+            for symbol, fields in quotes.items():
+                row = self._index.get(symbol)
+                if row is None:
+                    continue
+                size = len(fields)
+                if (
+                    self._received[row]
+                    and self._widths[row] == size
+                    and self._buffer[row, :size].tolist() == fields
+                ):
+                    continue
+                if size > self._buffer.shape[1]:
+                    self._buffer = np.pad(
+                        self._buffer,
+                        ((0, 0), (0, size - self._buffer.shape[1])),
+                        constant_values="",
+                    )
+                self._buffer[row, :size] = fields
+                self._buffer[row, size:] = ""
+                self._widths[row] = size
+                self._received[row] = True
+                changed.append(row)
+            return self._frame(np.array(changed, dtype=np.int64))
+
+    def poll(self) -> pd.DataFrame:
+        """
+        轮询一次全部代码
+        :return: 发生变化的行
+        :rtype: pandas.DataFrame
+        """
+        quotes = fetch_hq(
+            self.symbols,
+            max_url_length=self.max_url_length,
+            timeout=self.timeout,
+            max_workers=self.max_workers,
+        )
+        return self.update(quotes)
+
+    def snapshot(self) -> pd.DataFrame:
+        """
+        当前缓冲区中全部已收到数据的代码
+        :return: 最新行情
+        :rtype: pandas.DataFrame
+        """
+        with self._lock:
+            return self._frame(np.flatnonzero(self._received))
+
+    def _handle_error(self, exc: Exception) -> float:
+        """
+        处理一次后台轮询失败
+        :param exc: 轮询抛出的异常
+        :type exc: Exception
+        :return: 下一次轮询前等待的秒数, 熔断期间等到允许探测为止
+        :rtype: float
+        """
+        self.error_count += 1
+        self.last_error = exc
+        if self.on_error is not None:
+            self.on_error(exc)
+        else:
+            now = time.monotonic()
+            if self._warned_at is None or now - self._warned_at >= ERROR_WARN_INTERVAL:
+                self._warned_at = now
+                warnings.warn(
+                    f"新浪行情轮询失败(累计 {self.error_count} 次): {exc!r}",
+                    RuntimeWarning,
+                )
+        return max(self.interval, get_circuit_breaker(HQ_URL).retry_after())
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            delay = self.interval
+            try:
+                changed = self.poll()
+            except Exception as exc:
+                changed = None
+                delay = self._handle_error(exc)
+            if changed is not None and not changed.empty and self.callback:
+                self.callback(changed)
+            self._stop.wait(delay)
+
+    def start(self) -> "SinaHqSubscription":
+        """
+        启动后台轮询线程, 有变化时调用 callback
+        :return: 订阅对象
+        :rtype: SinaHqSubscription
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        停止后台轮询线程
+        :return: None
+        :rtype: None
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "SinaHqSubscription":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    async def __aiter__(self) -> AsyncIterator[pd.DataFrame]:
+        loop = asyncio.get_running_loop()
+        while True:
+            changed = await loop.run_in_executor(None, self.poll)
+            if not changed.empty:
+                yield changed
+            await asyncio.sleep(self.interval)
+
+
+if __name__ == "__main__":
+    subscription = SinaHqSubscription(["nf_V0", "sh600000", "hk00700", "gb_aapl"])
+    print(subscription.poll())
@@ -0,0 +1,310 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 本地列式存储工具函数
+Parquet 读写依赖 pyarrow, 需要单独安装: pip install pyarrow
+"""
+
+import json
+import os
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Optional, Tuple, Union
+
+import pandas as pd
+
+DEFAULT_STORE_DIR = os.path.join(os.path.expanduser("~"), ".akshare", "store")
+
+
+def check_parquet_engine() -> None:
+    """
+    检查是否安装了 Parquet 读写引擎
+    :return: None
+    :rtype: None
+    :raises ImportError: 未安装 pyarrow
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "本地列式存储需要 pyarrow, 请执行 pip install pyarrow 安装"
+        ) from e
+
+
+def read_parquet(path: str) -> Optional[pd.DataFrame]:
+    """
+    读取 Parquet 文件, 文件不存在时返回 None
+    :param path: 文件路径
+    :type path: str
+    :return: 数据
+    :rtype: pandas.DataFrame
+    """
+    check_parquet_engine()
+    if not os.path.exists(path):
+        return None
+    return pd.read_parquet(path)
+
+
+def write_parquet(df: pd.DataFrame, path: str) -> None:
+    """
+    写入 Parquet 文件, 先写临时文件再替换, 中途失败不会损坏已有文件
+    :param df: 数据
+    :type df: pandas.DataFrame
+    :param path: 文件路径
+    :type path: str
+    :return: None
+    :rtype: None
+    """
+    check_parquet_engine()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    df.to_parquet(temp_path, index=False)
+    os.replace(temp_path, path)
+
+
+def parquet_num_rows(directory: str) -> int:
+    """
+    目录下 Parquet 分片的总行数, 只读取文件尾部的元数据; 目录不存在时返回 0,
+    没有正常关闭(缺少文件尾)的分片不计入
+    :param directory: 分片所在目录
+    :type directory: str
+    :return: 总行数
+    :rtype: int
+    """
+    check_parquet_engine()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if not os.path.isdir(directory):
+        return 0
+    num_rows = 0
+    for name in os.listdir(directory):
+        if name.startswith("part-") and name.endswith(".parquet"):
+            try:
+                num_rows += pq.read_metadata(os.path.join(directory, name)).num_rows
+            except pa.ArrowInvalid:
+                continue
+    return num_rows
+
+
+def read_parquet_parts(directory: str, columns: list = None) -> pd.DataFrame:
+    """
+    按文件名顺序读取目录下的 Parquet 分片; 没有正常关闭(缺少文件尾)的分片跳过
+    :param directory: 分片所在目录
+    :type directory: str
+    :param columns: 读取的列, 为 None 时读取全部列
+    :type columns: list
+    :return: 合并后的数据, 目录不存在或没有分片时为空
+    :rtype: pandas.DataFrame
+    """
+    check_parquet_engine()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if not os.path.isdir(directory):
+        return pd.DataFrame(columns=columns)
+    tables = []
+    for name in sorted(os.listdir(directory)):
+        if name.startswith("part-") and name.endswith(".parquet"):
+            try:
+                tables.append(
+                    pq.read_table(os.path.join(directory, name), columns=columns)
+                )
+            except pa.ArrowInvalid:
+                continue
+    if not tables:
+        return pd.DataFrame(columns=columns)
+    return pa.concat_tables(tables).to_pandas()
+
+
+class ParquetAppender:
+    """
+    只追加写入的 Parquet 分片
+    每个对象在目录下新建一个分片文件 part-00000.parquet, part-00001.parquet, ..., 不改写已有文件;
+    每次 write 写入一个行组, 关闭后文件可读, 用 pandas.read_parquet(目录) 读取全部分片
+    """
+
+    def __init__(self, directory: str):
+        """
+        :param directory: 分片所在目录
+        :type directory: str
+        """
+        check_parquet_engine()
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.path = None
+        self._writer = None
+        self._lock = threading.Lock()
+
+    def _next_path(self) -> str:
+        parts = [
+            name
+            for name in os.listdir(self.directory)
+            if name.startswith("part-") and name.endswith(".parquet")
+        ]
+        return os.path.join(self.directory, f"part-{len(parts):05d}.parquet")
+
+    def write(self, df: pd.DataFrame) -> None:
+        """
+        追加写入一个行组
+        :param df: 数据, 各次写入的字段和类型需一致
+        :type df: pandas.DataFrame
+        :return: None
+        :rtype: None
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if df.empty:
+            return
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with self._lock:
+            if self._writer is None:
+                self.path = self._next_path()
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            else:
+                table = table.cast(self._writer.schema)
+            self._writer.write_table(table)
+
+    def close(self) -> None:
+        """
+        关闭当前分片
+        :return: None
+        :rtype: None
+        """
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    def __enter__(self) -> "ParquetAppender":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class Checkpoint:
+    """
+    断点续传的检查点文件
+    按分区(如交易所)记录已经完成的键(如交易日), 包括没有数据的键; 文件只追加写入, 每个键一行 JSON,
+    标记的开销与已完成的键数无关; 中断时写了一半的最后一行在下次读取时忽略
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: 检查点文件路径
+        :type path: str
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self.done = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        partition, key = json.loads(line)
+                    except ValueError:
+                        continue
+                    self.done.setdefault(partition, set()).add(key)
+
+    def is_done(self, partition: str, key: str) -> bool:
+        """
+        是否已经完成
+        :param partition: 分区
+        :type partition: str
+        :param key: 键
+        :type key: str
+        :return: 是否已经完成
+        :rtype: bool
+        """
+        return key in self.done.get(partition, ())
+
+    def mark(self, partition: str, key: str) -> None:
+        """
+        标记为已完成并追加写入文件
+        :param partition: 分区
+        :type partition: str
+        :param key: 键
+        :type key: str
+        :return: None
+        :rtype: None
+        """
+        with self._lock:
+            if self.is_done(partition, key):
+                return
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps([partition, key]) + "\n")
+            self.done.setdefault(partition, set()).add(key)
+
+
+def partition_workers(
+    max_workers: Union[int, Dict[str, int], None], default: Dict[str, int]
+) -> Dict[str, int]:
+    """
+    每个分区的并发数
+    :param max_workers: 整数或 {分区: 并发数}, 为空时使用默认值
+    :type max_workers: int or dict
+    :param default: 默认的 {分区: 并发数}
+    :type default: dict
+    :return: {分区: 并发数}
+    :rtype: dict
+    """
+    if isinstance(max_workers, dict):
+        return {**default, **{k.upper(): v for k, v in max_workers.items()}}
+    if max_workers is not None:
+        return dict.fromkeys(default, max_workers)
+    return default
+
+
+def run_partitioned(
+    func: Callable[[str, str], None],
+    tasks: Iterable[Tuple[str, str]],
+    workers: Dict[str, int],
+    checkpoint: Checkpoint,
+) -> Dict[Tuple[str, str], Exception]:
+    """
+    按分区并发执行任务, 各分区同时执行, 每个分区使用单独的线程池限制并发数;
+    检查点中已经完成的 (分区, 键) 跳过, 由 func 在完成后自行标记
+    :param func: 任务函数, 参数为分区和键
+    :type func: callable
+    :param tasks: (分区, 键) 列表
+    :type tasks: iterable
+    :param workers: {分区: 并发数}, 未指定的分区为 1
+    :type workers: dict
+    :param checkpoint: 检查点
+    :type checkpoint: Checkpoint
+    :return: 失败的 {(分区, 键): 异常}
+    :rtype: dict
+    """
+    tasks = [
+        (partition, key)
+        for partition, key in tasks
+        if not checkpoint.is_done(partition, key)
+    ]
+    executors = {
+        partition: ThreadPoolExecutor(max_workers=max(1, workers.get(partition, 1)))
+        for partition in dict.fromkeys(partition for partition, _ in tasks)
+    }
+    error_dict = {}
+    try:
+        future_to_key = {
+            executors[partition].submit(func, partition, key): (partition, key)
+            for partition, key in tasks
+        }
+        for future in as_completed(future_to_key):
+            try:
+                future.result()
+            except Exception as e:
+                error_dict[future_to_key[future]] = e
+    finally:
+        for executor in executors.values():
+            executor.shutdown(wait=True)
+    if error_dict:
+        warnings.warn(
+            f"{len(error_dict)} partitioned tasks failed: "
+            f"{', '.join(f'{partition} {key}' for partition, key in list(error_dict)[:10])}"
+        )
+    return error_dict
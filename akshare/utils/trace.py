@@ -0,0 +1,469 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 15:00
+Desc: 请求追踪与热点路径计时
+共享请求层 (akshare.utils.request, akshare.aio.request) 每发送一次请求产生一个 request 事件,
+记录主机, 状态码, 字节数, 第几次重试, 等待令牌的时间和网络时间;
+解析步骤 (JSON 解码, JS 解码, 行情解析, 表格整理) 用 span 计时, 产生 parse 事件;
+事件交给 add_hook 注册的回调 (可转发到日志或 OpenTelemetry), 没有注册回调时不做任何记录;
+TraceCollector 在进程内汇总每个接口的请求数, 流量, 网络耗时和解析耗时
+"""
+
+import contextvars
+import functools
+import sys
+import threading
+import time
+import warnings
+from contextlib import contextmanager
+from typing import Callable, Dict, List
+from urllib.parse import urlsplit
+
+import numpy as np
+import pandas as pd
+
+UNKNOWN_INTERFACE = "<unknown>"
+# 推断接口名时跳过的模块: 通用工具函数和缓存装饰器不是用户调用的接口
+_INTERNAL_MODULES = ("akshare.utils.", "akshare.aio.request", "akshare.cache")
+
+_hooks: List[Callable] = []
+_hooks_lock = threading.Lock()
+_interface = contextvars.ContextVar("akshare_trace_interface", default=None)
+_attempt = contextvars.ContextVar("akshare_trace_attempt", default=0)
+_depth = contextvars.ContextVar("akshare_trace_depth", default=0)
+
+
+class Span:
+    """
+    一次请求或一个解析步骤的计时记录
+    kind 为 request 时 attributes 包括 method, host, path, status, bytes, attempt, wait, network, error;
+    kind 为 parse 时 depth 表示嵌套层数, 外层 span 的耗时已包含内层
+    """
+
+    __slots__ = (
+        "name",
+        "kind",
+        "interface",
+        "start",
+        "duration",
+        "depth",
+        "attributes",
+        "_sent",
+    )
+
+    def __init__(self, name: str, kind: str, interface: str, depth: int = 0):
+        self.name = name
+        self.kind = kind
+        self.interface = interface
+        self.depth = depth
+        self.start = time.perf_counter()
+        self.duration = 0.0
+        self.attributes: Dict = {}
+        self._sent = None
+
+    def mark_sent(self) -> None:
+        """
+        记录拿到令牌和并发名额, 开始发送请求的时间
+        :return: None
+        :rtype: None
+        """
+        self._sent = time.perf_counter()
+
+    def set_response(self, response) -> None:
+        """
+        记录响应的状态码和字节数; 流式响应不读取内容, 字节数取 Content-Length
+        :param response: requests 或 curl_cffi 的 Response 对象
+        :type response: requests.Response
+        :return: None
+        :rtype: None
+        """
+        self.attributes["status"] = response.status_code
+        if self.attributes.get("stream"):
+            length = response.headers.get("Content-Length")
+            self.attributes["bytes"] = int(length) if length else None
+        else:
+            self.attributes["bytes"] = len(response.content or b"")
+
+    def _finish(self, error: BaseException = None) -> None:
+        end = time.perf_counter()
+        self.duration = end - self.start
+        if error is not None:
+            self.attributes["error"] = type(error).__name__
+        if self.kind == "request":
+            sent = self._sent if self._sent is not None else end
+            self.attributes["wait"] = sent - self.start
+            self.attributes["network"] = end - sent
+
+    def __repr__(self) -> str:
+        return (
+            f"Span({self.kind}:{self.name}, interface={self.interface}, "
+            f"duration={self.duration * 1000:.2f}ms, {self.attributes})"
+        )
+
+
+class _NoopSpan:
+    """
+    没有注册回调时使用的空 span
+    """
+
+    attributes: Dict = {}
+
+    def mark_sent(self) -> None:
+        pass
+
+    def set_response(self, response) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def add_hook(hook: Callable[[Span], None]) -> None:
+    """
+    注册事件回调, 每个请求或解析步骤结束时以 Span 为参数调用, 可能在任意线程中调用
+    :param hook: 回调函数
+    :type hook: callable
+    :return: None
+    :rtype: None
+    """
+    global _hooks
+    with _hooks_lock:
+        _hooks = _hooks + [hook]
+
+
+def remove_hook(hook: Callable[[Span], None]) -> None:
+    """
+    移除事件回调
+    :param hook: add_hook 注册过的回调函数
+    :type hook: callable
+    :return: None
+    :rtype: None
+    """
+    global _hooks
+    with _hooks_lock:
+        _hooks = [item for item in _hooks if item is not hook]
+
+
+def is_enabled() -> bool:
+    """
+    是否注册了事件回调
+    :return: 是否记录事件
+    :rtype: bool
+    """
+    return bool(_hooks)
+
+
+def _emit(item: Span) -> None:
+    for hook in _hooks:
+        try:
+            hook(item)
+        except Exception as e:
+            warnings.warn(f"追踪回调 {hook!r} 出错: {e!r}")
+
+
+def current_interface() -> str:
+    """
+    当前请求所属的接口名
+    优先使用 interface 设置的名称, 否则取调用栈中最外层的 akshare 接口函数 (跳过 akshare.utils 等通用模块)
+    :return: 接口名, 无法确定时为 <unknown>
+    :rtype: str
+    """
+    name = _interface.get()
+    if name is not None:
+        return name
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("akshare.") and not module.startswith(_INTERNAL_MODULES):
+            name = frame.f_code.co_name
+        frame = frame.f_back
+    return name or UNKNOWN_INTERFACE
+
+
+@contextmanager
+def interface(name: str):
+    """
+    把代码块中的请求和解析步骤都记到 name 名下, 用于给自定义任务命名
+    :param name: 接口名
+    :type name: str
+    :return: None
+    :rtype: None
+    """
+    token = _interface.set(name)
+    try:
+        yield
+    finally:
+        _interface.reset(token)
+
+
+def bind(func: Callable) -> Callable:
+    """
+    提交到线程池之前绑定当前接口名; 工作线程的调用栈中没有接口函数, 需要由提交方传入
+    :param func: 在工作线程中执行的函数
+    :type func: callable
+    :return: 执行时带有当前接口名的函数, 没有注册回调时原样返回
+    :rtype: callable
+    """
+    if not _hooks:
+        return func
+    name = current_interface()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with interface(name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+@contextmanager
+def attempt(number: int):
+    """
+    标记代码块中的请求是第几次重试, 0 表示首次请求
+    :param number: 重试次数
+    :type number: int
+    :return: None
+    :rtype: None
+    """
+    token = _attempt.set(number)
+    try:
+        yield
+    finally:
+        _attempt.reset(token)
+
+
+@contextmanager
+def request_span(method: str, url: str, stream: bool = False):
+    """
+    记录一次 HTTP 请求, 由共享请求层调用
+    :param method: 请求方法
+    :type method: str
+    :param url: 请求 URL
+    :type url: str
+    :param stream: 是否为流式请求
+    :type stream: bool
+    :return: Span, 没有注册回调时为不做记录的空 span
+    :rtype: Span
+    """
+    if not _hooks:
+        yield _NOOP_SPAN
+        return
+    parts = urlsplit(url)
+    item = Span(method.upper(), "request", current_interface())
+    item.attributes.update(
+        method=method.upper(),
+        host=parts.hostname or url,
+        path=parts.path,
+        attempt=_attempt.get(),
+        stream=bool(stream),
+    )
+    try:
+        yield item
+    except BaseException as e:
+        item._finish(e)
+        _emit(item)
+        raise
+    item._finish()
+    _emit(item)
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """
+    记录一个解析步骤的耗时
+    :param name: 步骤名称, 如 json, em_parse, sina_decode
+    :type name: str
+    :param attributes: 附加信息
+    :type attributes: dict
+    :return: Span, 没有注册回调时为不做记录的空 span
+    :rtype: Span
+    """
+    if not _hooks:
+        yield _NOOP_SPAN
+        return
+    depth = _depth.get()
+    item = Span(name, "parse", current_interface(), depth=depth)
+    item.attributes.update(attributes)
+    token = _depth.set(depth + 1)
+    try:
+        yield item
+    except BaseException as e:
+        item._finish(e)
+        _emit(item)
+        raise
+    finally:
+        _depth.reset(token)
+    item._finish()
+    _emit(item)
+
+
+def traced(name: str) -> Callable:
+    """
+    装饰器, 用 span 记录函数的耗时
+    :param name: 步骤名称
+    :type name: str
+    :return: 装饰器
+    :rtype: callable
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _hooks:
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class TraceCollector:
+    """
+    进程内的事件汇总器, 作为上下文管理器使用时自动注册和移除回调
+    with TraceCollector() as collector:
+        ak.stock_zh_a_spot_em()
+    collector.print_summary()
+    """
+
+    def __init__(self):
+        self.spans: List[Span] = []
+        self.wall = None
+        self._lock = threading.Lock()
+        self._started = None
+
+    def __call__(self, item: Span) -> None:
+        with self._lock:
+            self.spans.append(item)
+
+    def __enter__(self) -> "TraceCollector":
+        self._started = time.perf_counter()
+        add_hook(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        remove_hook(self)
+        self.wall = time.perf_counter() - self._started
+        return False
+
+    def summary(self) -> pd.DataFrame:
+        """
+        按接口汇总
+        parse_s 只计最外层的解析步骤; wall_s 为该接口第一个事件开始到最后一个事件结束的时间
+        :return: 每个接口的请求数, 错误数, 重试数, 流量, 等待令牌和网络耗时, 解析耗时, 吞吐量
+        :rtype: pandas.DataFrame
+        """
+        columns = [
+            "interface",
+            "requests",
+            "errors",
+            "retries",
+            "kbytes",
+            "wait_s",
+            "network_s",
+            "network_mean_ms",
+            "network_p95_ms",
+            "network_max_ms",
+            "parse_s",
+            "wall_s",
+            "req_per_s",
+            "kb_per_s",
+        ]
+        with self._lock:
+            spans = list(self.spans)
+        groups: Dict[str, List[Span]] = {}
+        for item in spans:
+            groups.setdefault(item.interface, []).append(item)
+        rows = []
+        for name, items in groups.items():
+            requests = [item for item in items if item.kind == "request"]
+            network = np.array([item.attributes["network"] for item in requests])
+            kbytes = sum(item.attributes.get("bytes") or 0 for item in requests) / 1024
+            wall = max(item.start + item.duration for item in items) - min(
+                item.start for item in items
+            )
+            rows.append(
+                {
+                    "interface": name,
+                    "requests": len(requests),
+                    "errors": sum(
+                        "error" in item.attributes
+                        or (item.attributes.get("status") or 0) >= 400
+                        for item in requests
+                    ),
+                    "retries": sum(item.attributes["attempt"] > 0 for item in requests),
+                    "kbytes": kbytes,
+                    "wait_s": sum(item.attributes["wait"] for item in requests),
+                    "network_s": network.sum(),
+                    "network_mean_ms": network.mean() * 1000
+                    if len(network)
+                    else np.nan,
+                    "network_p95_ms": (
+                        np.percentile(network, 95) * 1000 if len(network) else np.nan
+                    ),
+                    "network_max_ms": network.max() * 1000 if len(network) else np.nan,
+                    "parse_s": sum(
+                        item.duration
+                        for item in items
+                        if item.kind == "parse" and item.depth == 0
+                    ),
+                    "wall_s": wall,
+                    "req_per_s": len(requests) / wall if wall > 0 else np.nan,
+                    "kb_per_s": kbytes / wall if wall > 0 else np.nan,
+                }
+            )
+        temp_df = pd.DataFrame(rows, columns=columns)
+        temp_df.sort_values(
+            by="wall_s", ascending=False, inplace=True, ignore_index=True
+        )
+        return temp_df
+
+    def stage_summary(self) -> pd.DataFrame:
+        """
+        按接口和步骤汇总耗时, 步骤包括 request 和各个解析步骤
+        :return: 每个接口每个步骤的次数, 合计, 平均和最长耗时
+        :rtype: pandas.DataFrame
+        """
+        with self._lock:
+            spans = list(self.spans)
+        temp_df = pd.DataFrame(
+            {
+                "interface": [item.interface for item in spans],
+                "stage": [
+                    "request" if item.kind == "request" else item.name for item in spans
+                ],
+                "seconds": [item.duration for item in spans],
+            }
+        )
+        temp_df = (
+            temp_df.groupby(["interface", "stage"], sort=False)["seconds"]
+            .agg(count="count", total_s="sum", mean_ms="mean", max_ms="max")
+            .reset_index()
+        )
+        temp_df["mean_ms"] = temp_df["mean_ms"] * 1000
+        temp_df["max_ms"] = temp_df["max_ms"] * 1000
+        return temp_df
+
+    def print_summary(self) -> None:
+        """
+        打印按接口和按步骤的汇总
+        :return: None
+        :rtype: None
+        """
+        with pd.option_context(
+            "display.max_columns", None, "display.width", 200, "display.precision", 3
+        ):
+            if self.wall is not None:
+                print(f"总耗时 {self.wall:.3f} 秒, 共 {len(self.spans)} 个事件")
+            print(self.summary().to_string(index=False))
+            print(self.stage_summary().to_string(index=False))
+
+
+if __name__ == "__main__":
+    import akshare as ak
+
+    with TraceCollector() as trace_collector:
+        ak.stock_zh_a_spot_em()
+        ak.stock_zh_a_hist(symbol="600000")
+    trace_collector.print_summary()
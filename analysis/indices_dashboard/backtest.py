@@ -5,6 +5,14 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import os
 import datetime
+import sys
+
+try:
+    from analysis.indices_dashboard.vector_backtest import action_labels, run_signal_backtest, trade_records
+except ImportError:
+    # 如果作为脚本直接运行，尝试添加路径
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from analysis.indices_dashboard.vector_backtest import action_labels, run_signal_backtest, trade_records
 
 # 配置日志 (中文)
 logging.basicConfig(
@@ -110,73 +118,47 @@ class BacktestStrategy:
         self.history = []
         self.trades = []
         
-        for date, row in self.df.iterrows():
-            price = row['Close']
-            signal = row['Signal']
-            ma20 = row['MA20']
-            
-            action = None
-            
-            # 交易逻辑
-            if signal == 1 and self.cash > 0:
-                # 满仓买入
-                shares = int(self.cash / price) # 向下取整
-                if shares > 0:
-                    cost = shares * price
-                    self.cash -= cost
-                    self.holdings = shares
-                    self.last_buy_date = date
-                    action = 'Buy'
-                    
-                    self.trades.append({
-                        'date': date,
-                        'type': '买入',
-                        'price': price,
-                        'shares': shares,
-                        'commission': 0,
-                        'reason': '20日线拐头向上',
-                        'balance': self.cash
-                    })
-                    logger.info(f"[{date.date()}] 买入 {self.name}, 价格: {price:.2f}, 股数: {shares}, 余额: {self.cash:.2f}")
+        dates = self.df.index
+        close = self.df['Close'].to_numpy(dtype=float)
+        signal = self.df['Signal'].to_numpy()
+        res = run_signal_backtest(
+            close, signal == 1, signal == -1, dates=dates,
+            initial_capital=self.initial_capital,
+            commission_rate_short=0.015, short_term_days=7,
+        )
 
-            elif signal == -1 and self.holdings > 0:
+        # 交易明细
+        last_buy_date = self.last_buy_date
+        for trade in trade_records(dates, close, res):
+            date = trade['date']
+            if trade['type'] == '买入':
+                # 满仓买入
+                last_buy_date = date
+                trade['reason'] = '20日线拐头向上'
+                logger.info(f"[{date.date()}] 买入 {self.name}, 价格: {trade['price']:.2f}, 股数: {trade['shares']}, 余额: {trade['balance']:.2f}")
+            else:
                 # 清仓卖出
-                revenue = self.holdings * price
-                
-                # 计算手续费
-                hold_days = (date - self.last_buy_date).days
-                fee_rate = 0.015 if hold_days < 7 else 0.0
-                commission = revenue * fee_rate
-                
-                final_cash = revenue - commission
-                self.cash += final_cash
-                
-                action = 'Sell'
-                
-                self.trades.append({
-                    'date': date,
-                    'type': '卖出',
-                    'price': price,
-                    'shares': self.holdings,
-                    'commission': commission,
-                    'reason': f'20日线拐头向下 (持有{hold_days}天)',
-                    'balance': self.cash
-                })
-                logger.info(f"[{date.date()}] 卖出 {self.name}, 价格: {price:.2f}, 手续费: {commission:.2f}, 余额: {self.cash:.2f}")
-                self.holdings = 0
+                hold_days = (date - last_buy_date).days
+                trade['reason'] = f'20日线拐头向下 (持有{hold_days}天)'
+                logger.info(f"[{date.date()}] 卖出 {self.name}, 价格: {trade['price']:.2f}, 手续费: {trade['commission']:.2f}, 余额: {trade['balance']:.2f}")
+            # 字段顺序: date, type, price, shares, commission, reason, balance
+            trade['balance'] = trade.pop('balance')
+            self.trades.append(trade)
+        self.last_buy_date = last_buy_date
+        self.cash = res['cash'][-1]
+        self.holdings = int(res['holdings'][-1])
 
-            # 每日结算
-            total_assets = self.cash + (self.holdings * price)
-            self.history.append({
-                'date': date,
-                'total': total_assets,
-                'price': price,
-                'ma20': ma20,
-                'signal': signal,
-                'action': action,
-                'holdings': self.holdings,
-                'cash': self.cash
-            })
+        # 每日结算
+        self.history = pd.DataFrame({
+            'date': dates,
+            'total': res['total'],
+            'price': close,
+            'ma20': self.df['MA20'].to_numpy(),
+            'signal': signal,
+            'action': action_labels(res['action']),
+            'holdings': res['holdings'].astype(int),
+            'cash': res['cash'],
+        }).to_dict('records')
 
         final_assets = self.history[-1]['total']
         ret = (final_assets - self.initial_capital) / self.initial_capital * 100
@@ -0,0 +1,271 @@
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+import akshare as ak
+from akshare.utils.store import read_parquet, write_parquet
+
+from analysis.indices_dashboard import data, plotter, strategy
+
+logger = logging.getLogger(__name__)
+
+STAGES = ["fetch", "compute", "backtest", "render"]
+
+
+class StageTimer:
+    """
+    按阶段累计耗时, 多个线程可以同时记录
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.records = defaultdict(list)  # stage -> [(symbol, seconds)]
+
+    def add(self, stage, symbol, seconds):
+        with self._lock:
+            self.records[stage].append((symbol, seconds))
+
+    def summary(self):
+        """
+        :return: DataFrame, 每个阶段的次数, 合计, 平均, 最慢的标的
+        """
+        rows = []
+        for stage in STAGES:
+            records = self.records.get(stage, [])
+            if not records:
+                continue
+            seconds = np.array([s for _, s in records])
+            slowest = records[int(seconds.argmax())]
+            rows.append(
+                {
+                    "stage": stage,
+                    "count": len(records),
+                    "total": seconds.sum(),
+                    "mean": seconds.mean(),
+                    "max": slowest[1],
+                    "slowest": slowest[0],
+                }
+            )
+        return pd.DataFrame(rows)
+
+    def log_summary(self, wall_seconds):
+        logger.info(
+            f"流水线完成, 总耗时 {wall_seconds:.2f} 秒; 各阶段累计耗时 (并发执行, 合计可能大于总耗时):"
+        )
+        for row in self.summary().itertuples(index=False):
+            logger.info(
+                f"  {row.stage:<8} {row.count:>4} 次, 合计 {row.total:8.2f} 秒, "
+                f"平均 {row.mean:6.3f} 秒, 最慢 {row.slowest} ({row.max:.3f} 秒)"
+            )
+
+
+def history_cache_path(cache_dir, symbol):
+    return os.path.join(cache_dir, "history", f"{symbol}.parquet")
+
+
+def indicator_cache_path(
+    cache_dir, symbol, ma_window=20, ma_list=None, slope_confirmation_days=2
+):
+    ma_key = "-".join(str(w) for w in data.indicator_ma_list(ma_window, ma_list))
+    key = f"ma{ma_window}_c{slope_confirmation_days}_{ma_key}"
+    return os.path.join(cache_dir, "indicators", f"{symbol}_{key}.parquet")
+
+
+def update_history(symbol, cache_dir):
+    """
+    增量更新本地缓存的日线: 从缓存的最后一个交易日开始重新获取 (覆盖盘中未收盘的数据), 只追加新的 K 线
+    :param symbol: 指数代码
+    :param cache_dir: 缓存目录
+    :return: (history, first_new); history 以 Date 为索引, first_new 为第一个有变化的交易日, 无变化时为 None
+    """
+    path = history_cache_path(cache_dir, symbol)
+    cached = read_parquet(path)
+    if cached is None or cached.empty:
+        raw = ak.stock_zh_index_daily_em(symbol=symbol)
+        if raw is None or raw.empty:
+            return None, None
+        history = data.clean_columns(raw)
+        first_new = history.index[0]
+    else:
+        cached = cached.set_index("Date")
+        last_date = cached.index[-1]
+        raw = ak.stock_zh_index_daily_em(
+            symbol=symbol, start_date=last_date.strftime("%Y%m%d")
+        )
+        if raw is None or raw.empty:
+            return cached, None
+        new = data.clean_columns(raw)
+        overlap = cached[cached.index >= new.index[0]]
+        if overlap.index.equals(new.index) and np.array_equal(
+            overlap.to_numpy(dtype=float),
+            new[overlap.columns].to_numpy(dtype=float),
+            equal_nan=True,
+        ):
+            return cached, None
+        history = pd.concat([cached[cached.index < new.index[0]], new[cached.columns]])
+        first_new = new.index[0]
+    write_parquet(history.reset_index(), path)
+    return history, first_new
+
+
+def update_indicators(
+    symbol,
+    history,
+    first_new,
+    cache_dir,
+    ma_window=20,
+    ma_list=None,
+    slope_confirmation_days=2,
+):
+    """
+    增量计算指标: first_new 之前的行沿用缓存, 只对 first_new 之后的行 (连同计算所需的前 lookback 行) 重新计算
+    :param history: update_history 返回的日线
+    :param first_new: 第一个有变化的交易日, None 表示日线无变化
+    :return: DataFrame (Index: Date), 与 data.compute_indicators(history) 相同的列
+    """
+    path = indicator_cache_path(
+        cache_dir, symbol, ma_window, ma_list, slope_confirmation_days
+    )
+    kwargs = dict(
+        ma_window=ma_window,
+        ma_list=ma_list,
+        slope_confirmation_days=slope_confirmation_days,
+    )
+    cached = read_parquet(path)
+    if cached is not None:
+        cached = cached.set_index("Date")
+        if first_new is None and cached.index.equals(history.index):
+            return cached
+
+    pos = (
+        history.index.searchsorted(first_new) if first_new is not None else len(history)
+    )
+    keep = (
+        cached[cached.index < first_new]
+        if cached is not None and first_new is not None
+        else None
+    )
+    # 缓存必须与 first_new 之前的日线逐日对应, 否则全部重新计算
+    if keep is not None and pos > 0 and keep.index.equals(history.index[:pos]):
+        tail_start = max(pos - data.indicator_lookback(**kwargs), 0)
+        tail = data.compute_indicators(history.iloc[tail_start:], **kwargs)
+        result = pd.concat([keep, tail.iloc[pos - tail_start :]])
+    else:
+        result = data.compute_indicators(history, **kwargs)
+    write_parquet(result.reset_index(), path)
+    return result
+
+
+def _render(hist_df, name, code, plot_settings, output_dir, enable_backtest):
+    start = time.perf_counter()
+    plotter.generate_report(
+        hist_df, name, code, plot_settings, output_dir, enable_backtest=enable_backtest
+    )
+    return time.perf_counter() - start
+
+
+def run_pipeline(indices, config, base_dir):
+    """
+    并发获取, 增量计算, 多进程绘图
+    1. fetch: 线程池并发增量更新所有指数的日线
+    2. compute / backtest: 每个指数的数据一到就在主线程计算指标与回测
+    3. render: 进程池生成 HTML 报告
+    :param indices: list of {'code', 'name'}
+    :param config: config.yaml 的内容
+    :param base_dir: indices_dashboard 目录
+    :return: StageTimer
+    """
+    global_settings = config.get("settings", {})
+    strategy_settings = config.get("strategy", {})
+    backtest_settings = config.get("backtest", {})
+    plot_settings = config.get("plot", {})
+
+    start_date = global_settings.get("start_date", "2024-01-01")
+    output_dir = os.path.join(base_dir, global_settings.get("output_dir", "output"))
+    cache_dir = os.path.join(base_dir, global_settings.get("cache_dir", "cache"))
+    enable_backtest = global_settings.get("enable_backtest", False)
+    fetch_workers = global_settings.get("fetch_workers", 8)
+    render_workers = global_settings.get("render_workers", os.cpu_count() or 1)
+    indicator_kwargs = dict(
+        ma_window=strategy_settings.get("ma_window", 20),
+        slope_confirmation_days=strategy_settings.get("slope_confirmation_days", 2),
+    )
+    show_signal_logs = strategy_settings.get("show_signal_logs", True)
+
+    timer = StageTimer()
+    wall_start = time.perf_counter()
+
+    def fetch(code):
+        start = time.perf_counter()
+        try:
+            return update_history(code, cache_dir)
+        finally:
+            timer.add("fetch", code, time.perf_counter() - start)
+
+    render_pool = (
+        ProcessPoolExecutor(max_workers=render_workers) if render_workers > 1 else None
+    )
+    render_futures = {}
+    try:
+        with ThreadPoolExecutor(max_workers=fetch_workers) as fetch_pool:
+            fetch_futures = {
+                fetch_pool.submit(fetch, idx["code"]): idx for idx in indices
+            }
+            for future in as_completed(fetch_futures):
+                code, name = (
+                    fetch_futures[future]["code"],
+                    fetch_futures[future]["name"],
+                )
+                try:
+                    history, first_new = future.result()
+                except Exception as e:
+                    logger.error(f"[{name}] 获取数据失败: {e}")
+                    continue
+                if history is None:
+                    logger.error(f"获取数据失败: {code}")
+                    continue
+                logger.info(
+                    f"--- 处理 {name} ({code}), 新数据起始: {first_new.date() if first_new is not None else '无'} ---"
+                )
+
+                start = time.perf_counter()
+                df = update_indicators(
+                    code, history, first_new, cache_dir, **indicator_kwargs
+                )
+                df = data.select_and_log_signals(
+                    df, name, start_date, show_signal_logs=show_signal_logs
+                )
+                timer.add("compute", code, time.perf_counter() - start)
+                if df.empty:
+                    logger.warning(f"[{name}] {start_date} 之后没有数据")
+                    continue
+
+                start = time.perf_counter()
+                hist_df, trades = strategy.process_strategy(
+                    df, backtest_settings, name=name, enable_backtest=enable_backtest
+                )
+                timer.add("backtest", code, time.perf_counter() - start)
+
+                args = (hist_df, name, code, plot_settings, output_dir, enable_backtest)
+                if render_pool is None:
+                    timer.add("render", code, _render(*args))
+                else:
+                    render_futures[render_pool.submit(_render, *args)] = code
+
+        for future in as_completed(render_futures):
+            code = render_futures[future]
+            try:
+                timer.add("render", code, future.result())
+            except Exception as e:
+                logger.error(f"[{code}] 生成报告失败: {e}")
+    finally:
+        if render_pool is not None:
+            render_pool.shutdown()
+
+    timer.log_summary(time.perf_counter() - wall_start)
+    return timer
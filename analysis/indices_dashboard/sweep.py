@@ -0,0 +1,261 @@
+import itertools
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+try:
+    from analysis.indices_dashboard.vector_backtest import run_signal_backtest
+except ImportError:
+    # 如果作为脚本直接运行，尝试添加路径
+    sys.path.append(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
+    from analysis.indices_dashboard.vector_backtest import run_signal_backtest
+
+logger = logging.getLogger(__name__)
+
+# 默认参数网格
+DEFAULT_GRID = {
+    "ma_window": [20],
+    "bias_window": [10, 20],
+    "bias_threshold": [None] + list(range(3, 21)),
+    "confirm_days": [1, 2, 3, 5],
+}
+
+RESULT_COLUMNS = [
+    "symbol",
+    "ma_window",
+    "bias_window",
+    "bias_threshold",
+    "confirm_days",
+    "return_pct",
+    "excess_pct",
+    "max_drawdown_pct",
+    "trades",
+]
+
+
+def param_grid(grid=None):
+    """
+    展开参数网格
+    :param grid: dict, 键为 ma_window, bias_window, bias_threshold, confirm_days, 缺省的键使用 DEFAULT_GRID
+    :return: DataFrame, 每行一组参数; bias_threshold 为 None 表示不使用 BIAS 卖出
+    """
+    grid = {**DEFAULT_GRID, **(grid or {})}
+    keys = ["ma_window", "bias_window", "bias_threshold", "confirm_days"]
+    return pd.DataFrame(list(itertools.product(*(grid[k] for k in keys))), columns=keys)
+
+
+def sweep_close(close, params, initial_capital=100000, **backtest_kwargs):
+    """
+    单个标的的参数扫描
+    每个窗口的均线和 BIAS 只计算一次, 所有参数组合的买卖信号拼成 (交易日, 参数组合) 的矩阵, 一次回测完成.
+    策略与 tools/optimize_bias.py 一致:
+    买入: MA(ma_window) 的斜率连续 confirm_days 天 > 0
+    卖出: 斜率 < 0 或 BIAS(bias_window) > bias_threshold
+    前 ma_window 个交易日不交易
+    :param close: 收盘价 Series
+    :param params: param_grid 返回的参数表
+    :param initial_capital: 初始资金
+    :param backtest_kwargs: 传给 run_signal_backtest 的参数, 默认按非整数股, 无手续费
+    :return: DataFrame, params 加上 return_pct, max_drawdown_pct, trades
+    """
+    close = pd.Series(close, dtype=float).reset_index(drop=True)
+    backtest_kwargs.setdefault("fractional", True)
+    n_rows = len(close)
+
+    windows = set(params["ma_window"]) | set(params["bias_window"])
+    ma = {w: close.rolling(window=w).mean() for w in windows}
+    slope = {w: ma[w].diff() for w in set(params["ma_window"])}
+    bias = {
+        w: ((close - ma[w]) / ma[w] * 100).to_numpy()
+        for w in set(params["bias_window"])
+    }
+    confirmed = {
+        (w, n): (slope[w].rolling(window=n).min() > 0).to_numpy()
+        for w, n in set(zip(params["ma_window"], params["confirm_days"]))
+    }
+    falling = {w: (slope[w] < 0).to_numpy() for w in slope}
+
+    buy = np.empty((n_rows, len(params)), dtype=bool)
+    sell = np.empty((n_rows, len(params)), dtype=bool)
+    for j, (ma_window, bias_window, threshold, confirm_days) in enumerate(
+        params[
+            ["ma_window", "bias_window", "bias_threshold", "confirm_days"]
+        ].itertuples(index=False)
+    ):
+        buy[:, j] = confirmed[(ma_window, confirm_days)]
+        sell[:, j] = falling[ma_window]
+        if threshold is not None and not pd.isna(threshold):
+            sell[:, j] |= bias[bias_window] > threshold
+        buy[:ma_window, j] = False
+        sell[:ma_window, j] = False
+
+    res = run_signal_backtest(
+        np.broadcast_to(close.to_numpy()[:, None], buy.shape),
+        buy,
+        sell,
+        initial_capital=initial_capital,
+        **backtest_kwargs,
+    )
+    total = res["total"]
+    result = params.reset_index(drop=True).copy()
+    result["return_pct"] = (total[-1] - initial_capital) / initial_capital * 100
+    result["max_drawdown_pct"] = (total / np.maximum.accumulate(total, axis=0) - 1).min(
+        axis=0
+    ) * 100
+    result["trades"] = np.count_nonzero(res["action"], axis=0)
+    return result
+
+
+def _sweep_worker(args):
+    symbol, close, params, backtest_kwargs = args
+    result = sweep_close(close, params, **backtest_kwargs)
+    result.insert(0, "symbol", symbol)
+    return result
+
+
+def fetch_close(symbol, start_date):
+    """
+    获取指数收盘价
+    :param symbol: 指数代码, 如 sh000813
+    :param start_date: 开始日期 'YYYY-MM-DD'
+    :return: Series (Index: Date)
+    """
+    import akshare as ak
+
+    df = ak.stock_zh_index_daily_em(symbol=symbol)
+    df["Date"] = pd.to_datetime(df["date"])
+    df.set_index("Date", inplace=True)
+    df.sort_index(inplace=True)
+    return pd.to_numeric(df["close"])[df.index >= start_date]
+
+
+def rank_results(results):
+    """
+    按收益率排序, 并计算每组参数在所有标的上的平均表现
+    :param results: sweep_symbols 返回的明细
+    :return: (明细, 汇总) 两个 DataFrame, 均按收益率降序
+    """
+    keys = ["ma_window", "bias_window", "bias_threshold", "confirm_days"]
+    detail = results.sort_values(
+        ["symbol", "return_pct"], ascending=[True, False], ignore_index=True
+    )
+    summary = (
+        results.assign(bias_threshold=results["bias_threshold"].astype(float))
+        .groupby(keys, dropna=False)
+        .agg(
+            symbols=("symbol", "nunique"),
+            mean_return_pct=("return_pct", "mean"),
+            median_return_pct=("return_pct", "median"),
+            mean_excess_pct=("excess_pct", "mean"),
+            worst_drawdown_pct=("max_drawdown_pct", "min"),
+            trades=("trades", "sum"),
+        )
+        .sort_values("mean_return_pct", ascending=False)
+        .reset_index()
+    )
+    return detail, summary
+
+
+def sweep_symbols(closes, grid=None, max_workers=None, **backtest_kwargs):
+    """
+    多个标的的参数扫描, 每个标的在一个子进程中计算
+    :param closes: dict, 标的代码 -> 收盘价 Series
+    :param grid: 参数网格, 见 param_grid
+    :param max_workers: 进程数, 默认为 CPU 核数; 1 时在当前进程计算
+    :param backtest_kwargs: 传给 run_signal_backtest 的参数
+    :return: DataFrame, RESULT_COLUMNS; excess_pct 为相对同一标的同组窗口不使用 BIAS 卖出时的收益差
+    """
+    params = param_grid(grid)
+    tasks = [
+        (symbol, close, params, backtest_kwargs) for symbol, close in closes.items()
+    ]
+    if max_workers == 1 or len(tasks) <= 1:
+        frames = [_sweep_worker(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            frames = list(executor.map(_sweep_worker, tasks))
+    if not frames:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+
+    results = pd.concat(frames, ignore_index=True)
+    baseline = results[results["bias_threshold"].isna()].set_index(
+        ["symbol", "ma_window", "bias_window", "confirm_days"]
+    )["return_pct"]
+    base = baseline.reindex(
+        pd.MultiIndex.from_frame(
+            results[["symbol", "ma_window", "bias_window", "confirm_days"]]
+        )
+    )
+    results["excess_pct"] = results["return_pct"].to_numpy() - base.to_numpy()
+    return results[RESULT_COLUMNS]
+
+
+def sweep_universe(
+    symbols,
+    start_date="2020-01-01",
+    grid=None,
+    max_workers=None,
+    fetch_workers=4,
+    output_dir=None,
+    **backtest_kwargs,
+):
+    """
+    下载数据并扫描参数, 可选输出 CSV
+    :param symbols: 指数代码列表
+    :param start_date: 开始日期
+    :param grid: 参数网格
+    :param max_workers: 计算进程数
+    :param fetch_workers: 下载线程数
+    :param output_dir: 输出目录, 写入 sweep_detail.csv 和 sweep_summary.csv
+    :return: (明细, 汇总)
+    """
+
+    def _fetch(symbol):
+        try:
+            return symbol, fetch_close(symbol, start_date)
+        except Exception as e:
+            logger.error(f"获取数据失败: {symbol}: {e}")
+            return symbol, None
+
+    with ThreadPoolExecutor(max_workers=fetch_workers) as executor:
+        closes = {
+            s: c for s, c in executor.map(_fetch, symbols) if c is not None and len(c)
+        }
+    logger.info(
+        f"数据获取完成: {len(closes)}/{len(symbols)} 个标的, {len(param_grid(grid))} 组参数"
+    )
+
+    detail, summary = rank_results(
+        sweep_symbols(closes, grid, max_workers=max_workers, **backtest_kwargs)
+    )
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+        detail.to_csv(
+            os.path.join(output_dir, "sweep_detail.csv"),
+            index=False,
+            encoding="utf-8-sig",
+        )
+        summary.to_csv(
+            os.path.join(output_dir, "sweep_summary.csv"),
+            index=False,
+            encoding="utf-8-sig",
+        )
+        logger.info(f"扫描结果已保存: {output_dir}")
+    return detail, summary
+
+
+if __name__ == "__main__":
+    from analysis.indices_dashboard.main import load_indices
+
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    codes = [idx["code"] for idx in load_indices(os.path.join(base_dir, "config.csv"))]
+    detail_df, summary_df = sweep_universe(
+        codes, output_dir=os.path.join(base_dir, "output_sweep")
+    )
+    print(summary_df.head(20).to_string())
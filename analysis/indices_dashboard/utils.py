@@ -5,6 +5,7 @@ import time
 from functools import wraps
 import pandas as pd
 import akshare as ak
+from akshare.utils.indicator import rolling_mean
 import mplfinance as mpf
 import matplotlib.pyplot as plt
 
@@ -104,10 +105,11 @@ def calculate_bias(df: pd.DataFrame, periods=[10, 20, 60]):
     :param periods: list of periods for BIAS calculation
     :return: DataFrame with new BIAS columns
     """
+    close = df['Close']
     for p in periods:
-        ma = df['Close'].rolling(window=p).mean()
+        ma = rolling_mean(close, p)
         # 避免除以 0
-        df[f'BIAS_{p}'] = (df['Close'] - ma) / ma * 100
+        df[f'BIAS_{p}'] = (close - ma) / ma * 100
     return df
 
 def plot_kline(symbol: str, name: str, df: pd.DataFrame, output_dir: str):
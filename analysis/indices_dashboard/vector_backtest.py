@@ -0,0 +1,182 @@
+import numpy as np
+import pandas as pd
+
+# action 数组中的取值
+BUY = 1
+SELL = -1
+
+_NS_PER_DAY = 86_400_000_000_000
+
+
+def run_signal_backtest(
+    close,
+    buy,
+    sell,
+    dates=None,
+    initial_capital=100000.0,
+    commission_rate_short=0.0,
+    short_term_days=7,
+    fractional=False,
+):
+    """
+    向量化的满仓买入 / 清仓卖出回测 (信号 -> 持仓 -> 资产)
+    close/buy/sell 为 (交易日, 标的) 的二维数组, 一维数组视为单个标的;
+    状态只在有信号的交易日变化, 因此只遍历有信号的交易日, 每次对所有标的做一次向量运算,
+    其余交易日的现金和持仓由最近一次信号日向前填充, 资产 = 现金 + 持仓 * 收盘价.
+    规则与逐行回测一致:
+    1. 买入: buy 且现金 > 0 时, 用全部现金买入 int(现金 / 价格) 股 (fractional 时为 现金 / 价格 且现金清零),
+       持仓被替换为本次买入的股数
+    2. 卖出: 未满足买入条件, sell 且持仓 > 0 时全部卖出, 持有自然日数 < short_term_days 时收取 commission_rate_short
+    :param close: 收盘价
+    :param buy: 买入信号 (bool)
+    :param sell: 卖出信号 (bool)
+    :param dates: 交易日, 用于计算持有天数; 为 None 时按交易日序号计算
+    :param initial_capital: 初始资金
+    :param commission_rate_short: 短期持有的卖出费率
+    :param short_term_days: 短期持有的天数
+    :param fractional: 是否允许买入非整数股
+    :return: dict, 与 close 同形状的 cash, holdings, total, action (1 买入, -1 卖出, 0 无),
+             shares (成交股数), commission (手续费)
+    """
+    close = np.asarray(close, dtype=float)
+    squeeze = close.ndim == 1
+    if squeeze:
+        close = close[:, None]
+    buy = np.asarray(buy, dtype=bool).reshape(close.shape)
+    sell = np.asarray(sell, dtype=bool).reshape(close.shape)
+    n_rows, n_cols = close.shape
+
+    if dates is None:
+        days = np.arange(n_rows, dtype=np.int64)
+        day_unit = 1
+    else:
+        days = pd.DatetimeIndex(dates).to_numpy(dtype="datetime64[ns]").astype(np.int64)
+        day_unit = _NS_PER_DAY
+
+    action = np.zeros(close.shape, dtype=np.int8)
+    shares_traded = np.zeros(close.shape)
+    commission = np.zeros(close.shape)
+
+    event_rows = np.flatnonzero((buy | sell).any(axis=1))
+    cash_rows = np.empty((len(event_rows), n_cols))
+    holdings_rows = np.empty((len(event_rows), n_cols))
+
+    cash = np.full(n_cols, float(initial_capital))
+    holdings = np.zeros(n_cols)
+    last_buy = np.zeros(n_cols, dtype=np.int64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for k, t in enumerate(event_rows):
+            price = close[t]
+            buy_branch = buy[t] & (cash > 0)
+            if fractional:
+                shares = cash / price
+            else:
+                shares = np.trunc(cash / price)
+            do_buy = buy_branch & (shares > 0)
+            do_sell = ~buy_branch & sell[t] & (holdings > 0)
+
+            if do_buy.any():
+                new_cash = 0.0 if fractional else cash - shares * price
+                cash = np.where(do_buy, new_cash, cash)
+                holdings = np.where(do_buy, shares, holdings)
+                last_buy = np.where(do_buy, days[t], last_buy)
+                action[t, do_buy] = BUY
+                shares_traded[t, do_buy] = shares[do_buy]
+
+            if do_sell.any():
+                revenue = holdings * price
+                hold_days = (days[t] - last_buy) // day_unit
+                fee = np.where(
+                    hold_days < short_term_days, revenue * commission_rate_short, 0.0
+                )
+                cash = np.where(do_sell, cash + (revenue - fee), cash)
+                action[t, do_sell] = SELL
+                shares_traded[t, do_sell] = holdings[do_sell]
+                commission[t, do_sell] = fee[do_sell]
+                holdings = np.where(do_sell, 0.0, holdings)
+
+            cash_rows[k] = cash
+            holdings_rows[k] = holdings
+
+    # 每个交易日对应的最近一次信号日, 第一个信号日之前为初始状态
+    pos = np.searchsorted(event_rows, np.arange(n_rows), side="right") - 1
+    cash_all = np.full(close.shape, float(initial_capital))
+    holdings_all = np.zeros(close.shape)
+    started = pos >= 0
+    cash_all[started] = cash_rows[pos[started]]
+    holdings_all[started] = holdings_rows[pos[started]]
+
+    result = {
+        "cash": cash_all,
+        "holdings": holdings_all,
+        "total": cash_all + holdings_all * close,
+        "action": action,
+        "shares": shares_traded,
+        "commission": commission,
+    }
+    if squeeze:
+        result = {key: value[:, 0] for key, value in result.items()}
+    return result
+
+
+def action_labels(action):
+    """
+    将 action 数组转换为 'Buy' / 'Sell' / None
+    :param action: run_signal_backtest 返回的一维 action 数组
+    :return: numpy.ndarray (object)
+    """
+    labels = np.full(len(action), None, dtype=object)
+    labels[action == BUY] = "Buy"
+    labels[action == SELL] = "Sell"
+    return labels
+
+
+def trade_records(dates, close, result, fractional=False):
+    """
+    由单个标的的回测结果生成交易明细
+    :param dates: 交易日
+    :param close: 收盘价
+    :param result: run_signal_backtest 返回的单个标的结果 (一维数组)
+    :param fractional: 是否为非整数股
+    :return: list of dict {date, type, price, shares, commission, balance}
+    """
+    dates = pd.DatetimeIndex(dates)
+    close = np.asarray(close, dtype=float)
+    trades = []
+    for t in np.flatnonzero(result["action"]):
+        is_buy = result["action"][t] == BUY
+        shares = result["shares"][t]
+        trades.append(
+            {
+                "date": dates[t],
+                "type": "买入" if is_buy else "卖出",
+                "price": close[t],
+                "shares": shares if fractional else int(shares),
+                "commission": 0 if is_buy else result["commission"][t],
+                "balance": result["cash"][t],
+            }
+        )
+    return trades
+
+
+if __name__ == "__main__":
+    import time
+
+    # 2000 个标的 x 20 年日线
+    rng = np.random.default_rng(0)
+    n_rows, n_cols = 5000, 2000
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (n_rows, n_cols)), axis=0))
+    ma = pd.DataFrame(close).rolling(20).mean().to_numpy()
+    slope = np.diff(ma, axis=0, prepend=np.nan)
+    dates = pd.bdate_range("2005-01-03", periods=n_rows)
+
+    start = time.perf_counter()
+    res = run_signal_backtest(
+        close, slope > 0, slope < 0, dates=dates, commission_rate_short=0.015
+    )
+    elapsed = time.perf_counter() - start
+    print(
+        f"{n_cols} 个标的 x {n_rows} 个交易日: {elapsed:.2f} 秒, "
+        f"平均收益 {(res['total'][-1] / 100000 - 1).mean() * 100:.2f}%"
+    )
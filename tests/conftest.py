@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: pytest 配置
+带 benchmark 标记的测试比较耗时或内存, 结果受机器负载影响, 默认跳过;
+使用 pytest --benchmark 运行. clock 为限速和熔断测试提供可控的时钟
+"""
+
+import pytest
+
+from akshare.utils import rate_limit
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="运行带 benchmark 标记的耗时和内存测试",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: 耗时或内存的性能测试, 需要 --benchmark 才运行"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="需要 --benchmark 才运行")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+class FakeTime:
+    """
+    monotonic 返回手动推进的时间, sleep 直接推进时间
+    """
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(rate_limit, "time", fake)
+    return fake
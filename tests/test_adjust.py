@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试本地复权计算, 以及复权因子和不复权行情的本地存储
+用本地构造的行情和因子表代替网络请求
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from akshare.stock import stock_zh_a_sina
+from akshare.stock_feature import stock_adjust_store
+from akshare.stock_feature.stock_adjust_store import (
+    stock_zh_a_daily_local,
+    stock_zh_a_daily_raw_sync,
+    stock_zh_a_daily_store_path,
+    stock_zh_a_factor_sync,
+)
+from akshare.utils.adjust import adjust_prices, asof_factor
+
+EVENT_DATES = pd.to_datetime(["2024-01-01", "2024-01-04", "2024-01-08"])
+HFQ_FACTORS = [1.0, 1.5, 3.0]
+
+
+def _raw_df() -> pd.DataFrame:
+    index = pd.bdate_range("2024-01-02", "2024-01-10", name="date")
+    close = np.linspace(10, 18, len(index))
+    return pd.DataFrame(
+        {
+            "open": close - 0.5,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": np.arange(1, len(index) + 1) * 100.0,
+            "amount": np.arange(1, len(index) + 1) * 1000.0,
+            "outstanding_share": 1e6,
+            "turnover": np.arange(1, len(index) + 1) * 1e-4,
+        },
+        index=index,
+    )
+
+
+def test_asof_factor():
+    """
+    test each date takes the latest factor on or before it
+    :return: None
+    :rtype: None
+    """
+    dates = ["2023-12-29", "2024-01-01", "2024-01-05", "2024-01-08", "2024-02-01"]
+    result = asof_factor(dates, EVENT_DATES[::-1], HFQ_FACTORS[::-1])
+    assert np.isnan(result[0])
+    assert result[1:].tolist() == [1.0, 1.5, 3.0, 3.0]
+
+
+def test_adjust_prices():
+    """
+    test hfq/qfq prices and that qfq keeps raw prices at the anchor date
+    :return: None
+    :rtype: None
+    """
+    raw_df = _raw_df()
+    hfq_df = adjust_prices(raw_df, EVENT_DATES, HFQ_FACTORS, adjust="hfq")
+    factor = asof_factor(raw_df.index, EVENT_DATES, HFQ_FACTORS)
+    assert np.allclose(hfq_df["close"], raw_df["close"] * factor)
+    assert hfq_df["volume"].equals(raw_df["volume"])
+
+    qfq_df = adjust_prices(raw_df, EVENT_DATES, HFQ_FACTORS, adjust="qfq")
+    assert np.allclose(qfq_df["close"], raw_df["close"] * factor / 3.0)
+    assert qfq_df.loc["2024-01-10", "close"] == raw_df.loc["2024-01-10", "close"]
+
+    anchor_df = adjust_prices(
+        raw_df, EVENT_DATES, HFQ_FACTORS, adjust="qfq", anchor_date="20240105"
+    )
+    assert np.allclose(
+        anchor_df.loc["2024-01-04":"2024-01-05"].to_numpy(),
+        raw_df.loc["2024-01-04":"2024-01-05"].to_numpy(),
+    )
+    assert anchor_df.loc["2024-01-09", "close"] == raw_df.loc["2024-01-09", "close"] * 2
+    assert adjust_prices(raw_df, EVENT_DATES, HFQ_FACTORS, adjust="").equals(raw_df)
+    with pytest.raises(ValueError):
+        adjust_prices(raw_df, EVENT_DATES, HFQ_FACTORS, adjust="foo")
+
+
+def test_daily_local_no_refetch(monkeypatch, tmp_path):
+    """
+    test the raw series and factors are fetched once and every adjust mode is
+    then computed from the store
+    :return: None
+    :rtype: None
+    """
+    calls = []
+
+    def fake_raw(symbol):
+        calls.append(("raw", symbol))
+        return _raw_df()
+
+    def fake_factor(symbol, method):
+        calls.append((method, symbol))
+        return pd.DataFrame(
+            {"date": EVENT_DATES, f"{method}_factor": [str(x) for x in HFQ_FACTORS]}
+        )
+
+    monkeypatch.setattr(stock_adjust_store, "_zh_a_daily_raw", fake_raw)
+    monkeypatch.setattr(stock_adjust_store, "_zh_a_fq_factor", fake_factor)
+    kwargs = dict(symbol="sh600000", store_dir=str(tmp_path))
+    raw_df = stock_zh_a_daily_local(**kwargs)
+    hfq_df = stock_zh_a_daily_local(adjust="hfq", **kwargs)
+    qfq_df = stock_zh_a_daily_local(
+        start_date="20240103", end_date="20240109", adjust="qfq", **kwargs
+    )
+    anchor_df = stock_zh_a_daily_local(adjust="qfq", anchor_date="20240104", **kwargs)
+    assert calls == [("raw", "sh600000"), ("hfq", "sh600000")]
+
+    assert raw_df.columns.tolist() == ["date"] + _raw_df().columns.tolist()
+    assert raw_df["close"].tolist() == _raw_df()["close"].round(2).tolist()
+    assert hfq_df["close"].iloc[-1] == round(_raw_df()["close"].iloc[-1] * 3.0, 2)
+    assert qfq_df["date"].tolist()[0] == pd.Timestamp("2024-01-03").date()
+    assert qfq_df["date"].tolist()[-1] == pd.Timestamp("2024-01-09").date()
+    assert anchor_df.set_index("date")["close"].iloc[2] == raw_df["close"].iloc[2]
+
+    stock_zh_a_daily_local(adjust="hfq", refresh=True, **kwargs)
+    assert len(calls) == 4
+
+
+def _make_stale(path: str) -> None:
+    yesterday = time.time() - 86400
+    os.utime(path, (yesterday, yesterday))
+
+
+def test_factor_sync_replaces(monkeypatch, tmp_path):
+    """
+    test a revised factor table replaces the stored one instead of being merged
+    :return: None
+    :rtype: None
+    """
+    tables = [
+        pd.DataFrame({"date": EVENT_DATES, "hfq_factor": HFQ_FACTORS}),
+        pd.DataFrame({"date": EVENT_DATES[[0, 2]], "hfq_factor": [1.0, 2.5]}),
+    ]
+    monkeypatch.setattr(
+        stock_adjust_store, "_zh_a_fq_factor", lambda symbol, method: tables.pop(0)
+    )
+    stock_zh_a_factor_sync("sh600000", store_dir=str(tmp_path))
+    factor_df = stock_zh_a_factor_sync(
+        "sh600000", store_dir=str(tmp_path), refresh=True
+    )
+    assert factor_df["date"].tolist() == EVENT_DATES[[0, 2]].tolist()
+    assert factor_df["hfq_factor"].tolist() == [1.0, 2.5]
+    stored_df = stock_zh_a_factor_sync(
+        "sh600000", store_dir=str(tmp_path), refresh=False
+    )
+    pd.testing.assert_frame_equal(stored_df, factor_df)
+
+
+def test_daily_quote(monkeypatch):
+    """
+    test the realtime quote is turned into one raw daily bar with turnover
+    :return: None
+    :rtype: None
+    """
+    fields = ["浦发银行", "10.10", "10.00", "10.30", "10.50", "9.90"] + ["0"] * 27
+    fields[8:10] = ["2000000", "20600000.00"]
+    fields[30:32] = ["2024-01-11", "15:00:00"]
+    quotes = {"sh600000": fields}
+    monkeypatch.setattr(stock_zh_a_sina, "fetch_hq", lambda symbols: quotes)
+    monkeypatch.setattr(
+        stock_zh_a_sina,
+        "_zh_a_share_amount",
+        lambda symbol: pd.DataFrame(
+            {"outstanding_share": ["100", "200", "400"]},
+            index=pd.to_datetime(["2023-01-01", "2024-01-05", "2024-02-01"]),
+        ),
+    )
+    temp_df = stock_zh_a_sina._zh_a_daily_quote("sh600000")
+    assert temp_df.index.tolist() == [pd.Timestamp("2024-01-11")]
+    row = temp_df.iloc[0]
+    assert row[["open", "high", "low", "close"]].tolist() == [10.1, 10.5, 9.9, 10.3]
+    assert row["prevclose"] == 10.0
+    assert row["outstanding_share"] == 2_000_000
+    assert row["turnover"] == 1.0
+    fields[8] = "0"
+    assert stock_zh_a_sina._zh_a_daily_quote("sh600000").empty
+
+
+def test_raw_sync_appends_latest_bar(monkeypatch, tmp_path):
+    """
+    test a stale store is extended from the realtime quote without a full download,
+    and fully downloaded again when the quote does not continue the stored series
+    :return: None
+    :rtype: None
+    """
+    calls = []
+    prevclose = [_raw_df()["close"].iloc[-1], 99.0]
+
+    def fake_raw(symbol):
+        calls.append("raw")
+        return _raw_df()
+
+    def fake_quote(symbol):
+        calls.append("quote")
+        temp_df = _raw_df().iloc[-1:].copy()
+        temp_df.index = pd.DatetimeIndex(["2024-01-11"], name="date")
+        temp_df["close"] = 20.0
+        temp_df["prevclose"] = prevclose.pop(0)
+        return temp_df
+
+    monkeypatch.setattr(stock_adjust_store, "_zh_a_daily_raw", fake_raw)
+    monkeypatch.setattr(stock_adjust_store, "_zh_a_daily_quote", fake_quote)
+    kwargs = dict(symbol="sh600000", store_dir=str(tmp_path))
+    path = stock_zh_a_daily_store_path("sh600000", str(tmp_path))
+    assert len(stock_zh_a_daily_raw_sync(**kwargs)) == len(_raw_df())
+    assert len(stock_zh_a_daily_raw_sync(**kwargs)) == len(_raw_df())
+    assert calls == ["raw"]
+
+    _make_stale(path)
+    temp_df = stock_zh_a_daily_raw_sync(**kwargs)
+    assert calls == ["raw", "quote"]
+    assert len(temp_df) == len(_raw_df()) + 1
+    assert temp_df.loc["2024-01-11", "close"] == 20.0
+    pd.testing.assert_frame_equal(temp_df.iloc[:-1], _raw_df(), check_freq=False)
+    assert len(pd.read_parquet(path)) == len(_raw_df()) + 1
+
+    _make_stale(path)
+    assert len(stock_zh_a_daily_raw_sync(**kwargs)) == len(_raw_df())
+    assert calls == ["raw", "quote", "quote", "raw"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试异步接口与同步接口的结果一致, 且请求可以同时进行
+用本地构造的响应代替网络请求
+"""
+
+import asyncio
+import json
+
+import pandas as pd
+
+import akshare.aio as ak_aio
+from akshare.aio import request as aio_request
+from akshare.stock_feature import stock_hist_em
+from akshare.utils import datacenter, rate_limit
+
+_KLINES = [
+    f"2024-01-{day:02d},10.{day},10.5,11.0,9.8,{day * 100},{day * 1000.5},1.2,0.5,0.05,0.3"
+    for day in range(2, 12)
+]
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, payload: dict):
+        self.content = json.dumps(payload).encode()
+        self.text = self.content.decode()
+        self.encoding = "utf-8"
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        return None
+
+
+def _kline_payload(params: dict) -> dict:
+    return {"data": {"code": params["secid"], "klines": _KLINES}}
+
+
+def _report_payload(params: dict) -> dict:
+    page = int(params["pageNumber"])
+    return {
+        "result": {
+            "pages": 4,
+            "data": [
+                {"SECURITY_CODE": f"{page}{i:05d}", "TRADE_DATE": "2024-04-10"}
+                for i in range(3)
+            ],
+        }
+    }
+
+
+class FakeSession:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def request(self, method, url, params=None, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if "kline" in url:
+            return FakeResponse(_kline_payload(params))
+        return FakeResponse(_report_payload(params))
+
+
+def test_aio_matches_sync(monkeypatch):
+    """
+    test async interfaces share parsing with the sync ones and run concurrently
+    :return: None
+    :rtype: None
+    """
+    session = FakeSession()
+    monkeypatch.setattr(rate_limit, "_limiters", {})
+    monkeypatch.setattr(rate_limit, "DEFAULT_RATE_LIMITS", {})
+    monkeypatch.setattr(aio_request, "get_async_session", lambda: session)
+    monkeypatch.setattr(
+        stock_hist_em,
+        "request_get",
+        lambda url, params=None, **kwargs: FakeResponse(_kline_payload(params)),
+    )
+    monkeypatch.setattr(
+        datacenter,
+        "_fetch_page",
+        lambda url, params, timeout: _report_payload(params)["result"],
+    )
+    sync_df = stock_hist_em.stock_zh_a_hist(symbol="600000")
+
+    async def main():
+        hist_list = await asyncio.gather(
+            *[ak_aio.stock_zh_a_hist(symbol=f"{600000 + i}") for i in range(50)]
+        )
+        report_df = await ak_aio.fetch_datacenter({"reportName": "RPT_TEST"})
+        return hist_list, report_df
+
+    hist_list, report_df = asyncio.run(main())
+    pd.testing.assert_frame_equal(hist_list[0], sync_df)
+    assert hist_list[7]["股票代码"].unique().tolist() == ["600007"]
+    assert session.max_in_flight > 1
+    pd.testing.assert_frame_equal(
+        report_df, datacenter.fetch_datacenter({"reportName": "RPT_TEST"})
+    )
+    assert len(report_df) == 12
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
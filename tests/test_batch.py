@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试多代码批量获取: 结果顺序, 失败代码的记录, 重试, 同一主机的并发数限制, 以及默认限速下仍然并发
+用本地构造的接口函数和会话代替网络请求
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+import pandas as pd
+import pytest
+
+from akshare.utils import rate_limit
+from akshare.utils import request as ak_request
+from akshare.utils.batch import batch
+
+
+class FakeInterface:
+    """
+    模拟单代码接口: 代码越小返回越慢, 使完成顺序与请求顺序相反; fail 中的代码先失败 n 次
+    """
+
+    def __init__(self, fail: dict = None):
+        self.fail = dict(fail or {})
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, symbol, start_date="19700101"):
+        with self._lock:
+            self.calls.append(symbol)
+            remaining = self.fail.get(symbol, 0)
+            if remaining:
+                self.fail[symbol] = remaining - 1
+        time.sleep(0.001 * (10 - int(symbol[-1])))
+        if remaining:
+            raise ConnectionError(f"{symbol} failed")
+        return pd.DataFrame({"date": [start_date], "close": [float(symbol[-1])]})
+
+
+def test_batch_order_errors_and_retry():
+    """
+    test results follow the input order, failures land in attrs["errors"],
+    and transient failures are retried
+    :return: None
+    :rtype: None
+    """
+    func = FakeInterface(fail={"000003": 1, "000005": 10})
+    symbols = ["000001", "000002", "000003", "000004", "000005", "000001"]
+    with pytest.warns(UserWarning, match="1 of 5 symbols failed"):
+        big_df = batch(
+            func, symbols, max_workers=4, retries=2, retry_delay=0, start_date="2024"
+        )
+    assert big_df["symbol"].tolist() == ["000001", "000002", "000003", "000004"]
+    assert big_df.columns.tolist() == ["symbol", "date", "close"]
+    assert (big_df["date"] == "2024").all()
+    assert list(big_df.attrs["errors"]) == ["000005"]
+    assert isinstance(big_df.attrs["errors"]["000005"], ConnectionError)
+    assert func.calls.count("000003") == 2
+    assert func.calls.count("000005") == 3
+
+    with pytest.warns(UserWarning):
+        result_dict = batch(func, symbols, retries=0, as_dict=True)
+    assert list(result_dict) == ["000001", "000002", "000003", "000004", "000005"]
+    assert isinstance(result_dict["000005"], ConnectionError)
+    assert result_dict["000004"]["close"].iloc[0] == 4.0
+
+
+def test_batch_rejects_duplicate_symbol_param():
+    """
+    test passing the symbol parameter in kwargs is rejected up front
+    :return: None
+    :rtype: None
+    """
+    func = FakeInterface()
+    with pytest.raises(ValueError, match="symbol"):
+        batch(func, ["000001"], symbol="000002")
+    assert func.calls == []
+
+
+class SlowSession:
+    """
+    按主机记录同时在途的请求数
+    """
+
+    def __init__(self):
+        self.in_flight = {}
+        self.max_in_flight = {}
+        self._lock = threading.Lock()
+
+    def request(self, method, url, **kwargs):
+        host = urlsplit(url).hostname
+        with self._lock:
+            self.in_flight[host] = self.in_flight.get(host, 0) + 1
+            self.max_in_flight[host] = max(
+                self.max_in_flight.get(host, 0), self.in_flight[host]
+            )
+        time.sleep(0.02)
+        with self._lock:
+            self.in_flight[host] -= 1
+        response = ak_request.requests.Response()
+        response.status_code = 200
+        response._content = b"{}"
+        return response
+
+
+def test_host_semaphore(monkeypatch):
+    """
+    test requests from many threads to one host are capped by set_host_concurrency
+    while another host is not affected
+    :return: None
+    :rtype: None
+    """
+    for name in ["_limiters", "_limit_config", "_semaphores", "_concurrency_config"]:
+        monkeypatch.setattr(rate_limit, name, {})
+    rate_limit.set_rate_limit("a.example.com", rate=1000.0, capacity=1000.0)
+    rate_limit.set_rate_limit("b.example.com", rate=1000.0, capacity=1000.0)
+    rate_limit.set_host_concurrency("a.example.com", 2)
+    assert rate_limit.get_host_concurrency("https://a.example.com/x") == 2
+    session = SlowSession()
+    monkeypatch.setattr(ak_request, "get_session", lambda: session)
+
+    urls = [f"https://{host}/data" for host in ["a.example.com", "b.example.com"]] * 8
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        list(executor.map(ak_request.request_get, urls))
+    assert session.max_in_flight["a.example.com"] == 2
+    assert session.max_in_flight["b.example.com"] > 2
+
+
+def test_batch_concurrent_under_default_limits(monkeypatch, clock):
+    """
+    test batch() still runs requests concurrently with the default per-source
+    rate limits, and hosts without a default are not throttled at all
+    :return: None
+    :rtype: None
+    """
+    for name in [
+        "_limiters",
+        "_limit_config",
+        "_semaphores",
+        "_concurrency_config",
+        "_breakers",
+        "_breaker_config",
+    ]:
+        monkeypatch.setattr(rate_limit, name, {})
+    session = SlowSession()
+    monkeypatch.setattr(ak_request, "get_session", lambda: session)
+
+    def fetch(symbol: str, host: str) -> pd.DataFrame:
+        ak_request.request_get(f"https://{host}/api/qt/stock/kline/get?secid={symbol}")
+        return pd.DataFrame({"代码": [symbol]})
+
+    symbols = [f"0.{i:06d}" for i in range(32)]
+    big_df = batch(fetch, symbols, max_workers=8, host="push2his.eastmoney.com")
+    assert big_df["代码"].tolist() == symbols
+    assert session.max_in_flight["push2his.eastmoney.com"] > 1
+    batch(fetch, symbols * 4, max_workers=8, host="unknown.example.com")
+    assert session.max_in_flight["unknown.example.com"] > 1
+    # 突发额度内不等待令牌, 没有默认限速的主机不限速
+    assert clock.sleeps == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试本地持久化缓存
+"""
+
+import types
+
+import pandas as pd
+import pytest
+
+from akshare import cache
+
+
+def test_cached_func(tmp_path):
+    """
+    test cache hit, ttl policy and purge
+    :return: None
+    :rtype: None
+    """
+    calls = []
+
+    @cache.cached(ttl=cache.history_ttl())
+    def demo_hist(symbol: str = "000001", end_date: str = "20200101"):
+        calls.append(symbol)
+        return pd.DataFrame({"close": [1.0, 2.0]})
+
+    cache.enable(path=str(tmp_path / "cache.sqlite"))
+    try:
+        demo_hist("000001")
+        temp_df = demo_hist(symbol="000001", end_date="20200101")
+        assert calls == ["000001"]
+        assert temp_df["close"].tolist() == [1.0, 2.0]
+        stats_df = cache.stats()
+        assert stats_df.loc[stats_df["func"] == "demo_hist", "hits"].iloc[0] == 1
+        assert cache.purge(demo_hist) == 1
+        demo_hist("000001")
+        assert calls == ["000001", "000001"]
+    finally:
+        cache.disable()
+
+
+def test_history_ttl_adjust():
+    """
+    test only unadjusted and hfq history is cached forever
+    :return: None
+    :rtype: None
+    """
+    policy = cache.history_ttl(recent_ttl=60)
+    assert policy({"end_date": "20200101", "adjust": ""}) is None
+    assert policy({"end_date": "20200101", "adjust": "hfq"}) is None
+    assert policy({"end_date": "20200101", "adjust": "qfq"}) == 60
+    assert policy({"end_date": "20200101", "adjust": "qfq-factor"}) == 60
+    assert policy({"end_date": "20200101", "adjust": "hfq-factor"}) == 60
+
+
+def test_cached_lru_eviction(tmp_path, monkeypatch):
+    """
+    test the least recently accessed entry is evicted over max_size
+    :return: None
+    :rtype: None
+    """
+    now = [1000.0]
+    monkeypatch.setattr(cache, "time", types.SimpleNamespace(time=lambda: now[0]))
+    calls = []
+
+    @cache.cached(ttl=None)
+    def demo_blob(symbol: str):
+        calls.append(symbol)
+        return symbol * 1000
+
+    cache.enable(path=str(tmp_path / "cache.sqlite"), max_size=2500)
+    try:
+        demo_blob("a")
+        now[0] += 1
+        demo_blob("b")
+        now[0] += 1
+        demo_blob("a")
+        now[0] += 1
+        demo_blob("c")
+        assert calls == ["a", "b", "c"]
+        demo_blob("a")
+        demo_blob("c")
+        assert calls == ["a", "b", "c"]
+        demo_blob("b")
+        assert calls == ["a", "b", "c", "b"]
+    finally:
+        cache.disable()
+
+
+def test_cached_ttl_expire(tmp_path, monkeypatch):
+    """
+    test an entry is refetched after a float ttl expires
+    :return: None
+    :rtype: None
+    """
+    now = [1000.0]
+    monkeypatch.setattr(cache, "time", types.SimpleNamespace(time=lambda: now[0]))
+    calls = []
+
+    @cache.cached(ttl=0.5)
+    def demo_spot(symbol: str):
+        calls.append(symbol)
+        return pd.DataFrame({"price": [len(calls)]})
+
+    cache.enable(path=str(tmp_path / "cache.sqlite"))
+    try:
+        assert demo_spot("000001")["price"].iloc[0] == 1
+        now[0] += 0.4
+        assert demo_spot("000001")["price"].iloc[0] == 1
+        now[0] += 0.2
+        assert demo_spot("000001")["price"].iloc[0] == 2
+        assert calls == ["000001", "000001"]
+    finally:
+        cache.disable()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
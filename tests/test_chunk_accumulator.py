@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试分块收集数据的合并结果, 以及长历史数据只在最后合并一次, 复制的行数随页数线性增长
+用本地构造的分页数据代替网络请求; 耗时比较需要 pytest --benchmark 才运行
+"""
+
+import datetime
+import time
+
+import pandas as pd
+import pytest
+
+from akshare.economic import macro_usa
+from akshare.stock_feature.stock_lhb_em import stock_lhb_detail_em
+from akshare.utils import datacenter
+from akshare.utils.datacenter import get_report_schema
+from akshare.utils.func import ChunkAccumulator
+
+
+class ConcatCounter:
+    """
+    记录 pd.concat 的调用次数和合并的总行数
+    """
+
+    def __init__(self, monkeypatch):
+        self.calls = 0
+        self.rows = 0
+        self._concat = pd.concat
+        monkeypatch.setattr(pd, "concat", self)
+
+    def __call__(self, objs, *args, **kwargs):
+        objs = list(objs)
+        self.calls += 1
+        self.rows += sum(len(obj) for obj in objs if obj is not None)
+        return self._concat(objs, *args, **kwargs)
+
+    def run(self, func, *args):
+        self.calls = self.rows = 0
+        result = func(*args)
+        return result, self.calls, self.rows
+
+
+def _assert_linear(monkeypatch, func, pages: int) -> None:
+    counter = ConcatCounter(monkeypatch)
+    small, small_calls, small_rows = counter.run(func, pages)
+    large, large_calls, large_rows = counter.run(func, pages * 2)
+    assert len(large) == 2 * len(small)
+    # 合并次数与页数无关, 每行只被复制常数次
+    assert large_calls == small_calls <= 2
+    assert large_rows <= 2 * len(large)
+
+
+def test_chunk_accumulator():
+    """
+    test chunks of frames, records and arrays give the same result as pd.concat
+    :return: None
+    :rtype: None
+    """
+    assert ChunkAccumulator().to_frame().empty
+    frames = [
+        pd.DataFrame({"a": range(i, i + 3), "b": list("xyz")}, index=[7, 8, 9])
+        for i in range(4)
+    ]
+    acc = ChunkAccumulator()
+    for frame in frames:
+        acc.append(frame)
+    acc.append(None)
+    assert len(acc) == 12
+    pd.testing.assert_frame_equal(acc.to_frame(), pd.concat(frames, ignore_index=True))
+    pd.testing.assert_frame_equal(acc.to_frame(ignore_index=False), pd.concat(frames))
+    records = ChunkAccumulator()
+    mixed = ChunkAccumulator()
+    for frame in frames:
+        records.append(frame.to_dict(orient="records"))
+        mixed.append(frame.to_dict(orient="list"))
+    pd.testing.assert_frame_equal(records.to_frame(), acc.to_frame())
+    pd.testing.assert_frame_equal(mixed.to_frame(), acc.to_frame())
+    # append 只保存引用, 不复制数据
+    assert all(chunk is frame for chunk, frame in zip(acc._chunks, frames))
+
+
+def test_jin10_macro_linear(monkeypatch):
+    """
+    test jin10 macro series paging back through max_date stays linear
+    :return: None
+    :rtype: None
+    """
+    page_size = 50
+
+    def run(pages: int) -> pd.DataFrame:
+        end = datetime.date(2024, 1, 1)
+        last = end - datetime.timedelta(days=pages * page_size)
+
+        class FakeResponse:
+            def __init__(self, params):
+                max_date = params["max_date"]
+                top = datetime.date.fromisoformat(max_date) if max_date else end
+                days = [top - datetime.timedelta(days=i) for i in range(page_size)]
+                self.values = [
+                    [day.isoformat(), i, None, i - 1]
+                    for i, day in enumerate(days)
+                    if day > last
+                ]
+
+            def json(self):
+                return {"data": {"values": self.values}}
+
+        monkeypatch.setattr(
+            macro_usa,
+            "request_get",
+            lambda url, params=None, **kwargs: FakeResponse(params),
+        )
+        return macro_usa.macro_usa_gdp_monthly()
+
+    temp_df = run(4)
+    assert len(temp_df) == 4 * page_size
+    assert temp_df["日期"].is_monotonic_increasing
+    _assert_linear(monkeypatch, run, pages=200)
+
+
+def test_lhb_multi_year_linear(monkeypatch):
+    """
+    test multi-year lhb detail download stays linear in the number of pages
+    :return: None
+    :rtype: None
+    """
+    fields = list(get_report_schema("stock_lhb_detail_em").columns) + [
+        "SECUCODE",
+        "SECURITY_TYPE_CODE",
+    ]
+    row = {field: 1.0 for field in fields}
+    row["TRADE_DATE"] = "2024-04-10 00:00:00"
+    page_size = 100
+
+    def run(pages: int) -> pd.DataFrame:
+        def fetch_page(url, params, timeout):
+            return {"pages": pages, "data": [dict(row) for _ in range(page_size)]}
+
+        monkeypatch.setattr(datacenter, "_fetch_page", fetch_page)
+        return stock_lhb_detail_em(start_date="20200101", end_date="20241231")
+
+    _assert_linear(monkeypatch, run, pages=200)
+
+
+def test_accumulator_single_concat(monkeypatch):
+    """
+    test one concat at the end instead of growing the frame page by page
+    :return: None
+    :rtype: None
+    """
+    frames = [pd.DataFrame({"a": range(1000), "b": 1.0, "c": "x"}) for _ in range(300)]
+    counter = ConcatCounter(monkeypatch)
+
+    def accumulated() -> pd.DataFrame:
+        big_chunks = ChunkAccumulator()
+        for frame in frames:
+            big_chunks.append(frame)
+        return big_chunks.to_frame()
+
+    result, calls, rows = counter.run(accumulated)
+    assert (calls, rows) == (1, 300 * 1000)
+    pd.testing.assert_frame_equal(result, counter._concat(frames, ignore_index=True))
+
+
+@pytest.mark.benchmark
+def test_accumulator_beats_iterative_concat():
+    """
+    test one concat at the end is faster than growing the frame page by page
+    :return: None
+    :rtype: None
+    """
+    frames = [pd.DataFrame({"a": range(1000), "b": 1.0, "c": "x"}) for _ in range(300)]
+
+    def iterative() -> pd.DataFrame:
+        big_df = pd.DataFrame()
+        for frame in frames:
+            big_df = pd.concat(objs=[big_df, frame], ignore_index=True)
+        return big_df
+
+    def accumulated() -> pd.DataFrame:
+        big_chunks = ChunkAccumulator()
+        for frame in frames:
+            big_chunks.append(frame)
+        return big_chunks.to_frame()
+
+    start = time.perf_counter()
+    expected = iterative()
+    iterative_time = time.perf_counter() - start
+    start = time.perf_counter()
+    result = accumulated()
+    accumulated_time = time.perf_counter() - start
+    pd.testing.assert_frame_equal(result, expected)
+    assert accumulated_time < iterative_time
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "--benchmark"])
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试按主机共享的熔断器: 限流或连接被重置时熔断, 超时后只放行一个探测请求, 拒绝的请求记录到 trace
+用本地构造的会话代替网络请求, 用可控的时钟(conftest.clock)代替真实时间
+"""
+
+import threading
+
+import pytest
+import requests
+
+from akshare.exceptions import CircuitOpenError, RateLimitError
+from akshare.futures import requests_fun
+from akshare.utils import rate_limit, trace
+from akshare.utils import request as ak_request
+
+URL = "https://quote.example.com/api/data"
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, headers: dict = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.encoding = "utf-8"
+        self.content = b""
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error", response=self)
+
+
+class FakeSession:
+    """
+    按顺序返回预设的结果, 异常类型直接抛出
+    """
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def request(self, method, url, **kwargs):
+        with self._lock:
+            self.calls += 1
+            outcome = self.outcomes.pop(0) if self.outcomes else 200
+        if isinstance(outcome, type) and issubclass(outcome, Exception):
+            raise outcome("connection reset by peer")
+        return (
+            FakeResponse(*outcome)
+            if isinstance(outcome, tuple)
+            else FakeResponse(outcome)
+        )
+
+
+@pytest.fixture
+def fake_session(monkeypatch, clock):
+    for name in ["_limiters", "_limit_config", "_breakers", "_breaker_config"]:
+        monkeypatch.setattr(rate_limit, name, {})
+    rate_limit.set_rate_limit(URL, rate=1000.0, capacity=1000.0)
+    rate_limit.set_circuit_breaker(URL, failure_threshold=3, recovery_timeout=30)
+
+    def install(outcomes):
+        session = FakeSession(outcomes)
+        monkeypatch.setattr(ak_request, "get_session", lambda: session)
+        return session
+
+    return install
+
+
+def test_breaker_opens_and_probes(fake_session, clock):
+    """
+    test consecutive 403/429/resets open the circuit, open circuits send nothing,
+    and a failed half-open probe doubles the wait
+    :return: None
+    :rtype: None
+    """
+    session = fake_session([403, 429, requests.ConnectionError, 200, 429, 200])
+    breaker = rate_limit.get_circuit_breaker(URL)
+    assert ak_request.request_get(URL).status_code == 403
+    assert ak_request.request_get(URL).status_code == 429
+    with pytest.raises(requests.ConnectionError):
+        ak_request.request_get(URL)
+    assert breaker.state == breaker.OPEN
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        ak_request.request_get(URL)
+    assert isinstance(exc_info.value, RateLimitError)
+    assert exc_info.value.host == "quote.example.com"
+    assert exc_info.value.retry_after == 30
+    assert session.calls == 3
+
+    clock.now += 30
+    # 只有一个探测请求能进入 half_open
+    assert breaker.allow_request()
+    assert breaker.state == breaker.HALF_OPEN
+    assert not breaker.allow_request()
+    breaker.release()
+    assert ak_request.request_get(URL).status_code == 200
+    assert breaker.state == breaker.CLOSED
+
+    # 探测失败后等待时间加倍
+    breaker.record_failure()
+    breaker.record_failure()
+    assert ak_request.request_get(URL).status_code == 429
+    clock.now += 30
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.retry_after() == 60
+    clock.now += 59
+    with pytest.raises(CircuitOpenError):
+        ak_request.request_get(URL)
+    clock.now += 1
+    assert ak_request.request_get(URL).status_code == 200
+    assert session.calls == 6
+
+
+def test_retry_after_and_retry_stop(fake_session, monkeypatch):
+    """
+    test a 429 with Retry-After opens the circuit at once for at least that long,
+    retry helpers stop instead of sleeping, and other hosts are unaffected
+    :return: None
+    :rtype: None
+    """
+    monkeypatch.setattr(ak_request.time, "sleep", lambda seconds: None)
+    session = fake_session([(429, {"Retry-After": "120"})])
+    with pytest.raises(CircuitOpenError) as exc_info:
+        ak_request.request_with_retry(URL, max_retries=5)
+    assert exc_info.value.retry_after > 100
+    assert session.calls == 1
+    assert rate_limit.get_circuit_breaker("other.example.com").state == "closed"
+
+    assert requests_fun.requests_link(URL) is None
+    assert session.calls == 1
+
+    # 5xx 不计入熔断
+    breaker = rate_limit.get_circuit_breaker("other.example.com")
+    for _ in range(10):
+        breaker.record_response(503)
+    assert breaker.state == breaker.CLOSED
+
+
+def test_rejection_traced(fake_session):
+    """
+    test requests rejected by an open circuit are recorded as failed request spans
+    :return: None
+    :rtype: None
+    """
+    fake_session([429, 429, 429])
+    with trace.TraceCollector() as collector:
+        for _ in range(3):
+            ak_request.request_get(URL)
+        with pytest.raises(CircuitOpenError):
+            ak_request.request_get(URL)
+    spans = [item for item in collector.spans if item.kind == "request"]
+    assert len(spans) == 4
+    assert [item.attributes["status"] for item in spans[:3]] == [429] * 3
+    assert spans[-1].attributes["error"] == "CircuitOpenError"
+    assert spans[-1].attributes["host"] == "quote.example.com"
+    assert "status" not in spans[-1].attributes
+    summary_df = collector.summary()
+    # 3 次 429 和 1 次熔断拒绝
+    assert summary_df["errors"].sum() == 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试 analysis/indices_dashboard 流水线的增量更新: 只获取新增的 K 线, 指标只重算尾部
+用本地构造的日线代替网络请求
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import akshare as ak
+from analysis.indices_dashboard import data, pipeline, plotter
+
+
+class FakeIndexDaily:
+    """
+    模拟 stock_zh_index_daily_em, 只返回 end 之前的数据, 并记录请求的 start_date
+    """
+
+    def __init__(self, n: int = 400):
+        rng = np.random.default_rng(0)
+        close = 3000 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+        self.df = pd.DataFrame(
+            {
+                "date": pd.bdate_range("2023-01-02", periods=n).strftime("%Y-%m-%d"),
+                "open": close * 0.99,
+                "close": close,
+                "high": close * 1.01,
+                "low": close * 0.98,
+                "volume": 1e6,
+                "amount": 1e9,
+            }
+        )
+        self.end = n - 5
+        self.calls = []
+
+    def __call__(self, symbol, start_date="19900101", end_date="20500101"):
+        self.calls.append((symbol, start_date))
+        temp_df = self.df.iloc[: self.end]
+        return temp_df[
+            temp_df["date"] >= pd.to_datetime(start_date).strftime("%Y-%m-%d")
+        ].copy()
+
+
+def test_incremental_update(monkeypatch, tmp_path):
+    """
+    test later runs fetch from the last cached bar, pick up a revised last bar,
+    and tail-recomputed indicators match a full recompute
+    :return: None
+    :rtype: None
+    """
+    fake = FakeIndexDaily()
+    monkeypatch.setattr(ak, "stock_zh_index_daily_em", fake, raising=False)
+    cache_dir = str(tmp_path)
+    kwargs = dict(ma_window=20, slope_confirmation_days=3)
+
+    history, first_new = pipeline.update_history("sh000001", cache_dir)
+    assert fake.calls == [("sh000001", "19900101")]
+    assert first_new == history.index[0]
+    pipeline.update_indicators("sh000001", history, first_new, cache_dir, **kwargs)
+
+    history, first_new = pipeline.update_history("sh000001", cache_dir)
+    assert first_new is None
+    assert fake.calls[-1] == ("sh000001", history.index[-1].strftime("%Y%m%d"))
+
+    # 盘中最后一根 K 线被修正, 并新增 5 根
+    last = fake.end - 1
+    fake.df.loc[last, "close"] = fake.df.loc[last, "close"] * 1.02
+    fake.end += 5
+    history, first_new = pipeline.update_history("sh000001", cache_dir)
+    assert len(history) == len(fake.df)
+    assert first_new == pd.Timestamp(fake.df.loc[last, "date"])
+    assert history["Close"].iloc[-6] == fake.df.loc[last, "close"]
+
+    compute_calls = []
+    compute = data.compute_indicators
+
+    def counting_compute(df, **kw):
+        compute_calls.append(len(df))
+        return compute(df, **kw)
+
+    monkeypatch.setattr(data, "compute_indicators", counting_compute)
+    result = pipeline.update_indicators(
+        "sh000001", history, first_new, cache_dir, **kwargs
+    )
+    assert compute_calls == [6 + data.indicator_lookback(**kwargs)]
+    expected = compute(history, **kwargs)
+    pd.testing.assert_frame_equal(result, expected, check_freq=False, rtol=1e-9)
+
+
+def test_run_pipeline(monkeypatch, tmp_path):
+    """
+    test the pipeline processes every index, renders reports and logs stage timings
+    :return: None
+    :rtype: None
+    """
+    fake = FakeIndexDaily()
+    monkeypatch.setattr(ak, "stock_zh_index_daily_em", fake, raising=False)
+    rendered = []
+    monkeypatch.setattr(
+        plotter,
+        "generate_report",
+        lambda hist_df, name, code, *args, **kwargs: rendered.append(
+            (code, len(hist_df))
+        ),
+    )
+    config = {
+        "settings": {
+            "start_date": "2024-01-01",
+            "enable_backtest": True,
+            "cache_dir": str(tmp_path),
+            "fetch_workers": 4,
+            "render_workers": 1,
+        },
+        "strategy": {
+            "ma_window": 20,
+            "slope_confirmation_days": 2,
+            "show_signal_logs": False,
+        },
+        "backtest": {},
+        "plot": {},
+    }
+    indices = [{"code": f"sh00000{i}", "name": f"指数{i}"} for i in range(5)]
+    timer = pipeline.run_pipeline(indices, config, str(tmp_path))
+    assert sorted(code for code, _ in rendered) == [idx["code"] for idx in indices]
+    summary = timer.summary().set_index("stage")
+    assert summary.index.tolist() == pipeline.STAGES
+    assert (summary["count"] == 5).all()
+
+    rendered.clear()
+    pipeline.run_pipeline(indices, config, str(tmp_path))
+    assert len(rendered) == 5
+    # 第二次运行时每个指数只从最后一个交易日开始获取
+    assert all(start != "19900101" for _, start in fake.calls[5:])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试东方财富数据中心客户端的分页合并和字段定义
+用本地构造的分页数据代替网络请求
+"""
+
+import pandas as pd
+
+from akshare.stock_feature.stock_lhb_em import stock_lhb_detail_em
+from akshare.utils import datacenter
+from akshare.utils.datacenter import (
+    ReportSchema,
+    apply_report_schema,
+    fetch_datacenter,
+    get_report_schema,
+)
+
+
+def _fake_pages(rows: list, page_size: int, calls: list):
+    pages = max(1, -(-len(rows) // page_size))
+
+    def fetch_page(url, params, timeout):
+        calls.append(dict(params))
+        page = int(params["pageNumber"])
+        return {
+            "pages": pages,
+            "data": rows[(page - 1) * page_size : page * page_size],
+        }
+
+    return fetch_page
+
+
+def test_fetch_datacenter(monkeypatch):
+    """
+    test pages are fetched once each and merged in page order
+    :return: None
+    :rtype: None
+    """
+    rows = [{"CODE": f"{i:06d}", "PRICE": "-" if i % 5 == 0 else i} for i in range(23)]
+    calls = []
+    monkeypatch.setattr(datacenter, "_fetch_page", _fake_pages(rows, 5, calls))
+    schema = ReportSchema(
+        columns={"CODE": "代码", "PRICE": "价格"},
+        output=["序号", "代码", "价格"],
+        dtypes=[("价格", "number")],
+    )
+    temp_df = fetch_datacenter({"reportName": "RPT_TEST", "pageNumber": "1"}, schema)
+    assert sorted(call["pageNumber"] for call in calls) == [1, 2, 3, 4, 5]
+    assert temp_df["代码"].tolist() == [row["CODE"] for row in rows]
+    assert temp_df["序号"].tolist() == list(range(1, 24))
+    assert temp_df["价格"].dtype == "float64" and temp_df["价格"].isna().sum() == 5
+    empty_df = apply_report_schema(pd.DataFrame(), schema)
+    assert empty_df.empty and list(empty_df.columns) == schema.output
+
+
+def test_stock_lhb_detail_em_schema(monkeypatch):
+    """
+    test lhb detail interface applies its registered schema
+    :return: None
+    :rtype: None
+    """
+    schema = get_report_schema("stock_lhb_detail_em")
+    fields = list(schema.columns) + ["SECUCODE", "SECURITY_TYPE_CODE"]
+    rows = [
+        {
+            field: ("2024-04-1%d 00:00:00" % (i % 10) if field == "TRADE_DATE" else i)
+            for field in fields
+        }
+        for i in range(12)
+    ]
+    monkeypatch.setattr(datacenter, "_fetch_page", _fake_pages(rows, 5, []))
+    temp_df = stock_lhb_detail_em(start_date="20240410", end_date="20240419")
+    assert list(temp_df.columns) == schema.output
+    assert len(temp_df) == 12
+    assert str(temp_df["上榜日"].iloc[1]) == "2024-04-11"
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试东方财富行情数据的 schema 解析
+与逐列调用 pd.to_numeric 的原有写法比较结果; 耗时和内存峰值的比较需要 pytest --benchmark 才运行
+直接运行本文件会额外比较 1000000 行数据
+"""
+
+import random
+import time
+import tracemalloc
+
+import pandas as pd
+import pytest
+
+from akshare.stock_feature import stock_hist_em
+from akshare.stock_feature.stock_hist_em import _A_SPOT_SCHEMA, _DAILY_KLINE_SCHEMA
+from akshare.utils.em_parse import coerce_columns, parse_klines
+
+
+def _klines(rows: int, seed: int = 0) -> list:
+    """
+    按东方财富日线格式生成的模拟数据
+    """
+    rng = random.Random(seed)
+    start = pd.Timestamp("1990-12-19")
+    lines = []
+    for i in range(rows):
+        close = rng.uniform(1, 3000)
+        fields = [
+            (start + pd.Timedelta(days=i % 20000)).strftime("%Y-%m-%d"),
+            f"{close * rng.uniform(0.9, 1.1):.2f}",
+            f"{close:.2f}",
+            f"{close * 1.1:.2f}",
+            f"{close * 0.9:.2f}",
+            str(rng.randint(0, 10**9)),
+            f"{rng.uniform(0, 1e11):.2f}",
+            f"{rng.uniform(0, 20):.2f}",
+            f"{rng.uniform(-10, 10):.2f}",
+            f"{rng.uniform(-50, 50):.2f}",
+            "-" if i % 97 == 0 else f"{rng.uniform(0, 30):.2f}",
+        ]
+        lines.append(",".join(fields))
+    return lines
+
+
+def _parse_klines_by_column(lines: list) -> pd.DataFrame:
+    """
+    原有写法: 先拆分为字符串二维列表, 再逐列转换类型
+    """
+    names = [name for name, _ in _DAILY_KLINE_SCHEMA]
+    temp_df = pd.DataFrame([item.split(",") for item in lines])
+    temp_df.columns = names
+    temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
+    for name in names[1:]:
+        temp_df[name] = pd.to_numeric(temp_df[name], errors="coerce")
+    return temp_df
+
+
+def _measure(func, *args) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def _benchmark(rows: int) -> dict:
+    lines = _klines(rows)
+    return {
+        "to_numeric": _measure(_parse_klines_by_column, lines),
+        "schema": _measure(parse_klines, lines, _DAILY_KLINE_SCHEMA),
+    }
+
+
+def test_parse_klines():
+    """
+    test schema parser returns the same frame as per-column coercion
+    :return: None
+    :rtype: None
+    """
+    lines = _klines(rows=2000)
+    lines.append("2024-01-02,-,1.5,x,2,3,4,5,6,7,8")
+    expected = _parse_klines_by_column(lines)
+    result = parse_klines(lines, _DAILY_KLINE_SCHEMA)
+    pd.testing.assert_frame_equal(result, expected)
+    assert parse_klines([], _DAILY_KLINE_SCHEMA).empty
+
+
+def test_coerce_columns():
+    """
+    test block coercion of diff frames
+    :return: None
+    :rtype: None
+    """
+    names = [name for name, _ in _A_SPOT_SCHEMA]
+    rows = [
+        {name: "-" if (i + j) % 7 == 0 else i * 1.5 + j for j, name in enumerate(names)}
+        for i in range(300)
+    ]
+    expected = pd.DataFrame(rows)
+    for name in names:
+        expected[name] = pd.to_numeric(expected[name], errors="coerce")
+    result = coerce_columns(pd.DataFrame(rows), _A_SPOT_SCHEMA)
+    pd.testing.assert_frame_equal(result, expected)
+    rows[0]["涨速"] = "abc"
+    assert pd.isna(coerce_columns(pd.DataFrame(rows), _A_SPOT_SCHEMA)["涨速"][0])
+
+
+def _coerce_by_column(df: pd.DataFrame, schema) -> pd.DataFrame:
+    """
+    原有写法: 逐列调用 pd.to_numeric
+    """
+    for name, _ in schema:
+        df[name] = pd.to_numeric(df[name], errors="coerce")
+    return df
+
+
+def test_spot_frames(monkeypatch):
+    """
+    test the B share and AB comparison frames match per-column coercion
+    :return: None
+    :rtype: None
+    """
+    b_fields = stock_hist_em._A_SPOT_PARAMS["fields"].split(",") + ["f19", "f26"]
+    ab_fields = "f201,f202,f203,f196,f200,f197,f152,f12,f13,f14,f1,f2,f4,f3,f199"
+    raw = {}
+    for host, fields in [
+        ("28.push2.eastmoney.com", b_fields),
+        ("push2.eastmoney.com", ab_fields.split(",")),
+    ]:
+        temp_df = pd.DataFrame(
+            [
+                {
+                    field: "-" if (i + j) % 7 == 0 else f"{1000 + i * 3 + j / 10}"
+                    for j, field in enumerate(fields)
+                }
+                for i in range(50)
+            ]
+        )
+        temp_df.insert(0, "index", range(1, 51))
+        raw[host] = temp_df
+    monkeypatch.setattr(
+        stock_hist_em,
+        "fetch_paginated_data",
+        lambda url, params: raw[url.split("/")[2]].copy(),
+    )
+    for func in [
+        stock_hist_em.stock_zh_b_spot_em,
+        stock_hist_em.stock_zh_ab_comparison_em,
+    ]:
+        result = func()
+        with monkeypatch.context() as patch:
+            patch.setattr(stock_hist_em, "coerce_columns", _coerce_by_column)
+            expected = func()
+        pd.testing.assert_frame_equal(result, expected)
+        assert result.iloc[:, 3:].isna().any().any()
+
+
+@pytest.mark.benchmark
+def test_parse_klines_speed():
+    """
+    benchmark schema parser against per-column coercion on 10000 rows
+    :return: None
+    :rtype: None
+    """
+    _benchmark(rows=1000)
+    result = _benchmark(rows=10000)
+    print(f"klines 10000 rows (seconds, peak bytes): {result}")
+    assert result["schema"][0] < result["to_numeric"][0]
+    assert result["schema"][1] < result["to_numeric"][1]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "--benchmark"])
+    for n in (10000, 1000000):
+        print(n, _benchmark(rows=n))
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试期货交易所日交易数据的批量下载, 分区存储, 断点续传和只追加写入的检查点
+用本地构造的数据代替网络请求
+"""
+
+import threading
+
+import pandas as pd
+import pytest
+
+from akshare.futures import cons, futures_daily_bar, futures_daily_store
+from akshare.futures.futures_daily_store import (
+    futures_daily_store_path,
+    get_futures_daily_bulk,
+)
+from akshare.utils.store import Checkpoint
+
+
+def test_bulk_resume(monkeypatch, tmp_path):
+    """
+    test only trading days are fetched, partitions are written and a rerun
+    fetches only the days that failed
+    :return: None
+    :rtype: None
+    """
+    calls = []
+    lock = threading.Lock()
+    failing = {("DCE", "20240104")}
+
+    def make_func(market):
+        def func(date):
+            with lock:
+                calls.append((market, date))
+            if (market, date) in failing:
+                raise ConnectionError("reset")
+            if market == "GFEX":
+                return pd.DataFrame()
+            return pd.DataFrame(
+                {
+                    "symbol": [f"{market}2405", f"{market}efp"],
+                    "date": [date, date],
+                    "close": [1.0, 2.0],
+                }
+            )
+
+        return func
+
+    for market in ["CFFEX", "DCE", "GFEX"]:
+        monkeypatch.setitem(futures_daily_bar._MARKET_FUNC, market, make_func(market))
+    # 数据开始日期之前的空数据视为完成
+    monkeypatch.setitem(futures_daily_store.EXCHANGE_DATA_START, "GFEX", "20250101")
+    kwargs = dict(
+        start_date="20240101",
+        end_date="20240107",
+        market=["CFFEX", "DCE", "GFEX"],
+        store_dir=str(tmp_path),
+        retries=0,
+    )
+    with pytest.warns(UserWarning):
+        first_df = get_futures_daily_bulk(**kwargs)
+    trading_days = ["20240102", "20240103", "20240104", "20240105"]
+    assert sorted(calls) == sorted(
+        (market, date) for market in ["CFFEX", "DCE", "GFEX"] for date in trading_days
+    )
+    assert list(first_df.attrs["errors"]) == [("DCE", "20240104")]
+    assert len(first_df) == 7
+    assert not first_df["symbol"].str.contains("efp").any()
+    stored_df = pd.read_parquet(
+        futures_daily_store_path("CFFEX", "20240103", str(tmp_path))
+    )
+    assert stored_df["symbol"].tolist() == ["CFFEX2405"]
+
+    calls.clear()
+    failing.clear()
+    second_df = get_futures_daily_bulk(**kwargs)
+    assert calls == [("DCE", "20240104")]
+    assert second_df.attrs["errors"] == {}
+    assert len(second_df) == 8
+    assert second_df.iloc[4]["symbol"] == "DCE2405"
+
+
+def test_checkpoint_append_only(tmp_path):
+    """
+    test each key is appended as one line and a torn last line is ignored on load
+    :return: None
+    :rtype: None
+    """
+    path = tmp_path / "checkpoint.jsonl"
+    checkpoint = Checkpoint(str(path))
+    for i in range(1000):
+        checkpoint.mark("DCE" if i % 2 else "SHFE", f"{i:08d}")
+    checkpoint.mark("DCE", "00000001")
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 1000
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('["DCE", "2024')
+    reloaded = Checkpoint(str(path))
+    assert reloaded.done == checkpoint.done
+    assert reloaded.is_done("DCE", "00000999")
+    assert not reloaded.is_done("SHFE", "00000999")
+
+
+def test_unpublished_days_not_checkpointed(monkeypatch, tmp_path):
+    """
+    test empty days from the latest data date on are fetched again on the next run
+    :return: None
+    :rtype: None
+    """
+    calls = []
+
+    def func(date):
+        calls.append(date)
+        if date < "20240104":
+            return pd.DataFrame({"symbol": ["IF2401"], "date": [date], "close": [1.0]})
+        return pd.DataFrame()
+
+    monkeypatch.setitem(futures_daily_bar._MARKET_FUNC, "CFFEX", func)
+    monkeypatch.setattr(cons, "get_latest_data_date", lambda day: "20240104")
+    kwargs = dict(
+        start_date="20240101",
+        end_date="20240107",
+        market="CFFEX",
+        store_dir=str(tmp_path),
+        max_workers=1,
+    )
+    assert len(get_futures_daily_bulk(**kwargs)) == 2
+    calls.clear()
+    get_futures_daily_bulk(**kwargs)
+    assert sorted(calls) == ["20240104", "20240105"]
+
+
+def test_empty_historical_day_refetched(monkeypatch, tmp_path):
+    """
+    test an empty historical trading day after the exchange data start is
+    reported as an error and fetched again on the next run
+    :return: None
+    :rtype: None
+    """
+    calls = []
+    empty_days = {"20240103"}
+
+    def func(date):
+        calls.append(date)
+        if date in empty_days:
+            return pd.DataFrame()
+        return pd.DataFrame({"symbol": ["IF2401"], "date": [date], "close": [1.0]})
+
+    monkeypatch.setitem(futures_daily_bar._MARKET_FUNC, "CFFEX", func)
+    kwargs = dict(
+        start_date="20240101",
+        end_date="20240105",
+        market="CFFEX",
+        store_dir=str(tmp_path),
+        max_workers=1,
+        retries=1,
+        retry_delay=0,
+    )
+    with pytest.warns(UserWarning):
+        first_df = get_futures_daily_bulk(**kwargs)
+    assert list(first_df.attrs["errors"]) == [("CFFEX", "20240103")]
+    assert calls.count("20240103") == 2
+    assert len(first_df) == 3
+    calls.clear()
+    empty_days.clear()
+    second_df = get_futures_daily_bulk(**kwargs)
+    assert calls == ["20240103"]
+    assert second_df.attrs["errors"] == {}
+    assert len(second_df) == 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试沪深京 A 股历史行情的本地增量同步: 首次下载, 只追加新 K 线, 前复权改写后全量重新下载
+用本地构造的东方财富 klines 响应代替网络请求
+"""
+
+import pandas as pd
+import pytest
+
+from akshare.stock_feature import stock_hist_em, stock_hist_store
+
+
+class FakeResponse:
+    def __init__(self, payload: dict):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+class FakeKlineServer:
+    """
+    模拟东方财富日线接口, 只返回 end 之前的 K 线, 并记录每次请求的 beg
+    """
+
+    def __init__(self, n: int = 30):
+        self.dates = pd.bdate_range("2024-01-02", periods=n).strftime("%Y-%m-%d")
+        self.close = [10.0 + i * 0.1 for i in range(n)]
+        self.end = n - 5
+        self.begs = []
+
+    def __call__(self, url, params=None, **kwargs):
+        self.begs.append(params["beg"])
+        beg = pd.to_datetime(params["beg"]).strftime("%Y-%m-%d")
+        klines = [
+            f"{day},{close - 0.1:.2f},{close:.2f},{close + 0.2:.2f},{close - 0.2:.2f},"
+            f"1000,10000.0,1.0,0.5,0.05,0.3"
+            for day, close in zip(self.dates[: self.end], self.close[: self.end])
+            if day >= beg
+        ]
+        return FakeResponse({"data": {"code": params["secid"], "klines": klines}})
+
+
+@pytest.fixture
+def server(monkeypatch):
+    fake = FakeKlineServer()
+    monkeypatch.setattr(stock_hist_em, "request_get", fake)
+    return fake
+
+
+def test_hist_sync(server, tmp_path):
+    """
+    test the first sync stores everything, later syncs only fetch from the
+    second-to-last stored bar, and a rewritten overlap triggers a full download
+    :return: None
+    :rtype: None
+    """
+    kwargs = dict(symbol="600000", adjust="qfq", store_dir=str(tmp_path))
+    path = stock_hist_store.stock_zh_a_hist_store_path(
+        symbol="600000", adjust="qfq", store_dir=str(tmp_path)
+    )
+
+    first_df = stock_hist_store.stock_zh_a_hist_sync(**kwargs)
+    assert server.begs == ["19700101"]
+    assert len(first_df) == 25
+    assert len(pd.read_parquet(path)) == 25
+
+    # 只追加: 从倒数第二根 K 线开始请求
+    server.end += 5
+    append_df = stock_hist_store.stock_zh_a_hist_sync(**kwargs)
+    assert server.begs[-1] == server.dates[23].replace("-", "")
+    assert len(append_df) == 30
+    assert append_df["收盘"].tolist() == pytest.approx(server.close)
+    pd.testing.assert_frame_equal(pd.read_parquet(path), append_df)
+
+    # 除权除息后前复权价格整体改写, 重叠的 K 线价格变化, 重新下载全部历史
+    server.close = [close * 0.9 for close in server.close]
+    rewritten_df = stock_hist_store.stock_zh_a_hist_sync(**kwargs)
+    assert server.begs[-2:] == [server.dates[28].replace("-", ""), "19700101"]
+    assert rewritten_df["收盘"].tolist() == pytest.approx(
+        [round(close, 2) for close in server.close]
+    )
+    pd.testing.assert_frame_equal(pd.read_parquet(path), rewritten_df)
+
+    # 日期过滤只作用于返回值, 本地文件仍是全部历史
+    window_df = stock_hist_store.stock_zh_a_hist_sync(
+        start_date="20240110", end_date="20240115", **kwargs
+    )
+    assert window_df["日期"].astype(str).tolist() == [
+        "2024-01-10",
+        "2024-01-11",
+        "2024-01-12",
+        "2024-01-15",
+    ]
+    assert len(pd.read_parquet(path)) == 30
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
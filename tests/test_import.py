@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试 import akshare 的启动耗时、内存占用以及惰性导入注册表
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import akshare
+
+IMPORT_TIME_BUDGET = 0.5  # 秒
+IMPORT_MEMORY_BUDGET = 20 * 1024 * 1024  # 字节
+
+_BENCHMARK_CODE = """
+import json
+import sys
+import time
+import tracemalloc
+
+tracemalloc.start()
+start = time.perf_counter()
+import akshare
+elapsed = time.perf_counter() - start
+peak = tracemalloc.get_traced_memory()[1]
+heavy = [name for name in ("pandas", "py_mini_racer", "bs4", "lxml") if name in sys.modules]
+print(json.dumps({"elapsed": elapsed, "peak": peak, "heavy": heavy}))
+"""
+
+
+def _cold_import_stats() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _BENCHMARK_CODE],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def test_import_is_lazy():
+    """
+    test a cold import akshare does not load the heavy dependencies
+    :return: None
+    :rtype: None
+    """
+    assert _cold_import_stats()["heavy"] == []
+
+
+@pytest.mark.benchmark
+def test_import_budget():
+    """
+    test import time and memory of a cold import akshare
+    :return: None
+    :rtype: None
+    """
+    stats = _cold_import_stats()
+    assert stats["elapsed"] < IMPORT_TIME_BUDGET
+    assert stats["peak"] < IMPORT_MEMORY_BUDGET
+
+
+def test_lazy_registry():
+    """
+    test every registered interface can be resolved
+    :return: None
+    :rtype: None
+    """
+    for name in akshare._LAZY_IMPORTS:
+        assert callable(getattr(akshare, name))
+    assert "stock_zh_a_hist" in dir(akshare)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "--benchmark"])
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试滚动指标的批量计算与增量计算
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from akshare.utils.indicator import (
+    IndicatorState,
+    ma_slope,
+    rolling_indicators,
+    rolling_mean,
+)
+
+
+def _close(shape=(600, 4), seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    close = 3000 * np.exp(np.cumsum(rng.normal(0, 0.01, shape), axis=0))
+    # 第 2 个标的晚上市, 第 3 个标的中间停牌一天
+    close[:100, 1] = np.nan
+    close[300, 2] = np.nan
+    return close
+
+
+def test_batch_matches_pandas():
+    """
+    test rolling mean, slope and signals against the pandas formulation
+    :return: None
+    :rtype: None
+    """
+    close_df = pd.DataFrame(_close())
+    for window in [5, 20, 120]:
+        expected = close_df.rolling(window).mean()
+        result = rolling_mean(close_df, window)
+        pd.testing.assert_frame_equal(result, expected, rtol=1e-9)
+        pd.testing.assert_frame_equal(
+            ma_slope(close_df, window), expected.diff(), rtol=1e-6, atol=1e-9
+        )
+    assert np.isnan(rolling_mean(np.arange(3.0), 5)).all()
+
+    indicators = rolling_indicators(close_df, windows=[20, 60], confirm_days=3)
+    slope = close_df.rolling(20).mean().diff()
+    expected_signal = pd.DataFrame(0, index=close_df.index, columns=close_df.columns)
+    expected_signal[slope.rolling(3).min() > 0] = 1
+    expected_signal[slope < 0] = -1
+    assert (indicators["Signal"] == expected_signal).all().all()
+    pd.testing.assert_frame_equal(
+        indicators["BIAS60"],
+        (close_df - close_df.rolling(60).mean()) / close_df.rolling(60).mean() * 100,
+        rtol=1e-9,
+    )
+    assert list(indicators) == [
+        "MA20",
+        "BIAS20",
+        "MA60",
+        "BIAS60",
+        "MA_Slope",
+        "Slope_Prev",
+        "Signal",
+    ]
+    series_result = rolling_indicators(close_df[0])
+    assert isinstance(series_result["MA120"], pd.Series)
+
+
+@pytest.mark.parametrize("column", [0, 1, 2])
+def test_state_matches_batch(column):
+    """
+    test O(1) updates reproduce the batch results bar by bar
+    :return: None
+    :rtype: None
+    """
+    close = _close()[:, column]
+    batch = rolling_indicators(close, confirm_days=2)
+    state = IndicatorState(confirm_days=2)
+    rows = [state.update(value) for value in close]
+    for key, expected in batch.items():
+        result = np.array([row[key] for row in rows])
+        if key in ("MA_Slope", "Slope_Prev", "Signal"):
+            np.testing.assert_array_equal(result, expected)
+        else:
+            np.testing.assert_allclose(result, expected, rtol=1e-9)
+
+    # 只用最近 max(windows) + 1 根 K 线预热即可
+    warm = IndicatorState.from_history(close[-122:-1], confirm_days=2)
+    last = warm.update(close[-1])
+    assert last["MA_Slope"] == rows[-1]["MA_Slope"]
+    assert last["Signal"] == rows[-1]["Signal"]
+    assert last["MA120"] == pytest.approx(rows[-1]["MA120"], rel=1e-12)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
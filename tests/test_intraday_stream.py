@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试东方财富分时数据推送的增量输出, 断线重连, Parquet 分片的续写和跨日
+用本地构造的 SSE 事件代替网络请求
+"""
+
+import json
+
+import pandas as pd
+import requests
+
+from akshare.stock import stock_intraday_em as intraday
+
+
+def _event(details: list, full: int) -> str:
+    return "data: " + json.dumps({"full": full, "data": {"details": details}}) + "\n"
+
+
+def _ticks(count: int, minute: int = 30) -> list:
+    return [f"09:{minute}:{i:02d},10.{i},{i + 1},0,2" for i in range(count)]
+
+
+def _run_stream(monkeypatch, tmp_path, event_stream) -> list:
+    monkeypatch.setattr(intraday, "_event_stream", event_stream)
+    stream = intraday.stock_intraday_em_stream(
+        symbol="000001", spill_dir=str(tmp_path), reconnect_delay=0, max_reconnects=0
+    )
+    return list(stream)
+
+
+def test_stream_reconnect_and_spill(monkeypatch, tmp_path):
+    """
+    test ticks are emitted once across a reconnect and spilled to parquet
+    :return: None
+    :rtype: None
+    """
+    ticks = [f"09:30:0{i},10.{i},{i + 1},0,{2 if i % 2 else 1}" for i in range(6)]
+    connections = []
+
+    def event_stream(url, params, timeout=None, on_open=None):
+        connections.append(params["secid"])
+        if len(connections) == 1:
+            yield _event(ticks[:3], full=1)
+            yield _event([], full=0)
+            yield _event(ticks[3:5], full=0)
+            raise requests.ConnectionError("reset")
+        yield _event(ticks, full=1)
+
+    monkeypatch.setattr(intraday, "_event_stream", event_stream)
+    stream = intraday.stock_intraday_em_stream(
+        symbol="000001",
+        buffer_size=4,
+        spill_dir=str(tmp_path),
+        reconnect_delay=0,
+        max_reconnects=1,
+    )
+    batches = list(stream)
+    assert connections == ["0.000001"] * 3
+    assert [len(batch) for batch in batches] == [3, 2, 1]
+    big_df = pd.concat(batches, ignore_index=True)
+    assert big_df["时间"].tolist() == [tick.split(",")[0] for tick in ticks]
+    assert big_df["代码"].unique().tolist() == ["000001"]
+    assert big_df["买卖盘性质"].tolist()[:2] == ["卖盘", "买盘"]
+    assert stream.positions == {"0.000001": 6}
+    assert stream.buffer()["时间"].tolist() == big_df["时间"].tolist()[-4:]
+    spill_df = pd.read_parquet(next(tmp_path.rglob("0.000001")))
+    pd.testing.assert_frame_equal(spill_df, big_df)
+
+
+def test_stream_resume_from_spill(monkeypatch, tmp_path):
+    """
+    test a restarted stream skips the ticks already spilled for the day
+    :return: None
+    :rtype: None
+    """
+    ticks = _ticks(6)
+    monkeypatch.setattr(intraday, "_trade_date", lambda: "20261016")
+
+    def first(url, params, timeout=None, on_open=None):
+        yield _event(ticks[:4], full=1)
+
+    def second(url, params, timeout=None, on_open=None):
+        yield _event(ticks, full=1)
+
+    assert [len(batch) for batch in _run_stream(monkeypatch, tmp_path, first)] == [4]
+    batches = _run_stream(monkeypatch, tmp_path, second)
+    assert [batch["时间"].tolist() for batch in batches] == [
+        [tick.split(",")[0] for tick in ticks[4:]]
+    ]
+    spill_path = tmp_path / "stock_intraday_em" / "20261016" / "0.000001"
+    assert len(list(spill_path.glob("part-*.parquet"))) == 2
+    spill_df = pd.read_parquet(spill_path)
+    assert spill_df["时间"].tolist() == [tick.split(",")[0] for tick in ticks]
+
+
+def test_stream_spill_rollover(monkeypatch, tmp_path):
+    """
+    test ticks after a trading day rollover are spilled under the new date
+    :return: None
+    :rtype: None
+    """
+    trade_date = ["20261015"]
+    monkeypatch.setattr(intraday, "_trade_date", lambda: trade_date[0])
+
+    def event_stream(url, params, timeout=None, on_open=None):
+        yield _event(_ticks(3), full=1)
+        yield _event(_ticks(1, minute=59), full=0)
+        trade_date[0] = "20261016"
+        yield _event(_ticks(2, minute=25), full=1)
+
+    batches = _run_stream(monkeypatch, tmp_path, event_stream)
+    assert [len(batch) for batch in batches] == [3, 1, 2]
+    root = tmp_path / "stock_intraday_em"
+    assert sorted(path.name for path in root.iterdir()) == ["20261015", "20261016"]
+    assert len(pd.read_parquet(root / "20261015" / "0.000001")) == 4
+    new_day_df = pd.read_parquet(root / "20261016" / "0.000001")
+    assert new_day_df["时间"].tolist() == ["09:25:00", "09:25:01"]
+
+
+def test_stream_short_full_snapshot(monkeypatch, tmp_path):
+    """
+    test a short or capped full snapshot on reconnect does not re-emit delivered ticks
+    :return: None
+    :rtype: None
+    """
+    monkeypatch.setattr(intraday, "_trade_date", lambda: "20261016")
+    ticks = _ticks(6) + ["09:31:00,11.0,1,0,2"] * 3
+    connections = []
+
+    def event_stream(url, params, timeout=None, on_open=None):
+        connections.append(params["secid"])
+        if len(connections) == 1:
+            yield _event(ticks[:7], full=1)
+            raise requests.ConnectionError("reset")
+        if len(connections) == 2:
+            # 服务端返回的全量明细比已输出的少
+            yield _event(ticks[:4], full=1)
+            raise requests.ConnectionError("reset")
+        # 只包含最近部分成交的全量明细, 同一秒内的成交按笔数跳过
+        yield _event(ticks[5:], full=1)
+
+    monkeypatch.setattr(intraday, "_event_stream", event_stream)
+    stream = intraday.stock_intraday_em_stream(
+        symbol="000001", spill_dir=str(tmp_path), reconnect_delay=0, max_reconnects=2
+    )
+    batches = list(stream)
+    assert [len(batch) for batch in batches] == [7, 2]
+    assert stream.positions == {"0.000001": 9}
+    spill_df = pd.read_parquet(tmp_path / "stock_intraday_em" / "20261016" / "0.000001")
+    assert spill_df["时间"].tolist() == [tick.split(",")[0] for tick in ticks]
+
+    def restart(url, params, timeout=None, on_open=None):
+        yield _event(ticks[6:] + ["09:31:01,11.1,1,0,1"], full=1)
+
+    batches = _run_stream(monkeypatch, tmp_path, restart)
+    assert [batch["时间"].tolist() for batch in batches] == [["09:31:01"]]
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
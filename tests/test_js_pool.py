@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试 JS 执行环境池: 实例复用, 并发使用的实例数不超过上限, 出错的实例不再放回池中
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from py_mini_racer import py_mini_racer
+
+from akshare.utils.js_pool import JSContextPool, get_js_pool
+
+_SCRIPT = "var counter = 0; function inc() { counter += 1; return counter; }"
+
+
+class CountingPool(JSContextPool):
+    """
+    记录创建的实例
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.contexts = []
+
+    def _create(self):
+        ctx = super()._create()
+        self.contexts.append(ctx)
+        return ctx
+
+
+def test_context_reuse():
+    """
+    test the script is compiled once and the same instance is reused
+    :return: None
+    :rtype: None
+    """
+    pool = CountingPool(_SCRIPT, max_size=4)
+    assert [pool.call("inc") for _ in range(5)] == [1, 2, 3, 4, 5]
+    assert len(pool.contexts) == 1
+    assert pool.eval("counter * 2") == 10
+    assert get_js_pool(_SCRIPT) is get_js_pool(_SCRIPT)
+
+
+def test_concurrent_checkout_bounded():
+    """
+    test concurrent users never hold more than max_size instances at once
+    :return: None
+    :rtype: None
+    """
+    pool = CountingPool(_SCRIPT, max_size=3)
+    lock = threading.Lock()
+    state = {"in_use": 0, "max_in_use": 0}
+
+    def work(_):
+        with pool.context() as ctx:
+            with lock:
+                state["in_use"] += 1
+                state["max_in_use"] = max(state["max_in_use"], state["in_use"])
+            time.sleep(0.01)
+            result = ctx.call("inc")
+            with lock:
+                state["in_use"] -= 1
+        return result
+
+    with ThreadPoolExecutor(max_workers=12) as executor:
+        results = list(executor.map(work, range(48)))
+    assert len(results) == 48
+    assert len(pool.contexts) == 3
+    assert state["max_in_use"] == 3
+    # 每个实例的计数器各自递增, 合计正好是调用次数
+    assert sum(ctx.eval("counter") for ctx in pool.contexts) == 48
+
+
+def test_failed_context_discarded():
+    """
+    test an instance that raised is dropped and replaced, including for a
+    thread already waiting on a full pool
+    :return: None
+    :rtype: None
+    """
+    pool = CountingPool(_SCRIPT, max_size=1)
+    assert pool.call("inc") == 1
+    with pytest.raises(py_mini_racer.MiniRacerBaseException):
+        pool.eval("counter = 100; throw new Error('half done')")
+    # 新实例重新加载代码, 不会看到出错前改了一半的状态
+    assert pool.call("inc") == 1
+    assert len(pool.contexts) == 2
+
+    entered = threading.Event()
+    waiter_result = []
+
+    def fail():
+        with pytest.raises(RuntimeError):
+            with pool.context():
+                entered.set()
+                time.sleep(0.05)
+                raise RuntimeError("decode failed")
+
+    def wait():
+        entered.wait()
+        waiter_result.append(pool.call("inc"))
+
+    threads = [threading.Thread(target=fail), threading.Thread(target=wait)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert waiter_result == [1]
+    assert len(pool.contexts) == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
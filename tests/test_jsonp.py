@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试宽松 JSON 与 JSONP 解析
+tests/data/jsonp_fixtures.json 按新浪财经和腾讯财经各接口的返回格式整理, 期望结果由 demjson.decode 解析截取后的值得到;
+大数据量时的结果与 demjson 一致; 与 demjson 比较耗时需要 pytest --benchmark,
+直接运行本文件会额外比较 2000 行数据 (demjson 需要数十秒)
+"""
+
+import json
+import pathlib
+import random
+import time
+
+import pytest
+
+from akshare.utils import demjson
+from akshare.utils.jsonp import loads, loads_jsonp, normalize_loose_json
+
+FIXTURE_PATH = pathlib.Path(__file__).parent / "data" / "jsonp_fixtures.json"
+
+
+def _market_center_payload(rows: int, seed: int = 0) -> str:
+    """
+    按新浪财经行情中心格式生成的模拟数据: JSONP 包裹, 键没有引号
+    """
+    rng = random.Random(seed)
+    items = []
+    for i in range(rows):
+        price = rng.uniform(1, 500)
+        items.append(
+            f'{{symbol:"sh{600000 + i}",code:"{600000 + i}",name:"股票{i}",'
+            f'trade:"{price:.3f}",pricechange:{rng.uniform(-5, 5):.3f},'
+            f'changepercent:{rng.uniform(-10, 10):.3f},ticktime:"15:00:00",'
+            f"per:{rng.uniform(0, 100):.2f},mktcap:{rng.uniform(1e5, 1e9):.4f}}}"
+        )
+    return (
+        "/*<script>location.href='//sina.com';</script>*/\n"
+        f"IO.XSRV2.CallbackList['abc']([{','.join(items)}]);"
+    )
+
+
+def test_fixtures():
+    """
+    test recorded response formats decode to the same result as demjson
+    :return: None
+    :rtype: None
+    """
+    with open(FIXTURE_PATH, encoding="utf-8") as f:
+        fixtures = json.load(f)
+    for fixture in fixtures:
+        assert loads_jsonp(fixture["payload"]) == fixture["expected"], fixture["name"]
+
+
+def test_loose_syntax():
+    """
+    test relaxed keys, single quotes, trailing commas and strings are kept intact
+    :return: None
+    :rtype: None
+    """
+    text = "{a:1, 'b':'it\\'s \"x\"', c:\"k:v, }\", d:[1, 2,], e:undefined, /* x */}"
+    assert normalize_loose_json(text) == (
+        '{"a":1, "b":"it\'s \\"x\\"", "c":"k:v, }", "d":[1, 2], "e":null }'
+    )
+    assert loads(text) == {
+        "a": 1,
+        "b": 'it\'s "x"',
+        "c": "k:v, }",
+        "d": [1, 2],
+        "e": None,
+    }
+    assert loads('["a=b", 1]') == ["a=b", 1]
+    assert loads_jsonp('["a=b", 1]') == ["a=b", 1]
+    # 转换后仍不是标准 JSON 时交给 demjson
+    assert loads("{1: 'a'}") == demjson.decode("{1: 'a'}")
+
+
+def test_large_payload_parity():
+    """
+    test the fast path on a large loose payload gives the same result as demjson
+    :return: None
+    :rtype: None
+    """
+    payload = _market_center_payload(200)
+    expected = demjson.decode(payload[payload.find("([") + 1 : payload.rfind("]") + 1])
+    assert loads_jsonp(payload) == expected
+
+
+@pytest.mark.benchmark
+def test_faster_than_demjson(rows: int = 200):
+    """
+    test the fast path on a large loose payload is faster than demjson
+    :return: None
+    :rtype: None
+    """
+    payload = _market_center_payload(rows)
+    start = time.perf_counter()
+    result = loads_jsonp(payload)
+    fast_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = demjson.decode(payload[payload.find("([") + 1 : payload.rfind("]") + 1])
+    demjson_seconds = time.perf_counter() - start
+    assert result == expected
+    print(f"{rows} rows: jsonp {fast_seconds:.4f}s, demjson {demjson_seconds:.4f}s")
+    assert fast_seconds * 10 < demjson_seconds
+
+
+if __name__ == "__main__":
+    test_fixtures()
+    test_loose_syntax()
+    test_faster_than_demjson(rows=2000)
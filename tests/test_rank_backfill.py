@@ -0,0 +1,246 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试会员持仓排名合计的向量化计算及其与逐合约循环计算的一致性, 以及批量下载的断点续传
+用本地构造的排名表代替网络请求
+"""
+
+import threading
+
+import pandas as pd
+import pytest
+
+from akshare.futures import cons, cot
+from akshare.futures.cot_store import futures_rank_store_path, get_rank_sum_backfill
+
+
+def _rank_table(symbol: str, size: int = 25, as_text: bool = False) -> pd.DataFrame:
+    temp_df = pd.DataFrame(
+        {
+            "rank": range(1, size + 1),
+            "vol_party_name": [f"会员{i}" for i in range(size)],
+            "vol": [1000 * (size - i) for i in range(size)],
+            "vol_chg": [i - 10 for i in range(size)],
+            "long_party_name": [f"会员{i}" for i in range(size)],
+            "long_open_interest": [500 + i for i in range(size)],
+            "long_open_interest_chg": [1] * size,
+            "short_party_name": [f"会员{i}" for i in range(size)],
+            "short_open_interest": [300 - i for i in range(size)],
+            "short_open_interest_chg": [-1] * size,
+            "symbol": symbol,
+        }
+    )
+    if as_text:
+        # 郑商所的数值是带千分位的文本, 缺失值为 "-"
+        for col in cot.intColumns:
+            temp_df[col] = temp_df[col].map(lambda x: f"{x:,}")
+        temp_df.loc[3, "vol_chg"] = "-"
+        temp_df["rank"] = temp_df["rank"].astype(str)
+    return temp_df
+
+
+def test_rank_sum_frame():
+    """
+    test top-n sums per contract and the variety rows added for DCE/SHFE/CFFEX
+    :return: None
+    :rtype: None
+    """
+    tables = [
+        _rank_table("RB2405"),
+        _rank_table("RB2410", size=8),
+        _rank_table("SR405", as_text=True),
+        _rank_table("XX2405"),
+    ]
+    long_df = cot._rank_long_frame(tables)
+    long_df["date"] = "20240102"
+    records = cot._rank_sum_frame(long_df, ["RB", "SR"])
+    assert records["symbol"].tolist() == ["RB2405", "RB2410", "SR405", "RB"]
+    row = records.set_index("symbol").loc["RB2405"]
+    assert row["vol_top5"] == sum(1000 * (25 - i) for i in range(5))
+    assert row["short_open_interest_top20"] == sum(300 - i for i in range(20))
+    assert records.set_index("symbol").loc["RB2410", "vol_top15"] == sum(
+        1000 * (8 - i) for i in range(8)
+    )
+    assert records.set_index("symbol").loc["SR405", "vol_chg_top5"] == sum(
+        i - 10 for i in range(5) if i != 3
+    )
+    variety_row = records.set_index("symbol").loc["RB"]
+    assert variety_row["variety"] == "RB"
+    assert variety_row["vol_top10"] == (
+        records.set_index("symbol").loc[["RB2405", "RB2410"], "vol_top10"].sum()
+    )
+    assert (records["date"] == "20240102").all()
+
+
+def _nested_loop_rank_sum(big_dict: dict, vars_list: list, date: str) -> pd.DataFrame:
+    # 向量化之前 get_rank_sum 逐合约筛选和加总的实现
+    czce_var = [i for i in vars_list if i in cons.market_exchange_symbols["czce"]]
+    records = pd.DataFrame()
+    for table in big_dict.values():
+        table = table.map(lambda x: 0 if x == "" else x)
+        for symbol_inner in set(table["symbol"]):
+            var = cot.symbol_varieties(symbol_inner)
+            if var not in vars_list:
+                continue
+            if var in czce_var:
+                for col in [
+                    item for item in table.columns if item.find("open_interest") > -1
+                ] + ["vol", "vol_chg"]:
+                    table[col] = [
+                        float(value.replace(",", "")) if value != "-" else 0.0
+                        for value in table[col]
+                    ]
+            table_cut = table[table["symbol"] == symbol_inner].copy()
+            table_cut["rank"] = table_cut["rank"].astype("float")
+            row = {"symbol": symbol_inner, "variety": var}
+            for top in (5, 10, 15, 20):
+                table_cut_top = table_cut[table_cut["rank"] <= top]
+                for col in cot.intColumns:
+                    row[f"{col}_top{top}"] = table_cut_top[col].sum()
+            row["date"] = date
+            records = pd.concat([records, pd.DataFrame(row, index=[0])])
+    add_vars = [
+        i
+        for i in cons.market_exchange_symbols["dce"]
+        + cons.market_exchange_symbols["shfe"]
+        + cons.market_exchange_symbols["cffex"]
+        if i in records["variety"].tolist()
+    ]
+    for var in add_vars:
+        records_cut = records[records["variety"] == var]
+        var_record = pd.DataFrame(records_cut.sum()).T
+        var_record["date"] = date
+        var_record.loc[:, ["variety", "symbol"]] = var
+        records = pd.concat([records, var_record], ignore_index=True)
+    return records.reset_index(drop=True)
+
+
+def test_rank_sum_frame_parity():
+    """
+    test the grouped sums match the previous per-contract nested loop
+    :return: None
+    :rtype: None
+    """
+    big_dict = {
+        "RB2405": _rank_table("RB2405"),
+        "RB2410": _rank_table("RB2410", size=8),
+        "IF2401": _rank_table("IF2401", size=20),
+        "SR405": _rank_table("SR405", as_text=True),
+        "XX2405": _rank_table("XX2405"),
+    }
+    vars_list = ["RB", "IF", "SR"]
+    long_df = cot._rank_long_frame(big_dict.values())
+    long_df["date"] = "20240102"
+    records = cot._rank_sum_frame(long_df, vars_list)
+    expected = _nested_loop_rank_sum(big_dict, vars_list, "20240102")
+    records = records.sort_values("symbol", ignore_index=True)
+    expected = expected[records.columns].sort_values("symbol", ignore_index=True)
+    sum_columns = records.columns[2:-1]
+    expected[sum_columns] = expected[sum_columns].astype(float)
+    records[sum_columns] = records[sum_columns].astype(float)
+    pd.testing.assert_frame_equal(records, expected, check_dtype=False)
+
+
+def test_rank_backfill_resume(monkeypatch, tmp_path):
+    """
+    test exchanges are fetched per trading day, stored, and a rerun only
+    fetches the day that failed
+    :return: None
+    :rtype: None
+    """
+    calls = []
+    lock = threading.Lock()
+    failing = {("SHFE", "20240103")}
+
+    def make_func(market, symbol):
+        def func(date, vars_list=None):
+            key = (market, date.strftime("%Y%m%d"))
+            with lock:
+                calls.append(key)
+            if key in failing:
+                return False
+            return {symbol: _rank_table(symbol)}
+
+        return func
+
+    monkeypatch.setitem(cot._RANK_FUNC, "SHFE", make_func("SHFE", "RB2405"))
+    monkeypatch.setitem(cot._RANK_FUNC, "CFFEX", make_func("CFFEX", "IF2401"))
+    kwargs = dict(
+        start_day="20240101",
+        end_day="20240104",
+        vars_list=["RB", "IF"],
+        store_dir=str(tmp_path),
+        retries=0,
+    )
+    with pytest.warns(UserWarning):
+        first_df = get_rank_sum_backfill(**kwargs)
+    trading_days = ["20240102", "20240103", "20240104"]
+    assert sorted(calls) == sorted(
+        (market, date) for market in ["SHFE", "CFFEX"] for date in trading_days
+    )
+    assert list(first_df.attrs["errors"]) == [("SHFE", "20240103")]
+    stored_df = pd.read_parquet(
+        futures_rank_store_path("CFFEX", "20240103", str(tmp_path))
+    )
+    assert stored_df["symbol"].unique().tolist() == ["IF2401"]
+    # 每个合约一行, 再加一行品种合计
+    assert len(first_df) == 3 * 2 + 2 * 2
+
+    calls.clear()
+    failing.clear()
+    second_df = get_rank_sum_backfill(**kwargs)
+    assert calls == [("SHFE", "20240103")]
+    assert second_df.attrs["errors"] == {}
+    assert len(second_df) == 3 * 2 * 2
+    only_rb_df = get_rank_sum_backfill(**{**kwargs, "vars_list": ["RB"]})
+    assert calls == [("SHFE", "20240103")]
+    assert set(only_rb_df["variety"]) == {"RB"}
+
+
+def test_rank_backfill_gfex_partial_day(monkeypatch, tmp_path):
+    """
+    test a GFEX day with one failing contract is not stored and is fetched again on the next run
+    :return: None
+    :rtype: None
+    """
+    failing = {("lc2407", "20240103")}
+    calls = []
+    lock = threading.Lock()
+
+    def contract_list(symbol, date):
+        return [f"{symbol}2407"] if symbol in ("si", "lc") else []
+
+    def contract_data(symbol, contract_id, date):
+        with lock:
+            calls.append((contract_id, date))
+        if (contract_id, date) in failing:
+            raise ConnectionError("reset")
+        return _rank_table(contract_id.upper())
+
+    monkeypatch.setattr(cot, "__futures_gfex_contract_list", contract_list)
+    monkeypatch.setattr(cot, "__futures_gfex_contract_data", contract_data)
+    kwargs = dict(
+        start_day="20240102",
+        end_day="20240103",
+        vars_list=["SI", "LC"],
+        store_dir=str(tmp_path),
+        retries=0,
+    )
+    with pytest.warns(UserWarning):
+        first_df = get_rank_sum_backfill(**kwargs)
+    assert list(first_df.attrs["errors"]) == [("GFEX", "20240103")]
+    assert not (tmp_path / "futures_rank" / "GFEX" / "20240103.parquet").exists()
+    assert set(first_df["date"].astype(str)) == {"20240102"}
+
+    calls.clear()
+    failing.clear()
+    second_df = get_rank_sum_backfill(**kwargs)
+    assert sorted(calls) == [("lc2407", "20240103"), ("si2407", "20240103")]
+    assert second_df.attrs["errors"] == {}
+    assert set(second_df["symbol"]) == {"SI2407", "LC2407"}
+    assert len(second_df) == 2 * 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试按主机共享的令牌桶: 补充速度, 容量上限, 令牌不足时的阻塞等待和各数据源的默认限速
+用可控的时钟(conftest.clock)代替真实时间
+"""
+
+import pytest
+
+from akshare.utils import rate_limit
+
+
+def test_refill_and_capacity(clock):
+    """
+    test tokens refill at rate per second and never exceed capacity
+    :return: None
+    :rtype: None
+    """
+    bucket = rate_limit.TokenBucket(rate=2.0, capacity=4.0)
+    assert [bucket.try_acquire() for _ in range(5)] == [True] * 4 + [False]
+    clock.now += 0.5
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    # 空闲很久也只积累 capacity 个令牌
+    clock.now += 100
+    assert [bucket.try_acquire() for _ in range(5)] == [True] * 4 + [False]
+    assert not bucket.try_acquire(tokens=0.5)
+    clock.now += 0.25
+    assert bucket.try_acquire(tokens=0.5)
+    assert rate_limit.TokenBucket(rate=5.0).capacity == 5.0
+
+
+def test_blocking_acquire(clock):
+    """
+    test acquire sleeps exactly until enough tokens have been refilled
+    :return: None
+    :rtype: None
+    """
+    bucket = rate_limit.TokenBucket(rate=4.0, capacity=2.0)
+    start = clock.now
+    for _ in range(6):
+        bucket.acquire()
+    # 前 2 个令牌立即可用, 之后每个令牌等待 1 / rate 秒
+    assert clock.sleeps == pytest.approx([0.25] * 4)
+    assert clock.now - start == pytest.approx(1.0)
+    bucket.acquire(tokens=2.0)
+    assert clock.sleeps[-1] == pytest.approx(0.5)
+
+
+def test_shared_per_host(clock, monkeypatch):
+    """
+    test limiters are shared per source, unknown hosts are unlimited and
+    set_rate_limit overrides the defaults
+    :return: None
+    :rtype: None
+    """
+    monkeypatch.setattr(rate_limit, "_limiters", {})
+    monkeypatch.setattr(rate_limit, "_limit_config", {})
+    limiter = rate_limit.get_rate_limiter("https://push2his.eastmoney.com/api/qt")
+    assert (limiter.rate, limiter.capacity) == (20.0, 40.0)
+    assert rate_limit.get_rate_limiter("https://7.push2his.eastmoney.com/") is limiter
+    assert rate_limit.get_rate_limiter("push2his.eastmoney.com") is limiter
+    assert rate_limit.get_rate_limiter("https://push2.eastmoney.com/") is not limiter
+    sina = rate_limit.get_rate_limiter("https://vip.stock.finance.sina.com.cn/q")
+    assert rate_limit.get_rate_limiter("https://finance.sina.com.cn/") is sina
+    assert rate_limit.get_rate_limiter("https://a.example.com/") is rate_limit.NO_LIMIT
+    assert rate_limit.NO_LIMIT.try_acquire(tokens=1e9)
+
+    rate_limit.set_rate_limit("a.example.com", rate=10.0, capacity=20.0)
+    configured = rate_limit.get_rate_limiter("https://a.example.com/x?y=1")
+    assert (configured.rate, configured.capacity) == (10.0, 20.0)
+    assert rate_limit.get_rate_limiter("https://b.a.example.com/") is configured
+    rate_limit.set_rate_limit("push2his.eastmoney.com", rate=1.0)
+    replaced = rate_limit.get_rate_limiter("https://push2his.eastmoney.com/")
+    assert replaced is not limiter
+    assert replaced.rate == 1.0
+    rate_limit.set_rate_limit("push2his.eastmoney.com", rate=None)
+    assert (
+        rate_limit.get_rate_limiter("https://push2his.eastmoney.com/")
+        is rate_limit.NO_LIMIT
+    )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试共享连接池会话: 复用同一个会话, 修改配置后重建, 不保存服务端下发的 cookies
+用本机的 HTTP 服务代替网络请求
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from akshare.utils import request as ak_request
+
+
+class CookieHandler(BaseHTTPRequestHandler):
+    """
+    每次都下发 cookie, 并在响应体中返回收到的 Cookie 请求头
+    """
+
+    def do_GET(self):
+        body = (self.headers.get("Cookie") or "").encode()
+        self.send_response(200)
+        self.send_header("Set-Cookie", "session_id=abc; Path=/")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_url(monkeypatch):
+    for name in ["HTTP_PROXY", "http_proxy", "ALL_PROXY", "all_proxy"]:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CookieHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+    ak_request.reset_session()
+
+
+def test_shared_session(local_url, monkeypatch):
+    """
+    test get_session returns one pooled session, set_session_config rebuilds it,
+    and cookies from responses are not sent on later calls
+    :return: None
+    :rtype: None
+    """
+    monkeypatch.setattr(ak_request, "_session_config", dict(ak_request._session_config))
+    ak_request.reset_session()
+    session = ak_request.get_session()
+    assert ak_request.get_session() is session
+    adapter = session.get_adapter(local_url)
+    assert adapter._pool_maxsize == ak_request._session_config["pool_maxsize"]
+
+    first = ak_request.request_get(local_url)
+    assert first.cookies.get("session_id") == "abc"
+    second = ak_request.request_get(local_url)
+    assert second.text == ""
+    assert len(session.cookies) == 0
+    assert ak_request.get_session() is session
+
+    ak_request.set_session_config(pool_maxsize=4, keep_alive=False)
+    rebuilt = ak_request.get_session()
+    assert rebuilt is not session
+    assert rebuilt.get_adapter(local_url)._pool_maxsize == 4
+    assert rebuilt.headers["Connection"] == "close"
+    assert ak_request.request_get(local_url).status_code == 200
+
+    # fork 之后的子进程重新建立会话
+    ak_request._reset_after_fork()
+    assert ak_request.get_session() is not rebuilt
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
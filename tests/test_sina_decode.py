@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试新浪财经压缩数据的 Python 解码; 耗时比较需要 pytest --benchmark 才运行
+tests/data/sina_decode_fixtures.json 中的期望结果由 akshare.stock.cons.hk_js_decode 在 V8 中执行得到,
+覆盖日线, 收盘价, 分时, 交易日历和多列整数序列等格式
+"""
+
+import json
+import pathlib
+import random
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from akshare.index import index_stock_us_sina
+from akshare.utils.sina_decode import (
+    _ALPHABET,
+    _iso_to_datetime64,
+    _rows_to_columns,
+    decode_sina,
+)
+
+FIXTURE_PATH = pathlib.Path(__file__).parent / "data" / "sina_decode_fixtures.json"
+
+
+def _load_fixtures() -> list:
+    with open(FIXTURE_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _assert_same_columns(result: dict, expected: dict, name: str) -> None:
+    assert list(result) == list(expected), name
+    for key in expected:
+        if expected[key].dtype.kind == "M":
+            assert np.array_equal(
+                result[key].view("int64"), expected[key].view("int64")
+            ), f"{name}: {key}"
+        else:
+            assert np.array_equal(result[key], expected[key], equal_nan=True), (
+                f"{name}: {key}"
+            )
+
+
+def _daily_payload(rows: int = 5000, seed: int = 0) -> str:
+    """
+    按新浪日线格式编码的模拟数据, 只含普通 K 线
+    """
+    rng = random.Random(seed)
+    bits = [(3466 >> i) & 1 for i in range(12)] + [1] * 6
+
+    def put(value: int, width: int) -> None:
+        bits.extend((value >> i) & 1 for i in range(width))
+
+    price, volume = 0, 0
+    for _ in range(rows):
+        open_ = max(100, price + rng.randint(-50, 50)) if price else 200
+        close = max(100, open_ + rng.randint(-100, 100))
+        high = max(open_, close) + rng.randint(0, 50)
+        low = min(open_, close) - rng.randint(0, 50)
+        target = rng.randint(1000, 16000)
+        bits.append(0)
+        for value, width in (
+            (open_ - price, 9),
+            (high - open_, 9),
+            (open_ - low, 9),
+            (close - open_, 9),
+            (target - volume, 15),
+            (rng.randint(-1000, 1000), 15),
+        ):
+            put(value, width)
+        price, volume = close, target
+    bits.extend([1, 1, 0, 0, 0, 0])
+    bits.extend([0] * (-len(bits) % 6))
+    return "".join(
+        _ALPHABET[sum(bits[i + j] << j for j in range(6))]
+        for i in range(0, len(bits), 6)
+    )
+
+
+def test_decode_fixtures():
+    """
+    test python decoder against recorded js output
+    :return: None
+    :rtype: None
+    """
+    for fixture in _load_fixtures():
+        expected = _rows_to_columns(fixture["expected"], _iso_to_datetime64)
+        result = decode_sina(fixture["payload"], engine="python")
+        _assert_same_columns(result, expected, fixture["name"])
+
+
+def test_decode_engine_parity():
+    """
+    test python and js engines return the same columns
+    :return: None
+    :rtype: None
+    """
+    payloads = [fixture["payload"] for fixture in _load_fixtures()]
+    payloads.append(_daily_payload(rows=500))
+    for payload in payloads:
+        _assert_same_columns(
+            decode_sina(payload, engine="python"),
+            decode_sina(payload, engine="js"),
+            payload[:16],
+        )
+
+
+def test_index_us_stock_sina(monkeypatch):
+    """
+    test us index daily uses the python decoder
+    :return: None
+    :rtype: None
+    """
+    payload = _daily_payload(rows=20)
+
+    class FakeResponse:
+        text = f'var KLC_KL_us="{payload}";'
+
+    monkeypatch.setattr(index_stock_us_sina, "request_get", lambda url: FakeResponse())
+    temp_df = index_stock_us_sina.index_us_stock_sina(symbol=".INX")
+    expected = pd.DataFrame(decode_sina(payload, engine="python"))
+    assert len(temp_df) == 20
+    assert temp_df["close"].tolist() == expected["close"].tolist()
+    assert temp_df["date"].iloc[0] == expected["date"].dt.date.iloc[0]
+
+
+@pytest.mark.benchmark
+def test_decode_speed():
+    """
+    benchmark python decoder against the js decoder on a long daily series
+    :return: None
+    :rtype: None
+    """
+    payload = _daily_payload()
+    timings = {}
+    for engine in ("python", "js"):
+        pd.DataFrame(decode_sina(payload, engine=engine))
+        start = time.perf_counter()
+        for _ in range(3):
+            pd.DataFrame(decode_sina(payload, engine=engine))
+        timings[engine] = (time.perf_counter() - start) / 3
+    print(f"sina decode 5000 rows: {timings}")
+    assert timings["python"] < timings["js"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "--benchmark", "-s"])
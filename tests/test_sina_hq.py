@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试新浪财经实时行情订阅的分批请求和增量输出
+用本地构造的行情文本代替网络请求
+"""
+
+import asyncio
+import threading
+import warnings
+
+import pytest
+
+from akshare.futures import futures_zh_sina
+from akshare.utils import rate_limit, sina_hq
+from akshare.utils.sina_hq import (
+    SinaHqSubscription,
+    batch_symbols,
+    parse_hq_text,
+    random_rn,
+)
+
+
+def _hq_text(quotes: dict) -> str:
+    return "\n".join(
+        f'var hq_str_{symbol}="{",".join(fields)}";'
+        for symbol, fields in quotes.items()
+    )
+
+
+def test_batch_and_parse():
+    """
+    test batches respect the url length limit and the response text is parsed
+    :return: None
+    :rtype: None
+    """
+    assert int(random_rn(), 16) < 2147483648
+    symbols = [f"nf_V{2300 + i}" for i in range(2000)]
+    batches = batch_symbols(symbols, max_url_length=2000)
+    assert [symbol for batch in batches for symbol in batch] == symbols
+    assert len(batches) <= 12
+    for batch in batches:
+        assert len(f"{sina_hq.HQ_URL}rn=7fffffff&list={','.join(batch)}") <= 2000
+    text = 'var hq_str_sh600000="浦发银行,10.0,9.9,";\nvar hq_str_gb_xxx="";\n'
+    assert parse_hq_text(text) == {
+        "sh600000": ["浦发银行", "10.0", "9.9", ""],
+        "gb_xxx": [],
+    }
+
+
+def test_subscription_diff(monkeypatch):
+    """
+    test only changed rows are emitted and the buffer grows for wide rows
+    :return: None
+    :rtype: None
+    """
+    symbols = [f"sh{600000 + i}" for i in range(1500)]
+    quotes = {symbol: [symbol, "10.0", "09:30:00"] for symbol in symbols}
+    requests = []
+
+    def fetch_batch(batch, timeout):
+        requests.append(batch)
+        return parse_hq_text(_hq_text({symbol: quotes[symbol] for symbol in batch}))
+
+    monkeypatch.setattr(sina_hq, "_fetch_batch", fetch_batch)
+    subscription = SinaHqSubscription(symbols, interval=0, width=2)
+    first = subscription.poll()
+    assert len(first) == 1500 and first.loc["sh600001", 1] == "10.0"
+    assert len(requests) <= 10
+    assert subscription.poll().empty
+    quotes["sh600007"] = ["sh600007", "10.5", "09:30:03", "x", "y"]
+    changed = subscription.poll()
+    assert list(changed.index) == ["sh600007"]
+    assert changed.iloc[0].tolist() == quotes["sh600007"]
+    assert subscription.snapshot().shape == (1500, 5)
+
+    async def first_update():
+        async for update in subscription:
+            return update
+
+    quotes["sh600009"] = ["sh600009", "9.0", "09:30:06"]
+    update = asyncio.run(first_update())
+    assert list(update.index) == ["sh600009"]
+
+
+def test_subscription_on_error(monkeypatch):
+    """
+    test background poll errors are passed to on_error instead of being swallowed
+    :return: None
+    :rtype: None
+    """
+
+    def fetch_batch(batch, timeout):
+        raise ConnectionError("connection reset by peer")
+
+    monkeypatch.setattr(sina_hq, "_fetch_batch", fetch_batch)
+    errors = []
+    failed = threading.Event()
+
+    def on_error(exc):
+        errors.append(exc)
+        failed.set()
+
+    with SinaHqSubscription(["sh600000"], interval=0.01, on_error=on_error) as sub:
+        assert failed.wait(5)
+    assert isinstance(errors[0], ConnectionError)
+    assert sub.error_count >= 1 and sub.last_error is not None
+
+
+def test_subscription_error_warning_and_backoff(monkeypatch, clock):
+    """
+    test errors without on_error warn at most once per interval and polling waits for an open circuit
+    :return: None
+    :rtype: None
+    """
+    monkeypatch.setattr(sina_hq, "time", clock)
+    monkeypatch.setattr(rate_limit, "_breakers", {})
+    monkeypatch.setattr(rate_limit, "_breaker_config", {})
+    rate_limit.set_circuit_breaker(sina_hq.HQ_URL, recovery_timeout=30)
+    sub = SinaHqSubscription(["sh600000"], interval=3)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        assert sub._handle_error(ConnectionError("reset")) == 3
+        clock.now += 10
+        sub._handle_error(ConnectionError("reset"))
+        clock.now += sina_hq.ERROR_WARN_INTERVAL
+        sub._handle_error(ConnectionError("reset"))
+    assert len(caught) == 2 and "累计 3 次" in str(caught[1].message)
+    rate_limit.get_circuit_breaker(sina_hq.HQ_URL).record_failure(retry_after=30)
+    assert sub._handle_error(ConnectionError("reset")) == 30
+
+
+def test_futures_zh_spot_duplicate_symbols(monkeypatch):
+    """
+    test duplicated contracts keep one row per requested symbol and stay aligned
+    :return: None
+    :rtype: None
+    """
+    prices = {"nf_V2309": "6000", "nf_RB2310": "3700"}
+
+    def fetch_batch(batch, timeout):
+        return parse_hq_text(
+            _hq_text(
+                {
+                    symbol: [symbol[3:], "150000"] + [prices[symbol]] * 26
+                    for symbol in batch
+                }
+            )
+        )
+
+    monkeypatch.setattr(sina_hq, "_fetch_batch", fetch_batch)
+    monkeypatch.setattr(
+        futures_zh_sina,
+        "_futures_contract_exchange_min",
+        lambda symbol: ("DCE" if symbol.startswith("V") else "SHFE", 1),
+    )
+    temp_df = futures_zh_sina.futures_zh_spot(
+        symbol="V2309,V2309,RB2310", market="CF", adjust="1"
+    )
+    assert temp_df["symbol"].tolist() == ["V2309", "V2309", "RB2310"]
+    assert temp_df["exchange"].tolist() == ["DCE", "DCE", "SHFE"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
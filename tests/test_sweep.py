@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试 analysis/indices_dashboard 的参数扫描与逐个参数回测的结果一致
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.indices_dashboard.sweep import (
+    RESULT_COLUMNS,
+    param_grid,
+    rank_results,
+    sweep_close,
+    sweep_symbols,
+)
+
+
+def _close(seed: int, n: int = 600) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    return pd.Series(
+        1000 * np.exp(np.cumsum(rng.normal(0, 0.015, n))),
+        index=pd.bdate_range("2018-01-02", periods=n),
+    )
+
+
+def test_sweep_matches_run_backtest():
+    """
+    test every grid point equals a separate optimize_bias run_backtest call
+    :return: None
+    :rtype: None
+    """
+    from tools.optimize_bias import run_backtest
+
+    close = _close(0)
+    params = param_grid(
+        {
+            "ma_window": [20],
+            "bias_window": [5, 10],
+            "bias_threshold": [None, 2, 4, 8],
+            "confirm_days": [2],
+        }
+    )
+    result = sweep_close(close, params)
+    assert len(result) == 8
+    for row in result.itertuples(index=False):
+        expected = run_backtest(
+            pd.DataFrame({"Close": close}),
+            bias_window=row.bias_window,
+            bias_threshold=row.bias_threshold,
+        )
+        assert row.return_pct == expected
+    assert (result["max_drawdown_pct"] <= 0).all()
+    assert (result["trades"] > 0).all()
+
+
+def test_sweep_symbols_ranked():
+    """
+    test the process pool gives the same table as in-process evaluation and
+    the summary ranks parameter sets across symbols
+    :return: None
+    :rtype: None
+    """
+    closes = {f"sh00000{i}": _close(i) for i in range(3)}
+    grid = {
+        "ma_window": [10, 20],
+        "bias_window": [10],
+        "bias_threshold": [None, 3, 6],
+        "confirm_days": [1, 3],
+    }
+    serial_df = sweep_symbols(closes, grid, max_workers=1)
+    parallel_df = sweep_symbols(closes, grid, max_workers=2)
+    pd.testing.assert_frame_equal(serial_df, parallel_df)
+    assert serial_df.columns.tolist() == RESULT_COLUMNS
+    assert len(serial_df) == 3 * 12
+    assert (serial_df[serial_df["bias_threshold"].isna()]["excess_pct"] == 0).all()
+
+    detail_df, summary_df = rank_results(serial_df)
+    assert len(summary_df) == 12
+    assert (summary_df["symbols"] == 3).all()
+    assert summary_df["mean_return_pct"].is_monotonic_decreasing
+    first = detail_df[detail_df["symbol"] == "sh000000"]["return_pct"]
+    assert first.is_monotonic_decreasing
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
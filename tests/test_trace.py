@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试请求追踪: 请求层和解析步骤产生的事件按接口汇总, 线程池中的请求也记到调用的接口名下
+用本地构造的会话代替网络请求
+"""
+
+import json
+import threading
+
+import pytest
+
+from akshare.stock_feature import stock_hist_em
+from akshare.utils import rate_limit, trace
+from akshare.utils import request as ak_request
+
+# 接口实际返回的字段比请求的多两个
+_FIELDS = stock_hist_em._A_SPOT_PARAMS["fields"].split(",") + ["f19", "f26"]
+
+
+class FakeResponse:
+    headers = {}
+
+    def __init__(self, status_code: int, payload: dict = None):
+        self.status_code = status_code
+        self.content = json.dumps(payload or {}).encode()
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise ak_request.requests.HTTPError(f"{self.status_code} error")
+
+
+class FakeSession:
+    """
+    东方财富分页接口, 共 5 页, 每页 20 条; 第一次请求返回 502
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def request(self, method, url, params=None, **kwargs):
+        with self._lock:
+            self.calls += 1
+            first = self.calls == 1
+        if first:
+            return FakeResponse(502)
+        page = int(params["pn"])
+        diff = [
+            {field: (f"{page}{i:05d}" if field == "f12" else i) for field in _FIELDS}
+            for i in range(20)
+        ]
+        return FakeResponse(200, {"data": {"total": 100, "diff": diff}})
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    for name in ["_limiters", "_limit_config", "_breakers", "_breaker_config"]:
+        monkeypatch.setattr(rate_limit, name, {})
+    monkeypatch.setattr(rate_limit, "DEFAULT_RATE_LIMITS", {})
+    monkeypatch.setattr(ak_request.time, "sleep", lambda seconds: None)
+    session = FakeSession()
+    monkeypatch.setattr(ak_request, "get_session", lambda: session)
+    return session
+
+
+def test_collector_summary(fake_session):
+    """
+    test request and parse events are attributed to the calling interface,
+    including pages fetched by worker threads, and summarized per interface
+    :return: None
+    :rtype: None
+    """
+    with trace.TraceCollector() as collector:
+        spot_df = stock_hist_em.stock_zh_a_spot_em()
+        with trace.interface("nightly_job"):
+            stock_hist_em.stock_zh_a_spot_em()
+    assert len(spot_df) == 100
+    assert not trace.is_enabled()
+
+    requests = [item for item in collector.spans if item.kind == "request"]
+    assert len(requests) == fake_session.calls == 11
+    assert {item.interface for item in collector.spans} == {
+        "stock_zh_a_spot_em",
+        "nightly_job",
+    }
+    assert requests[0].attributes["status"] == 502
+    assert requests[1].attributes["attempt"] == 1
+    assert requests[1].attributes["host"] == "82.push2.eastmoney.com"
+    assert all(item.attributes["bytes"] > 0 for item in requests)
+
+    summary_df = collector.summary().set_index("interface")
+    row = summary_df.loc["stock_zh_a_spot_em"]
+    assert row["requests"] == 6
+    assert row["errors"] == 1
+    assert row["retries"] == 1
+    assert summary_df.loc["nightly_job", "requests"] == 5
+    assert row["kbytes"] == pytest.approx(
+        sum(item.attributes["bytes"] for item in requests[:6]) / 1024
+    )
+    assert row["parse_s"] > 0
+
+    stage_df = collector.stage_summary()
+    stages = stage_df[stage_df["interface"] == "stock_zh_a_spot_em"]
+    assert stages.set_index("stage")["count"].to_dict() == {
+        "request": 6,
+        "json": 5,
+        "paginated_frame": 1,
+        "em_parse": 1,
+    }
+
+
+def test_disabled_and_hook_errors(fake_session):
+    """
+    test nothing is recorded without hooks and a failing hook only warns
+    :return: None
+    :rtype: None
+    """
+    with trace.span("json") as item:
+        item.attributes["ignored"] = True
+    assert trace.bind(len) is len
+
+    def broken_hook(item):
+        raise RuntimeError("boom")
+
+    trace.add_hook(broken_hook)
+    try:
+        with pytest.warns(UserWarning, match="boom"):
+            ak_request.request_get("https://example.com/a")
+    finally:
+        trace.remove_hook(broken_hook)
+    assert not trace.is_enabled()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试交易日历的二分查找
+"""
+
+import datetime
+
+import numpy as np
+
+from akshare.futures import cons
+
+
+def test_trading_calendar():
+    """
+    test calendar queries against a linear scan of calendar.json
+    :return: None
+    :rtype: None
+    """
+    calendar = cons.get_trading_calendar()
+    days = cons.get_calendar()
+    assert cons.get_trading_calendar() is calendar
+    assert len(calendar) == len(days) and days == sorted(days)
+    day = datetime.date(2023, 12, 20)
+    while day <= datetime.date(2024, 1, 10):
+        d_str = day.strftime("%Y%m%d")
+        expected = d_str in days
+        assert calendar.is_trading_day(day) is expected
+        assert (d_str in calendar) is expected
+        prev_days = [d for d in days if d < d_str]
+        next_days = [d for d in days if d > d_str]
+        assert calendar.prev_trading_day(day).strftime("%Y%m%d") == prev_days[-1]
+        assert calendar.next_trading_day(d_str).strftime("%Y%m%d") == next_days[0]
+        if expected:
+            assert cons.last_trading_day(d_str) == prev_days[-1]
+        day += datetime.timedelta(days=1)
+    between = calendar.trading_days_between("20231225", "2024-01-05")
+    assert [d.strftime("%Y%m%d") for d in between.astype(datetime.date)] == [
+        d for d in days if "20231225" <= d <= "20240105"
+    ]
+    shifted = calendar.offset(
+        np.array(["2023-12-30", "2024-01-02"], "datetime64[D]"), 1
+    )
+    assert list(shifted.astype(str)) == ["2024-01-02", "2024-01-03"]
+    assert np.isnat(
+        calendar.offset(np.array(["1990-12-19"], "datetime64[D]"), -1)
+    ).all()
+    assert (
+        cons.get_latest_data_date(datetime.datetime(2018, 10, 5, 17, 1, 0))
+        == "20180928"
+    )
+
+
+if __name__ == "__main__":
+    test_trading_calendar()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 15:00
+Desc: 测试 analysis/indices_dashboard 的向量化回测与原逐行回测的结果一致
+_loop_process_strategy 和 _loop_optimize_backtest 保留了改写前的逐行实现, 作为对照
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.indices_dashboard import strategy
+from analysis.indices_dashboard.vector_backtest import run_signal_backtest
+
+CONFIG = {
+    "initial_capital": 100000,
+    "commission_rate_short": 0.015,
+    "short_term_days": 7,
+}
+
+
+def _signal_df(n: int = 400, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 3000 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    # 包含连续买入信号和持有不足 7 天就卖出的情况
+    signal = rng.choice([-1, 0, 0, 0, 1], size=n)
+    df = pd.DataFrame(
+        {
+            "Open": close * 0.99,
+            "High": close * 1.01,
+            "Low": close * 0.98,
+            "Close": close,
+            "Volume": 1.0,
+            "MA20": pd.Series(close).rolling(20).mean().to_numpy(),
+            "BIAS20": rng.normal(0, 1, n),
+            "MA_Slope": rng.normal(0, 1, n),
+            "Signal": signal,
+        },
+        index=pd.bdate_range("2015-01-05", periods=n, name="Date"),
+    )
+    return df
+
+
+def _loop_process_strategy(df, config):
+    initial_capital = config.get("initial_capital", 100000)
+    commission_rate_short = config.get("commission_rate_short", 0.015)
+    short_term_days = config.get("short_term_days", 7)
+    cash = initial_capital
+    holdings = 0
+    last_buy_date = None
+    history = []
+    trades = []
+    for date, row in df.iterrows():
+        price = row["Close"]
+        signal = row["Signal"]
+        action = None
+        if signal == 1 and cash > 0:
+            shares = int(cash / price)
+            if shares > 0:
+                cash -= shares * price
+                holdings = shares
+                last_buy_date = date
+                action = "Buy"
+                trades.append(
+                    {
+                        "date": date,
+                        "type": "买入",
+                        "price": price,
+                        "shares": shares,
+                        "commission": 0,
+                        "balance": cash,
+                    }
+                )
+        elif signal == -1 and holdings > 0:
+            revenue = holdings * price
+            hold_days = (date - last_buy_date).days if last_buy_date else 999
+            fee = 0.0
+            if hold_days < short_term_days:
+                fee = revenue * commission_rate_short
+            cash += revenue - fee
+            action = "Sell"
+            trades.append(
+                {
+                    "date": date,
+                    "type": "卖出",
+                    "price": price,
+                    "shares": holdings,
+                    "commission": fee,
+                    "balance": cash,
+                }
+            )
+            holdings = 0
+        record = {
+            "date": date,
+            "total": cash + holdings * price,
+            "price": price,
+            "action": action,
+            "signal": signal,
+            "Open": row.get("Open", price),
+            "High": row.get("High", price),
+            "Low": row.get("Low", price),
+            "Close": price,
+        }
+        for col in df.columns:
+            if col.startswith("MA") or col.startswith("BIAS"):
+                record[col] = row.get(col, 0)
+        history.append(record)
+    return pd.DataFrame(history), trades
+
+
+def _loop_optimize_backtest(df, bias_threshold=None):
+    position = 0
+    cash = 100000
+    shares = 0
+    for i in range(20, len(df)):
+        price = df["Close"].iloc[i]
+        slope = df["Slope"].iloc[i]
+        slope_prev = df["Slope_Prev"].iloc[i]
+        bias = df["BIAS"].iloc[i]
+        buy_signal = (slope > 0) and (slope_prev > 0)
+        sell_signal = (slope < 0) or (
+            (bias_threshold is not None) and (bias > bias_threshold)
+        )
+        if position == 0:
+            if buy_signal:
+                shares = cash / price
+                cash = 0
+                position = 1
+        elif position == 1:
+            if sell_signal:
+                cash = shares * price
+                shares = 0
+                position = 0
+    final_value = cash + (shares * df["Close"].iloc[-1])
+    return (final_value - 100000) / 100000 * 100
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_process_strategy_parity(seed):
+    """
+    test history and trades match the row-by-row loop
+    :return: None
+    :rtype: None
+    """
+    df = _signal_df(seed=seed)
+    hist_df, trades = strategy.process_strategy(df, CONFIG)
+    expected_df, expected_trades = _loop_process_strategy(df, CONFIG)
+    pd.testing.assert_frame_equal(hist_df, expected_df, check_dtype=False)
+    assert trades == expected_trades
+    assert any(trade["commission"] > 0 for trade in trades)
+
+    hist_df, trades = strategy.process_strategy(df, CONFIG, enable_backtest=False)
+    assert trades == []
+    assert (hist_df["total"] == CONFIG["initial_capital"]).all()
+    assert hist_df["action"].isna().all()
+
+
+def test_optimize_bias_parity():
+    """
+    test the fractional-share BIAS sweep backtest matches the iloc loop
+    :return: None
+    :rtype: None
+    """
+    from tools.optimize_bias import run_backtest
+
+    rng = np.random.default_rng(3)
+    close = 1000 * np.exp(np.cumsum(rng.normal(0, 0.015, 600)))
+    df = pd.DataFrame({"Close": close}, index=pd.bdate_range("2018-01-02", periods=600))
+    for threshold in [None, 2, 5]:
+        # run_backtest 在传入的 DataFrame 上计算指标列, 对照实现直接使用这些列
+        frame = df.copy()
+        result = run_backtest(frame, bias_threshold=threshold)
+        expected = _loop_optimize_backtest(frame, bias_threshold=threshold)
+        assert result == expected
+
+
+def test_multi_instrument():
+    """
+    test a 2-D run equals running every instrument on its own
+    :return: None
+    :rtype: None
+    """
+    frames = [_signal_df(n=300, seed=seed) for seed in range(5)]
+    close = np.column_stack([f["Close"].to_numpy() for f in frames])
+    signal = np.column_stack([f["Signal"].to_numpy() for f in frames])
+    dates = frames[0].index
+    res = run_signal_backtest(
+        close, signal == 1, signal == -1, dates=dates, commission_rate_short=0.015
+    )
+    for j in range(len(frames)):
+        single = run_signal_backtest(
+            close[:, j],
+            signal[:, j] == 1,
+            signal[:, j] == -1,
+            dates=dates,
+            commission_rate_short=0.015,
+        )
+        for key, value in single.items():
+            np.testing.assert_array_equal(res[key][:, j], value)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
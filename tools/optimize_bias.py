@@ -1,6 +1,12 @@
+import os
+import sys
+
 import akshare as ak
 import pandas as pd
-import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.indices_dashboard.sweep import param_grid, sweep_close
+from analysis.indices_dashboard.vector_backtest import run_signal_backtest
 
 def run_backtest(df, bias_window=10, bias_threshold=None):
     """
@@ -21,44 +27,24 @@ def run_backtest(df, bias_window=10, bias_threshold=None):
     df['BIAS'] = (df['Close'] - ma_n) / ma_n * 100
     
     # 2. Simulate Trading
-    position = 0
-    cash = 100000
-    shares = 0
-    initial_capital = 100000
-    
     # Align signals with data.py logic (Confirmed Buy)
     # Buy: Slope > 0 and Prev > 0
     # Sell: Slope < 0 OR BIAS > Threshold
-    
-    for i in range(20, len(df)):
-        price = df['Close'].iloc[i]
-        slope = df['Slope'].iloc[i]
-        slope_prev = df['Slope_Prev'].iloc[i]
-        bias = df['BIAS'].iloc[i]
-        date = df.index[i]
-        
-        # Buy Signal
-        buy_signal = (slope > 0) and (slope_prev > 0)
-        
-        # Sell Signal
-        sell_signal_slope = (slope < 0)
-        sell_signal_bias = (bias_threshold is not None) and (bias > bias_threshold)
-        sell_signal = sell_signal_slope or sell_signal_bias
-        
-        if position == 0:
-            if buy_signal:
-                # Buy
-                shares = cash / price
-                cash = 0
-                position = 1
-        elif position == 1:
-            if sell_signal:
-                # Sell
-                cash = shares * price
-                shares = 0
-                position = 0
-                
-    final_value = cash + (shares * df['Close'].iloc[-1])
+    slope = df['Slope'].to_numpy()
+    buy_signal = (slope > 0) & (df['Slope_Prev'].to_numpy() > 0)
+    sell_signal = slope < 0
+    if bias_threshold is not None:
+        sell_signal |= df['BIAS'].to_numpy() > bias_threshold
+    # 前 20 个交易日 MA20 尚未形成, 不交易
+    buy_signal[:20] = False
+    sell_signal[:20] = False
+
+    initial_capital = 100000
+    res = run_signal_backtest(
+        df['Close'].to_numpy(dtype=float), buy_signal, sell_signal,
+        initial_capital=initial_capital, fractional=True,
+    )
+    final_value = res['total'][-1]
     return (final_value - initial_capital) / initial_capital * 100
 
 def optimize_bias(symbol="sh000813", start_date="2020-01-01"):
@@ -74,27 +60,30 @@ def optimize_bias(symbol="sh000813", start_date="2020-01-01"):
         print(f"Data range: {df.index[0].date()} to {df.index[-1].date()}")
         print("-" * 40)
         
+        # 所有阈值一次扫描: MA / BIAS 只计算一次
+        params = param_grid({
+            'ma_window': [20], 'bias_window': [10],
+            'bias_threshold': [None] + list(range(3, 21)),  # Test 3% to 20%
+            'confirm_days': [2],
+        })
+        result = sweep_close(df['Close'], params)
+
         # Baseline (No BIAS Sell)
-        base_ret = run_backtest(df.copy(), bias_threshold=None)
+        base_ret = result['return_pct'].iloc[0]
         print(f"基准收益 (仅Slope卖出): {base_ret:.2f}%")
-        
-        # Test Thresholds
-        best_ret = -999
-        best_th = None
-        
+
         print("\n测试不同 BIAS 阈值 (基于 MA10):")
         print("阈值(%) | 收益率(%) | 提升(%)")
         print("-------|-----------|--------")
-        
-        for th in range(3, 21): # Test 3% to 20%
-            ret = run_backtest(df.copy(), bias_window=10, bias_threshold=th)
+
+        for th, ret in result[['bias_threshold', 'return_pct']].iloc[1:].itertuples(index=False):
             diff = ret - base_ret
             print(f"{th:6d} | {ret:9.2f} | {diff:+.2f}")
-            
-            if ret > best_ret:
-                best_ret = ret
-                best_th = th
-                
+
+        best = result.iloc[1:]['return_pct'].idxmax()
+        best_ret = result.loc[best, 'return_pct']
+        best_th = result.loc[best, 'bias_threshold']
+
         print("-" * 40)
         if best_ret > base_ret:
             print(f"✅ 最佳阈值: {best_th}% (收益率: {best_ret:.2f}%)")